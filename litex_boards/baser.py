@@ -0,0 +1,219 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# 10GBASE-R PHY.
+#
+# LiteEth XGMII TX/RX + 64b/66b PCS (encoder/decoder, self-synchronous scrambler, block lock) over
+# the LiteEth UltraScale+ GTY 10GBASE-R transceiver (10.3125Gbps), shared by the QSFP targets.
+#
+# Usage:
+#   from litex_boards.baser import USP10GBASERPHY
+#   phy = USP10GBASERPHY(qsfp_pll, platform.request("qsfp0"), sys_clk_freq, cd="eth")
+
+from migen import *
+
+from litex.gen import *
+
+# 64b/66b PCS --------------------------------------------------------------------------------------
+
+# 64b/66b control codes (XGMII <-> 7-bit 64b/66b codes) and block types.
+_XGMII_IDLE, _XGMII_START, _XGMII_TERM, _XGMII_ERROR = 0x07, 0xfb, 0xfd, 0xfe
+_BASER_IDLE, _BASER_ERROR = 0x00, 0x1e
+_BLOCK_CTRL   = 0x1e
+_BLOCK_START0 = 0x78
+_BLOCK_START4 = 0x33
+_BLOCK_TERM   = [0x87, 0x99, 0xaa, 0xb4, 0xcc, 0xd2, 0xe1, 0xff] # Terminate on lane 0-7.
+
+class BaseRScrambler(Module):
+    """Self-synchronous 64b/66b (de)scrambler (x^58 + x^39 + 1)."""
+    def __init__(self, descramble=False):
+        self.i = Signal(64)
+        self.o = Signal(64)
+
+        # # #
+
+        state = Signal(58)
+        line  = [] # Bits on the line (scrambled).
+        def line_bit(n):
+            return state[58 + n] if n < 0 else line[n]
+        for n in range(64):
+            bit = self.i[n] ^ line_bit(n - 39) ^ line_bit(n - 58)
+            line.append(self.i[n] if descramble else bit)
+            self.comb += self.o[n].eq(bit)
+        self.sync += state.eq(Cat(*line[64-58:]))
+
+class BaseRPCSTX(Module):
+    """XGMII to 64b/66b encoder + scrambler."""
+    def __init__(self):
+        self.xgmii_data = xgmii_data = Signal(64)
+        self.xgmii_ctl  = xgmii_ctl  = Signal(8)
+        self.data       = Signal(64)
+        self.header     = Signal(2)
+
+        # # #
+
+        lanes   = [xgmii_data[8*i:8*(i+1)] for i in range(8)]
+        block   = Signal(64)
+        header  = Signal(2)
+        codes   = Cat(*[Mux(lanes[i] == _XGMII_IDLE, C(_BASER_IDLE, 7), C(_BASER_ERROR, 7)) for i in range(8)])
+        is_idle = [(lanes[i] == _XGMII_IDLE) for i in range(8)]
+
+        # Encoder.
+        cases = If(xgmii_ctl == 0x00,
+            header.eq(0b01),
+            block.eq(xgmii_data),
+        ).Elif((xgmii_ctl == 0x01) & (lanes[0] == _XGMII_START),
+            block.eq(Cat(C(_BLOCK_START0, 8), xgmii_data[8:])),
+        ).Elif((xgmii_ctl == 0x1f) & (lanes[4] == _XGMII_START) & (Cat(*is_idle[:4]) == 0b1111),
+            block.eq(Cat(C(_BLOCK_START4, 8), C(0, 32), xgmii_data[40:])),
+        )
+        for k in range(8):
+            cases = cases.Elif((xgmii_ctl == ((0xff << k) & 0xff)) & (lanes[k] == _XGMII_TERM),
+                block.eq(Cat(C(_BLOCK_TERM[k], 8), *lanes[:k])),
+            )
+        cases = cases.Else(
+            block.eq(Cat(C(_BLOCK_CTRL, 8), Mux(xgmii_ctl == 0xff, codes, Replicate(C(_BASER_ERROR, 7), 8)))),
+        )
+        self.comb += header.eq(0b10)
+        self.comb += cases
+
+        # Scrambler (header is not scrambled).
+        self.submodules.scrambler = scrambler = BaseRScrambler()
+        self.comb += scrambler.i.eq(block)
+        self.sync += [
+            self.data.eq(scrambler.o),
+            self.header.eq(header),
+        ]
+
+class BaseRPCSRX(Module):
+    """64b/66b block lock + descrambler + decoder to XGMII."""
+    def __init__(self):
+        self.data       = Signal(64)
+        self.header     = Signal(2)
+        self.slip       = Signal()
+        self.block_lock = Signal()
+        self.xgmii_data = xgmii_data = Signal(64)
+        self.xgmii_ctl  = xgmii_ctl  = Signal(8)
+
+        # # #
+
+        # Block Lock: slip on invalid sync headers until 64 consecutive valid ones, lose lock on 16
+        # invalid sync headers in a 64 blocks window (simplified IEEE 802.3 49.2.14 state machine).
+        header_valid = Signal()
+        slip_wait    = Signal(6)
+        valid_count  = Signal(7)
+        block_count  = Signal(6)
+        error_count  = Signal(5)
+        self.comb += header_valid.eq(self.header[0] ^ self.header[1])
+        self.sync += [
+            self.slip.eq(0),
+            If(slip_wait != 0,
+                slip_wait.eq(slip_wait - 1)
+            ).Elif(~self.block_lock,
+                If(header_valid,
+                    valid_count.eq(valid_count + 1),
+                    If(valid_count == 63,
+                        self.block_lock.eq(1),
+                        block_count.eq(0),
+                        error_count.eq(0),
+                    )
+                ).Else(
+                    valid_count.eq(0),
+                    self.slip.eq(1),
+                    slip_wait.eq(2**len(slip_wait) - 1), # Wait for the gearbox slip to be applied.
+                )
+            ).Else(
+                block_count.eq(block_count + 1),
+                If(block_count == 63,
+                    error_count.eq(0)
+                ),
+                If(~header_valid,
+                    error_count.eq(error_count + 1),
+                    If(error_count == 15,
+                        self.block_lock.eq(0),
+                        valid_count.eq(0),
+                    )
+                )
+            )
+        ]
+
+        # Descrambler.
+        self.submodules.descrambler = descrambler = BaseRScrambler(descramble=True)
+        self.comb += descrambler.i.eq(self.data)
+        block  = descrambler.o
+        header = self.header
+
+        # Decoder.
+        def lanes(*lanes):
+            return Cat(*[C(l, 8) if isinstance(l, int) else l for l in lanes])
+        btype = block[:8]
+        octets = [block[8*i:8*(i+1)] for i in range(8)]
+        codes = [block[8 + 7*i:8 + 7*(i+1)] for i in range(8)]
+        cases = If(~self.block_lock | ~(header[0] ^ header[1]),
+            xgmii_ctl.eq(0xff),
+            xgmii_data.eq(lanes(*[_XGMII_IDLE]*8)),
+        ).Elif(header == 0b01,
+            xgmii_ctl.eq(0x00),
+            xgmii_data.eq(block),
+        ).Elif(btype == _BLOCK_CTRL,
+            xgmii_ctl.eq(0xff),
+            xgmii_data.eq(Cat(*[Mux(codes[i] == _BASER_IDLE, C(_XGMII_IDLE, 8), C(_XGMII_ERROR, 8)) for i in range(8)])),
+        ).Elif(btype == _BLOCK_START0,
+            xgmii_ctl.eq(0x01),
+            xgmii_data.eq(lanes(_XGMII_START, *octets[1:])),
+        ).Elif(btype == _BLOCK_START4,
+            xgmii_ctl.eq(0x1f),
+            xgmii_data.eq(lanes(*[_XGMII_IDLE]*4, _XGMII_START, *octets[5:])),
+        )
+        for k in range(8):
+            cases = cases.Elif(btype == _BLOCK_TERM[k],
+                xgmii_ctl.eq((0xff << k) & 0xff),
+                xgmii_data.eq(lanes(*octets[1:k+1], _XGMII_TERM, *[_XGMII_IDLE]*(7 - k))),
+            )
+        cases = cases.Else(
+            xgmii_ctl.eq(0xff),
+            xgmii_data.eq(lanes(*[_XGMII_ERROR]*8)),
+        )
+        self.sync += cases
+
+# 10GBASE-R PHY ------------------------------------------------------------------------------------
+
+class USP10GBASERPHY(LiteXModule):
+    """10GBASE-R PHY: LiteEth XGMII TX/RX + 64b/66b PCS + GTY transceiver (10.3125Gbps)."""
+    dw          = 64
+    tx_clk_freq = 156.25e6
+    rx_clk_freq = 156.25e6
+    def __init__(self, pll, data_pads, sys_clk_freq, cd="eth"):
+        from liteeth.phy.xgmii import LiteEthPHYXGMIITX, LiteEthPHYXGMIIRX
+        from liteeth.phy.usp_gty_10g_baser import USP_GTY_10G_BASER
+        self.integrated_ifg_inserter = True
+        xgmii = Record([("tx_data", 64), ("tx_ctl", 8), ("rx_data", 64), ("rx_ctl", 8)])
+
+        # # #
+
+        # Transceiver.
+        self.serdes = serdes = ClockDomainsRenamer({"eth_tx": f"{cd}_tx", "eth_rx": f"{cd}_rx"})(
+            USP_GTY_10G_BASER(pll, data_pads, sys_clk_freq))
+
+        # PCS.
+        self.pcs_tx = pcs_tx = ClockDomainsRenamer(f"{cd}_tx")(BaseRPCSTX())
+        self.pcs_rx = pcs_rx = ClockDomainsRenamer(f"{cd}_rx")(BaseRPCSRX())
+        self.comb += [
+            pcs_tx.xgmii_data.eq(xgmii.tx_data),
+            pcs_tx.xgmii_ctl.eq(xgmii.tx_ctl),
+            serdes.tx_data.eq(pcs_tx.data),
+            serdes.tx_header.eq(pcs_tx.header),
+            pcs_rx.data.eq(serdes.rx_data),
+            pcs_rx.header.eq(serdes.rx_header),
+            serdes.rx_slip.eq(pcs_rx.slip),
+            xgmii.rx_data.eq(pcs_rx.xgmii_data),
+            xgmii.rx_ctl.eq(pcs_rx.xgmii_ctl),
+        ]
+
+        # XGMII.
+        self.tx = ClockDomainsRenamer(f"{cd}_tx")(LiteEthPHYXGMIITX(xgmii, self.dw))
+        self.rx = ClockDomainsRenamer(f"{cd}_rx")(LiteEthPHYXGMIIRX(xgmii, self.dw))
+        self.sink, self.source = self.tx.sink, self.rx.source
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Etherbone Bulk transfers.
+#
+# By default, the Etherbone core is built with small record buffers and litex_server issues one read
+# per packet over UDP, so memory dumps/firmware loads are bound by the network round-trip. With
+# --etherbone-bulk, targets build the Etherbone core with ETHERBONE_BULK_BUFFER_DEPTH-deep record
+# buffers (exported as ETHERBONE_BUFFER_DEPTH) and CommUDPBulk moves up to ~250 words per packet:
+# - Reads : one record with up to (depth - 2) reads.
+# - Writes: one record with up to (depth - 3) writes followed by a record reading back the last
+#   written word, used as acknowledge (Etherbone writes are not acknowledged) and flow-control.
+# The Etherbone record FIFOs are store-and-forward, so the records in flight (base addresses +
+# writes/reads) have to fit in the buffer depth.
+#
+# Usage:
+#   ./colorlight_5a_75x.py --with-etherbone --etherbone-bulk --csr-csv=csr.csv --build --load
+#   python3 -m litex_boards.etherbone_bulk --csr-csv=csr.csv --size=0x100000
+
+import os
+import time
+import socket
+import argparse
+
+from litex.tools.remote.comm_udp import CommUDP
+from litex.tools.remote.etherbone import EtherbonePacket, EtherboneRecord
+from litex.tools.remote.etherbone import EtherboneReads, EtherboneWrites
+
+# Constants ----------------------------------------------------------------------------------------
+
+ETHERBONE_BUFFER_DEPTH      =  16 # LiteX's add_etherbone default.
+ETHERBONE_BULK_BUFFER_DEPTH = 256 # Max supported by LiteEth's Etherbone (8-bit record counts).
+
+# CommUDP Bulk -------------------------------------------------------------------------------------
+
+class CommUDPBulk(CommUDP):
+    def __init__(self, buffer_depth=None, retries=10, **kwargs):
+        CommUDP.__init__(self, **kwargs)
+        if buffer_depth is None:
+            constants    = getattr(self, "constants", None)
+            buffer_depth = ETHERBONE_BUFFER_DEPTH if constants is None else \
+                constants.d.get("etherbone_buffer_depth", ETHERBONE_BUFFER_DEPTH)
+        self.buffer_depth = buffer_depth
+        self.retries      = retries
+        self.read_length  = min(buffer_depth - 2, 255) # Base/Return addresses.
+        self.write_length = min(buffer_depth - 3, 255) # Base address + Acknowledge record.
+
+    def _packet(self, record):
+        packet = EtherbonePacket(addr_width=self.addr_width)
+        packet.records = [record]
+        packet.encode()
+        return packet.bytes
+
+    def _request(self, reads_addrs, writes_addr=None, writes_datas=None):
+        for r in range(self.retries):
+            self.read_counter += 1
+
+            # Send writes (when any) and reads (Etherbone handles one record per packet).
+            if writes_datas is not None:
+                record = EtherboneRecord(addr_size=self.addr_width//8)
+                record.writes = EtherboneWrites(addr_size=self.addr_width//8, base_addr=writes_addr, datas=iter(writes_datas))
+                self.socket.sendto(self._packet(record), (self.server, self.port))
+            record = EtherboneRecord(addr_size=self.addr_width//8)
+            record.reads = EtherboneReads(addr_size=self.addr_width//8, addrs=reads_addrs)
+            record.reads.base_ret_addr = self.read_counter
+            self.socket.sendto(self._packet(record), (self.server, self.port))
+
+            # Wait for the response (and ignore late responses to previous requests).
+            while True:
+                try:
+                    datas, dummy = self.socket.recvfrom(8192)
+                except socket.timeout:
+                    if self.debug:
+                        print("socket timeout, retrying ({}/{})".format(r+1, self.retries))
+                    break
+                packet = EtherbonePacket(self.addr_width, datas)
+                packet.decode()
+                record = packet.records.pop()
+                if record.writes.base_addr == self.read_counter:
+                    return record.writes.get_datas()
+        raise socket.timeout
+
+    def read_bulk(self, addr, length):
+        datas = []
+        for offset in range(0, length, self.read_length):
+            n = min(self.read_length, length - offset)
+            datas += self._request(reads_addrs=[addr + 4*(offset + j) for j in range(n)])
+        return datas
+
+    def write_bulk(self, addr, datas):
+        for offset in range(0, len(datas), self.write_length):
+            chunk = datas[offset:offset + self.write_length]
+            base  = addr + 4*offset
+            self._request(reads_addrs=[base + 4*(len(chunk) - 1)], writes_addr=base, writes_datas=chunk)
+
+# Benchmark ----------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Etherbone bulk read/write benchmark.")
+    parser.add_argument("--host",         default="192.168.1.50", help="Etherbone IP address.")
+    parser.add_argument("--port",         default=1234, type=int, help="Etherbone UDP port.")
+    parser.add_argument("--csr-csv",      default="csr.csv",      help="SoC CSV file.")
+    parser.add_argument("--buffer-depth", default=None, type=int, help="Etherbone buffer depth (default: from CSV file).")
+    parser.add_argument("--base",         default=None,           help="Base address (default: main_ram).")
+    parser.add_argument("--size",         default="0x100000",     help="Transfer size in bytes.")
+    args = parser.parse_args()
+
+    bus = CommUDPBulk(
+        server       = args.host,
+        port         = args.port,
+        csr_csv      = args.csr_csv,
+        buffer_depth = args.buffer_depth,
+    )
+    bus.open()
+
+    base   = bus.mems.main_ram.base if args.base is None else int(args.base, 0)
+    length = int(args.size, 0)//4
+    datas  = [int.from_bytes(os.urandom(4), "little") for _ in range(length)]
+    print(f"Etherbone bulk: {length*4} bytes @ 0x{base:08x}, {bus.write_length} writes / {bus.read_length} reads per packet.")
+
+    # Write.
+    start = time.time()
+    bus.write_bulk(base, datas)
+    duration = time.time() - start
+    print(f"Write: {length*4/(duration*1e6):.2f} MB/s")
+
+    # Read.
+    start = time.time()
+    rdatas = bus.read_bulk(base, length)
+    duration = time.time() - start
+    print(f"Read : {length*4/(duration*1e6):.2f} MB/s")
+
+    # Check.
+    errors = sum(w != r for w, r in zip(datas, rdatas))
+    print(f"Errors: {errors}/{length}")
+
+    bus.close()
+
+if __name__ == "__main__":
+    main()
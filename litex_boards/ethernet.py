@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Ethernet MAC configuration.
+#
+# add_ethernet wraps SoC.add_ethernet with the MAC buffering knobs:
+# - RX/TX slots: more RX slots absorb bursts while the CPU is busy, more TX slots let software queue
+#   frames (power of 2).
+# - MTU: the slot size is the MTU rounded up to a power of 2 (2KB for the default 1530 bytes, 16KB
+#   for Jumbo frames with 9022 bytes).
+# - Data width: 8: MAC datapath in the PHY clock domains, 32: MAC datapath in the sys clock domain.
+# Each slot is a Block RAM buffer, so this trades BRAM for network throughput. The RX path can be
+# benchmarked in simulation (frames at line rate, CPU modeled by its per-frame/per-byte cost) to
+# select the configuration of a board.
+#
+# Usage (on the targets with an Ethernet MAC):
+#   ./colorlight_i5.py --with-ethernet --eth-rx-slots=8 --eth-tx-slots=4 --build
+#   python3 -m litex_boards.ethernet --rx-slots=8 --sys-clk-freq=60e6
+
+import math
+import argparse
+from contextlib import contextmanager
+
+# Constants ----------------------------------------------------------------------------------------
+
+ETH_MTU       = 1530 # LiteEth default.
+ETH_JUMBO_MTU = 9022 # 9000 bytes payload + Ethernet header, VLAN tag and CRC.
+
+# Helpers ------------------------------------------------------------------------------------------
+
+@contextmanager
+def _eth_mtu(mtu):
+    # LiteEth sizes the MAC slots from eth_mtu (imported in each module from liteeth.common).
+    import liteeth.mac
+    import liteeth.mac.sram
+    import liteeth.mac.wishbone
+    modules  = [liteeth.mac, liteeth.mac.sram, liteeth.mac.wishbone]
+    eth_mtus = [m.eth_mtu for m in modules]
+    for m in modules:
+        m.eth_mtu = mtu
+    try:
+        yield
+    finally:
+        for m, eth_mtu in zip(modules, eth_mtus):
+            m.eth_mtu = eth_mtu
+
+def _check_slots(nslots):
+    if nslots < 1 or (nslots & (nslots - 1)):
+        raise ValueError(f"Ethernet MAC slots must be a power of 2 (got {nslots}).")
+
+# Ethernet -----------------------------------------------------------------------------------------
+
+def add_ethernet(soc, rx_slots=2, tx_slots=2, mtu=ETH_MTU, **kwargs):
+    _check_slots(rx_slots)
+    _check_slots(tx_slots)
+    assert ETH_MTU <= mtu <= ETH_JUMBO_MTU
+    with _eth_mtu(mtu):
+        soc.add_ethernet(nrxslots=rx_slots, ntxslots=tx_slots, **kwargs)
+
+# Arguments ----------------------------------------------------------------------------------------
+
+def eth_mac_args(parser, data_width=8):
+    parser.add_target_argument("--eth-rx-slots",   default=2,          type=int, help="Ethernet MAC RX slots.")
+    parser.add_target_argument("--eth-tx-slots",   default=2,          type=int, help="Ethernet MAC TX slots.")
+    parser.add_target_argument("--eth-mtu",        default=ETH_MTU,    type=int, help=f"Ethernet MAC MTU (up to {ETH_JUMBO_MTU} for Jumbo frames).")
+    parser.add_target_argument("--eth-data-width", default=data_width, type=int, help="Ethernet MAC data width (8: PHY clock domains, 32: sys clock domain).", choices=[8, 32])
+
+def eth_mac_argdict(args):
+    return {
+        "eth_rx_slots"   : args.eth_rx_slots,
+        "eth_tx_slots"   : args.eth_tx_slots,
+        "eth_mtu"        : args.eth_mtu,
+        "eth_data_width" : args.eth_data_width,
+    }
+
+# RX Benchmark -------------------------------------------------------------------------------------
+
+def eth_mac_rx_bench(rx_slots=2, mtu=ETH_MTU, frame_size=1514, frames=64,
+    sys_clk_freq         = 100e6,
+    link_speed           = 1e9,
+    cpu_cycles_per_frame = 2000,
+    cpu_cycles_per_byte  = 2):
+    from migen import run_simulation, passive
+    from liteeth.mac.sram import LiteEthMACSRAMWriter
+
+    _check_slots(rx_slots)
+    assert frame_size <= mtu
+    dw = 32
+    with _eth_mtu(mtu):
+        writer = LiteEthMACSRAMWriter(dw=dw, depth=math.ceil(mtu/(dw//8)), nslots=rx_slots)
+    writer.specials += writer.mems # Exposed on the bus by the Wishbone interface in the MAC.
+
+    beats           = math.ceil(frame_size/(dw//8))
+    last_bytes      = frame_size - (beats - 1)*(dw//8)
+    overhead_bytes  = 8 + 4 + 12 # Preamble + CRC + Inter-Frame Gap.
+    bytes_per_cycle = link_speed/8/sys_clk_freq
+    results         = {"received": 0, "bytes": 0}
+
+    def phy():
+        # Frames back-to-back at line rate.
+        cycles = 0
+        credit = 0
+        for n in range(frames):
+            for i in range(beats):
+                while credit < (dw//8):
+                    yield writer.sink.valid.eq(0)
+                    yield
+                    credit += bytes_per_cycle
+                    cycles += 1
+                yield writer.sink.valid.eq(1)
+                yield writer.sink.data.eq(n)
+                yield writer.sink.last.eq(i == beats - 1)
+                yield writer.sink.last_be.eq((1 << (last_bytes - 1)) if i == beats - 1 else 0)
+                yield
+                credit += bytes_per_cycle - (dw//8)
+                cycles += 1
+            credit -= overhead_bytes
+        yield writer.sink.valid.eq(0)
+        # Wait for the CPU to handle all the received frames.
+        while results["received"] + (yield writer._errors.status) < frames:
+            yield
+            cycles += 1
+        results["dropped"] = (yield writer._errors.status)
+        results["cycles"]  = cycles
+
+    @passive
+    def cpu():
+        # Interrupt/stack + copy of each frame, then release of the slot.
+        while True:
+            if (yield writer.ev.available.trigger):
+                length = (yield writer._length.status)
+                for _ in range(cpu_cycles_per_frame + length*cpu_cycles_per_byte):
+                    yield
+                results["received"] += 1
+                results["bytes"]    += length
+                yield writer.ev.pending.r.eq(1)
+                yield writer.ev.pending.re.eq(1)
+                yield
+                yield writer.ev.pending.re.eq(0)
+            yield
+
+    run_simulation(writer, [phy(), cpu()])
+    results["throughput"] = results["bytes"]*8*sys_clk_freq/results["cycles"]
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="Ethernet MAC RX throughput benchmark (simulation).")
+    parser.add_argument("--rx-slots",             default=2,       type=int,   help="MAC RX slots.")
+    parser.add_argument("--mtu",                  default=ETH_MTU, type=int,   help="MAC MTU.")
+    parser.add_argument("--frame-size",           default=1514,    type=int,   help="Frame size (without preamble/CRC).")
+    parser.add_argument("--frames",               default=64,      type=int,   help="Number of frames.")
+    parser.add_argument("--sys-clk-freq",         default=100e6,   type=float, help="System clock frequency.")
+    parser.add_argument("--link-speed",           default=1e9,     type=float, help="Link speed (bits/s).")
+    parser.add_argument("--cpu-cycles-per-frame", default=2000,    type=int,   help="CPU cycles per frame (interrupt, stack).")
+    parser.add_argument("--cpu-cycles-per-byte",  default=2,       type=int,   help="CPU cycles per byte (copy).")
+    args = parser.parse_args()
+
+    r = eth_mac_rx_bench(
+        rx_slots             = args.rx_slots,
+        mtu                  = args.mtu,
+        frame_size           = args.frame_size,
+        frames               = args.frames,
+        sys_clk_freq         = args.sys_clk_freq,
+        link_speed           = args.link_speed,
+        cpu_cycles_per_frame = args.cpu_cycles_per_frame,
+        cpu_cycles_per_byte  = args.cpu_cycles_per_byte,
+    )
+    print(f"RX: {r['received']}/{args.frames} frames received ({r['dropped']} dropped), {r['throughput']/1e6:.1f} Mbit/s.")
+
+if __name__ == "__main__":
+    main()
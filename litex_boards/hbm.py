@@ -0,0 +1,292 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# UltraScale+ HBM2 (Alveo U280, FK33).
+#
+# get_hbm_ip generates the HBM2 IP locally (Vivado create_ip script) from parameters, USPHBM2IP
+# instantiates it, and add_hbm connects its AXI ports (Pseudo-Channels, 256MB each) to the SoC:
+# - axi-lite: (up to) four ports directly on the SoC bus (single beat accesses).
+# - axi: all ports behind an AXI crossbar with burst support: the SoC bus accesses the first 1GB
+#   (remapped to HBM address 0), DMAs (AXIDMAWriter/AXIDMAReader, soc.hbm_dma_writer/reader) the
+#   full HBM. The SoC and the DMAs see the same HBM addresses (SoC: 0x4000_0000 + HBM address).
+#
+# Usage (on the target):
+#   ./xilinx_alveo_u280.py --with-hbm --hbm-interconnect=axi --hbm-ports=32 --with-pcie --build
+
+import os
+import hashlib
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+from litex.soc.interconnect.axi import *
+from litex.soc.integration.soc import SoCRegion
+from litex.soc.cores.ram.xilinx_usp_hbm2 import USPHBM2
+
+# HBM2 IP ------------------------------------------------------------------------------------------
+
+def default_ip_cache_dir():
+    return os.environ.get("LITEX_BOARDS_IP_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "litex-boards", "ip"))
+
+def get_hbm_ip(device, ip_name="hbm_0", ports=32, axi_clk_freq=250e6, ref_clk_freq=100e6, apb_clk_freq=100e6,
+    stacks    = 2,
+    cache_dir = None):
+    # HBM2 IP generated locally (Vivado create_ip script) from parameters. Scripts are stored in a
+    # content-addressed cache (shared between builds, a script is only written when the
+    # configuration changes) that is also used as Vivado's IP cache: IP outputs are only
+    # generated/synthesized when the configuration changes.
+    cache_dir = os.path.abspath(cache_dir or default_ip_cache_dir())
+    config = {
+        "USER_HBM_DENSITY"   : f"{4*stacks}GB",
+        "USER_HBM_STACK"     : f"{stacks}",
+        "USER_AXI_CLK_FREQ"  : f"{axi_clk_freq/1e6:g}",
+        "USER_AXI_CLK1_FREQ" : f"{axi_clk_freq/1e6:g}",
+        "USER_CLK_SEL_LIST0" : "AXI_00_ACLK",
+        "USER_CLK_SEL_LIST1" : "AXI_16_ACLK" if ports > 16 else "AXI_00_ACLK",
+    }
+    for i in range(stacks):
+        config[f"USER_HBM_REF_CLK_{i}"]       = f"{ref_clk_freq/1e6:g}"
+        config[f"USER_APB_PCLK_{i}"]          = f"{apb_clk_freq/1e6:g}"
+        config[f"USER_SWITCH_ENABLE_{i:02d}"] = "TRUE"
+    for i in range(8*stacks):
+        config[f"USER_MC_ENABLE_{i:02d}"] = "TRUE"
+    for i in range(16*stacks):
+        config[f"USER_SAXI_{i:02d}"] = "true" if i < ports else "false"
+    key = hashlib.sha256(repr((device, ip_name, sorted(config.items()))).encode()).hexdigest()[:16]
+    tcl = [
+        f"config_ip_cache -use_cache_location {{{os.path.join(cache_dir, 'vivado')}}}",
+        f"create_ip -vendor xilinx.com -library ip -name hbm -module_name {ip_name}",
+        "set_property -dict [list \\",
+        *[f"    CONFIG.{k} {{{v}}} \\" for k, v in config.items()],
+        f"] [get_ips {ip_name}]",
+        f"generate_target all [get_ips {ip_name}]",
+        f"synth_ip [get_ips {ip_name}]",
+    ]
+    filename = os.path.join(cache_dir, key, ip_name + ".tcl")
+    if not os.path.exists(filename):
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        with open(filename + ".tmp", "w") as f:
+            f.write("\n".join(tcl) + "\n")
+        os.replace(filename + ".tmp", filename)
+    return filename
+
+class USPHBM2IP(USPHBM2):
+    def __init__(self, platform, ip_filename, ports=32, **kwargs):
+        self.ip_filename = ip_filename
+        self.ports       = ports
+        USPHBM2.__init__(self, platform, **kwargs)
+
+    def add_sources(self, platform):
+        platform.add_ip(self.ip_filename)
+
+    def do_finalize(self):
+        # Only connect the AXI ports enabled in the IP.
+        for k in list(self.hbm_params.keys()):
+            if k[2:6] == "AXI_" and int(k[6:8]) >= self.ports:
+                del self.hbm_params[k]
+        USPHBM2.do_finalize(self)
+
+# AXI DMAs -----------------------------------------------------------------------------------------
+
+def _add_axi_dma_csr(dma):
+    # base/length/enable/loop control and done/offset status CSRs (same names as LiteDRAM DMAs).
+    dma._base   = CSRStorage(64)
+    dma._length = CSRStorage(32)
+    dma._enable = CSRStorage()
+    dma._done   = CSRStatus()
+    dma._loop   = CSRStorage()
+    dma._offset = CSRStatus(32)
+    dma.comb += [
+        dma.base.eq(dma._base.storage),
+        dma.length.eq(dma._length.storage),
+        dma.enable.eq(dma._enable.storage),
+        dma.loop.eq(dma._loop.storage),
+        dma._done.status.eq(dma.done),
+        dma._offset.status.eq(dma.offset),
+    ]
+
+class AXIDMAWriter(LiteXModule):
+    """Write a stream to AXI memory with INCR bursts (base/length in bytes, burst aligned).
+
+    Up to outstanding bursts are in flight; done is only set once all the bursts are acknowledged
+    (write responses received).
+    """
+    def __init__(self, axi, burst_length=16, outstanding=4, with_csr=True):
+        self.axi    = axi
+        self.sink   = sink = stream.Endpoint([("data", axi.data_width)])
+        self.base   = Signal(64)
+        self.length = Signal(32)
+        self.enable = Signal()
+        self.done   = Signal()
+        self.loop   = Signal()
+        self.offset = Signal(32)
+
+        # # #
+
+        burst_bytes = burst_length*axi.data_width//8
+        beat        = Signal(max=burst_length)
+
+        # Bursts in flight (address accepted, write response not received). Not cleared on disable:
+        # responses of the bursts already issued are still received.
+        pending = Signal(max=outstanding + 1)
+        self.sync += pending.eq(pending + (axi.aw.valid & axi.aw.ready) - (axi.b.valid & axi.b.ready))
+
+        self.comb += [
+            axi.aw.addr.eq(self.base + self.offset),
+            axi.aw.burst.eq(0b01), # INCR.
+            axi.aw.len.eq(burst_length - 1),
+            axi.aw.size.eq(log2_int(axi.data_width//8)),
+            axi.w.data.eq(sink.data),
+            axi.w.strb.eq(2**(axi.data_width//8) - 1),
+            axi.w.last.eq(beat == (burst_length - 1)),
+            axi.b.ready.eq(1),
+        ]
+
+        self.fsm = fsm = ResetInserter()(FSM(reset_state="IDLE"))
+        self.comb += fsm.reset.eq(~self.enable)
+        fsm.act("IDLE",
+            NextValue(self.offset, 0),
+            NextState("AW"),
+        )
+        fsm.act("AW",
+            axi.aw.valid.eq(pending < outstanding),
+            If(axi.aw.valid & axi.aw.ready,
+                NextValue(beat, 0),
+                NextState("W"),
+            )
+        )
+        fsm.act("W",
+            axi.w.valid.eq(sink.valid),
+            sink.ready.eq(axi.w.ready),
+            If(axi.w.valid & axi.w.ready,
+                NextValue(beat, beat + 1),
+                If(axi.w.last,
+                    NextValue(self.offset, self.offset + burst_bytes),
+                    NextState("NEXT"),
+                )
+            )
+        )
+        fsm.act("NEXT",
+            If(self.offset >= self.length,
+                If(self.loop,
+                    NextValue(self.offset, 0),
+                    NextState("AW"),
+                ).Else(
+                    NextState("DONE"),
+                )
+            ).Else(
+                NextState("AW"),
+            )
+        )
+        fsm.act("DONE", self.done.eq(pending == 0))
+
+        if with_csr:
+            _add_axi_dma_csr(self)
+
+class AXIDMAReader(LiteXModule):
+    """Read AXI memory to a stream with INCR bursts, up to outstanding bursts in flight."""
+    def __init__(self, axi, burst_length=16, outstanding=4, with_csr=True):
+        self.axi    = axi
+        self.source = source = stream.Endpoint([("data", axi.data_width)])
+        self.base   = Signal(64)
+        self.length = Signal(32)
+        self.enable = Signal()
+        self.done   = Signal()
+        self.loop   = Signal()
+        self.offset = Signal(32)
+
+        # # #
+
+        burst_bytes = burst_length*axi.data_width//8
+        depth       = burst_length*outstanding
+
+        # Read data is buffered: bursts are only requested when their data fits in the FIFO.
+        self.fifo = fifo = stream.SyncFIFO([("data", axi.data_width)], depth, buffered=True)
+        reserved  = Signal(max=depth + 1)
+        ar_done   = Signal()
+        self.sync += reserved.eq(reserved +
+            Mux(axi.ar.valid & axi.ar.ready, burst_length, 0) -
+            (fifo.source.valid & fifo.source.ready))
+        self.comb += [
+            axi.ar.valid.eq(self.enable & ~ar_done & (reserved <= (depth - burst_length))),
+            axi.ar.addr.eq(self.base + self.offset),
+            axi.ar.burst.eq(0b01), # INCR.
+            axi.ar.len.eq(burst_length - 1),
+            axi.ar.size.eq(log2_int(axi.data_width//8)),
+            axi.r.ready.eq(1),
+            fifo.sink.valid.eq(axi.r.valid),
+            fifo.sink.data.eq(axi.r.data),
+            fifo.source.connect(source),
+            self.done.eq(ar_done & (reserved == 0)),
+        ]
+        self.sync += [
+            If(~self.enable,
+                self.offset.eq(0),
+                ar_done.eq(0),
+            ).Elif(axi.ar.valid & axi.ar.ready,
+                self.offset.eq(self.offset + burst_bytes),
+                If((self.offset + burst_bytes) >= self.length,
+                    If(self.loop,
+                        self.offset.eq(0),
+                    ).Else(
+                        ar_done.eq(1),
+                    )
+                )
+            )
+        ]
+
+        if with_csr:
+            _add_axi_dma_csr(self)
+
+# Add HBM ------------------------------------------------------------------------------------------
+
+def add_hbm(soc, ports=4, interconnect="axi-lite", ip_cache_dir=None, with_dma=False, origin=0x4000_0000):
+    assert interconnect in ["axi-lite", "axi"]
+    assert (not with_dma) or (interconnect == "axi")
+    platform = soc.platform
+
+    # HBM Core (IP generated locally, see get_hbm_ip).
+    ports  = ports if interconnect == "axi" else min(ports, 4)
+    hbm_ip = get_hbm_ip(platform.device, ports=ports, axi_clk_freq=soc.sys_clk_freq, cache_dir=ip_cache_dir)
+    soc.hbm = hbm = ClockDomainsRenamer({"axi": "sys"})(USPHBM2IP(platform, hbm_ip, ports=ports))
+
+    # AXI-Lite: Connect (up to) four of the HBM's AXI interfaces to the main bus of the SoC (single
+    # beat accesses).
+    if interconnect == "axi-lite":
+        for i in range(ports):
+            axi_hbm      = hbm.axi[i]
+            axi_lite_hbm = AXILiteInterface(data_width=256, address_width=33)
+            soc.submodules += AXILite2AXI(axi_lite_hbm, axi_hbm)
+            soc.bus.add_slave(f"hbm{i}", axi_lite_hbm, SoCRegion(origin=origin + 0x1000_0000*i, size=0x1000_0000)) # 256MB.
+
+    # AXI: HBM's AXI interfaces (Pseudo-Channels, 256MB each) behind an AXI crossbar with burst
+    # support: the SoC bus accesses the first 1GB, DMAs (hbm_masters) the full HBM.
+    if interconnect == "axi":
+        assert ports in [1, 2, 4, 8, 16, 32]
+        size    = min(ports, 4)*0x1000_0000
+        axi_bus = AXIInterface(data_width=256, address_width=32, id_width=6)
+        axi_soc = AXIInterface(data_width=256, address_width=32, id_width=6)
+        soc.bus.add_slave("hbm", axi_bus, SoCRegion(origin=origin, size=size))
+        # SoC addresses are not remapped by the SoC bus: remove the region origin, so the SoC
+        # accesses HBM address 0 (Pseudo-Channel 0) at origin, as the DMAs do.
+        soc.submodules += AXIRemapper(axi_bus, axi_soc, origin=0, size=size)
+        soc.hbm_masters = [axi_soc]
+        if with_dma:
+            soc.hbm_dma_writer = AXIDMAWriter(AXIInterface(data_width=256, address_width=33, id_width=6))
+            soc.hbm_dma_reader = AXIDMAReader(AXIInterface(data_width=256, address_width=33, id_width=6))
+            soc.hbm_masters += [soc.hbm_dma_writer.axi, soc.hbm_dma_reader.axi]
+        # Pseudo-Channel selected by HBM address bits [28:33] (decoder addresses are in 256-bit words).
+        soc.hbm_xbar = AXICrossbar(
+            masters = soc.hbm_masters,
+            slaves  = [(lambda a, i=i: a[28-5:33-5] == i, hbm.axi[i]) for i in range(ports)])
+
+    # Link HBM2 channel 0 as main RAM
+    soc.bus.add_region("main_ram", SoCRegion(origin=origin, size=0x1000_0000, linker=True)) # 256MB.
+
+    return hbm
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Static index of litex_boards.platforms.
+#
+# Platforms are described by an AST scan of their sources (no import, so no vendor platform classes
+# are pulled in): device(s), vendor/family, default toolchain, default clock, resources (from _io*)
+# and connectors (from _connectors*). The index is stored in index.json (regenerated with
+# "python3 -m litex_boards.index --update"); entries whose source changed since generation are
+# re-scanned on load, so queries are always consistent with the tree.
+#
+# Usage:
+#   from litex_boards.index import find_platforms
+#   find_platforms(vendor="xilinx", resources=["pcie_x8", "ddram"])
+#
+#   python3 -m litex_boards.index --vendor=lattice --resource=ddram
+
+import os
+import ast
+import json
+import hashlib
+import argparse
+
+# Index --------------------------------------------------------------------------------------------
+
+INDEX_VERSION  = 1
+platforms_dir  = os.path.join(os.path.dirname(__file__), "platforms")
+index_filename = os.path.join(os.path.dirname(__file__), "index.json")
+
+# AST Helpers --------------------------------------------------------------------------------------
+
+def _eval_number(node):
+    # Evaluate simple constant expressions (ex: 1e9/100e6).
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return -_eval_number(node.operand)
+    if isinstance(node, ast.BinOp):
+        ops = {
+            ast.Add  : lambda a, b: a + b,
+            ast.Sub  : lambda a, b: a - b,
+            ast.Mult : lambda a, b: a * b,
+            ast.Div  : lambda a, b: a / b,
+            ast.Pow  : lambda a, b: a ** b,
+        }
+        if type(node.op) in ops:
+            return ops[type(node.op)](_eval_number(node.left), _eval_number(node.right))
+    raise ValueError
+
+def _eval_strings(node, env={}, depth=0):
+    # Return the possible string values of an expression: constants, dicts/lists of constants and
+    # subscripts of these, concatenations/f-strings (all combinations) and names resolved through
+    # env (name -> list of possible value nodes).
+    if depth > 8:
+        return []
+    def _eval(n):
+        return _eval_strings(n, env, depth + 1)
+    def _concat(parts):
+        values = [""]
+        for part in parts:
+            values = [a + b for a in values for b in part][:64]
+        return values
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return [node.value]
+    if isinstance(node, ast.Constant) and isinstance(node.value, int) and (depth > 0):
+        return [str(node.value)] # Formatted/concatenated integers (ex: f"xc7a{kgates}t...").
+    if (isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub) and
+        isinstance(node.operand, ast.Constant) and isinstance(node.operand.value, int) and (depth > 0)):
+        return [str(-node.operand.value)] # Negative integers (ex: f"xc7a100t{speedgrade}...").
+    if isinstance(node, ast.JoinedStr):
+        return _concat([_eval(v.value) if isinstance(v, ast.FormattedValue) else _eval(v) for v in node.values])
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return _concat([_eval(node.left), _eval(node.right)])
+    if isinstance(node, ast.Dict):
+        return [s for v in node.values for s in _eval(v)]
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [s for v in node.elts for s in _eval(v)]
+    if (isinstance(node, ast.Subscript) and
+        isinstance(node.value, ast.Call) and
+        isinstance(node.value.func, ast.Attribute) and
+        node.value.func.attr == "split"):
+        # Field of a split string (ex: variant.split("-")[-1]).
+        try:
+            field = int(_eval_number(node.slice))
+        except ValueError:
+            return []
+        sep    = node.value.args[0].value if node.value.args and isinstance(node.value.args[0], ast.Constant) else None
+        values = []
+        for value in _eval(node.value.func.value):
+            try:
+                values.append(value.split(sep)[field])
+            except IndexError:
+                pass
+        return values
+    if isinstance(node, ast.Subscript):
+        return _eval(node.value)
+    if isinstance(node, ast.IfExp):
+        return _eval(node.body) + _eval(node.orelse)
+    if isinstance(node, ast.Name):
+        return [s for v in env.get(node.id, []) for s in _eval(v)]
+    return []
+
+def _resource_names(node):
+    # Names of ("name", number, ...) entries in a list.
+    names = []
+    if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add):
+        return _resource_names(node.left) + _resource_names(node.right)
+    if isinstance(node, (ast.List, ast.Tuple)):
+        for elt in node.elts:
+            if isinstance(elt, ast.Tuple) and elt.elts:
+                name = elt.elts[0]
+                if isinstance(name, ast.Constant) and isinstance(name.value, str):
+                    names.append(name.value)
+    return names
+
+def _unique(l):
+    return sorted(set(l))
+
+# Platform Scan ------------------------------------------------------------------------------------
+
+def scan_platform(filename):
+    with open(filename, "rb") as f:
+        source = f.read()
+    tree = ast.parse(source, filename)
+    name = os.path.splitext(os.path.basename(filename))[0]
+    info = {
+        "name"               : name,
+        "sha256"             : hashlib.sha256(source).hexdigest(),
+        "vendor"             : None,
+        "family"             : None,
+        "devices"            : [],
+        "toolchain"          : None,
+        "parameters"         : {},
+        "default_clk_name"   : None,
+        "default_clk_period" : None,
+        "default_clk_freq"   : None,
+        "resources"          : [],
+        "connectors"         : [],
+    }
+
+    # Imported names -> vendor (litex.build.<vendor>).
+    vendors = {}
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module and node.module.startswith("litex.build."):
+            for alias in node.names:
+                vendors[alias.asname or alias.name] = node.module.split(".")[2]
+
+    module_assigns = {}
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            for target in node.targets:
+                if isinstance(target, ast.Name):
+                    module_assigns.setdefault(target.id, []).append(node.value)
+
+    # IOs / Connectors: _io*/_connectors* lists, at module level or built in functions (ex: _get_io()).
+    resources  = []
+    connectors = []
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Assign, ast.AugAssign)):
+            for target in getattr(node, "targets", [getattr(node, "target", None)]):
+                if isinstance(target, ast.Name) and target.id.startswith("_io"):
+                    resources += _resource_names(node.value)
+                if isinstance(target, ast.Name) and target.id.startswith("_connectors"):
+                    connectors += _resource_names(node.value)
+
+    for node in tree.body:
+        # Platform.
+        if isinstance(node, ast.ClassDef) and node.name == "Platform":
+            for base in node.bases:
+                if isinstance(base, ast.Name):
+                    info["family"] = base.id
+                    info["vendor"] = vendors.get(base.id, None)
+            for item in node.body:
+                if isinstance(item, ast.Assign):
+                    for target in item.targets:
+                        if not isinstance(target, ast.Name):
+                            continue
+                        if target.id == "default_clk_name":
+                            info["default_clk_name"] = (_eval_strings(item.value) + [None])[0]
+                        if target.id in ["default_clk_period", "default_clk_freq"]:
+                            try:
+                                info[target.id] = _eval_number(item.value)
+                            except ValueError:
+                                pass
+                if isinstance(item, ast.FunctionDef) and item.name == "__init__":
+                    # Parameters (ex: variant, revision, toolchain) and their defaults.
+                    args     = item.args.args[1:]
+                    defaults = [None]*(len(args) - len(item.args.defaults)) + item.args.defaults
+                    for arg, default in zip(args, defaults):
+                        try:
+                            info["parameters"][arg.arg] = ast.literal_eval(default) if default is not None else None
+                        except ValueError:
+                            info["parameters"][arg.arg] = None
+                    info["toolchain"] = info["parameters"].get("toolchain", None)
+
+                    # Device(s): first argument of <VendorPlatform>.__init__(self, device, ...),
+                    # resolved through parameters (default or asserted values) and assignments.
+                    env = {k: list(v) for k, v in module_assigns.items()}
+                    for arg, default in zip(args, defaults):
+                        if default is not None:
+                            env[arg.arg] = [default]
+                    for sub in ast.walk(item):
+                        if isinstance(sub, ast.Assign):
+                            for target in sub.targets:
+                                if isinstance(target, ast.Name):
+                                    env[target.id] = env.get(target.id, []) + [sub.value]
+                        if (isinstance(sub, ast.Assert) and
+                            isinstance(sub.test, ast.Compare) and
+                            isinstance(sub.test.left, ast.Name) and
+                            isinstance(sub.test.ops[0], ast.In) and
+                            isinstance(sub.test.comparators[0], (ast.List, ast.Tuple))):
+                            env[sub.test.left.id] = [sub.test.comparators[0]]
+                    for sub in ast.walk(item):
+                        if (isinstance(sub, ast.Call) and
+                            isinstance(sub.func, ast.Attribute) and
+                            sub.func.attr == "__init__" and
+                            len(sub.args) >= 2):
+                            info["devices"] += _eval_strings(sub.args[1], env)
+                            for keyword in sub.keywords:
+                                if keyword.arg == "toolchain" and info["toolchain"] is None:
+                                    info["toolchain"] = (_eval_strings(keyword.value, env) + [None])[0]
+
+    if info["default_clk_freq"] is None and info["default_clk_period"]:
+        info["default_clk_freq"] = 1e9/info["default_clk_period"]
+    if info["default_clk_freq"] is not None:
+        info["default_clk_freq"] = round(info["default_clk_freq"], 3) # Float noise of 1e9/period.
+    info["devices"]    = _unique(info["devices"])
+    info["resources"]  = _unique(resources)
+    info["connectors"] = _unique(connectors)
+    return info
+
+def platform_filenames():
+    return sorted(
+        os.path.join(platforms_dir, f) for f in os.listdir(platforms_dir)
+        if f.endswith(".py") and f != "__init__.py")
+
+def generate_index():
+    return {
+        "version"   : INDEX_VERSION,
+        "platforms" : {info["name"]: info for info in map(scan_platform, platform_filenames())},
+    }
+
+def write_index(filename=index_filename):
+    with open(filename, "w") as f:
+        json.dump(generate_index(), f, indent=1, sort_keys=True)
+        f.write("\n")
+
+# Query API ----------------------------------------------------------------------------------------
+
+_index = None
+
+def load_index(filename=index_filename):
+    # Load stored index and re-scan entries that are missing or whose source changed.
+    global _index
+    if _index is not None:
+        return _index
+    platforms = {}
+    if os.path.exists(filename):
+        with open(filename, "r") as f:
+            stored = json.load(f)
+        if stored.get("version", None) == INDEX_VERSION:
+            platforms = stored["platforms"]
+    index = {}
+    for filename in platform_filenames():
+        name = os.path.splitext(os.path.basename(filename))[0]
+        with open(filename, "rb") as f:
+            sha256 = hashlib.sha256(f.read()).hexdigest()
+        info = platforms.get(name, None)
+        if (info is None) or (info["sha256"] != sha256):
+            info = scan_platform(filename)
+        index[name] = info
+    _index = {"version": INDEX_VERSION, "platforms": index}
+    return _index
+
+def get_platform(name):
+    return load_index()["platforms"][name]
+
+def find_platforms(vendor=None, family=None, device=None, toolchain=None, resources=[], connectors=[]):
+    # Filter platforms; device is a case-insensitive substring match, resources/connectors must all
+    # be present.
+    matches = []
+    for name, info in sorted(load_index()["platforms"].items()):
+        if vendor is not None and info["vendor"] != vendor:
+            continue
+        if family is not None and info["family"] != family:
+            continue
+        if device is not None and not any(device.lower() in d.lower() for d in info["devices"]):
+            continue
+        if toolchain is not None and info["toolchain"] != toolchain:
+            continue
+        if not set(resources).issubset(info["resources"]):
+            continue
+        if not set(connectors).issubset(info["connectors"]):
+            continue
+        matches.append(info)
+    return matches
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteX-Boards platforms index.")
+    parser.add_argument("--update",    action="store_true",            help="Regenerate index.json.")
+    parser.add_argument("--vendor",    default=None,                   help="Filter on vendor (ex: xilinx, lattice).")
+    parser.add_argument("--family",    default=None,                   help="Filter on platform family (ex: XilinxUSPPlatform).")
+    parser.add_argument("--device",    default=None,                   help="Filter on device (substring).")
+    parser.add_argument("--toolchain", default=None,                   help="Filter on default toolchain.")
+    parser.add_argument("--resource",  default=[], action="append",    help="Filter on resource (can be repeated).")
+    parser.add_argument("--connector", default=[], action="append",    help="Filter on connector (can be repeated).")
+    parser.add_argument("--json",      action="store_true",            help="Output matching entries as JSON.")
+    args = parser.parse_args()
+
+    if args.update:
+        write_index()
+        return
+
+    matches = find_platforms(
+        vendor     = args.vendor,
+        family     = args.family,
+        device     = args.device,
+        toolchain  = args.toolchain,
+        resources  = args.resource,
+        connectors = args.connector)
+    if args.json:
+        print(json.dumps(matches, indent=4))
+    else:
+        for info in matches:
+            clk = f"{info['default_clk_name']}@{info['default_clk_freq']/1e6:g}MHz" if info["default_clk_freq"] else "-"
+            print(f"{info['name']:40s} {info['vendor'] or '-':12s} {','.join(info['devices']) or '-':40s} {clk}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# LitePCIe user-space programs.
+#
+# add_litepcie_program adds a program to the user-space tools of a LitePCIe driver generated by
+# litepcie.software.generate_litepcie_software (dst): the source is written to dst/user, built and
+# linked with liblitepcie by the driver Makefile. Programs include litepcie_csr.h (installed with
+# them) for their CSR accesses.
+
+import os
+
+# CSR helpers --------------------------------------------------------------------------------------
+
+_csr_h = """/* SPDX-License-Identifier: BSD-2-Clause
+ *
+ * LitePCIe CSR helpers (generated by LiteX-Boards).
+ *
+ */
+
+#ifndef __LITEPCIE_CSR_H
+#define __LITEPCIE_CSR_H
+
+#include <stdint.h>
+#include "liblitepcie.h"
+
+/* Multi-word CSRs are MSB first, size in 32-bit words (CSR_*_SIZE). */
+
+static inline void csr_write(int fd, uint32_t addr, int size, uint64_t value)
+{
+    for (int i = 0; i < size; i++)
+        litepcie_writel(fd, addr + 4*i, (uint32_t)(value >> (32*(size - 1 - i))));
+}
+
+static inline uint64_t csr_read(int fd, uint32_t addr, int size)
+{
+    uint64_t value = 0;
+    for (int i = 0; i < size; i++)
+        value = (value << 32) | litepcie_readl(fd, addr + 4*i);
+    return value;
+}
+
+#endif /* __LITEPCIE_CSR_H */
+"""
+
+_make_rule = """
+{name}: liblitepcie/liblitepcie.a {name}.o
+	$(CC) $(LDFLAGS) -o $@ $^ -Lliblitepcie -llitepcie
+"""
+
+# Programs -----------------------------------------------------------------------------------------
+
+def add_litepcie_program(dst, name, source):
+    # Write name.c (and litepcie_csr.h) to dst/user and add name to the Makefile programs.
+    user_dir = os.path.join(dst, "user")
+    with open(os.path.join(user_dir, "litepcie_csr.h"), "w") as f:
+        f.write(_csr_h)
+    with open(os.path.join(user_dir, f"{name}.c"), "w") as f:
+        f.write(source)
+    with open(os.path.join(user_dir, "Makefile"), "r") as f:
+        makefile = f.read()
+    if f"PROGS+={name}\n" not in makefile:
+        makefile = makefile.replace("\nall: $(PROGS)", f"PROGS+={name}\n\nall: $(PROGS)", 1)
+        makefile = makefile + _make_rule.format(name=name)
+        with open(os.path.join(user_dir, "Makefile"), "w") as f:
+            f.write(makefile)
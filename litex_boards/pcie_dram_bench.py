@@ -0,0 +1,288 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# PCIe <-> DRAM/HBM DMA benchmark.
+#
+# Gateware: connects a LitePCIe DMA to memory DMAs (Host -> Memory through a writer, Memory -> Host
+# through a reader) and measures each direction (cycles between first and last data beat, bytes)
+# over CSRs. Memory DMAs are expected to have base/length/enable/done/loop CSRs, base/length in bytes
+# (LiteDRAMDMAWriter/Reader with add_csr or equivalent).
+#
+# Software: generate_pcie_dram_bench_software adds a litepcie_dram_bench program to the LitePCIe
+# driver generated by litepcie.software.generate_litepcie_software.
+#
+# Usage (on the target):
+#   ./xilinx_kcu105.py --with-pcie --with-pcie-dram-bench --driver --build
+#   cd build/xilinx_kcu105/driver/user && make && ./litepcie_dram_bench -s 0x4000000
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+
+from litex_boards.litepcie_software import add_litepcie_program
+
+# PCIe DRAM Bench ----------------------------------------------------------------------------------
+
+class PCIeDRAMBench(LiteXModule):
+    def __init__(self, dma, writer, reader):
+        self.writer_cycles = CSRStatus(64, description="Host -> Memory cycles (first to last beat).")
+        self.writer_bytes  = CSRStatus(64, description="Host -> Memory bytes.")
+        self.reader_cycles = CSRStatus(64, description="Memory -> Host cycles (first to last beat).")
+        self.reader_bytes  = CSRStatus(64, description="Memory -> Host bytes.")
+
+        # # #
+
+        dma_data_width = len(dma.source.data)
+        mem_data_width = len(writer.sink.data)
+
+        # Host -> Memory.
+        self.writer_converter = stream.Converter(dma_data_width, mem_data_width)
+        self.submodules += stream.Pipeline(
+            dma.source,
+            self.writer_converter,
+            writer,
+        )
+
+        # Memory -> Host.
+        self.reader_converter = stream.Converter(mem_data_width, dma_data_width)
+        self.submodules += stream.Pipeline(
+            reader,
+            self.reader_converter,
+            dma.sink,
+        )
+
+        # Counters (cleared when the memory DMA is disabled).
+        for endpoint, enable, cycles, nbytes in [
+            (writer.sink,   writer._enable.storage, self.writer_cycles.status, self.writer_bytes.status),
+            (reader.source, reader._enable.storage, self.reader_cycles.status, self.reader_bytes.status),
+            ]:
+            count  = Signal(64)
+            active = Signal()
+            beat   = Signal()
+            self.comb += beat.eq(endpoint.valid & endpoint.ready)
+            self.sync += [
+                If(~enable,
+                    active.eq(0),
+                    count.eq(0),
+                    cycles.eq(0),
+                    nbytes.eq(0),
+                ).Else(
+                    If(active | beat,
+                        count.eq(count + 1),
+                    ),
+                    If(beat,
+                        active.eq(1),
+                        cycles.eq(count + 1),
+                        nbytes.eq(nbytes + mem_data_width//8),
+                    )
+                )
+            ]
+
+# Software -----------------------------------------------------------------------------------------
+
+_bench_c = """/* SPDX-License-Identifier: BSD-2-Clause
+ *
+ * LitePCIe <-> Memory DMA benchmark (generated by LiteX-Boards).
+ *
+ */
+
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+#include <inttypes.h>
+#include <unistd.h>
+#include "liblitepcie.h"
+#include "litepcie_csr.h"
+#include "soc.h"
+
+#define MEM_WRITER(reg)   CSR_{writer}_##reg
+#define MEM_READER(reg)   CSR_{reader}_##reg
+#define BENCH(reg)        CSR_{bench}_##reg
+#define MEM_WORD_BYTES    {word_bytes} /* Memory word (base alignment). */
+#define TIMEOUT_MS        5000
+
+static char litepcie_device[1024];
+
+static void print_result(const char *name, uint64_t cycles, uint64_t bytes)
+{{
+    double duration = (double)cycles / CONFIG_CLOCK_FREQUENCY;
+    printf("%-16s: %10" PRIu64 " bytes in %10" PRIu64 " cycles: %8.2f Gbps\\n",
+        name, bytes, cycles, duration > 0 ? (double)bytes * 8 / (duration * 1e9) : 0.0);
+}}
+
+/* Host -> Memory */
+/*----------------*/
+
+static int host_to_mem(uint64_t base, uint64_t size)
+{{
+    static struct litepcie_dma_ctrl dma = {{.use_reader = 1, .use_writer = 0, .loopback = 0}};
+    int fd;
+    int64_t end_time;
+    int ret = 0;
+
+    if (litepcie_dma_init(&dma, litepcie_device, 0))
+        exit(1);
+    fd = dma.fds.fd;
+
+    /* Configure memory writer. */
+    csr_write(fd, MEM_WRITER(ENABLE_ADDR), MEM_WRITER(ENABLE_SIZE), 0);
+    csr_write(fd, MEM_WRITER(BASE_ADDR),   MEM_WRITER(BASE_SIZE),   base);
+    csr_write(fd, MEM_WRITER(LENGTH_ADDR), MEM_WRITER(LENGTH_SIZE), size);
+    csr_write(fd, MEM_WRITER(LOOP_ADDR),   MEM_WRITER(LOOP_SIZE),   0);
+    csr_write(fd, MEM_WRITER(ENABLE_ADDR), MEM_WRITER(ENABLE_SIZE), 1);
+
+    /* Stream buffers until the memory writer is done. */
+    dma.reader_enable = 1;
+    end_time = get_time_ms() + TIMEOUT_MS;
+    while (!(csr_read(fd, MEM_WRITER(DONE_ADDR), MEM_WRITER(DONE_SIZE)) & 1)) {{
+        litepcie_dma_process(&dma);
+        while (litepcie_dma_next_write_buffer(&dma) != NULL);
+        if (get_time_ms() > end_time) {{
+            fprintf(stderr, "Host -> Memory: timeout.\\n");
+            ret = -1;
+            break;
+        }}
+    }}
+    dma.reader_enable = 0;
+    litepcie_dma_process(&dma);
+
+    print_result("Host -> Memory",
+        csr_read(fd, BENCH(WRITER_CYCLES_ADDR), BENCH(WRITER_CYCLES_SIZE)),
+        csr_read(fd, BENCH(WRITER_BYTES_ADDR),  BENCH(WRITER_BYTES_SIZE)));
+    csr_write(fd, MEM_WRITER(ENABLE_ADDR), MEM_WRITER(ENABLE_SIZE), 0);
+
+    litepcie_dma_cleanup(&dma);
+    return ret;
+}}
+
+/* Memory -> Host */
+/*----------------*/
+
+static int mem_to_host(uint64_t base, uint64_t size)
+{{
+    static struct litepcie_dma_ctrl dma = {{.use_reader = 0, .use_writer = 1, .loopback = 0}};
+    int fd;
+    int64_t end_time;
+    int ret = 0;
+
+    if (litepcie_dma_init(&dma, litepcie_device, 0))
+        exit(1);
+    fd = dma.fds.fd;
+
+    /* Start receiving buffers, then the memory reader. */
+    dma.writer_enable = 1;
+    litepcie_dma_process(&dma);
+    csr_write(fd, MEM_READER(ENABLE_ADDR), MEM_READER(ENABLE_SIZE), 0);
+    csr_write(fd, MEM_READER(BASE_ADDR),   MEM_READER(BASE_SIZE),   base);
+    csr_write(fd, MEM_READER(LENGTH_ADDR), MEM_READER(LENGTH_SIZE), size);
+    csr_write(fd, MEM_READER(LOOP_ADDR),   MEM_READER(LOOP_SIZE),   0);
+    csr_write(fd, MEM_READER(ENABLE_ADDR), MEM_READER(ENABLE_SIZE), 1);
+
+    /* Receive buffers until all the data has been streamed. */
+    end_time = get_time_ms() + TIMEOUT_MS;
+    while (csr_read(fd, BENCH(READER_BYTES_ADDR), BENCH(READER_BYTES_SIZE)) < size) {{
+        litepcie_dma_process(&dma);
+        while (litepcie_dma_next_read_buffer(&dma) != NULL);
+        if (get_time_ms() > end_time) {{
+            fprintf(stderr, "Memory -> Host: timeout.\\n");
+            ret = -1;
+            break;
+        }}
+    }}
+    dma.writer_enable = 0;
+    litepcie_dma_process(&dma);
+
+    print_result("Memory -> Host",
+        csr_read(fd, BENCH(READER_CYCLES_ADDR), BENCH(READER_CYCLES_SIZE)),
+        csr_read(fd, BENCH(READER_BYTES_ADDR),  BENCH(READER_BYTES_SIZE)));
+    csr_write(fd, MEM_READER(ENABLE_ADDR), MEM_READER(ENABLE_SIZE), 0);
+
+    litepcie_dma_cleanup(&dma);
+    return ret;
+}}
+
+/* Main */
+/*------*/
+
+static void help(void)
+{{
+    printf("LitePCIe <-> Memory DMA benchmark.\\n"
+           "usage: litepcie_dram_bench [options]\\n"
+           "\\n"
+           "options:\\n"
+           "-h                                Help.\\n"
+           "-c device_num                     Select the device (default = 0).\\n"
+           "-b base                           Memory base address (in bytes, default = 0x{default_base:x}).\\n"
+           "-s size                           Transfer size (in bytes, default = 0x{default_size:x}).\\n"
+           "-d direction                      tx (Host -> Memory), rx (Memory -> Host) or both (default).\\n"
+           );
+    exit(1);
+}}
+
+int main(int argc, char **argv)
+{{
+    int c;
+    int device_num = 0;
+    uint64_t base = 0x{default_base:x};
+    uint64_t size = 0x{default_size:x};
+    const char *direction = "both";
+    int ret = 0;
+
+    for (;;) {{
+        c = getopt(argc, argv, "hc:b:s:d:");
+        if (c == -1)
+            break;
+        switch (c) {{
+        case 'c':
+            device_num = atoi(optarg);
+            break;
+        case 'b':
+            base = strtoull(optarg, NULL, 0);
+            break;
+        case 's':
+            size = strtoull(optarg, NULL, 0);
+            break;
+        case 'd':
+            direction = optarg;
+            break;
+        default:
+            help();
+        }}
+    }}
+    snprintf(litepcie_device, sizeof(litepcie_device), "/dev/litepcie%d", device_num);
+
+    if ((size == 0) || (size % DMA_BUFFER_SIZE)) {{
+        fprintf(stderr, "Size must be a non-zero multiple of %d bytes.\\n", DMA_BUFFER_SIZE);
+        exit(1);
+    }}
+    if (base % MEM_WORD_BYTES) {{
+        fprintf(stderr, "Base must be a multiple of %d bytes.\\n", MEM_WORD_BYTES);
+        exit(1);
+    }}
+
+    if (strcmp(direction, "rx") != 0)
+        ret |= host_to_mem(base, size);
+    if (strcmp(direction, "tx") != 0)
+        ret |= mem_to_host(base, size);
+
+    return ret ? 1 : 0;
+}}
+"""
+
+def generate_pcie_dram_bench_software(soc, dst, name="pcie_dram_bench", writer="dram_dma_writer", reader="dram_dma_reader",
+    default_base = 0x1000_0000,
+    default_size = 0x0400_0000):
+    # Add litepcie_dram_bench to the user-space tools of a generated LitePCIe driver (dst).
+    add_litepcie_program(dst, "litepcie_dram_bench", _bench_c.format(
+        writer       = writer.upper(),
+        reader       = reader.upper(),
+        bench        = name.upper(),
+        word_bytes   = len(getattr(soc, writer).sink.data)//8,
+        default_base = default_base,
+        default_size = default_size))
@@ -310,7 +310,7 @@ _io = [
     ),
 
     # QSFP-1.
-    ("qsfp1_refclk_rst", 0, Pins("AU20"), IOStandard("LVCMOS12")),
+    ("qsfp1_refclk_rst", 0, Pins("AR21"), IOStandard("LVCMOS12")),
     ("qsfp1_modsell",    0, Pins("AY20"), IOStandard("LVCMOS12")),
     ("qsfp1_resetl",     0, Pins("BC18"), IOStandard("LVCMOS12")),
     ("qsfp1_modprsl",    0, Pins("BC19"), IOStandard("LVCMOS12")),
@@ -0,0 +1,260 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# PLL/MMCM configuration cache.
+#
+# LiteX's clocking modules (S7PLL/S7MMCM, USMMCM/USPMMCM, ECP5PLL, NXPLL, iCE40PLL, Intel PLLs, Gowin
+# PLLs) search divider/multiplier combinations in compute_config on each elaboration. When enabled,
+# the configurations are stored in a persistent cache, keyed by a hash of the PLL state (input
+# frequency, requested outputs with phases/margins, VCO/PFD/dividers ranges, derived from the
+# device/speedgrade) and of the LiteX source of the solver, and looked up before searching.
+# Configurations that can't be stored (Efinix PLLs configure the toolchain interface instead of
+# returning a configuration) are always computed.
+#
+# Each lookup is recorded (PLL class, hit/miss, duration) and can be written as a JSON report.
+#
+# The cache is never enabled implicitly: it is enabled with enable() (as done by test/sweep.py), or
+# by running a target through this module.
+#
+# Usage:
+#   python3 -m litex_boards.pll_cache litex_boards.targets.digilent_arty --build
+#   python3 -m litex_boards.pll_cache --cache-dir=build/pll_cache --report=pll.json litex_boards.targets.digilent_arty
+#   python3 -m test.sweep targets --pll-cache-dir=build/pll_cache
+
+import os
+import sys
+import json
+import time
+import runpy
+import atexit
+import pkgutil
+import argparse
+import hashlib
+import importlib
+import functools
+
+from migen import Signal
+from migen.fhdl.structure import _Value
+
+from litex.soc.cores.clock.common import compute_config_log
+
+# Helpers ------------------------------------------------------------------------------------------
+
+class _Unserializable(Exception):
+    pass
+
+def _serialize(value, signals):
+    # JSON representation of PLL state/configuration. Signals of the PLL outputs are referenced by
+    # output number, other Signals are anonymous.
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple, range)):
+        return [_serialize(v, signals) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _serialize(v, signals) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, _Value):
+        return {"clkout": signals.get(id(value), None)}
+    raise _Unserializable(type(value).__name__)
+
+def _deserialize(value, signals):
+    if isinstance(value, list):
+        return [_deserialize(v, signals) for v in value]
+    if isinstance(value, dict):
+        if list(value.keys()) == ["clkout"]:
+            return signals[value["clkout"]]
+        return {k: _deserialize(v, signals) for k, v in value.items()}
+    return value
+
+def _clkout_signals(pll):
+    return {id(clkout[0]): n for n, clkout in pll.clkouts.items()}
+
+def _pll_state(pll, signals):
+    state = {}
+    for name, value in sorted(vars(pll).items()):
+        if name.startswith("_") or name in ["logger"]:
+            continue
+        try:
+            state[name] = _serialize(value, signals)
+        except _Unserializable:
+            pass # Submodules, platform, ...: not part of the configuration search.
+    return state
+
+@functools.lru_cache(maxsize=None)
+def _source_hash(filename):
+    with open(filename, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+# PLL Cache ----------------------------------------------------------------------------------------
+
+class PLLCache:
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self.lookups   = []
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, pll, compute_config):
+        signals = _clkout_signals(pll)
+        h = hashlib.sha256()
+        h.update(json.dumps([
+            type(pll).__module__,
+            type(pll).__qualname__,
+            _source_hash(compute_config.__code__.co_filename),
+            _pll_state(pll, signals),
+        ]).encode())
+        return h.hexdigest()
+
+    def load(self, key):
+        filename = os.path.join(self.cache_dir, key + ".json")
+        if not os.path.exists(filename):
+            return None
+        with open(filename, "r") as f:
+            return json.load(f)
+
+    def store(self, key, entry):
+        filename = os.path.join(self.cache_dir, key + ".json")
+        tmp      = f"{filename}.tmp{os.getpid()}"
+        with open(tmp, "w") as f:
+            json.dump(entry, f, indent=4)
+        os.replace(tmp, filename)
+
+    def compute_config(self, compute_config, pll):
+        start = time.time()
+        try:
+            key = self.key(pll, compute_config)
+        except Exception:
+            key = None
+
+        # Hit: restore configuration (and the outputs added by the search, ex ECP5PLL's feedback).
+        entry = None if key is None else self.load(key)
+        if entry is not None:
+            signals = {n: clkout[0] for n, clkout in pll.clkouts.items()}
+            for n, clkout in sorted(entry["clkouts"].items(), key=lambda kv: int(kv[0])):
+                pll.clkouts[int(n)] = (Signal(), *clkout[1:])
+                clk = pll.clkouts[int(n)][0]
+                # Name the Signal as if created by the PLL's search (and not by the cache).
+                clk.backtrace = [b for b in clk.backtrace if b[0] != "pllcache"]
+                signals[int(n)] = clk
+            config = _deserialize(entry["config"], signals)
+            self.record(pll, "hit", start)
+            compute_config_log(pll.logger, config)
+            return config
+
+        # Miss: search and store configuration.
+        clkouts = dict(pll.clkouts)
+        config  = compute_config(pll)
+        if key is None or not isinstance(config, dict):
+            self.record(pll, "uncached", start)
+            return config
+        try:
+            signals = _clkout_signals(pll)
+            entry   = {
+                "pll"     : type(pll).__qualname__,
+                "config"  : _serialize(config, signals),
+                "clkouts" : {n: _serialize(clkout, signals) for n, clkout in pll.clkouts.items() if n not in clkouts},
+            }
+        except _Unserializable:
+            self.record(pll, "uncached", start)
+            return config
+        self.store(key, entry)
+        self.record(pll, "miss", start)
+        return config
+
+    def record(self, pll, status, start):
+        self.lookups.append({
+            "pll"      : type(pll).__qualname__,
+            "status"   : status,
+            "duration" : time.time() - start,
+        })
+
+    def reset(self):
+        self.lookups = []
+
+    def stats(self):
+        return {
+            "lookups"  : len(self.lookups),
+            "hits"     : len([l for l in self.lookups if l["status"] == "hit"]),
+            "misses"   : len([l for l in self.lookups if l["status"] == "miss"]),
+            "uncached" : len([l for l in self.lookups if l["status"] == "uncached"]),
+            "duration" : sum(l["duration"] for l in self.lookups),
+            "details"  : self.lookups,
+        }
+
+    def write_report(self, filename):
+        with open(filename, "w") as f:
+            json.dump(self.stats(), f, indent=4)
+
+# Enable -------------------------------------------------------------------------------------------
+
+_cache   = None
+_patched = {}
+
+def _pll_classes():
+    # Classes defining a compute_config in LiteX's clocking modules.
+    import litex.soc.cores.clock as clock
+    modules = [clock]
+    for info in pkgutil.iter_modules(clock.__path__):
+        try:
+            # Not all modules are imported by litex.soc.cores.clock (ex Gowin).
+            modules.append(importlib.import_module(f"{clock.__name__}.{info.name}"))
+        except Exception:
+            pass
+    classes = []
+    for module in modules:
+        for obj in vars(module).values():
+            if isinstance(obj, type) and "compute_config" in vars(obj) and obj not in classes:
+                classes.append(obj)
+    return classes
+
+def enable(cache_dir, report=None):
+    global _cache
+    cache_dir = os.path.expanduser(cache_dir)
+    if _cache is not None:
+        # Already enabled: only update the directory.
+        os.makedirs(cache_dir, exist_ok=True)
+        _cache.cache_dir = cache_dir
+        return _cache
+    _cache = PLLCache(cache_dir)
+    for cls in _pll_classes():
+        def compute_config(self, _compute_config=vars(cls)["compute_config"]):
+            return _cache.compute_config(_compute_config, self)
+        _patched[cls] = vars(cls)["compute_config"]
+        cls.compute_config = compute_config
+    if report:
+        atexit.register(_cache.write_report, report)
+    return _cache
+
+def disable():
+    # Restore LiteX's compute_config methods.
+    global _cache
+    for cls, compute_config in _patched.items():
+        cls.compute_config = compute_config
+    _patched.clear()
+    _cache = None
+
+def get():
+    return _cache
+
+def reset():
+    if _cache is not None:
+        _cache.reset()
+
+# Run ----------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a LiteX-Boards target with the PLL/MMCM configuration cache enabled.")
+    parser.add_argument("--cache-dir", default=None,             help="Cache directory (default: LITEX_BOARDS_PLL_CACHE_DIR or ~/.cache/litex_boards/pll).")
+    parser.add_argument("--report",    default=None,             help="Write the cache lookups to a JSON file.")
+    parser.add_argument("module",                                help="Target module (ex litex_boards.targets.digilent_arty).")
+    parser.add_argument("args",        nargs=argparse.REMAINDER, help="Target arguments.")
+    args = parser.parse_args()
+
+    cache_dir = args.cache_dir or os.environ.get("LITEX_BOARDS_PLL_CACHE_DIR", "~/.cache/litex_boards/pll")
+    enable(cache_dir, report=args.report)
+    sys.argv = [args.module] + args.args
+    runpy.run_module(args.module, run_name="__main__", alter_sys=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# SATA PHY checks.
+#
+# The targets build LiteSATAPHY with a 16-bit data-width: the PHY datapath is converted to 32-bit
+# and crossed to the sys clock domain, where the LiteSATA core receives one 32-bit word per SATA
+# clk/2 cycle (Gen1: 37.5MHz, Gen2: 75MHz, Gen3: 150MHz). A slower sys_clk can't sustain the link.
+#
+# check_sata_phy is called by the targets' main() with the sys_clk_freq the SoC will use (some targets
+# change it with the enabled features) and reports unsupported combinations as usage errors.
+
+# Constants ----------------------------------------------------------------------------------------
+
+SATA_PHY_MIN_CLK_FREQS = {"gen1": 37.5e6, "gen2": 75e6, "gen3": 150e6}
+
+# Checks -------------------------------------------------------------------------------------------
+
+def check_sata_phy(parser, gen, sys_clk_freq):
+    min_clk_freq = SATA_PHY_MIN_CLK_FREQS[gen]
+    if sys_clk_freq < min_clk_freq:
+        parser.error(f"SATA {gen.capitalize()} requires sys_clk_freq >= {min_clk_freq/1e6:g}MHz "
+                     f"(16-bit SATA PHY data-width), got {sys_clk_freq/1e6:g}MHz.")
@@ -0,0 +1,376 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# SATA <-> PCIe zero-copy streaming.
+#
+# Gateware: SATAPCIeStreamer connects a LiteSATA user port (single drive or striped, see
+# sata_striping.py) directly to a LitePCIe DMA channel: sector reads are streamed to the host through
+# the DMA Writer, sector writes are fed from the host through the DMA Reader, without the CPU in the
+# data path. DRAM FIFOs can optionally be inserted on both directions to absorb host/drive latency.
+# Commands (sector, count, direction) are issued over CSRs and the number of cycles/bytes of the
+# last command is reported for throughput measurements.
+#
+# Software: generate_sata_pcie_software adds a litepcie_sata program to the LitePCIe driver
+# generated by litepcie.software.generate_litepcie_software.
+#
+# Usage (on the target):
+#   ./sqrl_xcu1525.py --with-pcie --with-sata --with-sata-pcie --driver --build
+#   cd build/sqrl_xcu1525/driver/user && make
+#   ./litepcie_sata -s 0 -n 0x8000 read disk.bin
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+
+from litex_boards.litepcie_software import add_litepcie_program
+
+# SATA PCIe Streamer -------------------------------------------------------------------------------
+
+class SATAPCIeStreamer(LiteXModule):
+    def __init__(self, port, dma, to_host_buffer=None, from_host_buffer=None):
+        self.sector = CSRStorage(48, description="First sector (of each drive when striped).")
+        self.count  = CSRStorage(16, description="Number of sectors (of each drive when striped).")
+        self.write  = CSRStorage(description="Direction: 0: Drive(s) -> Host (Read), 1: Host -> Drive(s) (Write).")
+        self.start  = CSR()
+        self.done   = CSRStatus(description="Command done.")
+        self.failed = CSRStatus(description="Command failed.")
+        self.cycles = CSRStatus(64, description="Cycles of the last command.")
+        self.bytes  = CSRStatus(64, description="Bytes transferred by the last command.")
+
+        # # #
+
+        sata_data_width = port.dw
+        dma_data_width  = len(dma.source.data)
+        assert dma_data_width % sata_data_width == 0
+        beats_per_sector = 512*8//port.controller_dw
+        self.sector_bytes = beats_per_sector*sata_data_width//8 # Bytes per (striped) sector.
+
+        # Drive(s) -> Host: SATA data -> Converter -> (DRAM FIFO) -> DMA Writer.
+        to_host = stream.Endpoint([("data", sata_data_width)])
+        self.to_host_converter = stream.Converter(sata_data_width, dma_data_width)
+        to_host_pipeline = [to_host, self.to_host_converter]
+        if to_host_buffer is not None:
+            self.to_host_buffer = to_host_buffer
+            to_host_pipeline.append(to_host_buffer)
+        self.submodules += stream.Pipeline(*to_host_pipeline, dma.sink)
+
+        # Host -> Drive(s): DMA Reader -> (DRAM FIFO) -> Converter -> SATA data.
+        from_host = stream.Endpoint([("data", sata_data_width)])
+        self.from_host_converter = stream.Converter(dma_data_width, sata_data_width)
+        from_host_pipeline = [dma.source]
+        if from_host_buffer is not None:
+            self.from_host_buffer = from_host_buffer
+            from_host_pipeline.append(from_host_buffer)
+        self.submodules += stream.Pipeline(*from_host_pipeline, self.from_host_converter, from_host)
+
+        # FSM.
+        beat   = Signal(16 + log2_int(beats_per_sector))
+        beats  = Signal(16 + log2_int(beats_per_sector))
+        active = Signal()
+        self.comb += beats.eq(self.count.storage*beats_per_sector)
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            self.done.status.eq(1),
+            # Drain data from the Host between commands (DMA Reader may have been left running).
+            from_host.ready.eq(1),
+            If(self.start.re,
+                NextValue(beat, 0),
+                NextValue(self.failed.status, 0),
+                NextValue(self.cycles.status, 0),
+                NextValue(self.bytes.status,  0),
+                If(self.write.storage,
+                    NextState("WRITE")
+                ).Else(
+                    NextState("READ-CMD")
+                )
+            )
+        )
+        fsm.act("READ-CMD",
+            active.eq(1),
+            port.sink.valid.eq(1),
+            port.sink.last.eq(1),
+            port.sink.read.eq(1),
+            port.sink.sector.eq(self.sector.storage),
+            port.sink.count.eq(self.count.storage),
+            If(port.sink.ready,
+                NextState("READ-DATA")
+            )
+        )
+        fsm.act("READ-DATA",
+            active.eq(1),
+            # Data beats are forwarded, final status beat (end) is consumed.
+            to_host.valid.eq(port.source.valid & ~port.source.end),
+            to_host.data.eq(port.source.data),
+            port.source.ready.eq(to_host.ready | port.source.end),
+            If(port.source.valid & port.source.ready,
+                If(port.source.failed,
+                    NextValue(self.failed.status, 1)
+                ),
+                If(port.source.end,
+                    NextState("IDLE")
+                ).Else(
+                    NextValue(self.bytes.status, self.bytes.status + sata_data_width//8)
+                )
+            )
+        )
+        fsm.act("WRITE",
+            active.eq(1),
+            port.sink.valid.eq(from_host.valid),
+            port.sink.last.eq(beat == (beats - 1)),
+            port.sink.write.eq(1),
+            port.sink.sector.eq(self.sector.storage),
+            port.sink.count.eq(self.count.storage),
+            port.sink.data.eq(from_host.data),
+            from_host.ready.eq(port.sink.ready),
+            If(port.sink.valid & port.sink.ready,
+                NextValue(beat, beat + 1),
+                NextValue(self.bytes.status, self.bytes.status + sata_data_width//8),
+                If(port.sink.last,
+                    NextState("WRITE-ACK")
+                )
+            )
+        )
+        fsm.act("WRITE-ACK",
+            active.eq(1),
+            port.source.ready.eq(1),
+            If(port.source.valid & port.source.last,
+                NextValue(self.failed.status, port.source.failed),
+                NextState("IDLE")
+            )
+        )
+        self.sync += If(active, self.cycles.status.eq(self.cycles.status + 1))
+
+# Software -----------------------------------------------------------------------------------------
+
+_sata_c = """/* SPDX-License-Identifier: BSD-2-Clause
+ *
+ * LitePCIe <-> SATA streaming (generated by LiteX-Boards).
+ *
+ */
+
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+#include <inttypes.h>
+#include <unistd.h>
+#include "liblitepcie.h"
+#include "litepcie_csr.h"
+#include "soc.h"
+
+#define STREAMER(reg)     CSR_{streamer}_##reg
+#define SECTOR_BYTES      {sector_bytes} /* Bytes per (striped) sector. */
+#define TIMEOUT_MS        5000
+
+static char litepcie_device[1024];
+
+static void start_cmd(int fd, uint64_t sector, uint64_t count, int write)
+{{
+    csr_write(fd, STREAMER(SECTOR_ADDR), STREAMER(SECTOR_SIZE), sector);
+    csr_write(fd, STREAMER(COUNT_ADDR),  STREAMER(COUNT_SIZE),  count);
+    csr_write(fd, STREAMER(WRITE_ADDR),  STREAMER(WRITE_SIZE),  write);
+    csr_write(fd, STREAMER(START_ADDR),  STREAMER(START_SIZE),  1);
+}}
+
+static int end_cmd(int fd, const char *name)
+{{
+    uint64_t cycles = csr_read(fd, STREAMER(CYCLES_ADDR), STREAMER(CYCLES_SIZE));
+    uint64_t bytes  = csr_read(fd, STREAMER(BYTES_ADDR),  STREAMER(BYTES_SIZE));
+    double duration = (double)cycles / CONFIG_CLOCK_FREQUENCY;
+    if (csr_read(fd, STREAMER(FAILED_ADDR), STREAMER(FAILED_SIZE)) & 1) {{
+        fprintf(stderr, "%s: failed.\\n", name);
+        return -1;
+    }}
+    printf("%-6s: %10" PRIu64 " bytes in %10" PRIu64 " cycles: %8.2f MB/s\\n",
+        name, bytes, cycles, duration > 0 ? (double)bytes / (duration * 1e6) : 0.0);
+    return 0;
+}}
+
+/* Read (Drive(s) -> Host) */
+/*-------------------------*/
+
+static int sata_read(uint64_t sector, uint64_t count, FILE *f)
+{{
+    static struct litepcie_dma_ctrl dma = {{.use_reader = 0, .use_writer = 1, .loopback = 0}};
+    uint64_t size = count*SECTOR_BYTES;
+    uint64_t received = 0;
+    int64_t end_time;
+    char *buf;
+    int fd;
+    int ret = 0;
+
+    if (litepcie_dma_init(&dma, litepcie_device, 0))
+        exit(1);
+    fd = dma.fds.fd;
+
+    /* Start receiving buffers, then the read command. */
+    dma.writer_enable = 1;
+    litepcie_dma_process(&dma);
+    start_cmd(fd, sector, count, 0);
+
+    end_time = get_time_ms() + TIMEOUT_MS;
+    while (received < size) {{
+        litepcie_dma_process(&dma);
+        while ((received < size) && ((buf = litepcie_dma_next_read_buffer(&dma)) != NULL)) {{
+            if (fwrite(buf, 1, DMA_BUFFER_SIZE, f) != DMA_BUFFER_SIZE) {{
+                perror("fwrite");
+                ret = -1;
+                goto out;
+            }}
+            received += DMA_BUFFER_SIZE;
+            end_time  = get_time_ms() + TIMEOUT_MS;
+        }}
+        if (get_time_ms() > end_time) {{
+            fprintf(stderr, "Read: timeout.\\n");
+            ret = -1;
+            goto out;
+        }}
+    }}
+    ret = end_cmd(fd, "Read");
+
+out:
+    dma.writer_enable = 0;
+    litepcie_dma_process(&dma);
+    litepcie_dma_cleanup(&dma);
+    return ret;
+}}
+
+/* Write (Host -> Drive(s)) */
+/*--------------------------*/
+
+static int sata_write(uint64_t sector, uint64_t count, FILE *f)
+{{
+    static struct litepcie_dma_ctrl dma = {{.use_reader = 1, .use_writer = 0, .loopback = 0}};
+    uint64_t size = count*SECTOR_BYTES;
+    uint64_t sent = 0;
+    int64_t end_time;
+    char *buf;
+    int fd;
+    int ret = 0;
+
+    if (litepcie_dma_init(&dma, litepcie_device, 0))
+        exit(1);
+    fd = dma.fds.fd;
+
+    /* Start the write command, then send buffers (data received while idle is drained). */
+    start_cmd(fd, sector, count, 1);
+    dma.reader_enable = 1;
+
+    end_time = get_time_ms() + TIMEOUT_MS;
+    while (!(csr_read(fd, STREAMER(DONE_ADDR), STREAMER(DONE_SIZE)) & 1)) {{
+        litepcie_dma_process(&dma);
+        while ((sent < size) && ((buf = litepcie_dma_next_write_buffer(&dma)) != NULL)) {{
+            size_t n = fread(buf, 1, DMA_BUFFER_SIZE, f);
+            memset(buf + n, 0, DMA_BUFFER_SIZE - n);
+            sent    += DMA_BUFFER_SIZE;
+            end_time = get_time_ms() + TIMEOUT_MS;
+        }}
+        if (get_time_ms() > end_time) {{
+            fprintf(stderr, "Write: timeout.\\n");
+            ret = -1;
+            goto out;
+        }}
+    }}
+    ret = end_cmd(fd, "Write");
+
+out:
+    dma.reader_enable = 0;
+    litepcie_dma_process(&dma);
+    litepcie_dma_cleanup(&dma);
+    return ret;
+}}
+
+/* Main */
+/*------*/
+
+static void help(void)
+{{
+    printf("LitePCIe <-> SATA streaming.\\n"
+           "usage: litepcie_sata [options] cmd file\\n"
+           "\\n"
+           "options:\\n"
+           "-h                                Help.\\n"
+           "-c device_num                     Select the device (default = 0).\\n"
+           "-s sector                         First sector (default = 0).\\n"
+           "-n count                          Number of sectors (default = 0x{default_count:x}).\\n"
+           "\\n"
+           "available commands:\\n"
+           "read                              Read sectors to file.\\n"
+           "write                             Write file to sectors.\\n"
+           "\\n"
+           "Sectors are %d bytes (%d bytes per drive, striped).\\n", SECTOR_BYTES, 512);
+    exit(1);
+}}
+
+int main(int argc, char **argv)
+{{
+    int c;
+    int device_num = 0;
+    uint64_t sector = 0;
+    uint64_t count  = 0x{default_count:x};
+    const char *cmd;
+    FILE *f;
+    int ret;
+
+    for (;;) {{
+        c = getopt(argc, argv, "hc:s:n:");
+        if (c == -1)
+            break;
+        switch (c) {{
+        case 'c':
+            device_num = atoi(optarg);
+            break;
+        case 's':
+            sector = strtoull(optarg, NULL, 0);
+            break;
+        case 'n':
+            count = strtoull(optarg, NULL, 0);
+            break;
+        default:
+            help();
+        }}
+    }}
+    if (optind + 2 != argc)
+        help();
+    cmd = argv[optind];
+    snprintf(litepcie_device, sizeof(litepcie_device), "/dev/litepcie%d", device_num);
+
+    if ((count == 0) || (count > 0xffff) || ((count*SECTOR_BYTES) % DMA_BUFFER_SIZE)) {{
+        fprintf(stderr, "Count must be in [1, 0xffff] and count*%d a multiple of %d bytes.\\n",
+            SECTOR_BYTES, DMA_BUFFER_SIZE);
+        exit(1);
+    }}
+
+    if (!strcmp(cmd, "read")) {{
+        f = fopen(argv[optind + 1], "wb");
+        if (!f) {{
+            perror(argv[optind + 1]);
+            exit(1);
+        }}
+        ret = sata_read(sector, count, f);
+    }} else if (!strcmp(cmd, "write")) {{
+        f = fopen(argv[optind + 1], "rb");
+        if (!f) {{
+            perror(argv[optind + 1]);
+            exit(1);
+        }}
+        ret = sata_write(sector, count, f);
+    }} else
+        help();
+    fclose(f);
+
+    return ret ? 1 : 0;
+}}
+"""
+
+def generate_sata_pcie_software(soc, dst, streamer="sata_pcie", default_count=0x800):
+    # Add litepcie_sata to the user-space tools of a generated LitePCIe driver (dst).
+    add_litepcie_program(dst, "litepcie_sata", _sata_c.format(
+        streamer      = streamer.upper(),
+        sector_bytes  = getattr(soc, streamer).sector_bytes,
+        default_count = default_count))
@@ -0,0 +1,106 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# SATA Striping (RAID-0) over several LiteSATA PHYs.
+#
+# add_sata_striping creates a LiteSATA core per PHY and stripes them with LiteSATAStriping: each data
+# word of the striped port is split over the N controllers, so a striped sector is N x 512 bytes and
+# sector/count are the ones of each drive. The striped controller is exposed through a crossbar
+# (soc.<name>_crossbar, recording frontends can request their own port with get_port()) with a BIST
+# (generator/checker/identify) and throughput counters over CSRs.
+#
+# Usage (on the target):
+#   ./sqrl_xcu1525.py --with-sata --sata-ports=4 --build
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+
+from litesata.core import LiteSATACore
+from litesata.frontend.raid import LiteSATAStriping
+from litesata.frontend.arbitration import LiteSATACrossbar
+from litesata.frontend.bist import LiteSATABIST
+
+# SATA Throughput ----------------------------------------------------------------------------------
+
+class SATAThroughput(LiteXModule):
+    def __init__(self, controller):
+        self.enable      = CSRStorage(description="Enable counters (cleared when disabled).")
+        self.cycles      = CSRStatus(64, description="Cycles since enable.")
+        self.write_bytes = CSRStatus(64, description="Bytes written to the drives since enable.")
+        self.read_bytes  = CSRStatus(64, description="Bytes read from the drives since enable.")
+
+        # # #
+
+        data_bytes = len(controller.sink.data)//8
+
+        # Write data beats on the command sink, read data beats (except final status) on the source.
+        write_beat = Signal()
+        read_beat  = Signal()
+        self.comb += [
+            write_beat.eq(controller.sink.valid   & controller.sink.ready   & controller.sink.write),
+            read_beat.eq( controller.source.valid & controller.source.ready & controller.source.read & ~controller.source.end),
+        ]
+        self.sync += [
+            If(~self.enable.storage,
+                self.cycles.status.eq(0),
+                self.write_bytes.status.eq(0),
+                self.read_bytes.status.eq(0),
+            ).Else(
+                self.cycles.status.eq(self.cycles.status + 1),
+                If(write_beat,
+                    self.write_bytes.status.eq(self.write_bytes.status + data_bytes)
+                ),
+                If(read_beat,
+                    self.read_bytes.status.eq(self.read_bytes.status + data_bytes)
+                ),
+            )
+        ]
+
+# SATA Striping ------------------------------------------------------------------------------------
+
+def add_sata_striping(soc, phys, name="sata"):
+    sata_clk_freqs = {
+        "gen1":  75e6,
+        "gen2": 150e6,
+        "gen3": 300e6,
+    }
+
+    # Cores (one per PHY).
+    cores = []
+    for i, phy in enumerate(phys):
+        sata_clk_freq = sata_clk_freqs[phy.gen]
+        assert soc.clk_freq >= sata_clk_freq/2 # 16-bit PHY data-width.
+        core = LiteSATACore(phy)
+        soc.add_module(name=f"{name}_core{i}", module=core)
+        cores.append(core)
+
+        # Timing constraints.
+        soc.platform.add_period_constraint(phy.crg.cd_sata_tx.clk, 1e9/sata_clk_freq)
+        soc.platform.add_period_constraint(phy.crg.cd_sata_rx.clk, 1e9/sata_clk_freq)
+        soc.platform.add_false_path_constraints(
+            soc.crg.cd_sys.clk,
+            phy.crg.cd_sata_tx.clk,
+            phy.crg.cd_sata_rx.clk,
+        )
+
+    # Striping.
+    striping = LiteSATAStriping(cores)
+    soc.add_module(name=f"{name}_striping", module=striping)
+
+    # Throughput.
+    throughput = SATAThroughput(striping)
+    soc.add_module(name=f"{name}_throughput", module=throughput)
+
+    # Crossbar.
+    crossbar = LiteSATACrossbar(striping)
+    soc.add_module(name=f"{name}_crossbar", module=crossbar)
+
+    # BIST (Generator/Checker/Identify).
+    bist = LiteSATABIST(crossbar, with_csr=True)
+    soc.add_module(name=f"{name}_bist", module=bist)
@@ -23,12 +23,6 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.cores.pwm import PWM
 from litex.soc.cores.xadc import ZynqUSPSystemMonitor
 
-from litedram.modules import MT40A512M16
-from litedram.phy import usddrphy
-
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -64,6 +58,8 @@ class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=150e6, ddram_channel=0,
         with_led_chaser = True,
         with_pcie       = False,
+        pcie_lanes      = 8,
+        pcie_dmas       = 1,
         **kwargs):
         platform = adi_adrv2crr_fmc.Platform()
 
@@ -77,6 +73,8 @@ class BaseSoC(SoCCore):
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT40A512M16
+            from litedram.phy import usddrphy
             self.ddrphy = usddrphy.USPDDRPHY(
                 pads             = platform.request("ddram", ddram_channel),
                 memtype          = "DDR4",
@@ -91,13 +89,14 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPPCIEPHY
             assert self.csr_data_width == 32
 
-            self.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x8"),
+            self.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
                 speed = "gen3",
-                data_width = 256,
+                data_width = {1: 64, 2: 64, 4: 128, 8: 256}[pcie_lanes],
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -126,12 +125,16 @@ def main():
     parser = LiteXArgumentParser(platform=adi_adrv2crr_fmc.Platform, description="LiteX SoC on ADI ADRV2CRR-FMC.")
     parser.add_target_argument("--sys-clk-freq", default=150e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",   default=8, type=int, choices=[1, 2, 4, 8], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",    default=1, type=int,       help="Number of PCIe DMA channels.")
     parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
         with_pcie    = args.with_pcie,
+        pcie_lanes   = args.pcie_lanes,
+        pcie_dmas    = args.pcie_dmas,
         **parser.soc_argdict
     )
 
@@ -140,6 +143,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -54,9 +54,6 @@ from litex.soc.cores.clock import *
 from litex.soc.cores.video import VideoS6HDMIPHY
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT48LC32M8, SDRModule
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -118,6 +115,8 @@ class BaseSoC(SoCCore):
 
         # Add SDRAM if a shield with RAM has been added
         if not self.integrated_main_ram_size and (with_hdmi_shield or with_sdram_shield):
+            from litedram.modules import MT48LC32M8, SDRModule
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
             self.crg.specials += DDROutput(1, 0, platform.request("sdram_clock"), sdram_clk)
 
@@ -20,14 +20,9 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 
 from litex.soc.cores.led import LedChaser
-from litedram.modules import MT40A512M16
-from litedram.phy import usddrphy
 
 from liteeth.phy.usp_gty_1000basex import USP_GTY_1000BASEX
 
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -77,7 +72,10 @@ class BaseSoC(SoCCore):
                 eth_dynamic_ip         = True,
                 remote_ip              = None,
                 etherbone_ip           = "192.168.1.50",
+                ethernet_speed         = "1g",
                 with_pcie              = False,
+                pcie_lanes             = 4,
+                pcie_dmas              = 1,
                 **kwargs):
         platform = alibaba_vu13p.Platform()
 
@@ -95,6 +93,8 @@ class BaseSoC(SoCCore):
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT40A512M16
+            from litedram.phy import usddrphy
             self.ddrphy = usddrphy.USPDDRPHY(platform.request("ddram", ddram_channel),
                 memtype          = "DDR4",
                 sys_clk_freq     = sys_clk_freq,
@@ -108,10 +108,11 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            from litepcie.phy.usppciephy import USPPCIEPHY
+            self.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {4: 128, 8: 256, 16: 512}[pcie_lanes],
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         def parse_qsfp_port(port_string):
@@ -122,22 +123,52 @@ class BaseSoC(SoCCore):
         
         qsfp_in_use = [False, False]
 
+        def add_qsfp_10g_phy(qsfp_id, sfp_lane, cd):
+            from liteiclink.serdes.gty_ultrascale import GTYQuadPLL
+            from litex_boards.baser import USP10GBASERPHY
+            # QPLL (shared by the 4 lanes of the QSFP).
+            if not hasattr(self, f"qsfp{qsfp_id}_pll"):
+                refclk_pads = platform.request("qsfp_refclk", qsfp_id)
+                refclk      = Signal()
+                self.specials += Instance("IBUFDS_GTE4",
+                    i_CEB = 0,
+                    i_I   = refclk_pads.p,
+                    i_IB  = refclk_pads.n,
+                    o_O   = refclk)
+                self.add_module(name=f"qsfp{qsfp_id}_pll", module=GTYQuadPLL(refclk, 161.1328125e6, 10.3125e9))
+            phy = USP10GBASERPHY(getattr(self, f"qsfp{qsfp_id}_pll"),
+                data_pads    = platform.request(f"qsfp{qsfp_id}_sfp", sfp_lane),
+                sys_clk_freq = sys_clk_freq,
+                cd           = cd)
+            platform.add_false_path_constraints(self.crg.cd_sys.clk, phy.serdes.cd_eth_tx.clk, phy.serdes.cd_eth_rx.clk)
+            return phy
+
         if with_ethernet:
             qsfp_id, sfp_lane = parse_qsfp_port(ethernet_port)
-            self.ethphy = USP_GTY_1000BASEX(self.crg.cd_eth.clk,
-                data_pads    = self.platform.request("qsfp{}_sfp".format(qsfp_id), sfp_lane),
-                sys_clk_freq = self.clk_freq,
-                refclk_from_fabric = True)
-            self.add_ethernet(phy=self.ethphy, local_ip=ethernet_ip if not eth_dynamic_ip else None, dynamic_ip=eth_dynamic_ip, remote_ip=remote_ip)
+            if ethernet_speed == "10g":
+                self.ethphy = add_qsfp_10g_phy(qsfp_id, sfp_lane, cd="eth")
+                self.add_ethernet(phy=self.ethphy, data_width=64, local_ip=ethernet_ip if not eth_dynamic_ip else None, dynamic_ip=eth_dynamic_ip, remote_ip=remote_ip,
+                    with_timing_constraints = False)
+            else:
+                self.ethphy = USP_GTY_1000BASEX(self.crg.cd_eth.clk,
+                    data_pads    = self.platform.request("qsfp{}_sfp".format(qsfp_id), sfp_lane),
+                    sys_clk_freq = self.clk_freq,
+                    refclk_from_fabric = True)
+                self.add_ethernet(phy=self.ethphy, local_ip=ethernet_ip if not eth_dynamic_ip else None, dynamic_ip=eth_dynamic_ip, remote_ip=remote_ip)
             qsfp_in_use[qsfp_id] = True
 
         if with_etherbone:
             qsfp_id, sfp_lane = parse_qsfp_port(etherbone_port)
-            self.bonephy = USP_GTY_1000BASEX(self.crg.cd_eth.clk,
-                data_pads    = self.platform.request("qsfp{}_sfp".format(qsfp_id), sfp_lane),
-                sys_clk_freq = self.clk_freq,
-                refclk_from_fabric = True)
-            self.add_etherbone(phy=self.bonephy, ip_address=etherbone_ip)
+            if ethernet_speed == "10g":
+                self.bonephy = add_qsfp_10g_phy(qsfp_id, sfp_lane, cd="bone")
+                self.add_etherbone(phy=self.bonephy, phy_cd="bone", data_width=64, ip_address=etherbone_ip,
+                    with_timing_constraints = False)
+            else:
+                self.bonephy = USP_GTY_1000BASEX(self.crg.cd_eth.clk,
+                    data_pads    = self.platform.request("qsfp{}_sfp".format(qsfp_id), sfp_lane),
+                    sys_clk_freq = self.clk_freq,
+                    refclk_from_fabric = True)
+                self.add_etherbone(phy=self.bonephy, ip_address=etherbone_ip)
             qsfp_in_use[qsfp_id] = True
 
 
@@ -173,7 +204,7 @@ def main():
     sfp_list = []
     for qsfp in range(2):
         for sfp in range(4):
-            sfp_list.append("qsfp{}_{}".format(qsfp, sfp))
+            sfp_list.append("qsfp{}_sfp{}".format(qsfp, sfp))
 
     parser = LiteXArgumentParser(platform=alibaba_vu13p.Platform, description="LiteX SoC on Alibaba VU13P.")
     parser.add_target_argument("--flash",          action="store_true",       help="Write FPGA bitstream into spi flash.")
@@ -187,7 +218,10 @@ def main():
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",   help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",     help="Enable dynamic Ethernet IP addresses setting.")
     parser.add_target_argument("--etherbone-ip",   default="192.168.1.50",    help="Ethernet IP address.")
+    parser.add_target_argument("--ethernet-speed", default="1g", choices=["1g", "10g"], help="Ethernet/Etherbone speed (1000BASE-X or 10GBASE-R).")
     parser.add_target_argument("--with-pcie",      action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",     default=4, type=int, choices=[4, 8, 16], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",      default=1, type=int,       help="Number of PCIe DMA channels.")
     parser.add_target_argument("--driver",         action="store_true",       help="Generate PCIe driver.")
     args = parser.parse_args()
 
@@ -206,7 +240,10 @@ def main():
         remote_ip      = args.remote_ip,
         eth_dynamic_ip = args.eth_dynamic_ip,
         etherbone_ip  = args.etherbone_ip,
+        ethernet_speed = args.ethernet_speed,
         with_pcie    = args.with_pcie,
+        pcie_lanes   = args.pcie_lanes,
+        pcie_dmas    = args.pcie_dmas,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -214,6 +251,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -26,13 +26,6 @@ from litex.soc.cores.xadc import XADC
 from litex.soc.cores.dna  import DNA
 from litex.soc.cores.video import VideoS7HDMIPHY
 
-from litedram.modules import IS43TR16128B
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-from litepcie.phy.s7pciephy import S7PCIEPHY
-
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -84,12 +77,19 @@ class BaseSoC(SoCCore):
         with_xadc       = False,
         with_dna        = False,
         with_ethernet   = False,
+        eth_rx_slots    = 2,
+        eth_tx_slots    = 2,
+        eth_mtu         = 1530,
+        eth_data_width  = 8,
         with_etherbone  = False,
         eth_phy         = "rgmii",
         eth_ip          = "192.168.1.50",
         remote_ip       = None,
         eth_dynamic_ip  = False,
         with_pcie       = False,
+        pcie_lanes      = 2,
+        pcie_dmas       = 1,
+        pcie_msi        = "msi",
         with_led_chaser = True,
         with_buttons    = True,
         with_gpio       = False,
@@ -119,6 +119,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import IS43TR16128B
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype        = "DDR3",
                 nphases        = 4,
@@ -133,6 +135,7 @@ class BaseSoC(SoCCore):
         if with_ethernet or with_etherbone:
             # RGMII Ethernet PHY -------------------------------------------------------------------
             if eth_phy == "rgmii":
+                from liteeth.phy.s7rgmii import LiteEthPHYRGMII
                 # phy
                 self.ethphy = LiteEthPHYRGMII(
                     clock_pads = self.platform.request("eth_clocks"),
@@ -165,14 +168,30 @@ class BaseSoC(SoCCore):
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
             elif with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip if not eth_dynamic_ip else None, remote_ip=remote_ip)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy        = self.ethphy,
+                    dynamic_ip = eth_dynamic_ip,
+                    local_ip   = eth_ip if not eth_dynamic_ip else None,
+                    remote_ip  = remote_ip,
+                    data_width = eth_data_width,
+                    rx_slots   = eth_rx_slots,
+                    tx_slots   = eth_tx_slots,
+                    mtu        = eth_mtu,
+                )
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x2"),
-                data_width = 64,
+            from litepcie.phy.s7pciephy import S7PCIEPHY
+            self.pcie_phy = S7PCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {1: 64, 2: 64}[pcie_lanes],
+                msi_type   = pcie_msi,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, msi_type=pcie_msi)
+            if pcie_msi == "msi-x":
+                # MSI-X Table/PBA offsets are fixed in the PHY configuration.
+                self.csr.add("pcie_msi",       n=3)
+                self.csr.add("pcie_msi_table", n=4)
 
         # HDMI Options -----------------------------------------------------------------------------
         if with_hdmi:
@@ -210,6 +229,7 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=alientek_davincipro.Platform, decription="LiteX SoC on Alientek Davinci Pro.")
     parser.add_target_argument("--flash",          action="store_true",       help="Flash bitstream.")
     parser.add_target_argument("--variant",        default="a7-35",           help="Board variant (a7-35 or a7-100).")
@@ -222,6 +242,9 @@ def main():
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",   help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",       help="Enable dynamic Ethernet IP addresses setting.")
     parser.add_target_argument("--with-pcie",      action="store_true",        help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",     default=2, type=int, choices=[1, 2], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",      default=1, type=int,        help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi",       default="msi", choices=["msi", "msi-multi-vector", "msi-x"], help="PCIe MSI type.")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
@@ -230,6 +253,7 @@ def main():
     sdopts.add_argument("--with-spi-sdcard",       action="store_true",       help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",           action="store_true",       help="Enable SDCard support.")
     parser.add_target_argument("--with-gpio",      action="store_true",       help="Enable GPIOs through PMOD.") # FIXME: Temporary test.
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
@@ -248,9 +272,13 @@ def main():
         with_buttons   = True,
         with_gpio      = args.with_gpio,
         with_pcie      = args.with_pcie,
+        pcie_lanes     = args.pcie_lanes,
+        pcie_dmas      = args.pcie_dmas,
+        pcie_msi       = args.pcie_msi,
         with_video_colorbars   = args.with_video_colorbars,
         with_video_framebuffer = args.with_video_framebuffer,
         with_video_terminal    = args.with_video_terminal,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
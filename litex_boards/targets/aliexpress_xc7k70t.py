@@ -21,9 +21,6 @@ from litex.soc.cores.clock import *
 from litex.soc.cores.video import VideoS7HDMIPHY
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import W9812G6JB, SDRModule
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -60,7 +57,14 @@ class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6, sdram_rate="1:1",
         with_hdmi              = False,
         with_ethernet          = False,
+        eth_rx_slots           = 2,
+        eth_tx_slots           = 2,
+        eth_mtu                = 1530,
+        eth_data_width         = 8,
         with_pcie              = False,
+        pcie_lanes             = 4,
+        pcie_dmas              = 1,
+        pcie_msi               = "msi",
         with_sdram             = True,
         with_led_chaser        = True,
         with_video_terminal    = False,
@@ -77,6 +81,8 @@ class BaseSoC(SoCCore):
 
         # Add SDRAM if a shield with RAM has been added
         if not self.integrated_main_ram_size:
+            from litedram.modules import W9812G6JB, SDRModule
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             sdram_clk = ClockSignal("sys2x_ps" if sdram_rate == "1:2" else "sys_ps")
             self.crg.specials += DDROutput(1, 0, platform.request("sdram_clock"), sdram_clk)
 
@@ -106,14 +112,27 @@ class BaseSoC(SoCCore):
                 tx_delay = 1.417e-9,
                 rx_delay = 1.417e-9,
             )
-            self.add_ethernet(phy=self.ethphy)
+            from litex_boards.ethernet import add_ethernet
+            add_ethernet(self,
+                phy        = self.ethphy,
+                data_width = eth_data_width,
+                rx_slots   = eth_rx_slots,
+                tx_slots   = eth_tx_slots,
+                mtu        = eth_mtu,
+            )
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            from litepcie.phy.s7pciephy import S7PCIEPHY
+            self.pcie_phy = S7PCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {1: 64, 2: 64, 4: 128}[pcie_lanes],
+                msi_type   = pcie_msi,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, msi_type=pcie_msi)
+            if pcie_msi == "msi-x":
+                # MSI-X Table/PBA offsets are fixed in the PHY configuration.
+                self.csr.add("pcie_msi",       n=3)
+                self.csr.add("pcie_msi_table", n=4)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -125,16 +144,21 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=aliexpress_xc7k70t.Platform, description="LiteX SoC on AliExpress XC7K70T PCIe board.")
     parser.add_target_argument("--sys-clk-freq",    default=90e6, type=float,  help="System clock frequency.")
     parser.add_target_argument("--sdram-rate",      default="1:1",             help="SDRAM Rate: (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_argument("--with-ethernet",          action="store_true",       help="Enable ethernet")
     parser.add_argument("--with-pcie",              action="store_true",       help="Enable PCIe")
+    parser.add_argument("--pcie-lanes",             default=4, type=int, choices=[1, 2, 4], help="PCIe lanes.")
+    parser.add_argument("--pcie-dmas",              default=1, type=int,       help="Number of PCIe DMA channels.")
+    parser.add_argument("--pcie-msi",               default="msi", choices=["msi", "msi-multi-vector", "msi-x"], help="PCIe MSI type.")
     parser.add_argument("--with-hdmi",              action="store_true",       help="Enable HDMI")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true",       help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true",       help="Enable Video Framebuffer (HDMI).")
     viopts.add_argument("--with-video-colorbars",   action="store_true",       help="Enable Video Colorbars (HDMI).")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     # Note: baudrate is fixed because regardless of USB->TTL baud, the AVR <-> FPGA baudrate is
@@ -144,10 +168,14 @@ def main():
         sdram_rate             = args.sdram_rate,
         with_ethernet          = args.with_ethernet,
         with_pcie              = args.with_pcie,
+        pcie_lanes             = args.pcie_lanes,
+        pcie_dmas              = args.pcie_dmas,
+        pcie_msi               = args.pcie_msi,
         with_hdmi              = args.with_hdmi,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
         with_video_colorbars   = args.with_video_colorbars,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
     )
 
@@ -19,14 +19,6 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT40A512M16
-from litedram.phy import usddrphy
-
-from liteeth.phy.usrgmii import LiteEthPHYRGMII
-
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -57,11 +49,15 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=int(125e6),
         with_ethernet   = False,
+        eth_rx_slots    = 2,
+        eth_tx_slots    = 2,
+        eth_mtu         = 1530,
+        eth_data_width  = 8,
         with_etherbone  = False,
         eth_ip          = "192.168.1.50",
         remote_ip       = None,
         with_led_chaser = True,
-        with_pcie       = False, pcie_speed="gen3",
+        with_pcie       = False, pcie_speed="gen3", pcie_lanes=4, pcie_dmas=1,
         with_sdcard     = False,
         **kwargs):
         platform = alinx_axau15.Platform()
@@ -74,6 +70,8 @@ class BaseSoC(SoCCore):
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT40A512M16
+            from litedram.phy import usddrphy
             self.ddrphy = usddrphy.USPDDRPHY(platform.request("ddram"),
                 memtype          = "DDR4",
                 sys_clk_freq     = sys_clk_freq,
@@ -88,23 +86,26 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
+            from litepcie.phy.usppciephy import USPPCIEPHY
+            self.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
                 speed      = pcie_speed,
-                data_width = {"gen3": 128, "gen4": 256}[pcie_speed],
+                data_width = {
+                    "gen3": {1: 64, 2:  64, 4: 128},
+                    "gen4": {1: 64, 2: 128, 4: 256},
+                }[pcie_speed][pcie_lanes],
                 ip_name    = "pcie4c_uscale_plus",
                 bar0_size  = 0x20000,
             )
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
 
             # Set manual locations to avoid Vivado to remap lanes to X0Y4, X0Y5, X0Y6, X0Y7.
             platform.toolchain.pre_placement_commands.append("reset_property LOC [get_cells -hierarchical -filter {{NAME=~*pcie_usp_i/*GTHE4_CHANNEL_PRIM_INST}}]")
-            platform.toolchain.pre_placement_commands.append("set_property LOC GTHE4_CHANNEL_X0Y0 [get_cells -hierarchical -filter {{NAME=~*pcie_usp_i/*gthe4_channel_gen.gen_gthe4_channel_inst[0].GTHE4_CHANNEL_PRIM_INST}}]")
-            platform.toolchain.pre_placement_commands.append("set_property LOC GTHE4_CHANNEL_X0Y1 [get_cells -hierarchical -filter {{NAME=~*pcie_usp_i/*gthe4_channel_gen.gen_gthe4_channel_inst[1].GTHE4_CHANNEL_PRIM_INST}}]")
-            platform.toolchain.pre_placement_commands.append("set_property LOC GTHE4_CHANNEL_X0Y2 [get_cells -hierarchical -filter {{NAME=~*pcie_usp_i/*gthe4_channel_gen.gen_gthe4_channel_inst[2].GTHE4_CHANNEL_PRIM_INST}}]")
-            platform.toolchain.pre_placement_commands.append("set_property LOC GTHE4_CHANNEL_X0Y3 [get_cells -hierarchical -filter {{NAME=~*pcie_usp_i/*gthe4_channel_gen.gen_gthe4_channel_inst[3].GTHE4_CHANNEL_PRIM_INST}}]")
+            for i in range(pcie_lanes):
+                platform.toolchain.pre_placement_commands.append(f"set_property LOC GTHE4_CHANNEL_X0Y{i} [get_cells -hierarchical -filter {{{{NAME=~*pcie_usp_i/*gthe4_channel_gen.gen_gthe4_channel_inst[{i}].GTHE4_CHANNEL_PRIM_INST}}}}]")
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.usrgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
@@ -113,7 +114,15 @@ class BaseSoC(SoCCore):
                 usp        = True
             )
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, remote_ip=remote_ip)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy        = self.ethphy,
+                    remote_ip  = remote_ip,
+                    data_width = eth_data_width,
+                    rx_slots   = eth_rx_slots,
+                    tx_slots   = eth_tx_slots,
+                    mtu        = eth_mtu,
+                )
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
 
@@ -131,6 +140,7 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=alinx_axau15.Platform, description="LiteX SoC on AXAU15.")
     parser.add_target_argument("--sys-clk-freq",    default=125e6, type=float, help="System clock frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
@@ -141,8 +151,11 @@ def main():
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",      help="Enable dynamic Ethernet IP addresses setting.")
     parser.add_target_argument("--with-pcie",      action="store_true",      help="Enable PCIe support.")
     parser.add_target_argument("--pcie-speed",     default="gen3",           help="PCIe speed.", choices=["gen3", "gen4"])
+    parser.add_target_argument("--pcie-lanes",     default=4, type=int,      help="PCIe lanes.", choices=[1, 2, 4])
+    parser.add_target_argument("--pcie-dmas",      default=1, type=int,      help="Number of PCIe DMA channels.")
     parser.add_target_argument("--driver",         action="store_true",      help="Generate PCIe driver.")
     parser.add_target_argument("--with-sdcard",    action="store_true",      help="Add SDCard.")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
@@ -156,7 +169,10 @@ def main():
         eth_dynamic_ip = args.eth_dynamic_ip,
         with_pcie      = args.with_pcie,
         pcie_speed     = args.pcie_speed,
+        pcie_lanes     = args.pcie_lanes,
+        pcie_dmas      = args.pcie_dmas,
         with_sdcard    = args.with_sdcard,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
 	)
 
@@ -165,6 +181,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -6,7 +6,6 @@
 # Copyright (c) 2022 IBM Corp.
 # SPDX-License-Identifier: BSD-2-Clause
 
-
 import os
 import math
 
@@ -21,13 +20,6 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT41K128M16
-from litedram.phy import s7ddrphy
-
-from liteeth.phy import LiteEthS7PHYRGMII
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -64,8 +56,14 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, *, device, toolchain="vivado", sys_clk_freq=100e6,
         with_pcie      = False,
+        pcie_dmas      = 1,
+        pcie_msi       = "msi",
         with_etherbone = False,
         with_ethernet  = False,
+        eth_rx_slots   = 2,
+        eth_tx_slots   = 2,
+        eth_mtu        = 1530,
+        eth_data_width = 8,
         eth_dynamic_ip = False,
         eth_reset_time = "10e-3",
         eth_ip         = "192.168.1.120",
@@ -80,6 +78,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K128M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype      = "DDR3",
                 nphases      = 4,
@@ -92,13 +92,22 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy import LiteEthS7PHYRGMII
             self.ethphy = LiteEthS7PHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 hw_reset_cycles = math.ceil(float(eth_reset_time) * self.sys_clk_freq)
             )
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy        = self.ethphy,
+                    dynamic_ip = eth_dynamic_ip,
+                    data_width = eth_data_width,
+                    rx_slots   = eth_rx_slots,
+                    tx_slots   = eth_tx_slots,
+                    mtu        = eth_mtu,
+                )
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
 
@@ -106,10 +115,16 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x1"),
                 data_width = 128,
+                msi_type   = pcie_msi,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, msi_type=pcie_msi)
+            if pcie_msi == "msi-x":
+                # MSI-X Table/PBA offsets are fixed in the PHY configuration.
+                self.csr.add("pcie_msi",       n=3)
+                self.csr.add("pcie_msi_table", n=4)
 
         # Leds -------------------------------------------------------------------------------------
         self.leds = LedChaser(
@@ -120,11 +135,14 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=antmicro_artix_dc_scm.Platform, description="LiteX SoC on Artix DC-SCM.")
     parser.add_target_argument("--flash",        action="store_true",       help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq", default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--device",       default="xc7a100tfgg484-1", choices=["xc7a100tfgg484-1", "xc7a15tfgg484-1"])
     parser.add_target_argument("--with-pcie",    action="store_true",      help="Add PCIe.")
+    parser.add_target_argument("--pcie-dmas",    default=1, type=int,      help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi",     default="msi", choices=["msi", "msi-multi-vector", "msi-x"], help="PCIe MSI type.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",        action="store_true",    help="Add Ethernet.")
     ethopts.add_argument("--with-etherbone",       action="store_true",    help="Add EtherBone.")
@@ -133,6 +151,7 @@ def main():
     parser.add_target_argument("--eth-reset-time", default="10e-3",        help="Duration of Ethernet PHY reset.")
     parser.add_target_argument("--with-sdram",     action="store_true",    help="Add SDRAM.")
     parser.add_target_argument("--with-emmc",      action="store_true",    help="Add eMMC.")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
@@ -142,11 +161,14 @@ def main():
         device                 = args.device,
         sys_clk_freq           = args.sys_clk_freq,
         with_pcie              = args.with_pcie,
+        pcie_dmas              = args.pcie_dmas,
+        pcie_msi               = args.pcie_msi,
         with_ethernet          = args.with_ethernet,
         with_etherbone         = args.with_etherbone,
         eth_ip                 = args.eth_ip,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         eth_reset_time         = args.eth_reset_time,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
     )
 
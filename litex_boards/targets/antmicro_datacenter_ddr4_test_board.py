@@ -23,22 +23,16 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 from litex.soc.cores.video import VideoS7HDMIPHY
 
-from litedram.modules import MTA18ASF2G72PZ
-from litedram.phy.s7ddrphy import A7DDRPHY
 from litedram.init import get_sdram_phy_py_header
 from litedram.core.controller import ControllerSettings
 from litedram.common import PhySettings, GeomSettings, TimingSettings
 
-from liteeth.phy import LiteEthS7PHYRGMII
 from litex.soc.cores.hyperbus import HyperRAM
 
-from litespi.modules import S25FL128S0
-from litespi.opcodes import SpiNorFlashOpCodes as Codes
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, iodelay_clk_freq, with_video_pll=False):
+    def __init__(self, platform, sys_clk_freq, iodelay_clk_freq, with_video_pll=False, with_video_modes=False):
         self.rst          = Signal()
         self.cd_sys       = ClockDomain()
         self.cd_sys2x     = ClockDomain()
@@ -67,7 +61,11 @@ class _CRG(LiteXModule):
 
         # Video PLL.
         if with_video_pll:
-            self.video_pll = video_pll = S7MMCM(speedgrade=-1)
+            if with_video_modes:
+                from litex_boards.video_modes import VideoS7MMCM
+                self.video_pll = video_pll = VideoS7MMCM(speedgrade=-1)
+            else:
+                self.video_pll = video_pll = S7MMCM(speedgrade=-1)
             self.comb += video_pll.reset.eq(self.rst)
             video_pll.register_clkin(clk100, 100e6)
             video_pll.create_clkout(self.cd_hdmi,   40e6)
@@ -79,6 +77,10 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, *, sys_clk_freq=100e6, iodelay_clk_freq=200e6,
             with_ethernet          = False,
+            eth_rx_slots           = 2,
+            eth_tx_slots           = 2,
+            eth_mtu                = 1530,
+            eth_data_width         = 8,
             with_etherbone         = False,
             eth_ip                 = "192.168.1.50",
             eth_reset_time         = "10e-3",
@@ -89,18 +91,22 @@ class BaseSoC(SoCCore):
             with_led_chaser        = True,
             with_video_terminal    = False,
             with_video_framebuffer = False,
+            with_video_modes       = False,
             **kwargs):
         platform = antmicro_datacenter_ddr4_test_board.Platform()
 
         # CRG --------------------------------------------------------------------------------------
+        assert with_video_framebuffer or not with_video_modes
         with_video_pll = (with_video_terminal or with_video_framebuffer)
-        self.crg = _CRG(platform, sys_clk_freq, iodelay_clk_freq=iodelay_clk_freq, with_video_pll=with_video_pll)
+        self.crg = _CRG(platform, sys_clk_freq, iodelay_clk_freq=iodelay_clk_freq, with_video_pll=with_video_pll, with_video_modes=with_video_modes)
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on data center test board", **kwargs)
 
         # DDR4 SDRAM RDIMM -------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MTA18ASF2G72PZ
+            from litedram.phy.s7ddrphy import A7DDRPHY
             self.ddrphy = A7DDRPHY(platform.request("ddr4"),
                 memtype         = "DDR4",
                 iodelay_clk_freq = iodelay_clk_freq,
@@ -126,6 +132,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy import LiteEthS7PHYRGMII
             # Traces between PHY and FPGA introduce ignorable delays of ~0.165ns +/- 0.015ns.
             # PHY chip does not introduce delays on TX (FPGA->PHY), however it includes 1.2ns
             # delay for RX CLK so we only need 0.8ns to match the desired 2ns.
@@ -136,7 +143,15 @@ class BaseSoC(SoCCore):
                 hw_reset_cycles = math.ceil(float(eth_reset_time) * self.sys_clk_freq)
             )
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy        = self.ethphy,
+                    dynamic_ip = eth_dynamic_ip,
+                    data_width = eth_data_width,
+                    rx_slots   = eth_rx_slots,
+                    tx_slots   = eth_tx_slots,
+                    mtu        = eth_mtu,
+                )
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
 
@@ -156,6 +171,8 @@ class BaseSoC(SoCCore):
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
+            from litespi.modules import S25FL128S0
+            from litespi.opcodes import SpiNorFlashOpCodes as Codes
             self.add_spi_flash(mode="4x", module=S25FL128S0(Codes.READ_1_1_4), with_master=True)
 
         # System I2C (behing multiplexer) ----------------------------------------------------------
@@ -187,6 +204,7 @@ class LiteDRAMSettingsEncoder(json.JSONEncoder):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=antmicro_datacenter_ddr4_test_board.Platform, description="LiteX SoC on DDR4 Datacenter Test Board.")
     parser.add_target_argument("--flash",            action="store_true",       help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq",     default=100e6, type=float, help="System clock frequency.")
@@ -201,7 +219,9 @@ def main():
     parser.add_target_argument("--with-sdcard",            action="store_true",    help="Add SDCard.")
     parser.add_target_argument("--with-video-terminal",    action="store_true",    help="Enable Video Terminal (HDMI).")
     parser.add_target_argument("--with-video-framebuffer", action="store_true",    help="Enable Video Framebuffer (HDMI).")
+    parser.add_target_argument("--with-video-modes",       action="store_true",    help="Enable run-time Video Modes switching (with Video Framebuffer).")
     parser.add_target_argument("--with-spi-flash",         action="store_true",    help="Enable SPI Flash (MMAPed).")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
@@ -218,6 +238,8 @@ def main():
         with_spi_flash         = args.with_spi_flash,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        with_video_modes       = args.with_video_modes,
+        **eth_mac_argdict(args),
         **parser.soc_argdict)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -226,6 +248,9 @@ def main():
         # LiteDRAM settings (controller, phy, geom, timing)
         with open(os.path.join(builder.output_dir, 'litedram_settings.json'), 'w') as f:
             json.dump(builder.soc.sdram.controller.settings, f, cls=LiteDRAMSettingsEncoder, indent=4)
+        if args.with_video_modes:
+            from litex_boards.video_modes import generate_video_modes_header
+            generate_video_modes_header(soc, os.path.join(builder.generated_dir, "video_modes.h"))
 
     if args.load:
         prog = soc.platform.create_programmer()
@@ -17,10 +17,6 @@ from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT53E256M16D1
-from litedram.phy import lpddr4
-
-from liteeth.phy import LiteEthS7PHYRGMII
 from litex.soc.cores.hyperbus import HyperRAM
 
 # CRG ----------------------------------------------------------------------------------------------
@@ -50,6 +46,10 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, *, sys_clk_freq=50e6, iodelay_clk_freq=200e6,
             with_ethernet   = False,
+            eth_rx_slots    = 2,
+            eth_tx_slots    = 2,
+            eth_mtu         = 1530,
+            eth_data_width  = 8,
             with_etherbone  = False,
             eth_ip          = "192.168.1.50",
             eth_dynamic_ip  = False,
@@ -67,6 +67,8 @@ class BaseSoC(SoCCore):
 
         # LDDR4 SDRAM ------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT53E256M16D1
+            from litedram.phy import lpddr4
             self.ddrphy = lpddr4.K7LPDDR4PHY(platform.request("lpddr4"),
                 iodelay_clk_freq = iodelay_clk_freq,
                 sys_clk_freq     = sys_clk_freq,
@@ -89,6 +91,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy import LiteEthS7PHYRGMII
             # Traces between PHY and FPGA introduce ignorable delays of ~0.165ns +/- 0.015ns.
             # PHY chip does not introduce delays on TX (FPGA->PHY), however it includes 1.2ns
             # delay for RX CLK so we only need 0.8ns to match the desired 2ns.
@@ -98,7 +101,15 @@ class BaseSoC(SoCCore):
                 rx_delay   = 0.8e-9,
             )
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy        = self.ethphy,
+                    dynamic_ip = eth_dynamic_ip,
+                    data_width = eth_data_width,
+                    rx_slots   = eth_rx_slots,
+                    tx_slots   = eth_tx_slots,
+                    mtu        = eth_mtu,
+                )
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
 
@@ -112,6 +123,7 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=antmicro_lpddr4_test_board.Platform, description="LiteX SoC on LPDDR4 Test Board.")
     parser.add_target_argument("--flash",            action="store_true", help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq",     default=50e6,  type=float, help="System clock frequency.")
@@ -123,6 +135,7 @@ def main():
     parser.add_target_argument("--eth-dynamic-ip",   action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
     parser.add_target_argument("--with-hyperram",    action="store_true",    help="Add HyperRAM.")
     parser.add_target_argument("--with-sdcard",      action="store_true",    help="Add SDCard.")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
@@ -136,6 +149,7 @@ def main():
         eth_dynamic_ip    = args.eth_dynamic_ip,
         with_hyperram     = args.with_hyperram,
         with_sdcard       = args.with_sdcard,
+        **eth_mac_argdict(args),
         **parser.soc_argdict)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -19,11 +19,6 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 
-from litedram.modules import EDY4016A
-from litedram.phy import usddrphy
-
-from liteeth.phy.usrgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -60,6 +55,10 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
         with_ethernet   = False,
+        eth_rx_slots    = 2,
+        eth_tx_slots    = 2,
+        eth_mtu         = 1530,
+        eth_data_width  = 8,
         with_etherbone  = False,
         eth_ip          = "192.168.1.50",
         with_led_chaser = True,
@@ -76,6 +75,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
+            from liteeth.phy.usrgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
@@ -89,10 +89,19 @@ class BaseSoC(SoCCore):
                         if item.name == "REFCLK_FREQUENCY":
                             item.value=200.00
                             
-            self.add_ethernet(phy=self.ethphy)
+            from litex_boards.ethernet import add_ethernet
+            add_ethernet(self,
+                phy        = self.ethphy,
+                data_width = eth_data_width,
+                rx_slots   = eth_rx_slots,
+                tx_slots   = eth_tx_slots,
+                mtu        = eth_mtu,
+            )
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import EDY4016A
+            from litedram.phy import usddrphy
             self.ddrphy = usddrphy.USDDRPHY(platform.request("ddram"),
                 memtype          = "DDR4",
                 sys_clk_freq     = sys_clk_freq,
@@ -109,12 +118,14 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=avnet_aesku40.Platform, description="LiteX SoC on AESKU40.")
     parser.add_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",  action="store_true",    help="Add Ethernet.")
     ethopts.add_argument("--with-etherbone", action="store_true",    help="Add EtherBone.")
     parser.add_target_argument("--eth-ip",   default="192.168.1.50", help="Ethernet/Etherbone IP address.")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -122,6 +133,7 @@ def main():
         with_ethernet  = args.with_ethernet,
         with_etherbone = args.with_etherbone,
         eth_ip         = args.eth_ip,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
 	)
     builder = Builder(soc, **parser.builder_argdict)
@@ -36,11 +36,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 
-from litedram.modules import MT8JTF12864, parse_spd_hexdump, SDRAMModule
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -71,6 +66,10 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
         with_ethernet   = False,
+        eth_rx_slots    = 2,
+        eth_tx_slots    = 2,
+        eth_mtu         = 1530,
+        eth_data_width  = 8,
         with_etherbone  = False,
         with_rts_reset  = False,
         with_led_chaser = True,
@@ -90,6 +89,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT8JTF12864, parse_spd_hexdump, SDRAMModule
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.K7DDRPHY(
                 platform.request("ddram"),
                 memtype      = "DDR3",
@@ -115,6 +116,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.s7rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
@@ -122,10 +124,15 @@ class BaseSoC(SoCCore):
             )
 
         if with_ethernet:
-            self.add_ethernet(
+            from litex_boards.ethernet import add_ethernet
+            add_ethernet(self,
                 phy            = self.ethphy,
                 dynamic_ip     = True,
-                software_debug = False
+                software_debug = False,
+                data_width     = eth_data_width,
+                rx_slots       = eth_rx_slots,
+                tx_slots       = eth_tx_slots,
+                mtu            = eth_mtu,
             )
 
         if with_etherbone:
@@ -145,6 +152,7 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=berkeleylab_marble.Platform, description="LiteX SoC on BerkeleyLab Marble.")
     parser.add_target_argument("--sys-clk-freq",   default=125e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
@@ -152,6 +160,7 @@ def main():
     parser.add_target_argument("--with-rts-reset", action="store_true",       help="Connect UART RTS line to sys_clk reset.")
     parser.add_target_argument("--with-bist",      action="store_true",       help="Add DDR3 BIST Generator/Checker.")
     parser.add_target_argument("--spd-dump",                                  help="DDR3 configuration file, dumped using the `spdread` command in LiteX BIOS.")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -160,6 +169,7 @@ def main():
         with_etherbone = args.with_etherbone,
         with_bist      = args.with_bist,
         spd_dump       = args.spd_dump,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -22,6 +22,8 @@
 # Get and install wishbone tool from: https://github.com/litex-hub/wishbone-utils/releases
 # wishbone-tool --ethernet-host 192.168.1.50 --server terminal --csr-csv csr.csv
 # You should see the LiteX BIOS and be able to interact with it.
+# Add --etherbone-bulk for bulk memory transfers, benchmark with:
+# python3 -m litex_boards.etherbone_bulk --csr-csv=csr.csv
 #
 # 3) SoC with USB-ACM UART (on V7.0):
 # - Replace U23 with a SN74CBT3245APWR or remove U23 and place jumper wires to make the ports bi-directional.
@@ -43,7 +45,6 @@
 # Note you can also use the i5a-907 board:
 # ./colorlight_5a_75x.py --board=i5a-907 --revision=7.0 --build
 
-
 from migen import *
 from migen.genlib.resetsync import AsyncResetSynchronizer
 
@@ -58,11 +59,6 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import M12L16161A, M12L64322A
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-
-from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -121,7 +117,12 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, board, revision, sys_clk_freq=60e6, toolchain="trellis",
         with_ethernet    = False,
+        eth_rx_slots     = 2,
+        eth_tx_slots     = 2,
+        eth_mtu          = 1530,
+        eth_data_width   = 32,
         with_etherbone   = False,
+        etherbone_bulk   = False,
         eth_ip           = "192.168.1.50",
         eth_phy          = 0,
         with_led_chaser  = True,
@@ -163,6 +164,8 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import M12L16161A, M12L64322A
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
             if (board == "5a-75e" and revision == "6.0") or (board == "5a-75b" and (revision == "8.0" or revision == "8.2")):
@@ -179,14 +182,26 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", eth_phy),
                 pads       = self.platform.request("eth", eth_phy),
                 tx_delay   = 0e-9)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, data_width=32)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy        = self.ethphy,
+                    data_width = eth_data_width,
+                    rx_slots   = eth_rx_slots,
+                    tx_slots   = eth_tx_slots,
+                    mtu        = eth_mtu,
+                )
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, data_width=32)
+                # Bulk: large record buffers for memory dumps/firmware loads (see etherbone_bulk.py).
+                from litex_boards.etherbone_bulk import ETHERBONE_BUFFER_DEPTH, ETHERBONE_BULK_BUFFER_DEPTH
+                etherbone_buffer_depth = ETHERBONE_BULK_BUFFER_DEPTH if etherbone_bulk else ETHERBONE_BUFFER_DEPTH
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, data_width=32, buffer_depth=etherbone_buffer_depth)
+                self.add_constant("ETHERBONE_BUFFER_DEPTH", etherbone_buffer_depth)
 
         # Leds -------------------------------------------------------------------------------------
         # Disable leds when serial is used.
@@ -220,6 +235,7 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=colorlight_5a_75b.Platform, description="LiteX SoC on Colorlight 5A-75X.")
     parser.add_target_argument("--board",             default="5a-75b",         help="Board type (5a-75b, 5a-75e or i5a-907).")
     parser.add_target_argument("--revision",          default="7.0",            help="Board revision (6.0, 6.1, 7.0, 8.0, or 8.2).")
@@ -227,23 +243,30 @@ def main():
     ethopts = parser.target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",           action="store_true",    help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone",          action="store_true",    help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-bulk",    action="store_true",    help="Enable Etherbone bulk mode (large record buffers).")
     parser.add_target_argument("--eth-ip",            default="192.168.1.50", help="Ethernet/Etherbone IP address.")
     parser.add_target_argument("--eth-phy",           default=0, type=int,    help="Ethernet PHY (0 or 1).")
     parser.add_target_argument("--use-internal-osc",  action="store_true",    help="Use internal oscillator.")
     parser.add_target_argument("--sdram-rate",        default="1:1",          help="SDRAM Rate (1:1 Full Rate or 1:2 Half Rate).")
     parser.add_target_argument("--with-spi-flash",    action="store_true",    help="Add SPI flash support to the SoC")
+    eth_mac_args(parser, data_width=32)
     args = parser.parse_args()
 
+    if args.etherbone_bulk and not args.with_etherbone:
+        parser.error("--etherbone-bulk requires --with-etherbone.")
+
     soc = BaseSoC(board=args.board, revision=args.revision,
         sys_clk_freq     = args.sys_clk_freq,
         toolchain        = args.toolchain,
         with_ethernet    = args.with_ethernet,
         with_etherbone   = args.with_etherbone,
+        etherbone_bulk   = args.etherbone_bulk,
         eth_ip           = args.eth_ip,
         eth_phy          = args.eth_phy,
         use_internal_osc = args.use_internal_osc,
         sdram_rate       = args.sdram_rate,
         with_spi_flash   = args.with_spi_flash,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
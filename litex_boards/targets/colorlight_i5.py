@@ -6,6 +6,8 @@
 # Copyright (c) 2021 Kazumoto Kojima <kkojima@rr.iij4u.or.jp>
 # SPDX-License-Identifier: BSD-2-Clause
 
+import os
+
 from migen import *
 
 from litex.gen import *
@@ -22,11 +24,6 @@ from litex.soc.cores.led import LedChaser
 
 from litex.soc.interconnect.csr import *
 
-from litedram.modules import M12L64322A # Compatible with EM638325-6H.
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-
-from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -96,6 +93,10 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, board="i5", revision="7.0", toolchain="trellis", sys_clk_freq=60e6,
         with_ethernet          = False,
+        eth_rx_slots           = 2,
+        eth_tx_slots           = 2,
+        eth_mtu                = 1530,
+        eth_data_width         = 8,
         with_etherbone         = False,
         local_ip               = "",
         remote_ip              = "",
@@ -105,6 +106,8 @@ class BaseSoC(SoCCore):
         sdram_rate             = "1:1",
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        video_double_buffered  = False,
+        with_video_blitter     = False,
         **kwargs):
         board = board.lower()
         assert board in ["i5", "i9"]
@@ -139,6 +142,8 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import M12L64322A # Compatible with EM638325-6H.
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             self.sdrphy = sdrphy_cls(platform.request("sdram"))
             self.add_sdram("sdram",
@@ -149,12 +154,20 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", eth_phy),
                 pads       = self.platform.request("eth", eth_phy),
                 tx_delay = 0)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy        = self.ethphy,
+                    data_width = eth_data_width,
+                    rx_slots   = eth_rx_slots,
+                    tx_slots   = eth_tx_slots,
+                    mtu        = eth_mtu,
+                )
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy)
 
@@ -173,17 +186,28 @@ class BaseSoC(SoCCore):
             self.add_constant("REMOTEIP4", int(remote_ip[3]))
 
         # Video ------------------------------------------------------------------------------------
+        assert with_video_framebuffer or not with_video_blitter
         if with_video_terminal or with_video_framebuffer:
             self.videophy = VideoHDMIPHY(platform.request("gpdi"), clock_domain="hdmi")
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
+                if video_double_buffered:
+                    from litex_boards.video_framebuffer import add_video_framebuffer
+                    add_video_framebuffer(self, phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi",
+                        fifo_depth = 64*1024, # Limited EBRs on LFE5U-25F.
+                    )
+                else:
+                    self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
+                if with_video_blitter:
+                    from litex_boards.video_blitter import add_video_blitter
+                    add_video_blitter(self)
 
 # Build --------------------------------------------------------------------------------------------
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=colorlight_i5.Platform, description="LiteX SoC on Colorlight I5.")
     parser.add_target_argument("--board",            default="i5",             help="Board type (i5).")
     parser.add_target_argument("--revision",         default="7.0",            help="Board revision (7.0).")
@@ -202,6 +226,9 @@ def main():
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    parser.add_target_argument("--video-double-buffered", action="store_true", help="Use double-buffered (page flipping, burst DMA) Video Framebuffer.")
+    parser.add_target_argument("--with-video-blitter",    action="store_true", help="Enable Video Blitter (DMA fill/copy, with Video Framebuffer).")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(board=args.board, revision=args.revision,
@@ -216,6 +243,9 @@ def main():
         sdram_rate             = args.sdram_rate,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_double_buffered  = args.video_double_buffered,
+        with_video_blitter     = args.with_video_blitter,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
     )
     soc.platform.add_extension(colorlight_i5._sdcard_pmod_io)
@@ -227,6 +257,9 @@ def main():
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
+        if args.with_video_blitter:
+            from litex_boards.video_blitter import generate_video_blitter_header
+            generate_video_blitter_header(soc, os.path.join(builder.generated_dir, "video_blitter.h"))
 
     if args.load:
         prog = soc.platform.create_programmer()
@@ -20,7 +20,6 @@
 # However, is provides PMOD-compatible headers and the ethernet IOs are compatible.
 # See https://github.com/wuxx/Colorlight-FPGA-Projects#ext-board for more infos.
 
-
 from migen import *
 
 from litex.gen import *
@@ -36,11 +35,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.dna  import DNA
 
-from litedram.modules import M12L64322A
-from litedram.phy import GENSDRPHY
-
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -79,6 +73,10 @@ class BaseSoC(SoCCore):
         with_dna        = False,
         with_pmod_uart  = False,
         with_ethernet   = False,
+        eth_rx_slots    = 2,
+        eth_tx_slots    = 2,
+        eth_mtu         = 1530,
+        eth_data_width  = 8,
         with_etherbone  = False,
         eth_port        = 0,
         eth_ip          = "192.168.1.50",
@@ -106,6 +104,8 @@ class BaseSoC(SoCCore):
 
         # SDRAM ------------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import M12L64322A
+            from litedram.phy import GENSDRPHY
             sdrphy_cls = GENSDRPHY
             self.sdrphy = sdrphy_cls(platform.request("sdram"))
             self.add_sdram("sdram",
@@ -117,12 +117,21 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.s7rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", eth_port),
                 pads       = self.platform.request("eth", eth_port),
                 tx_delay = 0)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy        = self.ethphy,
+                    dynamic_ip = eth_dynamic_ip,
+                    data_width = eth_data_width,
+                    rx_slots   = eth_rx_slots,
+                    tx_slots   = eth_tx_slots,
+                    mtu        = eth_mtu,
+                )
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
 
@@ -144,6 +153,7 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=colorlight_i9plus.Platform, description="LiteX SoC on Arty A7.")
     parser.add_target_argument("--flash",          action="store_true",       help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
@@ -156,6 +166,7 @@ def main():
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",       help="Enable dynamic Ethernet IP addresses setting.")
     parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable SPI Flash (MMAPed).")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
@@ -171,6 +182,7 @@ def main():
         eth_ip         = args.eth_ip,
         eth_dynamic_ip = args.eth_dynamic_ip,
         with_spi_flash = args.with_spi_flash,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
     )
 
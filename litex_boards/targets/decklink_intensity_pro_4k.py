@@ -21,9 +21,6 @@ from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -42,7 +39,7 @@ class _CRG(LiteXModule):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=125e6, with_pcie=False, **kwargs):
+    def __init__(self, sys_clk_freq=125e6, with_pcie=False, pcie_dmas=1, pcie_msi="msi", **kwargs):
         platform = decklink_intensity_pro_4k.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -54,10 +51,16 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
+                msi_type   = pcie_msi,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, msi_type=pcie_msi)
+            if pcie_msi == "msi-x":
+                # MSI-X Table/PBA offsets are fixed in the PHY configuration.
+                self.csr.add("pcie_msi",       n=3)
+                self.csr.add("pcie_msi_table", n=4)
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -66,12 +69,16 @@ def main():
     parser = LiteXArgumentParser(platform=decklink_intensity_pro_4k.Platform, description="LiteX SoC Blackmagic Decklink Intensity Pro 4K.")
     parser.add_target_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-dmas",    default=1, type=int,       help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi",     default="msi", choices=["msi", "msi-multi-vector", "msi-x"], help="PCIe MSI type.")
     parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
         with_pcie    = args.with_pcie | True, # FIXME: Always enable PCIe for now.
+        pcie_dmas    = args.pcie_dmas,
+        pcie_msi     = args.pcie_msi,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -79,6 +86,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
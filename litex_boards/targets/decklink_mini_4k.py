@@ -24,12 +24,6 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.video import VideoS7GTPHDMIPHY
 
-from litedram.modules import MT41K128M16
-from litedram.phy import s7ddrphy
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -74,10 +68,15 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCMini):
     def __init__(self, sys_clk_freq=100e6,
         with_pcie              = False,
+        pcie_dmas              = 1,
+        pcie_msi               = "msi",
         with_sata              = False,
+        sata_gen               = "gen2",
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        with_colorbars_capture = False,
         **kwargs):
+        assert with_pcie or not with_colorbars_capture
         if with_video_terminal or with_video_framebuffer:
             sys_clk_freq = int(148.5e6) # FIXME: For now requires sys_clk >= video_clk.
         platform = decklink_mini_4k.Platform()
@@ -91,6 +90,8 @@ class BaseSoC(SoCMini):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K128M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype        = "DDR3",
                 nphases        = 4,
@@ -103,10 +104,16 @@ class BaseSoC(SoCMini):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
+                msi_type   = pcie_msi,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, msi_type=pcie_msi)
+            if pcie_msi == "msi-x":
+                # MSI-X Table/PBA offsets are fixed in the PHY configuration.
+                self.csr.add("pcie_msi",       n=3)
+                self.csr.add("pcie_msi_table", n=4)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -132,7 +139,7 @@ class BaseSoC(SoCMini):
             self.sata_phy = LiteSATAPHY(platform.device,
                 refclk     = ClockSignal("sata_refclk"),
                 pads       = platform.request("pcie2sata"),
-                gen        = "gen2",
+                gen        = sata_gen,
                 clk_freq   = sys_clk_freq,
                 data_width = 16)
 
@@ -150,6 +157,13 @@ class BaseSoC(SoCMini):
                 self.add_video_framebuffer(phy=self.videophy, timings="1920x1080@60Hz", clock_domain="hdmi")
             platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-49]") # FIXME: Use GTP refclk.
 
+        # Video Capture ----------------------------------------------------------------------------
+        # No SDI/HDMI input PHY (GTP inputs): capture a Color Bars test pattern.
+        if with_colorbars_capture:
+            from litex_boards.video_capture import add_video_capture
+            add_video_capture(self, timings="1920x1080@60Hz", clock_domain="hdmi", data_width=128)
+            self.comb += self.video_capture.source.connect(self.pcie_dma0.sink)
+
 # Build --------------------------------------------------------------------------------------------
 
 def main():
@@ -159,18 +173,34 @@ def main():
     pcieopts = parser.target_group.add_mutually_exclusive_group()
     pcieopts.add_argument("--with-pcie",   action="store_true", help="Enable PCIe support.")
     parser.add_target_argument("--driver", action="store_true", help="Generate PCIe driver.")
+    parser.add_target_argument("--pcie-dmas", default=1, type=int, help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi", default="msi", choices=["msi", "msi-multi-vector", "msi-x"], help="PCIe MSI type.")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
     pcieopts.add_argument("--with-sata",            action="store_true", help="Enable SATA support (over PCIe2SATA).")
+    parser.add_target_argument("--sata-gen",        default="2",         help="SATA Gen.", choices=["1", "2", "3"])
+    parser.add_target_argument("--with-colorbars-capture", action="store_true", help="Enable Video Capture of a Color Bars test pattern (DRAM ring buffer -> PCIe DMA, with PCIe).")
     args = parser.parse_args()
 
+    if args.with_sata:
+        from litex_boards.sata import check_sata_phy
+        sys_clk_freq = 148.5e6 if (args.with_video_terminal or args.with_video_framebuffer) else args.sys_clk_freq # See BaseSoC.
+        check_sata_phy(parser, "gen" + args.sata_gen, sys_clk_freq)
+
+    if args.with_colorbars_capture and not args.with_pcie:
+        parser.error("Color Bars Capture requires --with-pcie.")
+
     soc = BaseSoC(
         sys_clk_freq           = args.sys_clk_freq,
         with_pcie              = args.with_pcie,
+        pcie_dmas              = args.pcie_dmas,
+        pcie_msi               = args.pcie_msi,
         with_sata              = args.with_sata,
+        sata_gen               = "gen" + args.sata_gen,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        with_colorbars_capture = args.with_colorbars_capture,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -178,7 +208,11 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
+        if args.with_colorbars_capture:
+            from litex_boards.video_capture import generate_video_capture_software
+            generate_video_capture_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
         prog = soc.platform.create_programmer()
@@ -25,17 +25,10 @@ from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 
-from litedram.common import PHYPadsReducer
-from litedram.modules import MT41J256M16
-from litedram.phy import usddrphy
-
-from litepcie.phy.uspciephy import USPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq):
+    def __init__(self, platform, sys_clk_freq, with_video_clk=False):
         self.rst       = Signal()
         self.cd_sys    = ClockDomain()
         self.cd_sys4x  = ClockDomain()
@@ -59,14 +52,23 @@ class _CRG(LiteXModule):
         ]
         self.idelayctrl = USIDELAYCTRL(cd_ref=self.cd_idelay, cd_sys=self.cd_sys)
 
+        # Video PLL.
+        if with_video_clk:
+            self.cd_video = ClockDomain()
+            self.video_pll = video_pll = USMMCM(speedgrade=-2)
+            self.comb += video_pll.reset.eq(self.rst)
+            video_pll.register_clkin(pll.clkin, 200e6)
+            video_pll.create_clkout(self.cd_video, 148.5e6)
+
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=200e6, with_pcie=False, pcie_lanes=4, **kwargs):
+    def __init__(self, sys_clk_freq=200e6, with_pcie=False, pcie_lanes=4, pcie_dmas=1, with_colorbars_capture=False, **kwargs):
         platform = decklink_quad_hdmi_recorder.Platform()
+        assert with_pcie or not with_colorbars_capture
 
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq)
+        self.crg = _CRG(platform, sys_clk_freq, with_video_clk=with_colorbars_capture)
 
         # SoCCore ----------------------------------------------------------------------------------
         kwargs["uart_name"]    = "crossover"
@@ -75,6 +77,9 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.common import PHYPadsReducer
+            from litedram.modules import MT41J256M16
+            from litedram.phy import usddrphy
             self.ddrphy = usddrphy.USDDRPHY(
                 pads             = PHYPadsReducer(platform.request("ddram"), [0, 1, 2, 3]),
                 memtype          = "DDR3",
@@ -90,7 +95,10 @@ class BaseSoC(SoCCore):
         # FIXME: Does not seem to be working when also enabling DRAM. Has been tested succesfully by
         # disabling DRAM with --integrated-main-ram-size=0x100.
         if with_pcie:
+            from litepcie.phy.uspciephy import USPCIEPHY
             data_width = {
+                1 : 64,
+                2 : 64,
                 4 : 128,
                 8 : 256,
             }[pcie_lanes]
@@ -98,11 +106,19 @@ class BaseSoC(SoCCore):
                 speed      = "gen3",
                 data_width = data_width,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
             # False Paths (FIXME: Improve integration).
             platform.toolchain.pre_placement_commands.append("set_false_path -from [get_clocks sys_clk] -to [get_clocks pcie_clk_1]")
             platform.toolchain.pre_placement_commands.append("set_false_path -from [get_clocks pcie_clk_1] -to [get_clocks sys_clk]")
 
+        # Video Capture ----------------------------------------------------------------------------
+        # No HDMI input PHY (GTH inputs): capture a Color Bars test pattern.
+        if with_colorbars_capture:
+            from litex_boards.video_capture import add_video_capture
+            add_video_capture(self, timings="1920x1080@60Hz", clock_domain="video", data_width=data_width)
+            self.comb += self.video_capture.source.connect(self.pcie_dma0.sink)
+            platform.add_false_path_constraints(self.crg.cd_sys.clk, self.crg.cd_video.clk)
+
 # Build --------------------------------------------------------------------------------------------
 
 def main():
@@ -110,12 +126,21 @@ def main():
     parser = LiteXArgumentParser(platform=decklink_quad_hdmi_recorder.Platform, description="LiteX SoC on Blackmagic Decklink Quad HDMI Recorder.")
     parser.add_target_argument("--sys-clk-freq", default=200e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",   default=4, type=int, choices=[1, 2, 4, 8], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",    default=1, type=int,       help="Number of PCIe DMA channels.")
     parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--with-colorbars-capture", action="store_true", help="Enable Video Capture of a Color Bars test pattern (DRAM ring buffer -> PCIe DMA, with PCIe).")
     args = parser.parse_args()
 
+    if args.with_colorbars_capture and not args.with_pcie:
+        parser.error("Color Bars Capture requires --with-pcie.")
+
     soc = BaseSoC(
-        sys_clk_freq = args.sys_clk_freq,
-        with_pcie    = args.with_pcie,
+        sys_clk_freq           = args.sys_clk_freq,
+        with_pcie              = args.with_pcie,
+        pcie_lanes             = args.pcie_lanes,
+        pcie_dmas              = args.pcie_dmas,
+        with_colorbars_capture = args.with_colorbars_capture,
         **parser.soc_argdict
 	)
     builder = Builder(soc, **parser.builder_argdict)
@@ -123,7 +148,11 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
+        if args.with_colorbars_capture:
+            from litex_boards.video_capture import generate_video_capture_software
+            generate_video_capture_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
         prog = soc.platform.create_programmer()
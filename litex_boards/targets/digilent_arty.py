@@ -27,11 +27,6 @@ from litex.soc.cores.gpio import GPIOIn, GPIOTristate
 from litex.soc.cores.xadc import XADC
 from litex.soc.cores.dna  import DNA
 
-from litedram.modules import MT41K128M16
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.mii import LiteEthPHYMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -75,6 +70,7 @@ class BaseSoC(SoCCore):
         with_dna        = False,
         with_ethernet   = False,
         with_etherbone  = False,
+        etherbone_bulk  = False,
         eth_ip          = "192.168.1.50",
         remote_ip       = None,
         eth_dynamic_ip  = False,
@@ -105,6 +101,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K128M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype        = "DDR3",
                 nphases        = 4,
@@ -117,11 +115,16 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.mii import LiteEthPHYMII
             self.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
             if with_etherbone:
-                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet)
+                # Bulk: large record buffers for memory dumps/firmware loads (see etherbone_bulk.py).
+                from litex_boards.etherbone_bulk import ETHERBONE_BUFFER_DEPTH, ETHERBONE_BULK_BUFFER_DEPTH
+                etherbone_buffer_depth = ETHERBONE_BULK_BUFFER_DEPTH if etherbone_bulk else ETHERBONE_BUFFER_DEPTH
+                self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_ethmac=with_ethernet, buffer_depth=etherbone_buffer_depth)
+                self.add_constant("ETHERBONE_BUFFER_DEPTH", etherbone_buffer_depth)
             elif with_ethernet:
                 self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, local_ip=eth_ip, remote_ip=remote_ip)
 
@@ -204,6 +207,7 @@ def main():
     parser.add_target_argument("--with-usb",       action="store_true",       help="Enable USB Host.")
     parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
     parser.add_target_argument("--with-etherbone", action="store_true",       help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-bulk", action="store_true",       help="Enable Etherbone bulk mode (large record buffers).")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",   help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",       help="Enable dynamic Ethernet IP addresses setting.")
@@ -217,6 +221,8 @@ def main():
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
+    if args.etherbone_bulk and not args.with_etherbone:
+        parser.error("--etherbone-bulk requires --with-etherbone.")
 
     soc = BaseSoC(
         variant        = args.variant,
@@ -226,6 +232,7 @@ def main():
         with_dna       = args.with_dna,
         with_ethernet  = args.with_ethernet,
         with_etherbone = args.with_etherbone,
+        etherbone_bulk = args.etherbone_bulk,
         eth_ip         = args.eth_ip,
         remote_ip      = args.remote_ip,
         eth_dynamic_ip = args.eth_dynamic_ip,
@@ -20,15 +20,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 
-from litedram.modules import MT8KTF51264
-from litedram.phy import s7ddrphy
-
-from litedram.common import PHYPadsReducer
-
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-from liteeth.phy.v7_1000basex import V7_1000BASEX
-from liteeth.phy import LiteEthPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -70,6 +61,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+             from litedram.modules import MT8KTF51264
+             from litedram.phy import s7ddrphy
              self.ddrphy = s7ddrphy.V7DDRPHY(platform.request("ddram"),
                 memtype          = "DDR3",
                 nphases          = 4,
@@ -84,6 +77,7 @@ class BaseSoC(SoCCore):
             
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.v7_1000basex import V7_1000BASEX
             self.ethphy = V7_1000BASEX(
                 refclk_or_clk_pads = self.crg.cd_sfp.clk,
                 data_pads          = self.platform.request("sfp"),
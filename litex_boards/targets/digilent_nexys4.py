@@ -25,8 +25,6 @@ from litex.soc.interconnect import wishbone
 
 from litex.soc.integration.soc import colorer
 from litex.soc.cores.video import VideoVGAPHY
-from liteeth.phy.rmii import LiteEthPHYRMII
-
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -186,6 +184,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.rmii import LiteEthPHYRMII
             self.ethphy = LiteEthPHYRMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
@@ -6,6 +6,8 @@
 # Copyright (c) 2015-2019 Florent Kermarrec <florent@enjoy-digital.fr>
 # SPDX-License-Identifier: BSD-2-Clause
 
+import os
+
 from migen import *
 
 from litex.gen import *
@@ -18,15 +20,10 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.video import VideoS7HDMIPHY
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT41K256M16
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, sys_clk_freq, toolchain="vivado", with_video_pll=False):
+    def __init__(self, platform, sys_clk_freq, toolchain="vivado", with_video_pll=False, with_video_modes=False):
         self.rst          = Signal()
         self.cd_sys       = ClockDomain()
         self.cd_sys4x     = ClockDomain()
@@ -60,7 +57,11 @@ class _CRG(LiteXModule):
 
         # Video PLL.
         if with_video_pll:
-            self.video_pll = video_pll = S7MMCM(speedgrade=-1)
+            if with_video_modes:
+                from litex_boards.video_modes import VideoS7MMCM
+                self.video_pll = video_pll = VideoS7MMCM(speedgrade=-1)
+            else:
+                self.video_pll = video_pll = S7MMCM(speedgrade=-1)
             video_pll.reset.eq(~rst_n | self.rst)
             video_pll.register_clkin(clk100, 100e6)
             video_pll.create_clkout(self.cd_hdmi,   40e6)
@@ -71,18 +72,34 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, toolchain="vivado", sys_clk_freq=100e6,
         with_ethernet          = False,
+        eth_rx_slots           = 2,
+        eth_tx_slots           = 2,
+        eth_mtu                = 1530,
+        eth_data_width         = 8,
+        with_udp_streamer      = False,
+        udp_streamer_ip        = "192.168.1.50",
+        udp_streamer_dst_ip    = "192.168.1.100",
         with_led_chaser        = True,
-        with_sata              = False, sata_gen="gen2",
+        with_sata              = False,
+        sata_gen               = "gen2",
         vadj                   = "1.2V",
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        with_video_modes       = False,
+        video_double_buffered  = False,
+        with_video_blitter     = False,
+        with_video_capture     = False,
         **kwargs):
         platform = digilent_nexys_video.Platform(toolchain=toolchain)
 
         # CRG --------------------------------------------------------------------------------------
+        assert with_video_framebuffer or not with_video_modes
+        assert with_video_framebuffer or not with_video_blitter
+        assert with_udp_streamer or not with_video_capture
         with_video_pll = (with_video_terminal or with_video_framebuffer)
         self.crg = _CRG(platform, sys_clk_freq, toolchain,
-            with_video_pll       = with_video_pll
+            with_video_pll   = with_video_pll,
+            with_video_modes = with_video_modes,
         )
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -90,6 +107,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K256M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype      = "DDR3",
                 nphases      = 4,
@@ -100,12 +119,28 @@ class BaseSoC(SoCCore):
                 l2_cache_size = kwargs.get("l2_size", 8192)
             )
 
-        # Ethernet ---------------------------------------------------------------------------------
-        if with_ethernet:
+        # Ethernet / UDP Streamer ------------------------------------------------------------------
+        if with_ethernet or with_udp_streamer:
+            from liteeth.phy.s7rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
-            self.add_ethernet(phy=self.ethphy)
+            if with_ethernet:
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy        = self.ethphy,
+                    data_width = eth_data_width,
+                    rx_slots   = eth_rx_slots,
+                    tx_slots   = eth_tx_slots,
+                    mtu        = eth_mtu,
+                )
+            if with_udp_streamer:
+                from litex_boards.udp_streamer import add_udp_streamer
+                add_udp_streamer(self,
+                    phy            = self.ethphy,
+                    ip_address     = udp_streamer_ip,
+                    dst_ip_address = udp_streamer_dst_ip,
+                )
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -149,7 +184,32 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
+                if video_double_buffered:
+                    from litex_boards.video_framebuffer import add_video_framebuffer
+                    add_video_framebuffer(self, phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi",
+                        max_timings = "1920x1080@30Hz" if with_video_modes else None,
+                    )
+                else:
+                    self.add_video_framebuffer(phy=self.videophy, timings="800x600@60Hz", clock_domain="hdmi")
+                if with_video_blitter:
+                    from litex_boards.video_blitter import add_video_blitter
+                    add_video_blitter(self)
+
+        # Video Capture (HDMI In -> DRAM Ring Buffer -> UDP Streamer) ------------------------------
+        if with_video_capture:
+            from litex_boards.video_capture import VideoS7HDMIInPHY, add_video_capture
+            self.videophy_in = VideoS7HDMIInPHY(platform.request("hdmi_in"),
+                pix_clk_freq = 74.25e6,
+                clock_domain = "hdmi_in",
+                edid_timings = "1280x720@60Hz",
+            )
+            platform.add_period_constraint(self.videophy_in.clk, 1e9/74.25e6)
+            platform.add_false_path_constraints(self.crg.cd_sys.clk, self.videophy_in.cd_hdmi_in.clk)
+            add_video_capture(self, phy=self.videophy_in, timings="1280x720@60Hz", clock_domain="hdmi_in",
+                data_width = self.bus.data_width,
+            )
+            # Lossy and unframed: see litex_boards/video_capture.py.
+            self.comb += self.video_capture.source.connect(self.udp_streamer.sink)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -165,29 +225,51 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=digilent_nexys_video.Platform, description="LiteX SoC on Nexys Video.")
     parser.add_target_argument("--sys-clk-freq",  default=100e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-ethernet", action="store_true",       help="Enable Ethernet support.")
+    ethopts = parser.target_group.add_mutually_exclusive_group()
+    ethopts.add_argument("--with-ethernet",     action="store_true", help="Enable Ethernet support.")
+    ethopts.add_argument("--with-udp-streamer", action="store_true", help="Enable UDP Streamer (DRAM ring buffer -> UDP).")
+    parser.add_target_argument("--udp-streamer-ip",     default="192.168.1.50",  help="UDP Streamer IP address.")
+    parser.add_target_argument("--udp-streamer-dst-ip", default="192.168.1.100", help="UDP Streamer destination IP address.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
     parser.add_target_argument("--with-sata",            action="store_true", help="Enable SATA support (over FMCRAID).")
-    parser.add_target_argument("--sata-gen",             default="2",         help="SATA Gen.", choices=["1", "2"])
+    parser.add_target_argument("--sata-gen",             default="2",         help="SATA Gen.", choices=["1", "2"]) # No Gen3: GTPs limited to 3.75Gbps on -1 speedgrade.
     parser.add_target_argument("--vadj",                 default="1.2V",      help="FMC VADJ value.", choices=["1.2V", "1.8V", "2.5V", "3.3V"])
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    parser.add_target_argument("--with-video-modes", action="store_true", help="Enable run-time Video Modes switching (with Video Framebuffer).")
+    parser.add_target_argument("--video-double-buffered", action="store_true", help="Use double-buffered (page flipping, burst DMA) Video Framebuffer.")
+    parser.add_target_argument("--with-video-blitter",    action="store_true", help="Enable Video Blitter (DMA fill/copy, with Video Framebuffer).")
+    parser.add_target_argument("--with-video-capture",    action="store_true", help="Enable Video Capture (HDMI In -> DRAM ring buffer -> UDP Streamer, with UDP Streamer, lossy/unframed).")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
+    if args.with_sata:
+        from litex_boards.sata import check_sata_phy
+        check_sata_phy(parser, "gen" + args.sata_gen, args.sys_clk_freq)
+
     soc = BaseSoC(
         toolchain              = args.toolchain,
         sys_clk_freq           = args.sys_clk_freq,
         with_ethernet          = args.with_ethernet,
+        with_udp_streamer      = args.with_udp_streamer,
+        udp_streamer_ip        = args.udp_streamer_ip,
+        udp_streamer_dst_ip    = args.udp_streamer_dst_ip,
         with_sata              = args.with_sata,
         sata_gen               = "gen" + args.sata_gen,
         vadj                   = args.vadj,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        with_video_modes       = args.with_video_modes,
+        video_double_buffered  = args.video_double_buffered,
+        with_video_blitter     = args.with_video_blitter,
+        with_video_capture     = args.with_video_capture,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
@@ -197,6 +279,12 @@ def main():
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
+        if args.with_video_modes:
+            from litex_boards.video_modes import generate_video_modes_header
+            generate_video_modes_header(soc, os.path.join(builder.generated_dir, "video_modes.h"))
+        if args.with_video_blitter:
+            from litex_boards.video_blitter import generate_video_blitter_header
+            generate_video_blitter_header(soc, os.path.join(builder.generated_dir, "video_blitter.h"))
 
     if args.load:
         prog = soc.platform.create_programmer()
@@ -28,12 +28,9 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 from litex.soc.cores.pwm import PWM
 
-from liteeth.phy.trionrgmii import LiteEthPHYRGMII
 from litex.build.generic_platform import Subsignal, Pins, Misc, IOStandard
 from litex.soc.cores.usb_ohci import USBOHCI
 
-from liteeth.phy.titaniumrgmii import LiteEthPHYRGMII
-
 # Full stream debian demo :
 # --cpu-type=vexiiriscv --cpu-variant=debian --update-repo=no --with-jtag-tap --with-sdcard --with-coherent-dma --with-ohci --vexii-video "name=video"
 # --vexii-args="--fetch-l1-hardware-prefetch=nl --fetch-l1-refill-count=2 --fetch-l1-mem-data-width-min=128 --lsu-l1-mem-data-width-min=128 --lsu-software-prefetch --lsu-hardware-prefetch rpt --performance-counters 9 --lsu-l1-store-buffer-ops=32 --lsu-l1-refill-count 4 --lsu-l1-writeback-count 4 --lsu-l1-store-buffer-slots=4 --relaxed-div"
@@ -94,6 +91,10 @@ class BaseSoC(SoCCore):
             sys_clk_freq   = 100e6,
             cpu_clk_freq   = 100e6,
             with_ethernet  = False,
+            eth_rx_slots   = 2,
+            eth_tx_slots   = 2,
+            eth_mtu        = 1530,
+            eth_data_width = 8,
             with_etherbone = False,
             eth_ip         = "192.168.1.50",
             remote_ip      = None,
@@ -157,6 +158,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.titaniumrgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 platform           = platform,
                 clock_pads         = platform.request("eth_clocks"),
@@ -166,7 +168,18 @@ class BaseSoC(SoCCore):
             platform.add_false_path_constraints(self.crg.cd_sys.clk, self.ethphy.crg.cd_eth_rx.clk, self.ethphy.crg.cd_eth_tx.clk)
 
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, local_ip=eth_ip, remote_ip=remote_ip, software_debug=False, with_timing_constraints=False)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy                     = self.ethphy,
+                    local_ip                = eth_ip,
+                    remote_ip               = remote_ip,
+                    software_debug          = False,
+                    with_timing_constraints = False,
+                    data_width              = eth_data_width,
+                    rx_slots                = eth_rx_slots,
+                    tx_slots                = eth_tx_slots,
+                    mtu                     = eth_mtu,
+                )
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip, with_timing_constraints=False)
 
@@ -545,6 +558,7 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=efinix_ti375_c529_dev_kit.Platform, description="LiteX SoC on Efinix Ti375 C529 Dev Kit.")
     parser.add_target_argument("--flash",         action="store_true",       help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq",  default=100e6, type=float, help="System clock frequency.")
@@ -558,6 +572,7 @@ def main():
     ethopts.add_argument("--with-etherbone",  action="store_true",     help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",    default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
     parser.add_target_argument("--remote-ip", default="192.168.1.100", help="Remote IP address of TFTP server.")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -568,6 +583,7 @@ def main():
         with_etherbone = args.with_etherbone,
         eth_ip         = args.eth_ip,
         remote_ip      = args.remote_ip,
+        **eth_mac_argdict(args),
         **parser.soc_argdict)
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
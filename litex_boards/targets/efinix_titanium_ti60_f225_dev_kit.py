@@ -22,8 +22,6 @@ from litex.soc.interconnect import wishbone
 
 from litex.soc.cores.hyperbus import HyperRAM
 
-from liteeth.phy.titaniumrgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -66,6 +64,10 @@ class BaseSoC(SoCCore):
         with_spi_flash = False,
         with_hyperram  = False,
         with_ethernet  = False,
+        eth_rx_slots   = 2,
+        eth_tx_slots   = 2,
+        eth_mtu        = 1530,
+        eth_data_width = 8,
         with_etherbone = False,
         eth_phy        = 0,
         eth_ip         = "192.168.1.50",
@@ -119,6 +121,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.titaniumrgmii import LiteEthPHYRGMII
             platform.add_extension(efinix_titanium_ti60_f225_dev_kit.rgmii_ethernet_qse_ios("P1"))
             pads = platform.request("eth", eth_phy)
             self.ethphy = LiteEthPHYRGMII(
@@ -127,7 +130,17 @@ class BaseSoC(SoCCore):
                 pads               = pads,
                 with_hw_init_reset = False)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, local_ip=eth_ip, remote_ip=remote_ip, software_debug=False)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy            = self.ethphy,
+                    local_ip       = eth_ip,
+                    remote_ip      = remote_ip,
+                    software_debug = False,
+                    data_width     = eth_data_width,
+                    rx_slots       = eth_rx_slots,
+                    tx_slots       = eth_tx_slots,
+                    mtu            = eth_mtu,
+                )
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
 
@@ -135,6 +148,7 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=efinix_titanium_ti60_f225_dev_kit.Platform, description="LiteX SoC on Efinix Titanium Ti60 F225 Dev Kit.")
     parser.add_target_argument("--flash",          action="store_true",       help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq",   default=200e6, type=float, help="System clock frequency.")
@@ -149,6 +163,7 @@ def main():
     parser.add_target_argument("--eth-ip",    default="192.168.1.50",  help="Ethernet/Etherbone IP address.")
     parser.add_target_argument("--remote-ip", default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-phy",   default=0, type=int,     help="Ethernet PHY: 0 (default) or 1.")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -160,6 +175,7 @@ def main():
         eth_ip         = args.eth_ip,
         remote_ip      = args.remote_ip,
         eth_phy        = args.eth_phy,
+         **eth_mac_argdict(args),
          **parser.soc_argdict)
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
@@ -24,8 +24,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.interconnect import axi
 
-from liteeth.phy.trionrgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -59,6 +57,10 @@ class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=75e6,
         with_spi_flash  = False,
         with_ethernet   = False,
+        eth_rx_slots    = 2,
+        eth_tx_slots    = 2,
+        eth_mtu         = 1530,
+        eth_data_width  = 8,
         with_etherbone  = False,
         eth_phy         = 0,
         eth_rgmii_phy   = False,
@@ -104,6 +106,7 @@ class BaseSoC(SoCCore):
         if with_ethernet or with_etherbone:
             # Use board's Ethernet PHYs.
             if eth_rgmii_phy:
+                from liteeth.phy.trionrgmii import LiteEthPHYRGMII
                 msg =  "\n"
                 msg += "rx_ctl/tx_ctl pads location aren't compatible with DDIO mode.\n"
                 msg += "An hardware modification must be done:\n"
@@ -144,7 +147,17 @@ class BaseSoC(SoCCore):
                 )
 
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, local_ip=eth_ip, remote_ip=remote_ip, software_debug=False)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy            = self.ethphy,
+                    local_ip       = eth_ip,
+                    remote_ip      = remote_ip,
+                    software_debug = False,
+                    data_width     = eth_data_width,
+                    rx_slots       = eth_rx_slots,
+                    tx_slots       = eth_tx_slots,
+                    mtu            = eth_mtu,
+                )
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
 
@@ -382,6 +395,7 @@ calc_result = design.auto_calc_pll_clock("dram_pll", {"CLKOUT0_FREQ": "400.0"})
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=efinix_trion_t120_bga576_dev_kit.Platform, description="LiteX SoC on Efinix Trion T120 BGA576 Dev Kit.")
     parser.add_target_argument("--flash",          action="store_true",      help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq",   default=75e6, type=float, help="System clock frequency.")
@@ -393,6 +407,7 @@ def main():
     parser.add_target_argument("--remote-ip",     default="192.168.1.100", help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-rgmii-phy", action="store_true",     help="Uses onboard RGMII Phy instead of RMII PMOD.")
     parser.add_target_argument("--eth-phy",       default=0, type=int,     help="Ethernet PHY: 0 (default) or 1. (Only available with --eth-rgmii-phy")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -404,6 +419,7 @@ def main():
         remote_ip      = args.remote_ip,
         eth_phy        = args.eth_phy,
         eth_rgmii_phy  = args.eth_rgmii_phy,
+        **eth_mac_argdict(args),
         **parser.soc_argdict)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
@@ -25,9 +25,6 @@ from litex.soc.cores.led import LedChaser
 
 from litex.gen.genlib.misc import WaitTimer
 
-from litedram.modules import NDS36PT5
-from litedram.phy import GENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -72,6 +69,8 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size and sys_clk_freq <= 50e6 :
+            from litedram.modules import NDS36PT5
+            from litedram.phy import GENSDRPHY
             self.specials += ClkOutput(ClockSignal("sys_ps"), platform.request("sdram_clock"))
 
             self.sdrphy = GENSDRPHY(platform.request("sdram"), sys_clk_freq)
@@ -18,12 +18,6 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT40A256M16
-from litedram.phy import usddrphy
-
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -62,7 +56,7 @@ class _CRG(LiteXModule):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=2006, with_pcie=False, with_led_chaser=True, **kwargs):
+    def __init__(self, sys_clk_freq=2006, with_pcie=False, pcie_lanes=4, pcie_dmas=1, with_led_chaser=True, **kwargs):
         platform = enclustra_mercury_xu8_pe3.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -76,15 +70,18 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
+            from litepcie.phy.usppciephy import USPPCIEPHY
+            self.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
                 speed      = "gen3",
-                data_width = 128,
+                data_width = {4: 128, 8: 256}[pcie_lanes],
                 bar0_size  = 0x20000,
             )
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT40A256M16
+            from litedram.phy import usddrphy
             self.ddrphy = usddrphy.USPDDRPHY(platform.request("ddram"),
                 memtype          = "DDR4",
                 sys_clk_freq     = sys_clk_freq,
@@ -110,12 +107,16 @@ def main():
     parser = LiteXArgumentParser(platform=enclustra_mercury_xu8_pe3.Platform, description="LiteX SoC on Enclustra Mercury+ XU8/PE3.")
     parser.add_target_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",   default=4, type=int, choices=[4, 8], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",    default=1, type=int,       help="Number of PCIe DMA channels.")
     parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
     args = parser.parse_args()
 
     soc = BaseSoC(
          sys_clk_freq = args.sys_clk_freq,
          with_pcie    = args.with_pcie,
+         pcie_lanes   = args.pcie_lanes,
+         pcie_dmas    = args.pcie_dmas,
          **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -123,6 +124,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -38,9 +38,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.clock import *
 
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -65,7 +62,7 @@ class CRG(LiteXModule):
 # BaseSoC -----------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=125e6, with_pcie=False, with_led_chaser=True, **kwargs):
+    def __init__(self, sys_clk_freq=125e6, with_pcie=False, pcie_lanes=2, pcie_dmas=1, pcie_msi="msi", with_led_chaser=True, **kwargs):
         platform = fairwaves_xtrx.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -78,10 +75,16 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x2"),
-                data_width = 64,
+            from litepcie.phy.s7pciephy import S7PCIEPHY
+            self.pcie_phy = S7PCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {1: 64, 2: 64}[pcie_lanes],
+                msi_type   = pcie_msi,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, msi_type=pcie_msi)
+            if pcie_msi == "msi-x":
+                # MSI-X Table/PBA offsets are fixed in the PHY configuration.
+                self.csr.add("pcie_msi",       n=3)
+                self.csr.add("pcie_msi_table", n=4)
 
             # ICAP (For FPGA reload over PCIe).
             from litex.soc.cores.icap import ICAP
@@ -110,12 +113,18 @@ def main():
     parser.add_target_argument("--flash",           action="store_true",       help="Flash bitstream.")
     parser.add_target_argument("--sys-clk-freq",    default=125e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",       action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",      default=2, type=int, choices=[1, 2], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",       default=1, type=int,       help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi",        default="msi", choices=["msi", "msi-multi-vector", "msi-x"], help="PCIe MSI type.")
     parser.add_target_argument("--driver",          action="store_true",       help="Generate PCIe driver.")
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
         with_pcie    = args.with_pcie,
+        pcie_lanes   = args.pcie_lanes,
+        pcie_dmas    = args.pcie_dmas,
+        pcie_msi     = args.pcie_msi,
         **parser.soc_argdict
     )
     builder  = Builder(soc, **parser.builder_argdict)
@@ -123,6 +132,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
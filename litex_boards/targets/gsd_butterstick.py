@@ -25,11 +25,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.gpio import GPIOTristate
 
-from litedram.modules import MT41K64M16,MT41K128M16,MT41K256M16,MT41K512M16
-from litedram.phy import ECP5DDRPHY
-
-from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
-
 # CRG ---------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -83,6 +78,10 @@ class BaseSoC(SoCCore):
     def __init__(self, revision="1.0", device="85F", sys_clk_freq=60e6, toolchain="trellis",
         sdram_device     = "MT41K64M16",
         with_ethernet    = False,
+        eth_rx_slots     = 2,
+        eth_tx_slots     = 2,
+        eth_mtu          = 1530,
+        eth_data_width   = 8,
         with_etherbone   = False,
         eth_ip           = "192.168.1.50",
         eth_dynamic_ip   = False,
@@ -102,6 +101,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K64M16,MT41K128M16,MT41K256M16,MT41K512M16
+            from litedram.phy import ECP5DDRPHY
             available_sdram_modules = {
                 "MT41K64M16":  MT41K64M16,
                 "MT41K128M16": MT41K128M16,
@@ -123,13 +124,22 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 rx_delay   = 0e-9, # KSZ9031RNX phy adds a 1.2ns RX delay
                 )
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy        = self.ethphy,
+                    dynamic_ip = eth_dynamic_ip,
+                    data_width = eth_data_width,
+                    rx_slots   = eth_rx_slots,
+                    tx_slots   = eth_tx_slots,
+                    mtu        = eth_mtu,
+                )
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
 
@@ -155,6 +165,7 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=gsd_butterstick.Platform, description="LiteX SoC on ButterStick.")
     parser.add_target_argument("--programmer",   default="jtag",           help="Programming interface (jtag or dfu).")
     parser.add_target_argument("--sys-clk-freq", default=75e6, type=float, help="System clock frequency.")
@@ -171,6 +182,7 @@ def main():
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
     parser.add_target_argument("--with-syzygy-gpio",action="store_true", help="Enable GPIOs through SYZYGY Breakout on Port-A.")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
@@ -187,6 +199,7 @@ def main():
         eth_dynamic_ip   = args.eth_dynamic_ip,
         with_spi_flash   = args.with_spi_flash,
         with_syzygy_gpio = args.with_syzygy_gpio,
+        **eth_mac_argdict(args),
         **parser.soc_argdict)
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
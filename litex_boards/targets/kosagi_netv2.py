@@ -21,14 +21,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.clock import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import K4B2G1646F
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.rmii import LiteEthPHYRMII
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -63,6 +55,9 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, variant="a7-35", sys_clk_freq=100e6,
         with_pcie       = False,
+        pcie_lanes      = 4,
+        pcie_dmas       = 1,
+        pcie_msi        = "msi",
         with_ethernet   = False,
         eth_ip          = "192.168.1.50",
         remote_ip       = None,
@@ -78,6 +73,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import K4B2G1646F
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype      = "DDR3",
                 nphases      = 4,
@@ -90,6 +87,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
+            from liteeth.phy.rmii import LiteEthPHYRMII
             self.ethphy = LiteEthPHYRMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
@@ -97,10 +95,16 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            from litepcie.phy.s7pciephy import S7PCIEPHY
+            self.pcie_phy = S7PCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {1: 64, 2: 64, 4: 128}[pcie_lanes],
+                msi_type   = pcie_msi,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, msi_type=pcie_msi)
+            if pcie_msi == "msi-x":
+                # MSI-X Table/PBA offsets are fixed in the PHY configuration.
+                self.csr.add("pcie_msi",       n=3)
+                self.csr.add("pcie_msi_table", n=4)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -119,6 +123,9 @@ def main():
     parser.add_target_argument("--eth-ip",        default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
     parser.add_target_argument("--remote-ip",     default="192.168.1.100",   help="Remote IP address of TFTP server.")
     parser.add_target_argument("--with-pcie",     action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",    default=4, type=int, choices=[1, 2, 4], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",     default=1, type=int,       help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi",      default="msi", choices=["msi", "msi-multi-vector", "msi-x"], help="PCIe MSI type.")
     parser.add_target_argument("--driver",        action="store_true",       help="Generate PCIe driver.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
@@ -132,6 +139,9 @@ def main():
         eth_ip        = args.eth_ip,
         remote_ip     = args.remote_ip,
         with_pcie     = args.with_pcie,
+        pcie_lanes    = args.pcie_lanes,
+        pcie_dmas     = args.pcie_dmas,
+        pcie_msi      = args.pcie_msi,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
@@ -143,6 +153,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
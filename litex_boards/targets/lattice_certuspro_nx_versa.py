@@ -22,7 +22,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
 from litepcie.software          import *
-from litepcie.phy.lfcpnxpciephy import LFCPNXPCIEPHY
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -58,6 +57,7 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=75e6, toolchain="radiant",
         with_pcie       = False,
+        pcie_dmas       = 1,
         with_led_chaser = True,
         **kwargs):
         platform = lattice_certuspro_nx_versa.Platform(toolchain=toolchain)
@@ -70,8 +70,9 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.lfcpnxpciephy import LFCPNXPCIEPHY
             self.pcie_phy = LFCPNXPCIEPHY(platform, platform.request("pcie_x4"), cd="sys")
-            self.add_pcie(phy=self.pcie_phy, ndmas=1, data_width=128, with_msi=True) # FIXME: MSI not connected in PHY!
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, data_width=128, with_msi=True) # FIXME: MSI not connected in PHY!
 
             self.pcie_ctrl = platform.request("pcie_ctrl")
             self.comb += [
@@ -95,12 +96,14 @@ def main():
     parser.add_target_argument("--flash",        action="store_true",      help="Flash bitstream to SPI Flash.")
     parser.add_target_argument("--sys-clk-freq", default=75e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",    action="store_true",      help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-dmas",    default=1, type=int,      help="Number of PCIe DMA channels.")
     parser.add_target_argument("--driver",       action="store_true",      help="Generate PCIe driver from LitePCIe (override local version).")
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq = args.sys_clk_freq,
         with_pcie    = args.with_pcie,
+        pcie_dmas    = args.pcie_dmas,
         **parser.soc_argdict
     )
 
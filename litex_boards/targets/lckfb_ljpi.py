@@ -20,9 +20,6 @@ from litex.soc.cores.video import *
 
 from litex_boards.platforms import lckfb_ljpi
 
-from litedram.modules import MT41J128M16
-from litedram.phy import GW2DDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -121,6 +118,8 @@ class BaseSoC(SoCCore):
         # DDR3 SDRAM -------------------------------------------------------------------------------
         # if not self.integrated_main_ram_size:
         if with_dram:
+            from litedram.modules import MT41J128M16
+            from litedram.phy import GW2DDRPHY
             self.ddrphy = GW2DDRPHY(
                 pads         = platform.request("ddram"),
                 sys_clk_freq = sys_clk_freq
@@ -32,8 +32,6 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 from litex.soc.cores.usb_fifo import FT245PHYSynchronous
 
-from litescope import LiteScopeAnalyzer
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -98,6 +96,7 @@ class BaseSoC(SoCCore):
 
         # USB-FIFO ---------------------------------------------------------------------------------
         if with_usb_fifo:
+            from litescope import LiteScopeAnalyzer
             usb_pads = platform.request("usb_fifo")
             self.usb_phy = usb_phy = FT245PHYSynchronous(
                 pads       = usb_pads,
@@ -18,8 +18,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.video import VideoHDMIPHY
 from litex.soc.cores.bitbang import I2CMaster
 
-from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -62,7 +60,14 @@ class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=75e6, toolchain="trellis",
         with_spi_flash      = False,
         with_ethernet       = False,
+        eth_rx_slots        = 2,
+        eth_tx_slots        = 2,
+        eth_mtu             = 1530,
+        eth_data_width      = 8,
         with_etherbone      = False,
+        with_udp_streamer   = False,
+        udp_streamer_ip     = "192.168.1.50",
+        udp_streamer_dst_ip = "192.168.1.100",
         with_video_terminal = False,
         with_lcd            = False,
         with_ws2812         = False,
@@ -81,16 +86,31 @@ class BaseSoC(SoCCore):
             from litespi.opcodes import SpiNorFlashOpCodes as Codes
             self.add_spi_flash(mode="4x", module=W25Q128JV(Codes.READ_1_1_4), with_master=True)
 
-        # Ethernet / Etherbone ---------------------------------------------------------------------
-        if with_ethernet or with_etherbone:
+        # Ethernet / Etherbone / UDP Streamer ------------------------------------------------------
+        if with_ethernet or with_etherbone or with_udp_streamer:
+            from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 rx_delay   = 0e-9)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy        = self.ethphy,
+                    data_width = eth_data_width,
+                    rx_slots   = eth_rx_slots,
+                    tx_slots   = eth_tx_slots,
+                    mtu        = eth_mtu,
+                )
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy)
+            if with_udp_streamer:
+                from litex_boards.udp_streamer import add_udp_streamer
+                add_udp_streamer(self,
+                    phy            = self.ethphy,
+                    ip_address     = udp_streamer_ip,
+                    dst_ip_address = udp_streamer_dst_ip,
+                )
 
         # Video ------------------------------------------------------------------------------------
         if with_video_terminal:
@@ -120,12 +140,16 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=litex_acorn_baseboard.Platform, description="LiteX SoC on LiteX Acorn Baseboard.")
     parser.add_target_argument("--flash",        action="store_true",      help="Flash bitstream to SPI Flash.")
     parser.add_target_argument("--sys-clk-freq", default=75e6, type=float, help="System clock frequency.")
     ethopts = parser.target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",  action="store_true", help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true", help="Enable Etherbone support.")
+    ethopts.add_argument("--with-udp-streamer", action="store_true", help="Enable UDP Streamer (main RAM ring buffer -> UDP, requires --integrated-main-ram-size).")
+    parser.add_target_argument("--udp-streamer-ip",     default="192.168.1.50",  help="UDP Streamer IP address.")
+    parser.add_target_argument("--udp-streamer-dst-ip", default="192.168.1.100", help="UDP Streamer destination IP address.")
     sdopts = parser.target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
@@ -135,17 +159,25 @@ def main():
     parser.add_target_argument("--with-lcd",       action="store_true",      help="Enable OLED LCD support.")
     parser.add_target_argument("--with-ws2812",    action="store_true",      help="Enable WS2812 on PMOD1:0.")
 
+    eth_mac_args(parser)
     args = parser.parse_args()
 
+    if args.with_udp_streamer and not args.integrated_main_ram_size:
+        parser.error("--with-udp-streamer requires --integrated-main-ram-size (ring buffer, no DRAM on this board).")
+
     soc = BaseSoC(
         sys_clk_freq        = args.sys_clk_freq,
         toolchain           = args.toolchain,
         with_spi_flash      = args.with_spi_flash,
         with_ethernet       = args.with_ethernet,
         with_etherbone      = args.with_etherbone,
+        with_udp_streamer   = args.with_udp_streamer,
+        udp_streamer_ip     = args.udp_streamer_ip,
+        udp_streamer_dst_ip = args.udp_streamer_dst_ip,
         with_video_terminal = args.with_video_terminal,
         with_lcd            = args.with_lcd,
         with_ws2812         = args.with_ws2812,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
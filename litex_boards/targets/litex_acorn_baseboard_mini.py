@@ -27,16 +27,7 @@ from litex.soc.cores.led import LedChaser
 
 from litex.build.generic_platform import IOStandard, Subsignal, Pins
 
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
-from litedram.modules import MT41K512M16
-from litedram.phy import s7ddrphy
-
 from liteeth.phy.a7_gtp import QPLLSettings, QPLL
-from liteeth.phy.a7_1000basex import A7_1000BASEX
-
-from litesata.phy import LiteSATAPHY
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -89,13 +80,16 @@ class CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, variant="cle-215+", sys_clk_freq=125e6,
         with_pcie       = False,
+        pcie_dmas       = 1,
+        pcie_msi        = "msi",
         with_ethernet   = False,
         with_etherbone  = False,
         eth_ip          = "192.168.1.50",
         remote_ip       = None,
         eth_dynamic_ip  = False,
         with_led_chaser = True,
-        with_sata       = False, sata_gen="gen2",
+        with_sata       = False,
+        sata_gen        = "gen2",
         **kwargs):
         platform = sqrl_acorn.Platform(variant=variant)
         platform.add_extension(sqrl_acorn._litex_acorn_baseboard_mini_io, prepend=True)
@@ -113,6 +107,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K512M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype        = "DDR3",
                 nphases        = 4,
@@ -125,11 +121,17 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             assert not with_sata
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x1"),
                 data_width = 64,
+                msi_type   = pcie_msi,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, msi_type=pcie_msi)
+            if pcie_msi == "msi-x":
+                # MSI-X Table/PBA offsets are fixed in the PHY configuration.
+                self.csr.add("pcie_msi",       n=3)
+                self.csr.add("pcie_msi_table", n=4)
             platform.toolchain.pre_placement_commands.append("reset_property LOC [get_cells -hierarchical -filter {{NAME=~pcie_s7/*gtp_channel.gtpe2_channel_i}}]")
             platform.toolchain.pre_placement_commands.append("set_property LOC GTPE2_CHANNEL_X0Y7 [get_cells -hierarchical -filter {{NAME=~pcie_s7/*gtp_channel.gtpe2_channel_i}}]")
 
@@ -191,6 +193,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.a7_1000basex import A7_1000BASEX
             self.ethphy = A7_1000BASEX(
                 qpll_channel = qpll.channels[1 if with_pcie else 0],
                 data_pads    = self.platform.request("sfp"),
@@ -206,6 +209,7 @@ class BaseSoC(SoCCore):
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
+            from litesata.phy import LiteSATAPHY
             # PHY
             self.sata_phy = LiteSATAPHY(platform.device,
                 refclk     = self.crg.cd_sata_ref.clk,
@@ -240,6 +244,8 @@ def main():
     ])
     parser.add_target_argument("--sys-clk-freq",   default=125.00e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",      action="store_true",          help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-dmas",      default=1, type=int,          help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi",       default="msi", choices=["msi", "msi-multi-vector", "msi-x"], help="PCIe MSI type.")
     parser.add_target_argument("--driver",         action="store_true",          help="Generate PCIe driver.")
     parser.add_target_argument("--with-ethernet",  action="store_true",          help="Enable Ethernet support.")
     parser.add_target_argument("--with-etherbone", action="store_true",          help="Enable Etherbone support.")
@@ -247,13 +253,19 @@ def main():
     parser.add_target_argument("--remote-ip",      default="192.168.1.100",      help="Remote IP address of TFTP server.")
     parser.add_target_argument("--eth-dynamic-ip", action="store_true",          help="Enable dynamic Ethernet IP addresses setting.")
     parser.add_target_argument("--with-sata",      action="store_true",          help="Enable SATA support (over FMCRAID).")
-    parser.add_target_argument("--sata-gen",       default="2",                  help="SATA Gen.", choices=["1", "2"])
+    parser.add_target_argument("--sata-gen",       default="2",                  help="SATA Gen.", choices=["1", "2", "3"])
     args = parser.parse_args()
 
+    if args.with_sata:
+        from litex_boards.sata import check_sata_phy
+        check_sata_phy(parser, "gen" + args.sata_gen, args.sys_clk_freq)
+
     soc = BaseSoC(
         variant        = args.variant,
         sys_clk_freq   = args.sys_clk_freq,
         with_pcie      = args.with_pcie,
+        pcie_dmas      = args.pcie_dmas,
+        pcie_msi       = args.pcie_msi,
         with_ethernet  = args.with_ethernet,
         with_etherbone = args.with_etherbone,
         eth_ip         = args.eth_ip,
@@ -269,6 +281,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
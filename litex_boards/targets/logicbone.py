@@ -21,9 +21,6 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT41K512M16
-from litedram.phy import ECP5DDRPHY
-from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
 
 # _CRG ---------------------------------------------------------------------------------------------
 
@@ -93,6 +90,10 @@ class BaseSoC(SoCCore):
     def __init__(self, revision="rev0", device="45F", sdram_device="MT41K512M16",
         sys_clk_freq    = 75e6,
         with_ethernet   = False,
+        eth_rx_slots    = 2,
+        eth_tx_slots    = 2,
+        eth_mtu         = 1530,
+        eth_data_width  = 8,
         with_led_chaser = True,
         toolchain       = "trellis",
         **kwargs):
@@ -108,6 +109,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K512M16
+            from litedram.phy import ECP5DDRPHY
             available_sdram_modules = {
                 "MT41K512M16":  MT41K512M16,
                 #"AS4C1GM8":    AS4C1GM8, ## Too many rows, seems to break things.
@@ -127,10 +130,18 @@ class BaseSoC(SoCCore):
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
+            from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
-            self.add_ethernet(phy=self.ethphy)
+            from litex_boards.ethernet import add_ethernet
+            add_ethernet(self,
+                phy        = self.ethphy,
+                data_width = eth_data_width,
+                rx_slots   = eth_rx_slots,
+                tx_slots   = eth_tx_slots,
+                mtu        = eth_mtu,
+            )
 
 
         # Leds -------------------------------------------------------------------------------------
@@ -143,12 +154,14 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=logicbone.Platform, description="LiteX SoC on Logicbone.")
     parser.add_target_argument("--sys-clk-freq",   default=75e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--device",         default="45F",            help="FPGA device (45F or 85F).")
     parser.add_target_argument("--sdram-device",   default="MT41K512M16",    help="SDRAM device (MT41K512M16).")
     parser.add_target_argument("--with-ethernet",  action="store_true",      help="Enable Ethernet support.")
     parser.add_target_argument("--with-sdcard",    action="store_true",      help="Enable SDCard support.")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -157,6 +170,7 @@ def main():
         sys_clk_freq  = args.sys_clk_freq,
         sdram_device  = args.sdram_device,
         with_ethernet = args.with_ethernet,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
     )
     if args.with_sdcard:
@@ -29,11 +29,6 @@ from litex.soc.cores.video import VideoHDMIPHY
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 
-from litedram.modules import W9825G6KH6
-from litedram.modules import IS42S16320
-
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-
 from litex.soc.integration.soc import SoCRegion
 
 # CRG ---------------------------------------------------------------------------------------------
@@ -118,6 +113,7 @@ class BaseSoC(SoCCore):
 
         # DRAM -------------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             if sdram_rate == "1:2":
                 sdrphy_cls = HalfRateGENSDRPHY
             elif sdram_rate == "1:4":
@@ -129,6 +125,7 @@ class BaseSoC(SoCCore):
             self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
 
             if sdram_device == "W9825G6KH6":
+                from litedram.modules import W9825G6KH6
                 self.add_sdram("sdram",
                     phy           = self.sdrphy,
                     module        = W9825G6KH6(sys_clk_freq, sdram_rate),
@@ -136,6 +133,7 @@ class BaseSoC(SoCCore):
                 )
 
             if sdram_device == "IS42S16320":
+                from litedram.modules import IS42S16320
                 self.add_sdram("sdram",
                     phy           = self.sdrphy,
                     module        = IS42S16320(self.clk_freq, sdram_rate),
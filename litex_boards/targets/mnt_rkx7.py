@@ -14,7 +14,6 @@ from litex.gen import *
 
 from litex_boards.platforms import mnt_rkx7
 
-
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
@@ -28,11 +27,6 @@ from litex.soc.cores.gpio import GPIOOut
 from litex.soc.cores.video import VideoDVIPHY
 from litex.soc.cores.usb_ohci import USBOHCI
 
-from litedram.modules import IS43TR16512B
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -83,6 +77,10 @@ class BaseSoC(SoCCore):
 
     def __init__(self, sys_clk_freq=100e6,
         with_ethernet  = True,
+        eth_rx_slots   = 2,
+        eth_tx_slots   = 2,
+        eth_mtu        = 1530,
+        eth_data_width = 8,
         with_etherbone = False,
         with_spi_flash = True,
         with_usb_host  = True,
@@ -99,6 +97,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import IS43TR16512B
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.K7DDRPHY(platform.request("ddram"),
                 memtype      = "DDR3",
                 nphases      = 4,
@@ -118,13 +118,23 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.s7rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
             platform.add_platform_command("set_property CLOCK_DEDICATED_ROUTE FALSE [get_nets {{main_ethphy_eth_rx_clk_ibuf}}]")
             platform.add_platform_command("set_property CLOCK_DEDICATED_ROUTE FALSE [get_nets {{soclinux_ethphy_eth_rx_clk_ibuf}}]")
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=True, software_debug=False)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy            = self.ethphy,
+                    dynamic_ip     = True,
+                    software_debug = False,
+                    data_width     = eth_data_width,
+                    rx_slots       = eth_rx_slots,
+                    tx_slots       = eth_tx_slots,
+                    mtu            = eth_mtu,
+                )
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy)
 
@@ -206,6 +216,7 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=mnt_rkx7.Platform, description="LiteX SoC on MNT-RKX7.")
     parser.add_target_argument("--sys-clk-freq",    default=100e6,  type=float,         help="System clock frequency.")
     parser.add_target_argument("--with-spi-flash",  action="store_true", default=True,  help="Enable SPI Flash (MMAPed).")
@@ -216,6 +227,7 @@ def main():
     ethopts = parser.target_group.add_mutually_exclusive_group()
     ethopts.add_argument("--with-ethernet",  action="store_true", default=True, help="Enable Ethernet support.")
     ethopts.add_argument("--with-etherbone", action="store_true",               help="Enable Etherbone support.")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -224,6 +236,7 @@ def main():
         with_etherbone = args.with_etherbone,
         with_spi_flash = args.with_spi_flash,
         with_usb_host  = args.with_usb_host,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
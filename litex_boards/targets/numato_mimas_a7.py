@@ -18,11 +18,6 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT41J128M16
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -50,6 +45,7 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6, with_led_chaser=True, with_ethernet=False,
+                 eth_rx_slots=2, eth_tx_slots=2, eth_mtu=1530, eth_data_width=8,
                  **kwargs):
         platform = numato_mimas_a7.Platform()
 
@@ -61,6 +57,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41J128M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype      = "DDR3",
                 nphases      = 4,
@@ -73,10 +71,18 @@ class BaseSoC(SoCCore):
 
         # Ethernet ---------------------------------------------------------------------------------
         if with_ethernet:
+            from liteeth.phy.s7rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
-            self.add_ethernet(phy=self.ethphy)
+            from litex_boards.ethernet import add_ethernet
+            add_ethernet(self,
+                phy        = self.ethphy,
+                data_width = eth_data_width,
+                rx_slots   = eth_rx_slots,
+                tx_slots   = eth_tx_slots,
+                mtu        = eth_mtu,
+            )
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -88,14 +94,17 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=numato_mimas_a7.Platform, description="LiteX SoC on Mimas A7.")
     parser.add_target_argument("--sys-clk-freq",  default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-ethernet", action="store_true",       help="Enable Ethernet support.")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
         sys_clk_freq  = args.sys_clk_freq,
         with_ethernet = args.with_ethernet,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -21,12 +21,6 @@ from litex.soc.integration.builder import *
 
 from litex.soc.cores.clock import *
 
-from litedram.modules import MT8KTF51264
-from litedram.phy import s7ddrphy
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -53,7 +47,7 @@ class CRG(LiteXModule):
 # BaseSoC -----------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=100e6, with_pcie=False, **kwargs):
+    def __init__(self, sys_clk_freq=100e6, with_pcie=False, pcie_lanes=4, pcie_dmas=1, pcie_msi="msi", **kwargs):
         platform = numato_nereid.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -64,6 +58,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT8KTF51264
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.K7DDRPHY(platform.request("ddram"),
                 memtype          = "DDR3",
                 nphases          = 4,
@@ -78,10 +74,16 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            from litepcie.phy.s7pciephy import S7PCIEPHY
+            self.pcie_phy = S7PCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {1: 64, 2: 64, 4: 128}[pcie_lanes],
+                msi_type   = pcie_msi,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, msi_type=pcie_msi)
+            if pcie_msi == "msi-x":
+                # MSI-X Table/PBA offsets are fixed in the PHY configuration.
+                self.csr.add("pcie_msi",       n=3)
+                self.csr.add("pcie_msi_table", n=4)
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -90,12 +92,18 @@ def main():
     parser = LiteXArgumentParser(platform=numato_nereid.Platform, description="LiteX SoC on Nereid.")
     parser.add_target_argument("--sys-clk-freq", default=100e6,  type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",    action="store_true",        help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",   default=4, type=int, choices=[1, 2, 4], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",    default=1, type=int,        help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi",     default="msi", choices=["msi", "msi-multi-vector", "msi-x"], help="PCIe MSI type.")
     parser.add_target_argument("--driver",       action="store_true",        help="Generate PCIe driver.")
     args = parser.parse_args()
 
     soc = BaseSoC(
          sys_clk_freq = args.sys_clk_freq,
          with_pcie    = args.with_pcie,
+         pcie_lanes   = args.pcie_lanes,
+         pcie_dmas    = args.pcie_dmas,
+         pcie_msi     = args.pcie_msi,
          **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -103,6 +111,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -6,6 +6,8 @@
 # Copyright (c) 2020 Shinken Sanada <sanadashinken@gmail.com>
 # SPDX-License-Identifier: BSD-2-Clause
 
+import os
+
 from migen import *
 
 from litex.gen import *
@@ -20,15 +22,10 @@ from litex.soc.cores.video import video_timings
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.gpio import GPIOIn
 
-from litedram.modules import MT41K128M16
-from litedram.phy import s7ddrphy
-
-from liteeth.phy import LiteEthPHYGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
-    def __init__(self, platform, speed_grade, sys_clk_freq, with_video_pll=False, pix_clk=25.175e6):
+    def __init__(self, platform, speed_grade, sys_clk_freq, with_video_pll=False, with_video_modes=False, pix_clk=25.175e6):
         self.rst          = Signal()
         self.cd_sys       = ClockDomain()
         self.cd_sys4x     = ClockDomain()
@@ -64,7 +61,11 @@ class _CRG(LiteXModule):
 
         # Video PLL.
         if with_video_pll:
-            self.video_pll = video_pll = S7MMCM(speedgrade=speed_grade)
+            if with_video_modes:
+                from litex_boards.video_modes import VideoS7MMCM
+                self.video_pll = video_pll = VideoS7MMCM(speedgrade=speed_grade)
+            else:
+                self.video_pll = video_pll = S7MMCM(speedgrade=speed_grade)
             self.comb += video_pll.reset.eq(~rst_n | self.rst)
             video_pll.register_clkin(clk50, 50e6)
             video_pll.create_clkout(self.cd_hdmi,   pix_clk)
@@ -81,15 +82,18 @@ class BaseSoC(SoCCore):
         with_led_chaser        = True,
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        with_video_modes       = False,
         video_timing           = "640x480@60Hz",
         **kwargs):
         platform = qmtech_wukong.Platform(revision=revision,speedgrade=speedgrade)
 
         # CRG --------------------------------------------------------------------------------------
+        assert with_video_framebuffer or not with_video_modes
         with_video_pll = (with_video_terminal or with_video_framebuffer)
         self.crg = _CRG(platform, speedgrade, sys_clk_freq,
-            with_video_pll = with_video_pll,
-            pix_clk        = video_timings[video_timing]["pix_clk"]
+            with_video_pll   = with_video_pll,
+            with_video_modes = with_video_modes,
+            pix_clk          = video_timings[video_timing]["pix_clk"]
         )
 
         # SoCCore ----------------------------------------------------------------------------------
@@ -97,6 +101,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K128M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype        = "DDR3",
                 nphases        = 4,
@@ -109,6 +115,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy import LiteEthPHYGMII
             self.ethphy = LiteEthPHYGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
@@ -150,6 +157,7 @@ def main():
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true",       help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true",       help="Enable Video Framebuffer (HDMI).")
+    parser.add_target_argument("--with-video-modes", action="store_true",      help="Enable run-time Video Modes switching (with Video Framebuffer).")
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -162,6 +170,7 @@ def main():
         remote_ip              = args.remote_ip,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        with_video_modes       = args.with_video_modes,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
@@ -175,6 +184,9 @@ def main():
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
+        if args.with_video_modes:
+            from litex_boards.video_modes import generate_video_modes_header
+            generate_video_modes_header(soc, os.path.join(builder.generated_dir, "video_modes.h"))
 
     if args.load:
         prog = soc.platform.create_programmer()
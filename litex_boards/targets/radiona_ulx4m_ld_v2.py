@@ -27,12 +27,6 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.cores.gpio import GPIOTristate
 from litex.soc.cores.video import VideoHDMIPHY
 
-from litedram.common import PHYPadsReducer
-from litedram.modules import MT41K64M16,MT41K128M16,MT41K256M16,MT41K512M16
-from litedram.phy import ECP5DDRPHY
-
-from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -97,6 +91,10 @@ class BaseSoC(SoCCore):
     def __init__(self, revision="0.1", device="85F", toolchain="trellis", sys_clk_freq=int(100e6),
         sdram_device           = "MT41K512M16",
         with_ethernet          = False,
+        eth_rx_slots           = 2,
+        eth_tx_slots           = 2,
+        eth_mtu                = 1530,
+        eth_data_width         = 8,
         with_etherbone         = False,
         with_video_terminal    = True,
         with_video_framebuffer = False,
@@ -119,6 +117,9 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.common import PHYPadsReducer
+            from litedram.modules import MT41K64M16,MT41K128M16,MT41K256M16,MT41K512M16
+            from litedram.phy import ECP5DDRPHY
             available_sdram_modules = {
                 "MT41K64M16":  MT41K64M16,
                 "MT41K128M16": MT41K128M16,
@@ -140,11 +141,20 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.ecp5rgmii import LiteEthPHYRGMII
             self.submodules.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"))
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy        = self.ethphy,
+                    dynamic_ip = eth_dynamic_ip,
+                    data_width = eth_data_width,
+                    rx_slots   = eth_rx_slots,
+                    tx_slots   = eth_tx_slots,
+                    mtu        = eth_mtu,
+                )
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, ip_address=eth_ip)
 
@@ -178,6 +188,7 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=radiona_ulx4m_ld_v2.Platform, description="LiteX SoC on ULX4M-LD-V2")
     parser.add_argument("--sys-clk-freq",    default=100e6,          help="System clock frequency.")
     parser.add_argument("--revision",        default="1.0",          help="Board Revision (1.0).")
@@ -196,6 +207,7 @@ def main():
     viopts = parser.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
@@ -214,6 +226,7 @@ def main():
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
         with_syzygy_gpio       = args.with_syzygy_gpio,
+        **eth_mac_argdict(args),
         **parser.soc_argdict)
     if args.with_spi_sdcard:
         soc.add_spi_sdcard()
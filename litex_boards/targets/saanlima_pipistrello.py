@@ -23,9 +23,6 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT46H32M16
-from litedram.phy import s6ddrphy
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -165,6 +162,8 @@ class BaseSoC(SoCCore):
 
         # LPDDR SDRAM ------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT46H32M16
+            from litedram.phy import s6ddrphy
             self.ddrphy = s6ddrphy.S6HalfRateDDRPHY(platform.request("ddram"),
                 memtype           = "LPDDR",
                 rd_bitslip        = 1,
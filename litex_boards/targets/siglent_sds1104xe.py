@@ -32,6 +32,8 @@
 #
 # --------------------------------------------------------------------------------------------------
 
+import os
+
 from migen import *
 
 from litex.gen import *
@@ -43,12 +45,6 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.video import VideoVGAPHY
 
-from litedram.common import PHYPadsReducer
-from litedram.modules import MT41K64M16
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.mii import LiteEthPHYMII
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -82,9 +78,12 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6,
         with_etherbone         = True,
+        etherbone_bulk         = False,
         eth_ip                 = "192.168.1.50",
         with_video_terminal    = False,
         with_video_framebuffer = False,
+        video_double_buffered  = False,
+        with_video_blitter     = False,
         **kwargs):
         platform = siglent_sds1104xe.Platform()
 
@@ -98,6 +97,9 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.common import PHYPadsReducer
+            from litedram.modules import MT41K64M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(
                 pads           = PHYPadsReducer(platform.request("ddram"), [0, 1, 2, 3]),
                 memtype        = "DDR3",
@@ -111,22 +113,28 @@ class BaseSoC(SoCCore):
 
         # Etherbone + Ethernet ---------------------------------------------------------------------
         if with_etherbone:
+            from liteeth.phy.mii import LiteEthPHYMII
             # Ethernet PHY
             self.ethphy = LiteEthPHYMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
             )
 
-            # Etherbone.
+            # Etherbone (Bulk: large record buffers for memory dumps/firmware loads, see etherbone_bulk.py).
+            from litex_boards.etherbone_bulk import ETHERBONE_BUFFER_DEPTH, ETHERBONE_BULK_BUFFER_DEPTH
+            etherbone_buffer_depth = ETHERBONE_BULK_BUFFER_DEPTH if etherbone_bulk else ETHERBONE_BUFFER_DEPTH
             self.add_etherbone(
-                phy         = self.ethphy,
-                ip_address  = "192.168.1.50",
-                mac_address = 0x10e2d5000000,
-                data_width  = 8,
-                with_ethmac = True,
+                phy          = self.ethphy,
+                ip_address   = "192.168.1.50",
+                mac_address  = 0x10e2d5000000,
+                data_width   = 8,
+                buffer_depth = etherbone_buffer_depth,
+                with_ethmac  = True,
             )
+            self.add_constant("ETHERBONE_BUFFER_DEPTH", etherbone_buffer_depth)
 
         # Video ------------------------------------------------------------------------------------
+        assert with_video_framebuffer or not with_video_blitter
         video_timings = ("800x480@60Hz", {
             "pix_clk"       : 33.3e6,
             "h_active"      : 800,
@@ -143,7 +151,14 @@ class BaseSoC(SoCCore):
             if with_video_terminal:
                 self.add_video_terminal(phy=self.videophy, timings=video_timings, clock_domain="dvi")
             if with_video_framebuffer:
-                self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="dvi")
+                if video_double_buffered:
+                    from litex_boards.video_framebuffer import add_video_framebuffer
+                    add_video_framebuffer(self, phy=self.videophy, timings=video_timings, clock_domain="dvi")
+                else:
+                    self.add_video_framebuffer(phy=self.videophy, timings=video_timings, clock_domain="dvi")
+                if with_video_blitter:
+                    from litex_boards.video_blitter import add_video_blitter
+                    add_video_blitter(self)
 
 # Build --------------------------------------------------------------------------------------------
 
@@ -152,24 +167,36 @@ def main():
     parser = LiteXArgumentParser(platform=siglent_sds1104xe.Platform, description="LiteX SoC on SDS1104X-E.")
     parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-etherbone", action="store_true",       help="Enable Etherbone support.")
+    parser.add_target_argument("--etherbone-bulk", action="store_true",       help="Enable Etherbone bulk mode (large record buffers).")
     parser.add_target_argument("--eth-ip",         default="192.168.1.50",     help="Ethernet/Etherbone IP address.")
     viopts = parser.target_group.add_mutually_exclusive_group()
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
+    parser.add_target_argument("--video-double-buffered", action="store_true", help="Use double-buffered (page flipping, burst DMA) Video Framebuffer.")
+    parser.add_target_argument("--with-video-blitter",    action="store_true", help="Enable Video Blitter (DMA fill/copy, with Video Framebuffer).")
     args = parser.parse_args()
 
+    if args.etherbone_bulk and not args.with_etherbone:
+        parser.error("--etherbone-bulk requires --with-etherbone.")
+
     soc = BaseSoC(
         sys_clk_freq   = args.sys_clk_freq,
         with_etherbone = args.with_etherbone,
+        etherbone_bulk = args.etherbone_bulk,
         eth_ip         = args.eth_ip,
         with_video_terminal    = args.with_video_terminal,
         with_video_framebuffer = args.with_video_framebuffer,
+        video_double_buffered  = args.video_double_buffered,
+        with_video_blitter     = args.with_video_blitter,
         **parser.soc_argdict
     )
 
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
+        if args.with_video_blitter:
+            from litex_boards.video_blitter import generate_video_blitter_header
+            generate_video_blitter_header(soc, os.path.join(builder.generated_dir, "video_blitter.h"))
 
     if args.load:
         prog = soc.platform.create_programmer()
@@ -23,8 +23,6 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.cores.video import *
 
 from litedram.modules import AS4C32M16, MT41J128M16, W9825G6KH6
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-from litedram.phy import GW5DDRPHY
 from litex.build.io import DDROutput
 
 # CRG ----------------------------------------------------------------------------------------------
@@ -140,6 +138,7 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if with_ddr3 and not self.integrated_main_ram_size:
+            from litedram.phy import GW5DDRPHY
             self.ddrphy = GW5DDRPHY(
                 pads         = platform.request("ddram"),
                 sys_clk_freq = sys_clk_freq
@@ -155,6 +154,7 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if with_sdram and not self.integrated_main_ram_size:
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             module_cls = {
                 "sipeed": W9825G6KH6,
                 "mister": AS4C32M16}[sdram_model]
@@ -20,13 +20,7 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser, WS2812
 from litex.soc.cores.video import *
 
-from liteeth.phy.gw5rgmii import LiteEthPHYRGMII
-
-from litepcie.phy.gw5apciephy import GW5APCIEPHY
-
 from litedram.modules import AS4C32M16, MT41J256M16, W9825G6KH6
-from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
-from litedram.phy import GW5DDRPHY
 from litex.build.io import DDROutput
 
 from litex_boards.platforms import sipeed_tang_mega_138k_pro
@@ -127,6 +121,10 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=50e6,
         with_ethernet       = True,
+        eth_rx_slots        = 2,
+        eth_tx_slots        = 2,
+        eth_mtu             = 1530,
+        eth_data_width      = 32,
         with_etherbone      = False,
         local_ip            = "192.168.1.50",
         remote_ip           = "",
@@ -137,6 +135,7 @@ class BaseSoC(SoCCore):
         sdram_model         = "sipeed",
         sdram_rate          = "1:2",
         with_pcie           = False,
+        pcie_dmas           = 1,
         with_led_chaser     = True,
         with_rgb_led        = False,
         with_buttons        = True,
@@ -166,6 +165,7 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if with_ddr3 and not self.integrated_main_ram_size:
+            from litedram.phy import GW5DDRPHY
             self.ddrphy = GW5DDRPHY(
                 pads         = platform.request("ddram"),
                 sys_clk_freq = sys_clk_freq
@@ -196,6 +196,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.gw5rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
@@ -210,7 +211,16 @@ class BaseSoC(SoCCore):
                 o_CLKOUT   = clk50_half)
             self.specials += DDROutput(1, 0, platform.request("ephy_clk"), clk50_half)
             if with_ethernet:
-                self.add_ethernet(phy=self.ethphy, dynamic_ip=eth_dynamic_ip, data_width=32, software_debug=True)
+                from litex_boards.ethernet import add_ethernet
+                add_ethernet(self,
+                    phy            = self.ethphy,
+                    dynamic_ip     = eth_dynamic_ip,
+                    software_debug = True,
+                    data_width     = eth_data_width,
+                    rx_slots       = eth_rx_slots,
+                    tx_slots       = eth_tx_slots,
+                    mtu            = eth_mtu,
+                )
             if with_etherbone:
                 self.add_etherbone(phy=self.ethphy, data_width=32)
 
@@ -230,6 +240,7 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if with_sdram and not self.integrated_main_ram_size:
+            from litedram.phy import GENSDRPHY, HalfRateGENSDRPHY
             module_cls = {
                 "sipeed": W9825G6KH6,
                 "mister": AS4C32M16}[sdram_model]
@@ -246,13 +257,15 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.gw5apciephy import GW5APCIEPHY
             self.pcie_phy = GW5APCIEPHY(platform, platform.request("pcie"), nlanes=4, cd="sys")
-            self.add_pcie(phy=self.pcie_phy, ndmas=1, data_width=256)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, data_width=256)
 
 # Build --------------------------------------------------------------------------------------------
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=sipeed_tang_mega_138k_pro.Platform, description="LiteX SoC on Tang Mega 138K Pro.")
     parser.add_target_argument("--flash",           action="store_true",      help="Flash Bitstream.")
     parser.add_target_argument("--sys-clk-freq",    default=50e6, type=float, help="System clock frequency.")
@@ -271,6 +284,8 @@ def main():
     parser.add_target_argument("--remote-ip",       default="192.168.1.100",  help="Remote IP address of TFTP server.")
     parser.add_target_argument("--local-ip",        default="192.168.1.50",   help="Local IP address.")
     parser.add_target_argument("--with-pcie",       action="store_true",      help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-dmas",       default=1, type=int,      help="Number of PCIe DMA channels.")
+    eth_mac_args(parser, data_width=32)
     args = parser.parse_args()
 
     assert not (args.with_etherbone and args.eth_dynamic_ip)
@@ -282,11 +297,13 @@ def main():
         with_sdram          = args.with_sdram,
         sdram_model         = args.sdram_model,
         with_pcie           = args.with_pcie,
+        pcie_dmas           = args.pcie_dmas,
         with_ethernet       = args.with_ethernet,
         with_etherbone      = args.with_etherbone,
         local_ip            = args.local_ip,
         remote_ip           = args.remote_ip,
         eth_dynamic_ip      = args.eth_dynamic_ip,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
     )
 
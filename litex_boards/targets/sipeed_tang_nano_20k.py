@@ -22,9 +22,6 @@ from litex.soc.cores.gpio import GPIOIn
 from litex.soc.cores.led import LedChaser, WS2812
 from litex.soc.cores.video import VideoGowinHDMIPHY
 
-from litedram.modules import M12L64322A  # FIXME: use the real model number
-from litedram.phy import GENSDRPHY
-
 from litex_boards.platforms import sipeed_tang_nano_20k
 
 # CRG ----------------------------------------------------------------------------------------------
@@ -97,6 +94,8 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import M12L64322A  # FIXME: use the real model number
+            from litedram.phy import GENSDRPHY
             class SDRAMPads:
                 def __init__(self):
                     self.clk   = platform.request("O_sdram_clk")
@@ -20,14 +20,8 @@ from litex.soc.cores.led import LedChaser, WS2812
 from litex.soc.cores.gpio import GPIOIn
 from litex.soc.cores.video import *
 
-from liteeth.phy.rmii import LiteEthPHYRMII
-
 from litex_boards.platforms import sipeed_tang_primer_20k
 
-from litedram.common import PHYPadsReducer
-from litedram.modules import MT41K64M16
-from litedram.phy import GW2DDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -132,6 +126,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if with_dram:
+            from litedram.modules import MT41K64M16
+            from litedram.phy import GW2DDRPHY
             self.ddrphy = GW2DDRPHY(
                 pads         = platform.request("ddram"),
                 sys_clk_freq = sys_clk_freq
@@ -24,14 +24,6 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 from litex.soc.cores.video   import VideoS7HDMIPHY
 
-from litedram.modules import MT8JTF12864
-from litedram.phy import s7ddrphy
-
-from liteeth.phy import LiteEthPHY
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -79,7 +71,11 @@ class BaseSoC(SoCCore):
         eth_dynamic_ip         = False,
         with_led_chaser        = True,
         with_pcie              = False,
+        pcie_lanes             = 4,
+        pcie_dmas              = 1,
+        pcie_msi               = "msi",
         with_sata              = False,
+        sata_gen               = "gen2",
         with_video_colorbars   = False,
         with_video_framebuffer = False,
         with_video_terminal    = False,
@@ -94,6 +90,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT8JTF12864
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.K7DDRPHY(platform.request("ddram"),
                 memtype      = "DDR3",
                 nphases      = 4,
@@ -107,6 +105,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy import LiteEthPHY
             self.ethphy = LiteEthPHY(
                 clock_pads = self.platform.request("eth_clocks", 0),
                 pads       = self.platform.request("eth", 0),
@@ -132,10 +131,16 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            from litepcie.phy.s7pciephy import S7PCIEPHY
+            self.pcie_phy = S7PCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {1: 64, 2: 64, 4: 128}[pcie_lanes],
+                msi_type   = pcie_msi,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, msi_type=pcie_msi)
+            if pcie_msi == "msi-x":
+                # MSI-X Table/PBA offsets are fixed in the PHY configuration.
+                self.csr.add("pcie_msi",       n=3)
+                self.csr.add("pcie_msi_table", n=4)
 
         # TODO verify / test
         # SATA -------------------------------------------------------------------------------------
@@ -153,7 +158,7 @@ class BaseSoC(SoCCore):
             self.sata_phy = LiteSATAPHY(platform.device,
                 refclk     = sata_refclk,
                 pads       = platform.request("sata", 0),
-                gen        = "gen2",
+                gen        = sata_gen,
                 clk_freq   = sys_clk_freq,
                 data_width = 16)
 
@@ -193,8 +198,12 @@ def main():
     parser.add_target_argument("--local-ip",        default="192.168.1.50", help="Local IP address.")
     parser.add_target_argument("--eth-dynamic-ip",  action="store_true",    help="Enable dynamic Ethernet IP addresses setting.")
     parser.add_target_argument("--with-pcie",       action="store_true",    help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",      default=4, type=int, choices=[1, 2, 4], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",       default=1, type=int,    help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi",        default="msi", choices=["msi", "msi-multi-vector", "msi-x"], help="PCIe MSI type.")
     parser.add_target_argument("--driver",          action="store_true",    help="Generate PCIe driver.")
     parser.add_target_argument("--with-sata",       action="store_true",    help="Enable SATA support.")
+    parser.add_target_argument("--sata-gen",        default="2",            help="SATA Gen.", choices=["1", "2", "3"])
     sdopts = parser.target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
@@ -204,6 +213,10 @@ def main():
     viopts.add_argument("--with-video-colorbars",   action="store_true", help="Enable Video Colorbars (HDMI).")
     args = parser.parse_args()
 
+    if args.with_sata:
+        from litex_boards.sata import check_sata_phy
+        check_sata_phy(parser, "gen" + args.sata_gen, args.sys_clk_freq)
+
     assert not (args.with_etherbone and args.eth_dynamic_ip)
 
     soc = BaseSoC(
@@ -215,7 +228,11 @@ def main():
         remote_ip              = args.remote_ip,
         eth_dynamic_ip         = args.eth_dynamic_ip,
         with_pcie              = args.with_pcie,
+        pcie_lanes             = args.pcie_lanes,
+        pcie_dmas              = args.pcie_dmas,
+        pcie_msi               = args.pcie_msi,
         with_sata              = args.with_sata,
+        sata_gen               = "gen" + args.sata_gen,
         with_video_colorbars   = args.with_video_colorbars,
         with_video_framebuffer = args.with_video_framebuffer,
         with_video_terminal    = args.with_video_terminal,
@@ -230,6 +247,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
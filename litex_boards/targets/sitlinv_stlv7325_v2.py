@@ -25,14 +25,6 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 from litex.soc.cores.video   import VideoS7HDMIPHY
 
-from litedram.modules import MT8JTF12864
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -74,9 +66,17 @@ class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6,
         vccio                  = "3.3V",
         with_ethernet          = False,
+        eth_rx_slots           = 2,
+        eth_tx_slots           = 2,
+        eth_mtu                = 1530,
+        eth_data_width         = 8,
         with_led_chaser        = True,
         with_pcie              = False,
-        with_sata              = False, sata_gen="gen2",
+        pcie_lanes             = 4,
+        pcie_dmas              = 1,
+        pcie_msi               = "msi",
+        with_sata              = False,
+        sata_gen               = "gen2",
         with_video_colorbars   = False,
         with_video_framebuffer = False,
         with_video_terminal    = False,
@@ -91,6 +91,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT8JTF12864
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.K7DDRPHY(platform.request("ddram"),
                 memtype      = "DDR3",
                 nphases      = 4,
@@ -104,20 +106,34 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet:
+            from liteeth.phy.s7rgmii import LiteEthPHYRGMII
             self.ethphy = LiteEthPHYRGMII(
                 clock_pads = self.platform.request("eth_clocks", 0),
                 pads       = self.platform.request("eth", 0),
                 tx_delay = 1.417e-9,
                 rx_delay = 1.417e-9,
             )
-            self.add_ethernet(phy=self.ethphy)
+            from litex_boards.ethernet import add_ethernet
+            add_ethernet(self,
+                phy        = self.ethphy,
+                data_width = eth_data_width,
+                rx_slots   = eth_rx_slots,
+                tx_slots   = eth_tx_slots,
+                mtu        = eth_mtu,
+            )
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            from litepcie.phy.s7pciephy import S7PCIEPHY
+            self.pcie_phy = S7PCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {1: 64, 2: 64, 4: 128}[pcie_lanes],
+                msi_type   = pcie_msi,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, msi_type=pcie_msi)
+            if pcie_msi == "msi-x":
+                # MSI-X Table/PBA offsets are fixed in the PHY configuration.
+                self.csr.add("pcie_msi",       n=3)
+                self.csr.add("pcie_msi_table", n=4)
 
         # TODO verify / test
         # SATA -------------------------------------------------------------------------------------
@@ -165,14 +181,18 @@ class BaseSoC(SoCCore):
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=sitlinv_stlv7325_v2.Platform, description="LiteX SoC on AliExpress STLV7325-v2.")
     parser.add_target_argument("--sys-clk-freq",  default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--vccio",         default="3.3V", type=str, help="IO Voltage (set by J4), can be 2.5V or 3.3V")
     parser.add_target_argument("--with-pcie",       action="store_true",    help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",      default=4, type=int, choices=[1, 2, 4], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",       default=1, type=int,    help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi",        default="msi", choices=["msi", "msi-multi-vector", "msi-x"], help="PCIe MSI type.")
     parser.add_target_argument("--driver",          action="store_true",    help="Generate PCIe driver.")
     parser.add_target_argument("--with-ethernet",   action="store_true",    help="Enable Ethernet support.")
     parser.add_target_argument("--with-sata",       action="store_true",    help="Enable SATA support.")
-    parser.add_target_argument("--sata-gen",        default="2",    help="SATA Gen..", choices=["1", "2", "3"])
+    parser.add_target_argument("--sata-gen",        default="2",    help="SATA Gen.", choices=["1", "2", "3"])
     sdopts = parser.target_group.add_mutually_exclusive_group()
     sdopts.add_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support.")
     sdopts.add_argument("--with-sdcard",     action="store_true", help="Enable SDCard support.")
@@ -180,18 +200,27 @@ def main():
     viopts.add_argument("--with-video-terminal",    action="store_true", help="Enable Video Terminal (HDMI).")
     viopts.add_argument("--with-video-framebuffer", action="store_true", help="Enable Video Framebuffer (HDMI).")
     viopts.add_argument("--with-video-colorbars",   action="store_true", help="Enable Video Colorbars (HDMI).")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
+    if args.with_sata:
+        from litex_boards.sata import check_sata_phy
+        check_sata_phy(parser, "gen" + args.sata_gen, args.sys_clk_freq)
+
     soc = BaseSoC(
         sys_clk_freq           = args.sys_clk_freq,
         vccio                  = args.vccio,
         with_ethernet          = args.with_ethernet,
         with_pcie              = args.with_pcie,
+        pcie_lanes             = args.pcie_lanes,
+        pcie_dmas              = args.pcie_dmas,
+        pcie_msi               = args.pcie_msi,
         with_sata              = args.with_sata,
         sata_gen               = "gen" + args.sata_gen,
         with_video_colorbars   = args.with_video_colorbars,
         with_video_framebuffer = args.with_video_framebuffer,
         with_video_terminal    = args.with_video_terminal,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
@@ -203,6 +232,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -27,13 +27,6 @@ from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 from litex.soc.cores.bitbang import I2CMaster
 
-from litedram.phy import s7ddrphy
-from litedram.common import PHYPadsReducer
-from litedram.modules import K4B1G0446F
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -69,7 +62,11 @@ class BaseSoC(SoCCore):
         io_voltage      = "3.3V",
         with_led_chaser = True,
         with_pcie       = False,
+        pcie_lanes      = 4,
+        pcie_dmas       = 1,
+        pcie_msi        = "msi",
         with_sata       = False,
+        sata_gen        = "gen2",
         **kwargs):
         platform = sitlinv_xc7k420t.Platform(io_voltage)
 
@@ -81,6 +78,9 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.phy import s7ddrphy
+            from litedram.common import PHYPadsReducer
+            from litedram.modules import K4B1G0446F
             # we need to use A7DDRPHY instead of K7DDRPHY, because the 420T has no ODELAYE2
             self.ddrphy = s7ddrphy.A7DDRPHY(
                 pads         = PHYPadsReducer(platform.request("ddram", 0), [0, 1, 2, 3]),
@@ -98,10 +98,16 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            from litepcie.phy.s7pciephy import S7PCIEPHY
+            self.pcie_phy = S7PCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {1: 64, 2: 64, 4: 128, 8: 128}[pcie_lanes],
+                msi_type   = pcie_msi,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, msi_type=pcie_msi)
+            if pcie_msi == "msi-x":
+                # MSI-X Table/PBA offsets are fixed in the PHY configuration.
+                self.csr.add("pcie_msi",       n=3)
+                self.csr.add("pcie_msi_table", n=4)
 
         # TODO verify / test
         # SATA -------------------------------------------------------------------------------------
@@ -119,7 +125,7 @@ class BaseSoC(SoCCore):
             self.sata_phy = LiteSATAPHY(platform.device,
                 refclk     = sata_refclk,
                 pads       = platform.request("sata", 0),
-                gen        = "gen2",
+                gen        = sata_gen,
                 clk_freq   = sys_clk_freq,
                 data_width = 16)
 
@@ -143,15 +149,27 @@ def main():
     parser.add_target_argument("--sys-clk-freq",    default=100e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--io-voltage",      default="3.3V",            help="IO voltage chosen by Jumper J3. Can be: '3.3V' or '2.5V'.")
     parser.add_target_argument("--with-pcie",       action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",      default=4, type=int, choices=[1, 2, 4, 8], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",       default=1, type=int,       help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi",        default="msi", choices=["msi", "msi-multi-vector", "msi-x"], help="PCIe MSI type.")
     parser.add_target_argument("--driver",          action="store_true",       help="Generate PCIe driver.")
     parser.add_target_argument("--with-sata",       action="store_true",       help="Enable SATA support.")
+    parser.add_target_argument("--sata-gen",        default="2",               help="SATA Gen.", choices=["1", "2", "3"])
     args = parser.parse_args()
 
+    if args.with_sata:
+        from litex_boards.sata import check_sata_phy
+        check_sata_phy(parser, "gen" + args.sata_gen, args.sys_clk_freq)
+
     soc = BaseSoC(
         sys_clk_freq   = args.sys_clk_freq,
         io_voltage     = args.io_voltage,
         with_pcie      = args.with_pcie,
+        pcie_lanes     = args.pcie_lanes,
+        pcie_dmas      = args.pcie_dmas,
+        pcie_msi       = args.pcie_msi,
         with_sata      = args.with_sata,
+        sata_gen       = "gen" + args.sata_gen,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -159,6 +177,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -40,12 +40,6 @@ from litex.soc.cores.led import LedChaser
 from litex.soc.cores.xadc import XADC
 from litex.soc.cores.dna  import DNA
 
-from litedram.modules import MT41K512M16
-from litedram.phy import s7ddrphy
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class CRG(LiteXModule):
@@ -77,7 +71,11 @@ class BaseSoC(SoCCore):
     def __init__(self, variant="cle-215+", sys_clk_freq=100e6,
         with_led_chaser = True,
         with_pcie       = False,
+        pcie_dmas       = 1,
+        pcie_msi        = "msi",
         with_sata       = False,
+        sata_gen        = "gen1",
+        sata_ports      = 1,
         **kwargs):
         platform = sqrl_acorn.Platform(variant=variant)
 
@@ -96,6 +94,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT41K512M16
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(platform.request("ddram"),
                 memtype          = "DDR3",
                 nphases          = 4,
@@ -109,11 +109,17 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.s7pciephy import S7PCIEPHY
             self.comb += platform.request("pcie_clkreq_n").eq(0)
             self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
                 data_width = 128,
+                msi_type   = pcie_msi,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1, address_width=64)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, msi_type=pcie_msi, address_width=64)
+            if pcie_msi == "msi-x":
+                # MSI-X Table/PBA offsets are fixed in the PHY configuration.
+                self.csr.add("pcie_msi",       n=3)
+                self.csr.add("pcie_msi_table", n=4)
             platform.add_period_constraint(self.crg.cd_sys.clk, 1e9/sys_clk_freq)
 
             # ICAP (For FPGA reload over PCIe).
@@ -133,15 +139,20 @@ class BaseSoC(SoCCore):
             from litex.build.generic_platform import Subsignal, Pins
             from litesata.phy import LiteSATAPHY
 
-            # IOs
+            # IOs (M.2 lanes).
             _sata_io = [
                  # PCIe 2 SATA Custom Adapter (With PCIe Riser / SATA cable mod).
-                ("pcie2sata", 0,
-                    Subsignal("tx_p",  Pins("B6")),
-                    Subsignal("tx_n",  Pins("A6")),
-                    Subsignal("rx_p",  Pins("B10")),
-                    Subsignal("rx_n",  Pins("A10")),
-                ),
+                ("pcie2sata", i,
+                    Subsignal("tx_p", Pins(tx_p)),
+                    Subsignal("tx_n", Pins(tx_n)),
+                    Subsignal("rx_p", Pins(rx_p)),
+                    Subsignal("rx_n", Pins(rx_n)),
+                ) for i, (tx_p, tx_n, rx_p, rx_n) in enumerate([
+                    ("B6", "A6", "B10", "A10"),
+                    ("B4", "A4", "B8", "A8"),
+                    ("D5", "C5", "D11", "C11"),
+                    ("D7", "C7", "D9", "C9"),
+                ])
             ]
             platform.add_extension(_sata_io)
 
@@ -151,16 +162,28 @@ class BaseSoC(SoCCore):
             sata_refclk = ClockSignal("sata_refclk")
             platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-49]")
 
-            # PHY
-            self.sata_phy = LiteSATAPHY(platform.device,
-                refclk     = sata_refclk,
-                pads       = platform.request("pcie2sata"),
-                gen        = "gen1",
-                clk_freq   = sys_clk_freq,
-                data_width = 16)
+            # PHYs (GTPs of the Quad share the QPLL of the first PHY).
+            sata_phys = []
+            for i in range(sata_ports):
+                sata_phy = LiteSATAPHY(platform.device,
+                    refclk     = sata_refclk,
+                    pads       = platform.request("pcie2sata", i),
+                    gen        = sata_gen,
+                    clk_freq   = sys_clk_freq,
+                    data_width = 16,
+                    qpll       = None if i == 0 else sata_phys[0].phy.qpll)
+                sata_phys.append(sata_phy)
 
             # Core
-            self.add_sata(phy=self.sata_phy, mode="read+write")
+            if sata_ports == 1:
+                self.sata_phy = sata_phys[0]
+                self.add_sata(phy=self.sata_phy, mode="read+write")
+            # Striping (RAID-0) Core
+            else:
+                from litex_boards.sata_striping import add_sata_striping
+                for i, sata_phy in enumerate(sata_phys):
+                    self.add_module(name=f"sata_phy{i}", module=sata_phy)
+                add_sata_striping(self, phys=sata_phys)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -179,15 +202,27 @@ def main():
     pcieopts = parser.target_group.add_mutually_exclusive_group()
     pcieopts.add_argument("--with-pcie",            action="store_true", help="Enable PCIe support.")
     parser.add_target_argument("--driver",          action="store_true", help="Generate PCIe driver.")
+    parser.add_target_argument("--pcie-dmas",       default=1, type=int, help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi",        default="msi", choices=["msi", "msi-multi-vector", "msi-x"], help="PCIe MSI type.")
     parser.add_target_argument("--with-spi-sdcard", action="store_true", help="Enable SPI-mode SDCard support (requires SDCard adapter on P2).")
     pcieopts.add_argument("--with-sata",            action="store_true", help="Enable SATA support (over PCIe2SATA).")
+    parser.add_target_argument("--sata-gen",        default="1",         help="SATA Gen.", choices=["1", "2", "3"])
+    parser.add_target_argument("--sata-ports",      default=1, type=int, choices=[1, 2, 3, 4], help="Number of SATA ports (M.2 lanes, striped when > 1).")
     args = parser.parse_args()
 
+    if args.with_sata:
+        from litex_boards.sata import check_sata_phy
+        check_sata_phy(parser, "gen" + args.sata_gen, args.sys_clk_freq)
+
     soc = BaseSoC(
         variant      = args.variant,
         sys_clk_freq = args.sys_clk_freq,
         with_pcie    = args.with_pcie,
+        pcie_dmas    = args.pcie_dmas,
+        pcie_msi     = args.pcie_msi,
         with_sata    = args.with_sata,
+        sata_gen     = "gen" + args.sata_gen,
+        sata_ports   = args.sata_ports,
         **parser.soc_argdict
     )
     if args.with_spi_sdcard:
@@ -198,6 +233,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
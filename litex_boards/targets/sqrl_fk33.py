@@ -19,20 +19,14 @@ from litex.gen import *
 
 from litex_boards.platforms import sqrl_fk33
 
+from litex.soc.interconnect import stream
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.interconnect.axi import *
-from litex.soc.cores.ram.xilinx_usp_hbm2 import USPHBM2
 from litex.soc.cores.led import LedChaser
 
-from litepcie.phy.usppciephy import USPHBMPCIEPHY
-from litepcie.core import LitePCIeEndpoint, LitePCIeMSI
-from litepcie.frontend.dma import LitePCIeDMA
-from litepcie.frontend.wishbone import LitePCIeWishboneBridge
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -59,9 +53,14 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
-        with_led_chaser = True,
-        with_pcie       = False,
-        with_hbm        = False,
+        with_led_chaser  = True,
+        with_pcie        = False,
+        pcie_lanes       = 4,
+        pcie_dmas        = 1,
+        with_hbm         = False,
+        hbm_ports        = 4,
+        hbm_interconnect = "axi-lite",
+        ip_cache_dir     = None,
         **kwargs):
         platform = sqrl_fk33.Platform()
         if with_hbm:
@@ -79,29 +78,23 @@ class BaseSoC(SoCCore):
 
         # HBM --------------------------------------------------------------------------------------
         if with_hbm:
-            # Add HBM Core.
-            self.hbm = hbm = ClockDomainsRenamer({"axi": "sys"})(USPHBM2(platform))
-
-            # Get HBM .xci.
-            os.system("wget https://github.com/litex-hub/litex-boards/files/8178874/hbm_0.xci.txt")
-            os.makedirs("ip/hbm", exist_ok=True)
-            os.system("mv hbm_0.xci.txt ip/hbm/hbm_0.xci")
-
-            # Connect four of the HBM's AXI interfaces to the main bus of the SoC.
-            for i in range(4):
-                axi_hbm      = hbm.axi[i]
-                axi_lite_hbm = AXILiteInterface(data_width=256, address_width=33)
-                self.submodules += AXILite2AXI(axi_lite_hbm, axi_hbm)
-                self.bus.add_slave(f"hbm{i}", axi_lite_hbm, SoCRegion(origin=0x4000_0000 + 0x1000_0000*i, size=0x1000_0000)) # 256MB.
-            # Link HBM2 channel 0 as main RAM
-            self.bus.add_region("main_ram", SoCRegion(origin=0x4000_0000, size=0x1000_0000, linker=True)) # 256MB.
+            from litex_boards.hbm import add_hbm
+            add_hbm(self,
+                ports        = hbm_ports,
+                interconnect = hbm_interconnect,
+                ip_cache_dir = ip_cache_dir,
+                with_dma     = with_pcie and (hbm_interconnect == "axi"))
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
+            from litepcie.phy.usppciephy import USPHBMPCIEPHY
+            from litepcie.core import LitePCIeEndpoint, LitePCIeMSI
+            from litepcie.frontend.dma import LitePCIeDMA
+            from litepcie.frontend.wishbone import LitePCIeWishboneBridge
             assert self.csr_data_width == 32
             # PHY
-            self.pcie_phy = USPHBMPCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            self.pcie_phy = USPHBMPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {2: 64, 4: 128, 8: 256, 16: 512}[pcie_lanes],
                 bar0_size  = 0x20000)
 
             # Endpoint
@@ -112,20 +105,37 @@ class BaseSoC(SoCCore):
                 base_address = self.mem_map["csr"])
             self.bus.add_master(master=self.pcie_bridge.wishbone)
 
-            # DMA0
-            self.pcie_dma0 = LitePCIeDMA(self.pcie_phy, self.pcie_endpoint,
-                with_buffering = True, buffering_depth=1024,
-                with_loopback  = True)
-
-            self.add_constant("DMA_CHANNELS", 1)
+            # DMAs
+            for i in range(pcie_dmas):
+                pcie_dma = LitePCIeDMA(self.pcie_phy, self.pcie_endpoint,
+                    with_buffering = True, buffering_depth=1024,
+                    with_loopback  = True)
+                self.add_module(name=f"pcie_dma{i}", module=pcie_dma)
+
+            self.add_constant("DMA_CHANNELS", pcie_dmas)
+
+            # DMA0 <-> HBM (when enabled, DMA loopback has to be disabled).
+            if hasattr(self, "hbm_dma_writer"):
+                self.hbm_dma_writer_converter = stream.Converter(self.pcie_phy.data_width, 256)
+                self.hbm_dma_reader_converter = stream.Converter(256, self.pcie_phy.data_width)
+                self.submodules += stream.Pipeline(
+                    self.pcie_dma0.source,
+                    self.hbm_dma_writer_converter,
+                    self.hbm_dma_writer,
+                )
+                self.submodules += stream.Pipeline(
+                    self.hbm_dma_reader,
+                    self.hbm_dma_reader_converter,
+                    self.pcie_dma0.sink,
+                )
 
             # MSI
             self.pcie_msi = LitePCIeMSI()
             self.comb += self.pcie_msi.source.connect(self.pcie_phy.msi)
-            self.interrupts = {
-                "PCIE_DMA0_WRITER":    self.pcie_dma0.writer.irq,
-                "PCIE_DMA0_READER":    self.pcie_dma0.reader.irq,
-            }
+            self.interrupts = {}
+            for i in range(pcie_dmas):
+                self.interrupts[f"PCIE_DMA{i}_WRITER"] = getattr(self, f"pcie_dma{i}").writer.irq
+                self.interrupts[f"PCIE_DMA{i}_READER"] = getattr(self, f"pcie_dma{i}").reader.irq
             for i, (k, v) in enumerate(sorted(self.interrupts.items())):
                 self.comb += self.pcie_msi.irqs[i].eq(v)
                 self.add_constant(k + "_INTERRUPT", i)
@@ -141,16 +151,26 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=sqrl_fk33.Platform, description="LiteX SoC on FK33.")
-    parser.add_target_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--with-hbm",     action="store_true",       help="Use HBM2.")
-    parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--sys-clk-freq",     default=125e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--with-pcie",        action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",       default=4, type=int, choices=[2, 4, 8, 16], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",        default=1, type=int,       help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--with-hbm",         action="store_true",       help="Use HBM2.")
+    parser.add_target_argument("--hbm-ports",        default=4, type=int, choices=[1, 2, 4, 8, 16, 32], help="Number of HBM2 AXI ports/Pseudo-Channels to use (power of 2).")
+    parser.add_target_argument("--hbm-interconnect", default="axi-lite",        help="HBM2 interconnect (axi-lite or axi).", choices=["axi-lite", "axi"])
+    parser.add_target_argument("--ip-cache-dir",     default=None,              help="HBM2 IP cache directory (defaults to LITEX_BOARDS_IP_CACHE_DIR or ~/.cache/litex-boards/ip).")
+    parser.add_target_argument("--driver",           action="store_true",       help="Generate PCIe driver.")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = args.sys_clk_freq,
-        with_pcie    = args.with_pcie,
-        with_hbm     = args.with_hbm,
+        sys_clk_freq     = args.sys_clk_freq,
+        with_pcie        = args.with_pcie,
+        pcie_lanes       = args.pcie_lanes,
+        pcie_dmas        = args.pcie_dmas,
+        with_hbm         = args.with_hbm,
+        hbm_ports        = args.hbm_ports,
+        hbm_interconnect = args.hbm_interconnect,
+        ip_cache_dir     = args.ip_cache_dir,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -158,6 +178,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
@@ -15,17 +15,13 @@ from litex.gen import *
 
 from litex_boards.platforms import sqrl_xcu1525
 
+from litex.soc.interconnect import stream
 from litex.soc.cores.clock import *
+from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT40A512M8
-from litedram.phy import usddrphy
-
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -55,59 +51,242 @@ class _CRG(LiteXModule):
 
         self.idelayctrl = USPIDELAYCTRL(cd_ref=self.cd_idelay, cd_sys=self.cd_sys)
 
+# SDRAM Interleaver --------------------------------------------------------------------------------
+
+class _SDRAMInterleaver(LiteXModule):
+    """Aggregates N LiteDRAM native ports in a single address-interleaved native port.
+
+    The port address is split as [upper | channel | lower]: consecutive blocks of granularity bytes
+    go to consecutive channels. Commands are dispatched to the channels in order, write data/read
+    data are returned in the order of the commands (read data is buffered per channel and commands
+    are only issued when buffer space is available, since LiteDRAM ports can't be back-pressured).
+    """
+    def __init__(self, ports, granularity=1024, depth=16, mode="both"):
+        from litedram.common import LiteDRAMNativePort
+        nports        = len(ports)
+        data_width    = ports[0].data_width
+        address_width = ports[0].address_width
+        channel_bits  = log2_int(nports)
+        lower_bits    = log2_int(granularity//(data_width//8))
+        for port in ports:
+            assert port.data_width    == data_width
+            assert port.address_width == address_width
+        self.port = port = LiteDRAMNativePort(mode, address_width + channel_bits, data_width)
+
+        # # #
+
+        # Address decoding.
+        channel = Signal(channel_bits)
+        address = Signal(address_width)
+        self.comb += [
+            channel.eq(port.cmd.addr[lower_bits:lower_bits + channel_bits]),
+            address.eq(Cat(port.cmd.addr[:lower_bits], port.cmd.addr[lower_bits + channel_bits:])),
+        ]
+
+        # Order of the Write/Read commands (in channels).
+        self.wr_order = wr_order = stream.SyncFIFO([("channel", channel_bits)], depth*nports)
+        self.rd_order = rd_order = stream.SyncFIFO([("channel", channel_bits)], depth*nports)
+
+        # Commands / Read buffers.
+        cmd_ready  = Signal()
+        rd_fifos   = []
+        for n, p in enumerate(ports):
+            rd_fifo = stream.SyncFIFO([("data", data_width)], depth)
+            self.submodules += rd_fifo
+            rd_fifos.append(rd_fifo)
+
+            # Reads in flight (issued and not yet returned to the user port).
+            rd_pending   = Signal(max=depth + 1)
+            rd_available = Signal()
+            self.comb += rd_available.eq(rd_pending < depth)
+            self.sync += rd_pending.eq(rd_pending +
+                (p.cmd.valid & p.cmd.ready & ~p.cmd.we) -
+                (rd_fifo.source.valid & rd_fifo.source.ready))
+
+            self.comb += [
+                p.cmd.valid.eq(port.cmd.valid & (channel == n) &
+                    Mux(port.cmd.we, wr_order.sink.ready, rd_order.sink.ready & rd_available)),
+                p.cmd.we.eq(port.cmd.we),
+                p.cmd.addr.eq(address),
+                If(p.cmd.valid & p.cmd.ready,
+                    cmd_ready.eq(1)
+                ),
+                p.rdata.connect(rd_fifo.sink),
+            ]
+        self.comb += [
+            port.cmd.ready.eq(cmd_ready),
+            wr_order.sink.valid.eq(port.cmd.valid & port.cmd.ready &  port.cmd.we),
+            wr_order.sink.channel.eq(channel),
+            rd_order.sink.valid.eq(port.cmd.valid & port.cmd.ready & ~port.cmd.we),
+            rd_order.sink.channel.eq(channel),
+        ]
+
+        # Write Data (to the channel of the oldest Write command).
+        wr_channel = wr_order.source.channel
+        for n, p in enumerate(ports):
+            self.comb += [
+                p.wdata.valid.eq(port.wdata.valid & wr_order.source.valid & (wr_channel == n)),
+                p.wdata.data.eq(port.wdata.data),
+                p.wdata.we.eq(port.wdata.we),
+            ]
+        self.comb += [
+            port.wdata.ready.eq(wr_order.source.valid & Array(p.wdata.ready for p in ports)[wr_channel]),
+            wr_order.source.ready.eq(port.wdata.valid & port.wdata.ready),
+        ]
+
+        # Read Data (from the channel of the oldest Read command).
+        rd_channel = rd_order.source.channel
+        for n, rd_fifo in enumerate(rd_fifos):
+            self.comb += rd_fifo.source.ready.eq(port.rdata.ready & rd_order.source.valid & (rd_channel == n))
+        self.comb += [
+            port.rdata.valid.eq(rd_order.source.valid & Array(f.source.valid for f in rd_fifos)[rd_channel]),
+            port.rdata.data.eq(Array(f.source.data for f in rd_fifos)[rd_channel]),
+            rd_order.source.ready.eq(port.rdata.valid & port.rdata.ready),
+        ]
+
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6, ddram_channel=0,
-        with_led_chaser = True,
-        with_pcie       = False,
-        with_sata       = False,
+        ddram_interleaving    = 1024,
+        with_led_chaser       = True,
+        with_ethernet         = False,
+        with_etherbone        = False,
+        ethernet_port         = "qsfp0_sfp0",
+        etherbone_port        = "qsfp1_sfp0",
+        eth_ip                = "192.168.1.50",
+        remote_ip             = None,
+        eth_dynamic_ip        = False,
+        etherbone_ip          = "192.168.1.51",
+        ethernet_speed        = "1g",
+        with_pcie             = False,
+        pcie_lanes            = 4,
+        pcie_dmas             = 1,
+        with_pcie_dram_bench  = False,
+        with_sata             = False,
+        sata_gen              = "gen2",
+        sata_ports            = 1,
+        with_sata_pcie        = False,
+        sata_pcie_dram_buffer = False,
         **kwargs):
         platform = sqrl_xcu1525.Platform()
+        ddram_channels = [0, 1, 2, 3] if ddram_channel == "all" else [ddram_channel]
+        sata_pcie_dram_buffer_size = 0x0800_0000 # 128MB per direction.
 
         # CRG --------------------------------------------------------------------------------------
-        self.crg = _CRG(platform, sys_clk_freq, ddram_channel)
+        self.crg = _CRG(platform, sys_clk_freq, ddram_channels[0])
 
         # SoCCore ----------------------------------------------------------------------------------
         SoCCore.__init__(self, platform, sys_clk_freq, ident="LiteX SoC on XCU1525", **kwargs)
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
-            self.ddrphy = usddrphy.USPDDRPHY(
-                pads             = platform.request("ddram", ddram_channel),
-                memtype          = "DDR4",
-                sys_clk_freq     = sys_clk_freq,
-                iodelay_clk_freq = 500e6)
-            self.add_sdram("sdram",
-                phy           = self.ddrphy,
-                module        = MT40A512M8(sys_clk_freq, "1:4"),
-                size          = 0x40000000,
-                l2_cache_size = kwargs.get("l2_size", 8192)
-            )
+            from litedram.modules import MT40A512M8
+            from litedram.phy import usddrphy
+            # First channel is used as main_ram, additional channels (ddrphyN/sdramN, N=channel)
+            # get their own controller, outside of the main_ram.
+            # With the SATA <-> PCIe DRAM buffers, the top 256MB of the first channel are reserved
+            # for them and excluded from main_ram.
+            sdram_size     = 0x40000000
+            main_ram_size  = sdram_size
+            if with_sata_pcie and sata_pcie_dram_buffer:
+                main_ram_size -= 2*sata_pcie_dram_buffer_size
+            for n, channel in enumerate(ddram_channels):
+                suffix = "" if n == 0 else str(channel)
+                ddrphy = usddrphy.USPDDRPHY(
+                    pads             = platform.request("ddram", channel),
+                    memtype          = "DDR4",
+                    sys_clk_freq     = sys_clk_freq,
+                    iodelay_clk_freq = 500e6)
+                self.add_module(name=f"ddrphy{suffix}", module=ddrphy)
+                self.add_sdram(f"sdram{suffix}",
+                    phy                   = ddrphy,
+                    module                = MT40A512M8(sys_clk_freq, "1:4"),
+                    size                  = main_ram_size if n == 0 else sdram_size,
+                    l2_cache_size         = kwargs.get("l2_size", 8192),
+                    with_soc_interconnect = (n == 0),
+                )
             # Workadound for Vivado 2018.2 DRC, can be ignored and probably fixed on newer Vivado versions.
             platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks PDCN-2736]")
 
+        # DDR4 SDRAM Multi-Channel -----------------------------------------------------------------
+        if not self.integrated_main_ram_size and len(ddram_channels) > 1:
+            from litex.soc.interconnect import wishbone
+            from litedram.frontend.wishbone import LiteDRAMWishbone2Native
+            sdrams = [self.sdram] + [getattr(self, f"sdram{channel}") for channel in ddram_channels[1:]]
+
+            # Separate regions: first 512MB of additional channels mapped on the SoC bus.
+            for n, channel in enumerate(ddram_channels[1:]):
+                origin = 0x80000000 + n*0x20000000
+                wb     = wishbone.Interface(data_width=self.bus.data_width, address_width=32, addressing="word")
+                self.submodules += LiteDRAMWishbone2Native(
+                    wishbone     = wb,
+                    port         = sdrams[n + 1].crossbar.get_port(),
+                    base_address = origin)
+                self.bus.add_slave(f"sdram{channel}", wb, SoCRegion(origin=origin, size=0x20000000, cached=False))
+
+            # Aggregate: DMAs get ports interleaved over all channels (4GB), see get_dram_dma_port.
+            self.sdram_channels     = sdrams
+            self.ddram_interleaving = ddram_interleaving
+
+            # Note: Only the main sdram is initialized/calibrated by the BIOS, the additional
+            # channels are left uncalibrated and have to be initialized from the Host (see
+            # sdram{1,2,3}_init.py generated in the build directory) before being used.
+
+        # Ethernet / Etherbone (1000BASE-X or 10GBASE-R over QSFP lanes) --------------------------
+        if with_ethernet:
+            self.ethphy = self.add_qsfp_phy(ethernet_port, ethernet_speed, cd="eth")
+            self.add_ethernet(phy=self.ethphy, phy_cd="eth",
+                data_width = {"1g": 8, "10g": 64}[ethernet_speed],
+                local_ip   = eth_ip if not eth_dynamic_ip else None,
+                remote_ip  = remote_ip,
+                dynamic_ip = eth_dynamic_ip,
+                with_timing_constraints = (ethernet_speed == "1g"))
+        if with_etherbone:
+            self.etherbonephy = self.add_qsfp_phy(etherbone_port, ethernet_speed, cd="etherbone_eth")
+            self.add_etherbone(phy=self.etherbonephy, phy_cd="etherbone_eth",
+                data_width = {"1g": 8, "10g": 64}[ethernet_speed],
+                ip_address = etherbone_ip,
+                with_timing_constraints = (ethernet_speed == "1g"))
+
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            from litepcie.phy.usppciephy import USPPCIEPHY
+            self.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {2: 64, 4: 128, 8: 256, 16: 512}[pcie_lanes],
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
+
+            # PCIe DMA0 <-> DRAM benchmark (when enabled, DMA loopback has to be disabled).
+            if with_pcie_dram_bench:
+                from litedram.frontend.dma import LiteDRAMDMAWriter, LiteDRAMDMAReader
+                from litex_boards.pcie_dram_bench import PCIeDRAMBench
+                assert not self.integrated_main_ram_size
+                port_wr = self.get_dram_dma_port(mode="write")
+                port_rd = self.get_dram_dma_port(mode="read")
+                self.dram_dma_writer = LiteDRAMDMAWriter(port_wr, fifo_depth=32, with_csr=True)
+                self.dram_dma_reader = LiteDRAMDMAReader(port_rd, fifo_depth=64, with_csr=True)
+                self.pcie_dram_bench = PCIeDRAMBench(self.pcie_dma0, self.dram_dma_writer, self.dram_dma_reader)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
             from litex.build.generic_platform import Subsignal, Pins
             from litesata.phy import LiteSATAPHY
 
-            # IOs
+            # IOs (QSFP0 lanes, over QSFP to 4xSFP breakout cable when using several ports).
             _sata_io = [
                 # SFP 2 SATA Adapter / https://shop.trenz-electronic.de/en/TE0424-01-SFP-2-SATA-Adapter
-                ("qsfp2sata", 0,
-                    Subsignal("tx_p", Pins("N9")),
-                    Subsignal("tx_n", Pins("N8")),
-                    Subsignal("rx_p", Pins("N4")),
-                    Subsignal("rx_n", Pins("N3")),
-                ),
+                ("qsfp2sata", i,
+                    Subsignal("tx_p", Pins(tx_p)),
+                    Subsignal("tx_n", Pins(tx_n)),
+                    Subsignal("rx_p", Pins(rx_p)),
+                    Subsignal("rx_n", Pins(rx_n)),
+                ) for i, (tx_p, tx_n, rx_p, rx_n) in enumerate([
+                    ("N9", "N8", "N4", "N3"),
+                    ("M7", "M6", "M2", "M1"),
+                    ("L9", "L8", "L4", "L3"),
+                    ("K7", "K6", "K2", "K1"),
+                ])
             ]
             platform.add_extension(_sata_io)
 
@@ -116,16 +295,59 @@ class BaseSoC(SoCCore):
             self.crg.pll.create_clkout(self.cd_sata_refclk, 150e6)
             sata_refclk = ClockSignal("sata_refclk")
 
-            # PHY
-            self.sata_phy = LiteSATAPHY(platform.device,
-                refclk     = sata_refclk,
-                pads       = platform.request("qsfp2sata"),
-                gen        = "gen2",
-                clk_freq   = sys_clk_freq,
-                data_width = 16)
+            # PHYs
+            sata_phys = []
+            for i in range(sata_ports):
+                sata_phy = LiteSATAPHY(platform.device,
+                    refclk     = sata_refclk,
+                    pads       = platform.request("qsfp2sata", i),
+                    gen        = sata_gen,
+                    clk_freq   = sys_clk_freq,
+                    data_width = 16)
+                sata_phys.append(sata_phy)
 
             # Core
-            self.add_sata(phy=self.sata_phy, mode="read+write")
+            if sata_ports == 1:
+                self.sata_phy = sata_phys[0]
+                self.add_sata(phy=self.sata_phy, mode="read+write")
+            # Striping (RAID-0) Core
+            else:
+                from litex_boards.sata_striping import add_sata_striping
+                for i, sata_phy in enumerate(sata_phys):
+                    self.add_module(name=f"sata_phy{i}", module=sata_phy)
+                add_sata_striping(self, phys=sata_phys)
+
+        # SATA <-> PCIe Streaming ------------------------------------------------------------------
+        # Zero-copy streaming between SATA and PCIe DMA0 (DMA loopback has to be disabled).
+        if with_sata_pcie:
+            from litex_boards.sata_pcie import SATAPCIeStreamer
+            assert with_pcie and with_sata and not with_pcie_dram_bench
+            to_host_buffer   = None
+            from_host_buffer = None
+            # Optional DRAM buffering: 128MB per direction at the top of main_ram's channel, excluded
+            # from main_ram (see DDR4 SDRAM).
+            if sata_pcie_dram_buffer:
+                from litedram.frontend.fifo import LiteDRAMFIFO
+                assert not self.integrated_main_ram_size
+                to_host_buffer = LiteDRAMFIFO(
+                    data_width  = self.pcie_phy.data_width,
+                    base        = main_ram_size,
+                    depth       = sata_pcie_dram_buffer_size,
+                    write_port  = self.sdram.crossbar.get_port(mode="write"),
+                    read_port   = self.sdram.crossbar.get_port(mode="read"),
+                    with_bypass = True)
+                from_host_buffer = LiteDRAMFIFO(
+                    data_width  = self.pcie_phy.data_width,
+                    base        = main_ram_size + sata_pcie_dram_buffer_size,
+                    depth       = sata_pcie_dram_buffer_size,
+                    write_port  = self.sdram.crossbar.get_port(mode="write"),
+                    read_port   = self.sdram.crossbar.get_port(mode="read"),
+                    with_bypass = True)
+            self.sata_pcie = SATAPCIeStreamer(
+                port             = self.sata_crossbar.get_port(),
+                dma              = self.pcie_dma0,
+                to_host_buffer   = to_host_buffer,
+                from_host_buffer = from_host_buffer)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -133,31 +355,150 @@ class BaseSoC(SoCCore):
                 pads         = platform.request_all("user_led"),
                 sys_clk_freq = sys_clk_freq)
 
+    def get_dram_dma_port(self, mode):
+        # DRAM native port for DMAs: interleaved over all the channels with --ddram-channel=all (for
+        # the aggregate bandwidth), on main_ram's channel otherwise.
+        if not hasattr(self, "sdram_channels"):
+            return self.sdram.crossbar.get_port(mode=mode)
+        interleaver = _SDRAMInterleaver(
+            ports       = [sdram.crossbar.get_port(mode=mode) for sdram in self.sdram_channels],
+            granularity = self.ddram_interleaving,
+            mode        = mode)
+        self.add_module(name=f"sdram_interleaver_{mode}", module=interleaver)
+        return interleaver.port
+
+    def add_qsfp_phy(self, port, speed="1g", cd="eth"):
+        qsfp = port.split("_")[0]
+
+        # QSFP Module / RefClk (shared by the 4 lanes of the QSFP).
+        if not hasattr(self, f"{qsfp}_refclk"):
+            self.comb += [
+                self.platform.request(f"{qsfp}_refclk_rst").eq(0),
+                self.platform.request(f"{qsfp}_fs").eq(0b00), # 156.25MHz RefClk.
+                self.platform.request(f"{qsfp}_resetl").eq(~ResetSignal("sys")),
+                self.platform.request(f"{qsfp}_lpmode").eq(0),
+            ]
+            refclk_pads = self.platform.request(f"{qsfp}_refclk0")
+            setattr(self, f"{qsfp}_refclk", Signal(name=f"{qsfp}_refclk"))
+            self.specials += Instance("IBUFDS_GTE4",
+                i_CEB = 0,
+                i_I   = refclk_pads.p,
+                i_IB  = refclk_pads.n,
+                o_O   = getattr(self, f"{qsfp}_refclk"))
+        refclk = getattr(self, f"{qsfp}_refclk")
+
+        # 1000BASE-X PHY (Channel PLL).
+        if speed == "1g":
+            from liteeth.phy.usp_gty_1000basex import USP_GTY_1000BASEX
+            phy = USP_GTY_1000BASEX(refclk, self.platform.request(port), self.sys_clk_freq, refclk_freq=156.25e6)
+            phy = ClockDomainsRenamer({f"eth_{d}": f"{cd}_{d}" for d in ["tx", "rx", "tx_half", "rx_half"]})(phy)
+            return phy
+
+        # 10GBASE-R PHY (QPLL, shared by the 4 lanes of the QSFP).
+        from liteiclink.serdes.gty_ultrascale import GTYQuadPLL
+        from litex_boards.baser import USP10GBASERPHY
+        if not hasattr(self, f"{qsfp}_pll"):
+            self.add_module(name=f"{qsfp}_pll", module=GTYQuadPLL(refclk, 156.25e6, 10.3125e9))
+        phy = USP10GBASERPHY(getattr(self, f"{qsfp}_pll"), self.platform.request(port), self.sys_clk_freq, cd=cd)
+        self.platform.add_false_path_constraints(self.crg.cd_sys.clk, phy.serdes.cd_eth_tx.clk, phy.serdes.cd_eth_rx.clk)
+        return phy
+
+    def generate_sdram_phy_py_header(self, output_file, name="sdram"):
+        # Init sequence of the additional channels (not initialized by the BIOS, ex to do it from
+        # the Host over PCIe with litex_server/RemoteClient).
+        from litedram.init import get_sdram_phy_py_header
+        sdram = getattr(self, name)
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        with open(output_file, "w") as f:
+            f.write(get_sdram_phy_py_header(
+                sdram.controller.settings.phy,
+                sdram.controller.settings.timing))
+
 # Build --------------------------------------------------------------------------------------------
 
 def main():
     from litex.build.parser import LiteXArgumentParser
+    qsfp_lanes = [f"qsfp{i}_sfp{j}" for i in range(2) for j in range(4)]
     parser = LiteXArgumentParser(platform=sqrl_xcu1525.Platform, description="LiteX SoC on XCU1525.")
-    parser.add_target_argument("--sys-clk-freq",  default=125e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--ddram-channel", default="0",               help="DDRAM channel (0, 1, 2 or 3).")
-    parser.add_target_argument("--with-pcie",     action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--driver",        action="store_true",       help="Generate PCIe driver.")
-    parser.add_target_argument("--with-sata",     action="store_true",       help="Enable SATA support (over SFP2SATA).")
+    parser.add_target_argument("--sys-clk-freq",       default=125e6, type=float, help="System clock frequency.")
+    parser.add_target_argument("--ddram-channel",      default="0",               help="DDRAM channel (0, 1, 2, 3 or all, only main_ram's channel is calibrated by the BIOS).")
+    parser.add_target_argument("--ddram-interleaving", default=1024,  type=int,   help="DDRAM interleaving granularity in bytes of the DMA ports (with --ddram-channel=all).")
+    parser.add_target_argument("--with-ethernet",      action="store_true",       help="Enable Ethernet support (over QSFP lane).")
+    parser.add_target_argument("--with-etherbone",     action="store_true",       help="Enable Etherbone support (over QSFP lane).")
+    parser.add_target_argument("--ethernet-port",      default="qsfp0_sfp0",      help="Ethernet QSFP lane.", choices=qsfp_lanes)
+    parser.add_target_argument("--etherbone-port",     default="qsfp1_sfp0",      help="Etherbone QSFP lane.", choices=qsfp_lanes)
+    parser.add_target_argument("--eth-ip",             default="192.168.1.50",    help="Ethernet/Etherbone IP address.")
+    parser.add_target_argument("--remote-ip",          default="192.168.1.100",   help="Remote IP address of TFTP server.")
+    parser.add_target_argument("--eth-dynamic-ip",     action="store_true",       help="Enable dynamic Ethernet IP addresses setting.")
+    parser.add_target_argument("--etherbone-ip",       default="192.168.1.51",    help="Etherbone IP address.")
+    parser.add_target_argument("--ethernet-speed",     default="1g", choices=["1g", "10g"], help="Ethernet/Etherbone speed (1000BASE-X or 10GBASE-R).")
+    parser.add_target_argument("--with-pcie",          action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",         default=4, type=int, choices=[2, 4, 8, 16], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",          default=1, type=int,       help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--with-pcie-dram-bench", action="store_true",     help="Connect PCIe DMA0 to DRAM and add DMA throughput counters (benchmark).")
+    parser.add_target_argument("--driver",             action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--with-sata",          action="store_true",       help="Enable SATA support (over SFP2SATA).")
+    parser.add_target_argument("--sata-gen",           default="2",               help="SATA Gen.", choices=["1", "2", "3"])
+    parser.add_target_argument("--sata-ports",         default=1, type=int,       help="Number of SATA ports (QSFP0 lanes, striped when > 1).", choices=[1, 2, 3, 4])
+    parser.add_target_argument("--with-sata-pcie",     action="store_true",       help="Stream SATA sectors to/from PCIe DMA0 (zero-copy, requires --with-pcie/--with-sata).")
+    parser.add_target_argument("--sata-pcie-dram-buffer", action="store_true",    help="Buffer SATA <-> PCIe streams in DRAM (reduces main_ram to 768MB).")
     args = parser.parse_args()
 
+    if args.with_sata:
+        from litex_boards.sata import check_sata_phy
+        check_sata_phy(parser, "gen" + args.sata_gen, args.sys_clk_freq)
+
+    if args.with_sata_pcie and not (args.with_pcie and args.with_sata):
+        parser.error("--with-sata-pcie requires --with-pcie and --with-sata.")
+    if args.with_sata_pcie and args.with_pcie_dram_bench:
+        parser.error("--with-sata-pcie and --with-pcie-dram-bench both use PCIe DMA0.")
+    if args.with_ethernet and args.with_etherbone and (args.ethernet_port == args.etherbone_port):
+        parser.error("Ethernet and Etherbone QSFP lanes must be different.")
+    if args.with_sata:
+        for port in [args.ethernet_port if args.with_ethernet else None, args.etherbone_port if args.with_etherbone else None]:
+            if port in [f"qsfp0_sfp{i}" for i in range(args.sata_ports)]:
+                parser.error(f"{port} is used by SATA (SFP2SATA adapter).")
+
     soc = BaseSoC(
-        sys_clk_freq  = args.sys_clk_freq,
-        ddram_channel = int(args.ddram_channel, 0),
-        with_pcie     = args.with_pcie,
-        with_sata     = args.with_sata,
+        sys_clk_freq          = args.sys_clk_freq,
+        ddram_channel         = args.ddram_channel if args.ddram_channel == "all" else int(args.ddram_channel, 0),
+        ddram_interleaving    = args.ddram_interleaving,
+        with_ethernet         = args.with_ethernet,
+        with_etherbone        = args.with_etherbone,
+        ethernet_port         = args.ethernet_port,
+        etherbone_port        = args.etherbone_port,
+        eth_ip                = args.eth_ip,
+        remote_ip             = args.remote_ip,
+        eth_dynamic_ip        = args.eth_dynamic_ip,
+        etherbone_ip          = args.etherbone_ip,
+        ethernet_speed        = args.ethernet_speed,
+        with_pcie             = args.with_pcie,
+        pcie_lanes            = args.pcie_lanes,
+        pcie_dmas             = args.pcie_dmas,
+        with_pcie_dram_bench  = args.with_pcie_dram_bench,
+        with_sata             = args.with_sata,
+        sata_gen              = "gen" + args.sata_gen,
+        sata_ports            = args.sata_ports,
+        with_sata_pcie        = args.with_sata_pcie,
+        sata_pcie_dram_buffer = args.sata_pcie_dram_buffer,
         **parser.soc_argdict
 	)
     builder = Builder(soc, **parser.builder_argdict)
     if args.build:
         builder.build(**parser.toolchain_argdict)
+        if args.ddram_channel == "all" and not soc.integrated_main_ram_size:
+            for channel in [1, 2, 3]:
+                soc.generate_sdram_phy_py_header(os.path.join(builder.output_dir, f"sdram{channel}_init.py"), f"sdram{channel}")
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
+        if args.with_pcie_dram_bench:
+            from litex_boards.pcie_dram_bench import generate_pcie_dram_bench_software
+            generate_pcie_dram_bench_software(soc, os.path.join(builder.output_dir, "driver"))
+        if args.with_sata_pcie:
+            from litex_boards.sata_pcie import generate_sata_pcie_software
+            generate_sata_pcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
         prog = soc.platform.create_programmer()
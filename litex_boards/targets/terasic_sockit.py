@@ -19,9 +19,6 @@ from litex.soc.cores.video import VideoVGAPHY
 
 from litex.build.io import DDROutput
 
-from litedram.modules import W9825G6KH6, AS4C32M16
-from litedram.phy import HalfRateGENSDRPHY, GENSDRPHY
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -85,6 +82,8 @@ class BaseSoC(SoCCore):
 
         # SDR SDRAM --------------------------------------------------------------------------------
         if mister_sdram is not None:
+            from litedram.modules import W9825G6KH6, AS4C32M16
+            from litedram.phy import HalfRateGENSDRPHY, GENSDRPHY
             sdrphy_cls = HalfRateGENSDRPHY if sdram_rate == "1:2" else GENSDRPHY
             sdrphy_mod = {"xs_v22": W9825G6KH6, "xs_v24": AS4C32M16}[mister_sdram]
             self.sdrphy = sdrphy_cls(platform.request("sdram"), sys_clk_freq)
@@ -20,17 +20,6 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.common import PHYPadsReducer
-from litedram.modules import MT8JTF12864
-from litedram.phy import s7ddrphy
-
-from liteeth.phy.a7_gtp import QPLLSettings, QPLL
-from liteeth.phy.a7_1000basex import A7_1000BASEX
-from liteeth.phy.s7rgmii import LiteEthPHYRGMII
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -59,10 +48,17 @@ class _CRG(LiteXModule):
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=100e6,
         with_ethernet   = False,
+        eth_rx_slots    = 2,
+        eth_tx_slots    = 2,
+        eth_mtu         = 1530,
+        eth_data_width  = 8,
         eth_phy         = "rgmii",
         with_spi_flash  = False,
         with_led_chaser = True,
         with_pcie       = False,
+        pcie_lanes      = 4,
+        pcie_dmas       = 1,
+        pcie_msi        = "msi",
         **kwargs):
         platform = xilinx_ac701.Platform()
 
@@ -74,6 +70,9 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.common import PHYPadsReducer
+            from litedram.modules import MT8JTF12864
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.A7DDRPHY(
                 pads         = PHYPadsReducer(platform.request("ddram"), [0, 1, 2, 3]),
                 memtype      = "DDR3",
@@ -89,6 +88,7 @@ class BaseSoC(SoCCore):
         if with_ethernet:
             # RGMII Ethernet PHY -------------------------------------------------------------------
             if eth_phy == "rgmii":
+                from liteeth.phy.s7rgmii import LiteEthPHYRGMII
                 # phy
                 self.ethphy = LiteEthPHYRGMII(
                     clock_pads = self.platform.request("eth_clocks"),
@@ -96,6 +96,8 @@ class BaseSoC(SoCCore):
 
             # 1000BaseX Ethernet PHY ---------------------------------------------------------------
             if eth_phy == "1000basex":
+                from liteeth.phy.a7_gtp import QPLLSettings, QPLL
+                from liteeth.phy.a7_1000basex import A7_1000BASEX
                 # phy
                 self.comb += self.platform.request("sfp_mgt_clk_sel0", 0).eq(0)
                 self.comb += self.platform.request("sfp_mgt_clk_sel1", 0).eq(0)
@@ -120,7 +122,14 @@ class BaseSoC(SoCCore):
                     data_pads    = self.platform.request("sfp", 0),
                     sys_clk_freq = self.clk_freq)
 
-            self.add_ethernet(phy=self.ethphy)
+            from litex_boards.ethernet import add_ethernet
+            add_ethernet(self,
+                phy        = self.ethphy,
+                data_width = eth_data_width,
+                rx_slots   = eth_rx_slots,
+                tx_slots   = eth_tx_slots,
+                mtu        = eth_mtu,
+            )
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -130,10 +139,16 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            from litepcie.phy.s7pciephy import S7PCIEPHY
+            self.pcie_phy = S7PCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {1: 64, 4: 128}[pcie_lanes],
+                msi_type   = pcie_msi,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, msi_type=pcie_msi)
+            if pcie_msi == "msi-x":
+                # MSI-X Table/PBA offsets are fixed in the PHY configuration.
+                self.csr.add("pcie_msi",       n=3)
+                self.csr.add("pcie_msi_table", n=4)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -144,13 +159,18 @@ class BaseSoC(SoCCore):
 # Build --------------------------------------------------------------------------------------------
 def main():
     from litex.build.parser import LiteXArgumentParser
+    from litex_boards.ethernet import eth_mac_args, eth_mac_argdict
     parser = LiteXArgumentParser(platform=xilinx_ac701.Platform, description="LiteX SoC on AC701.")
     parser.add_target_argument("--sys-clk-freq",   default=100e6, type=float,  help="System clock frequency.")
     parser.add_target_argument("--with-ethernet",  action="store_true",        help="Enable Ethernet support.")
     parser.add_target_argument("--eth-phy",        default="rgmii",            help="Select Ethernet PHY (rgmii or 1000basex).")
     parser.add_target_argument("--with-spi-flash", action="store_true",        help="Enable SPI Flash (MMAPed).")
     parser.add_target_argument("--with-pcie",      action="store_true",        help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",     default=4, type=int, choices=[1, 4], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",      default=1, type=int,        help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi",       default="msi", choices=["msi", "msi-multi-vector", "msi-x"], help="PCIe MSI type.")
     parser.add_target_argument("--driver",         action="store_true",        help="Generate PCIe driver.")
+    eth_mac_args(parser)
     args = parser.parse_args()
 
     soc = BaseSoC(
@@ -159,6 +179,10 @@ def main():
         eth_phy        = args.eth_phy,
         with_spi_flash = args.with_spi_flash,
         with_pcie      = args.with_pcie,
+        pcie_lanes     = args.pcie_lanes,
+        pcie_dmas      = args.pcie_dmas,
+        pcie_msi       = args.pcie_msi,
+        **eth_mac_argdict(args),
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -166,6 +190,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
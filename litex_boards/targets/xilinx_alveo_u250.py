@@ -22,11 +22,6 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 
 from litex.soc.cores.led import LedChaser
-from litedram.modules import MTA18ASF2G72PZ
-from litedram.phy import usddrphy
-
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
 
 # CRG ----------------------------------------------------------------------------------------------
 
@@ -60,7 +55,7 @@ class _CRG(LiteXModule):
 # BaseSoC ------------------------------------------------------------------------------------------
 
 class BaseSoC(SoCCore):
-    def __init__(self, sys_clk_freq=125e6, with_led_chaser=True, with_pcie=False, **kwargs):
+    def __init__(self, sys_clk_freq=125e6, with_led_chaser=True, with_pcie=False, pcie_lanes=4, pcie_dmas=1, with_pcie_dram_bench=False, **kwargs):
         platform = xilinx_alveo_u250.Platform()
 
         # CRG --------------------------------------------------------------------------------------
@@ -71,6 +66,8 @@ class BaseSoC(SoCCore):
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MTA18ASF2G72PZ
+            from litedram.phy import usddrphy
             self.ddrphy = usddrphy.USPDDRPHY(platform.request("ddram"),
                 memtype          = "DDR4",
                 sys_clk_freq     = sys_clk_freq,
@@ -89,10 +86,22 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            from litepcie.phy.usppciephy import USPPCIEPHY
+            self.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {4: 128, 16: 512}[pcie_lanes],
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
+
+            # PCIe DMA0 <-> DRAM benchmark (when enabled, DMA loopback has to be disabled).
+            if with_pcie_dram_bench:
+                from litedram.frontend.dma import LiteDRAMDMAWriter, LiteDRAMDMAReader
+                from litex_boards.pcie_dram_bench import PCIeDRAMBench
+                assert not self.integrated_main_ram_size
+                port_wr = self.sdram.crossbar.get_port(mode="write")
+                port_rd = self.sdram.crossbar.get_port(mode="read")
+                self.dram_dma_writer = LiteDRAMDMAWriter(port_wr, fifo_depth=32, with_csr=True)
+                self.dram_dma_reader = LiteDRAMDMAReader(port_rd, fifo_depth=64, with_csr=True)
+                self.pcie_dram_bench = PCIeDRAMBench(self.pcie_dma0, self.dram_dma_writer, self.dram_dma_reader)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -107,12 +116,18 @@ def main():
     parser = LiteXArgumentParser(platform=xilinx_alveo_u250.Platform, description="LiteX SoC on Alveo U250.")
     parser.add_target_argument("--sys-clk-freq", default=125e6, type=float, help="System clock frequency.")
     parser.add_target_argument("--with-pcie",    action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",   default=4, type=int, choices=[4, 16], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",    default=1, type=int,       help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--with-pcie-dram-bench", action="store_true", help="Connect PCIe DMA0 to DRAM and add DMA throughput counters (benchmark).")
     parser.add_target_argument("--driver",       action="store_true",       help="Generate PCIe driver.")
     args = parser.parse_args()
 
     soc = BaseSoC(
-        sys_clk_freq = args.sys_clk_freq,
-        with_pcie    = args.with_pcie,
+        sys_clk_freq         = args.sys_clk_freq,
+        with_pcie            = args.with_pcie,
+        pcie_lanes           = args.pcie_lanes,
+        pcie_dmas            = args.pcie_dmas,
+        with_pcie_dram_bench = args.with_pcie_dram_bench,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -120,7 +135,11 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
+        if args.with_pcie_dram_bench:
+            from litex_boards.pcie_dram_bench import generate_pcie_dram_bench_software
+            generate_pcie_dram_bench_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
         prog = soc.platform.create_programmer()
@@ -21,26 +21,19 @@ from litex.gen import *
 
 from litex_boards.platforms import xilinx_alveo_u280
 
+from litex.soc.interconnect import stream
 from litex.soc.cores.clock import *
 from litex.soc.integration.soc_core import *
 from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
 from litex.soc.interconnect.axi import *
 from litex.soc.interconnect.csr import *
-from litex.soc.cores.ram.xilinx_usp_hbm2 import USPHBM2
 
 from litex.soc.cores.led import LedChaser
-from litedram.modules import MTA18ASF2G72PZ
-from litedram.phy import usddrphy
-
-from litepcie.phy.usppciephy import USPPCIEPHY
-from litepcie.software import generate_litepcie_software
 
 from litedram.common import *
 from litedram.frontend.axi import *
 
-from litescope import LiteScopeAnalyzer
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -90,9 +83,15 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=150e6, ddram_channel=0,
-        with_pcie       = False,
-        with_led_chaser = False,
-        with_hbm        = False,
+        with_pcie            = False,
+        pcie_lanes           = 4,
+        pcie_dmas            = 1,
+        with_pcie_dram_bench = False,
+        with_led_chaser      = False,
+        with_hbm             = False,
+        hbm_ports            = 4,
+        hbm_interconnect     = "axi-lite",
+        ip_cache_dir         = None,
         **kwargs):
         platform = xilinx_alveo_u280.Platform()
         if with_hbm:
@@ -108,26 +107,18 @@ class BaseSoC(SoCCore):
 
         # HBM / DRAM -------------------------------------------------------------------------------
         if with_hbm:
-            # Add HBM Core.
-            self.hbm = hbm = ClockDomainsRenamer({"axi": "sys"})(USPHBM2(platform))
-
-            # Get HBM .xci.
-            os.system("wget https://github.com/litex-hub/litex-boards/files/6893157/hbm_0.xci.txt")
-            os.makedirs("ip/hbm", exist_ok=True)
-            os.system("mv hbm_0.xci.txt ip/hbm/hbm_0.xci")
-
-            # Connect four of the HBM's AXI interfaces to the main bus of the SoC.
-            for i in range(4):
-                axi_hbm      = hbm.axi[i]
-                axi_lite_hbm = AXILiteInterface(data_width=256, address_width=33)
-                self.submodules += AXILite2AXI(axi_lite_hbm, axi_hbm)
-                self.bus.add_slave(f"hbm{i}", axi_lite_hbm, SoCRegion(origin=0x4000_0000 + 0x1000_0000*i, size=0x1000_0000)) # 256MB.
-            # Link HBM2 channel 0 as main RAM
-            self.bus.add_region("main_ram", SoCRegion(origin=0x4000_0000, size=0x1000_0000, linker=True)) # 256MB.
+            from litex_boards.hbm import add_hbm
+            add_hbm(self,
+                ports        = hbm_ports,
+                interconnect = hbm_interconnect,
+                ip_cache_dir = ip_cache_dir,
+                with_dma     = with_pcie and (hbm_interconnect == "axi"))
 
         else:
             # DDR4 SDRAM -------------------------------------------------------------------------------
             if not self.integrated_main_ram_size:
+                from litedram.modules import MTA18ASF2G72PZ
+                from litedram.phy import usddrphy
                 self.ddrphy = usddrphy.USPDDRPHY(platform.request("ddram", ddram_channel),
                     memtype          = "DDR4",
                     cmd_latency      = 1, # seems to work better with cmd_latency=1
@@ -146,10 +137,42 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = USPPCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            from litepcie.phy.usppciephy import USPPCIEPHY
+            self.pcie_phy = USPPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {4: 128, 16: 512}[pcie_lanes],
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
+
+            # PCIe DMA <-> HBM (when enabled, DMA loopback has to be disabled).
+            if hasattr(self, "hbm_dma_writer"):
+                if with_pcie_dram_bench:
+                    from litex_boards.pcie_dram_bench import PCIeDRAMBench
+                    self.pcie_dram_bench = PCIeDRAMBench(self.pcie_dma0, self.hbm_dma_writer, self.hbm_dma_reader)
+                else:
+                    self.hbm_dma_writer_converter = stream.Converter(self.pcie_phy.data_width, 256)
+                    self.hbm_dma_reader_converter = stream.Converter(256, self.pcie_phy.data_width)
+                    self.submodules += stream.Pipeline(
+                        self.pcie_dma0.source,
+                        self.hbm_dma_writer_converter,
+                        self.hbm_dma_writer,
+                    )
+                    self.submodules += stream.Pipeline(
+                        self.hbm_dma_reader,
+                        self.hbm_dma_reader_converter,
+                        self.pcie_dma0.sink,
+                    )
+
+            # PCIe DMA0 <-> DRAM benchmark (when enabled, DMA loopback has to be disabled).
+            elif with_pcie_dram_bench:
+                from litedram.frontend.dma import LiteDRAMDMAWriter, LiteDRAMDMAReader
+                from litex_boards.pcie_dram_bench import PCIeDRAMBench
+                assert not with_hbm, "PCIe HBM benchmark requires --hbm-interconnect=axi."
+                assert not self.integrated_main_ram_size
+                port_wr = self.sdram.crossbar.get_port(mode="write")
+                port_rd = self.sdram.crossbar.get_port(mode="read")
+                self.dram_dma_writer = LiteDRAMDMAWriter(port_wr, fifo_depth=32, with_csr=True)
+                self.dram_dma_reader = LiteDRAMDMAReader(port_rd, fifo_depth=64, with_csr=True)
+                self.pcie_dram_bench = PCIeDRAMBench(self.pcie_dma0, self.dram_dma_writer, self.dram_dma_reader)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -162,25 +185,37 @@ class BaseSoC(SoCCore):
 def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=xilinx_alveo_u280.Platform, description="LiteX SoC on Alveo U280.")
-    parser.add_target_argument("--sys-clk-freq",    default=150e6, type=float, help="System clock frequency.") # HBM2 with 250MHz, DDR4 with 150MHz (1:4)
-    parser.add_target_argument("--ddram-channel",   default="0",               help="DDRAM channel (0, 1, 2 or 3).") # also selects clk 0 or 1
-    parser.add_target_argument("--with-pcie",       action="store_true",       help="Enable PCIe support.")
-    parser.add_target_argument("--driver",          action="store_true",       help="Generate PCIe driver.")
-    parser.add_target_argument("--with-hbm",        action="store_true",       help="Use HBM2.")
-    parser.add_target_argument("--with-analyzer",   action="store_true",       help="Enable Analyzer.")
-    parser.add_target_argument("--with-led-chaser", action="store_true",       help="Enable LED Chaser.")
+    parser.add_target_argument("--sys-clk-freq",     default=150e6, type=float, help="System clock frequency.") # HBM2 with 250MHz, DDR4 with 150MHz (1:4)
+    parser.add_target_argument("--ddram-channel",    default="0",               help="DDRAM channel (0, 1, 2 or 3).") # also selects clk 0 or 1
+    parser.add_target_argument("--with-pcie",        action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",       default=4, type=int, choices=[4, 16], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",        default=1, type=int,       help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--with-pcie-dram-bench", action="store_true",   help="Connect PCIe DMA0 to DRAM/HBM and add DMA throughput counters (benchmark).")
+    parser.add_target_argument("--driver",           action="store_true",       help="Generate PCIe driver.")
+    parser.add_target_argument("--with-hbm",         action="store_true",       help="Use HBM2.")
+    parser.add_target_argument("--hbm-ports",        default=4, type=int, choices=[1, 2, 4, 8, 16, 32], help="Number of HBM2 AXI ports/Pseudo-Channels to use (power of 2).")
+    parser.add_target_argument("--hbm-interconnect", default="axi-lite",        help="HBM2 interconnect (axi-lite or axi).", choices=["axi-lite", "axi"])
+    parser.add_target_argument("--ip-cache-dir",     default=None,              help="HBM2 IP cache directory (defaults to LITEX_BOARDS_IP_CACHE_DIR or ~/.cache/litex-boards/ip).")
+    parser.add_target_argument("--with-analyzer",    action="store_true",       help="Enable Analyzer.")
+    parser.add_target_argument("--with-led-chaser",  action="store_true",       help="Enable LED Chaser.")
     args = parser.parse_args()
 
     if args.with_hbm:
         args.sys_clk_freq = 250e6
 
     soc = BaseSoC(
-        sys_clk_freq    = args.sys_clk_freq,
-        ddram_channel   = int(args.ddram_channel, 0),
-        with_pcie       = args.with_pcie,
-        with_led_chaser = args.with_led_chaser,
-        with_hbm        = args.with_hbm,
-        with_analyzer   = args.with_analyzer,
+        sys_clk_freq         = args.sys_clk_freq,
+        ddram_channel        = int(args.ddram_channel, 0),
+        with_pcie            = args.with_pcie,
+        pcie_lanes           = args.pcie_lanes,
+        pcie_dmas            = args.pcie_dmas,
+        with_pcie_dram_bench = args.with_pcie_dram_bench,
+        with_led_chaser      = args.with_led_chaser,
+        with_hbm             = args.with_hbm,
+        hbm_ports            = args.hbm_ports,
+        hbm_interconnect     = args.hbm_interconnect,
+        ip_cache_dir         = args.ip_cache_dir,
+        with_analyzer        = args.with_analyzer,
         **parser.soc_argdict
 	)
     builder = Builder(soc, **parser.builder_argdict)
@@ -188,7 +223,17 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
+        if args.with_pcie_dram_bench:
+            from litex_boards.pcie_dram_bench import generate_pcie_dram_bench_software
+            if hasattr(soc, "hbm_dma_writer"):
+                generate_pcie_dram_bench_software(soc, os.path.join(builder.output_dir, "driver"),
+                    writer       = "hbm_dma_writer",
+                    reader       = "hbm_dma_reader",
+                    default_base = 0x0000_0000)
+            else:
+                generate_pcie_dram_bench_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
         prog = soc.platform.create_programmer()
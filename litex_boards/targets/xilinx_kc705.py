@@ -21,14 +21,6 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT8JTF12864
-from litedram.phy import s7ddrphy
-
-from liteeth.phy import LiteEthPHY
-
-from litepcie.phy.s7pciephy import S7PCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -60,11 +52,18 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
-        with_ethernet   = False,
-        with_led_chaser = True,
-        with_spi_flash  = False,
-        with_pcie       = False,
-        with_sata       = False,
+        with_ethernet       = False,
+        with_udp_streamer   = False,
+        udp_streamer_ip     = "192.168.1.50",
+        udp_streamer_dst_ip = "192.168.1.100",
+        with_led_chaser     = True,
+        with_spi_flash      = False,
+        with_pcie           = False,
+        pcie_lanes          = 4,
+        pcie_dmas           = 1,
+        pcie_msi            = "msi",
+        with_sata           = False,
+        sata_gen            = "gen2",
         **kwargs):
         platform = xilinx_kc705.Platform()
 
@@ -76,6 +75,8 @@ class BaseSoC(SoCCore):
 
         # DDR3 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import MT8JTF12864
+            from litedram.phy import s7ddrphy
             self.ddrphy = s7ddrphy.K7DDRPHY(platform.request("ddram"),
                 memtype      = "DDR3",
                 nphases      = 4,
@@ -86,13 +87,22 @@ class BaseSoC(SoCCore):
                 l2_cache_size = kwargs.get("l2_size", 8192)
             )
 
-        # Ethernet ---------------------------------------------------------------------------------
-        if with_ethernet:
+        # Ethernet / UDP Streamer ------------------------------------------------------------------
+        if with_ethernet or with_udp_streamer:
+            from liteeth.phy import LiteEthPHY
             self.ethphy = LiteEthPHY(
                 clock_pads = self.platform.request("eth_clocks"),
                 pads       = self.platform.request("eth"),
                 clk_freq   = self.clk_freq)
-            self.add_ethernet(phy=self.ethphy)
+            if with_ethernet:
+                self.add_ethernet(phy=self.ethphy)
+            if with_udp_streamer:
+                from litex_boards.udp_streamer import add_udp_streamer
+                add_udp_streamer(self,
+                    phy            = self.ethphy,
+                    ip_address     = udp_streamer_ip,
+                    dst_ip_address = udp_streamer_dst_ip,
+                )
 
         # SPI Flash --------------------------------------------------------------------------------
         if with_spi_flash:
@@ -102,10 +112,16 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = S7PCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            from litepcie.phy.s7pciephy import S7PCIEPHY
+            self.pcie_phy = S7PCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {1: 64, 2: 64, 4: 128, 8: 128}[pcie_lanes],
+                msi_type   = pcie_msi,
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas, msi_type=pcie_msi)
+            if pcie_msi == "msi-x":
+                # MSI-X Table/PBA offsets are fixed in the PHY configuration.
+                self.csr.add("pcie_msi",       n=3)
+                self.csr.add("pcie_msi_table", n=4)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
@@ -134,7 +150,7 @@ class BaseSoC(SoCCore):
             self.sata_phy = LiteSATAPHY(platform.device,
                 refclk     = sata_refclk,
                 pads       = platform.request("sfp2sata"),
-                gen        = "gen2",
+                gen        = sata_gen,
                 clk_freq   = sys_clk_freq,
                 data_width = 16)
 
@@ -153,19 +169,38 @@ def main():
     from litex.build.parser import LiteXArgumentParser
     parser = LiteXArgumentParser(platform=xilinx_kc705.Platform, description="LiteX SoC on KC705.")
     parser.add_target_argument("--sys-clk-freq",   default=125e6, type=float, help="System clock frequency.")
-    parser.add_target_argument("--with-ethernet",  action="store_true",       help="Enable Ethernet support.")
+    ethopts = parser.target_group.add_mutually_exclusive_group()
+    ethopts.add_argument("--with-ethernet",     action="store_true", help="Enable Ethernet support.")
+    ethopts.add_argument("--with-udp-streamer", action="store_true", help="Enable UDP Streamer (DRAM ring buffer -> UDP).")
+    parser.add_target_argument("--udp-streamer-ip",     default="192.168.1.50",  help="UDP Streamer IP address.")
+    parser.add_target_argument("--udp-streamer-dst-ip", default="192.168.1.100", help="UDP Streamer destination IP address.")
     parser.add_target_argument("--with-spi-flash", action="store_true",       help="Enable SPI Flash (MMAPed).")
     parser.add_target_argument("--with-pcie",      action="store_true",       help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes",     default=4, type=int, choices=[1, 2, 4, 8], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas",      default=1, type=int,       help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--pcie-msi",       default="msi", choices=["msi", "msi-multi-vector", "msi-x"], help="PCIe MSI type.")
     parser.add_target_argument("--driver",         action="store_true",       help="Generate PCIe driver.")
     parser.add_target_argument("--with-sata",      action="store_true",       help="Enable SATA support (over SFP2SATA).")
+    parser.add_target_argument("--sata-gen",       default="2",               help="SATA Gen.", choices=["1", "2", "3"])
     args = parser.parse_args()
 
+    if args.with_sata:
+        from litex_boards.sata import check_sata_phy
+        check_sata_phy(parser, "gen" + args.sata_gen, args.sys_clk_freq)
+
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_spi_flash = args.with_spi_flash,
-        with_pcie      = args.with_pcie,
-        with_sata      = args.with_sata,
+        sys_clk_freq        = args.sys_clk_freq,
+        with_ethernet       = args.with_ethernet,
+        with_udp_streamer   = args.with_udp_streamer,
+        udp_streamer_ip     = args.udp_streamer_ip,
+        udp_streamer_dst_ip = args.udp_streamer_dst_ip,
+        with_spi_flash      = args.with_spi_flash,
+        with_pcie           = args.with_pcie,
+        pcie_lanes          = args.pcie_lanes,
+        pcie_dmas           = args.pcie_dmas,
+        pcie_msi            = args.pcie_msi,
+        with_sata           = args.with_sata,
+        sata_gen            = "gen" + args.sata_gen,
         **parser.soc_argdict
     )
     builder = Builder(soc, **parser.builder_argdict)
@@ -173,6 +208,7 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
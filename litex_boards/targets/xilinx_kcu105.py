@@ -20,14 +20,6 @@ from litex.soc.integration.soc_core import *
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import EDY4016A
-from litedram.phy import usddrphy
-
-from liteeth.phy.ku_1000basex import KU_1000BASEX
-
-from litepcie.phy.uspciephy import USPCIEPHY
-from litepcie.software import generate_litepcie_software
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -63,12 +55,17 @@ class _CRG(LiteXModule):
 
 class BaseSoC(SoCCore):
     def __init__(self, sys_clk_freq=125e6,
-        with_ethernet   = False,
-        with_etherbone  = False,
-        eth_ip          = "192.168.1.50",
-        with_led_chaser = True,
-        with_pcie       = False,
-        with_sata       = False,
+        with_ethernet        = False,
+        with_etherbone       = False,
+        eth_ip               = "192.168.1.50",
+        with_led_chaser      = True,
+        with_pcie            = False,
+        pcie_lanes           = 4,
+        pcie_dmas            = 1,
+        with_pcie_dram_bench = False,
+        with_sata            = False,
+        sata_gen             = "gen2",
+        sata_ports           = 1,
         **kwargs):
         platform = xilinx_kcu105.Platform()
 
@@ -80,6 +77,8 @@ class BaseSoC(SoCCore):
 
         # DDR4 SDRAM -------------------------------------------------------------------------------
         if not self.integrated_main_ram_size:
+            from litedram.modules import EDY4016A
+            from litedram.phy import usddrphy
             self.ddrphy = usddrphy.USDDRPHY(platform.request("ddram"),
                 memtype          = "DDR4",
                 sys_clk_freq     = sys_clk_freq,
@@ -93,6 +92,7 @@ class BaseSoC(SoCCore):
 
         # Ethernet / Etherbone ---------------------------------------------------------------------
         if with_ethernet or with_etherbone:
+            from liteeth.phy.ku_1000basex import KU_1000BASEX
             self.ethphy = KU_1000BASEX(self.crg.cd_eth.clk,
                 data_pads    = self.platform.request("sfp", 0),
                 sys_clk_freq = self.clk_freq)
@@ -105,25 +105,40 @@ class BaseSoC(SoCCore):
 
         # PCIe -------------------------------------------------------------------------------------
         if with_pcie:
-            self.pcie_phy = USPCIEPHY(platform, platform.request("pcie_x4"),
-                data_width = 128,
+            from litepcie.phy.uspciephy import USPCIEPHY
+            self.pcie_phy = USPCIEPHY(platform, platform.request(f"pcie_x{pcie_lanes}"),
+                data_width = {1: 64, 2: 64, 4: 128, 8: 256}[pcie_lanes],
                 bar0_size  = 0x20000)
-            self.add_pcie(phy=self.pcie_phy, ndmas=1)
+            self.add_pcie(phy=self.pcie_phy, ndmas=pcie_dmas)
+
+            # PCIe DMA0 <-> DRAM benchmark (when enabled, DMA loopback has to be disabled).
+            if with_pcie_dram_bench:
+                from litedram.frontend.dma import LiteDRAMDMAWriter, LiteDRAMDMAReader
+                from litex_boards.pcie_dram_bench import PCIeDRAMBench
+                assert not self.integrated_main_ram_size
+                port_wr = self.sdram.crossbar.get_port(mode="write")
+                port_rd = self.sdram.crossbar.get_port(mode="read")
+                self.dram_dma_writer = LiteDRAMDMAWriter(port_wr, fifo_depth=32, with_csr=True)
+                self.dram_dma_reader = LiteDRAMDMAReader(port_rd, fifo_depth=64, with_csr=True)
+                self.pcie_dram_bench = PCIeDRAMBench(self.pcie_dma0, self.dram_dma_writer, self.dram_dma_reader)
 
         # SATA -------------------------------------------------------------------------------------
         if with_sata:
             from litex.build.generic_platform import Subsignal, Pins
             from litesata.phy import LiteSATAPHY
 
-            # IOs
+            # IOs (SFP0/SFP1 cages, SFP0 shared with Ethernet).
             _sata_io = [
                 # SFP 2 SATA Adapter / https://shop.trenz-electronic.de/en/TE0424-01-SFP-2-SATA-Adapter
-                ("sfp2sata", 0,
-                    Subsignal("tx_p", Pins("U4")),
-                    Subsignal("tx_n", Pins("U3")),
-                    Subsignal("rx_p", Pins("T2")),
-                    Subsignal("rx_n", Pins("T1")),
-                ),
+                ("sfp2sata", i,
+                    Subsignal("tx_p", Pins(tx_p)),
+                    Subsignal("tx_n", Pins(tx_n)),
+                    Subsignal("rx_p", Pins(rx_p)),
+                    Subsignal("rx_n", Pins(rx_n)),
+                ) for i, (tx_p, tx_n, rx_p, rx_n) in enumerate([
+                    ("U4", "U3", "T2", "T1"),
+                    ("W4", "W3", "V2", "V1"),
+                ])
             ]
             platform.add_extension(_sata_io)
 
@@ -133,16 +148,27 @@ class BaseSoC(SoCCore):
             sata_refclk = ClockSignal("sata_refclk")
             platform.add_platform_command("set_property SEVERITY {{Warning}} [get_drc_checks REQP-1753]")
 
-            # PHY
-            self.sata_phy = LiteSATAPHY(platform.device,
-                refclk     = sata_refclk,
-                pads       = platform.request("sfp2sata"),
-                gen        = "gen2",
-                clk_freq   = sys_clk_freq,
-                data_width = 16)
+            # PHYs
+            sata_phys = []
+            for i in range(sata_ports):
+                sata_phy = LiteSATAPHY(platform.device,
+                    refclk     = sata_refclk,
+                    pads       = platform.request("sfp2sata", i),
+                    gen        = sata_gen,
+                    clk_freq   = sys_clk_freq,
+                    data_width = 16)
+                sata_phys.append(sata_phy)
 
             # Core
-            self.add_sata(phy=self.sata_phy, mode="read+write")
+            if sata_ports == 1:
+                self.sata_phy = sata_phys[0]
+                self.add_sata(phy=self.sata_phy, mode="read+write")
+            # Striping (RAID-0) Core
+            else:
+                from litex_boards.sata_striping import add_sata_striping
+                for i, sata_phy in enumerate(sata_phys):
+                    self.add_module(name=f"sata_phy{i}", module=sata_phy)
+                add_sata_striping(self, phys=sata_phys)
 
         # Leds -------------------------------------------------------------------------------------
         if with_led_chaser:
@@ -161,17 +187,31 @@ def main():
     ethopts.add_argument("--with-etherbone",  action="store_true",    help="Enable Etherbone support.")
     parser.add_target_argument("--eth-ip",    default="192.168.1.50", help="Ethernet/Etherbone IP address.")
     parser.add_target_argument("--with-pcie", action="store_true",    help="Enable PCIe support.")
+    parser.add_target_argument("--pcie-lanes", default=4, type=int, choices=[1, 2, 4, 8], help="PCIe lanes.")
+    parser.add_target_argument("--pcie-dmas", default=1, type=int,    help="Number of PCIe DMA channels.")
+    parser.add_target_argument("--with-pcie-dram-bench", action="store_true", help="Connect PCIe DMA0 to DRAM and add DMA throughput counters (benchmark).")
     parser.add_target_argument("--driver",    action="store_true",    help="Generate PCIe driver.")
     parser.add_target_argument("--with-sata", action="store_true",    help="Enable SATA support (over SFP2SATA).")
+    parser.add_target_argument("--sata-gen",  default="2",            help="SATA Gen.", choices=["1", "2", "3"])
+    parser.add_target_argument("--sata-ports", default=1, type=int, choices=[1, 2], help="Number of SATA ports (SFP cages, striped when > 1).")
     args = parser.parse_args()
 
+    if args.with_sata:
+        from litex_boards.sata import check_sata_phy
+        check_sata_phy(parser, "gen" + args.sata_gen, args.sys_clk_freq)
+
     soc = BaseSoC(
-        sys_clk_freq   = args.sys_clk_freq,
-        with_ethernet  = args.with_ethernet,
-        with_etherbone = args.with_etherbone,
-        eth_ip         = args.eth_ip,
-        with_pcie      = args.with_pcie,
-        with_sata      = args.with_sata,
+        sys_clk_freq         = args.sys_clk_freq,
+        with_ethernet        = args.with_ethernet,
+        with_etherbone       = args.with_etherbone,
+        eth_ip               = args.eth_ip,
+        with_pcie            = args.with_pcie,
+        pcie_lanes           = args.pcie_lanes,
+        pcie_dmas            = args.pcie_dmas,
+        with_pcie_dram_bench = args.with_pcie_dram_bench,
+        with_sata            = args.with_sata,
+        sata_gen             = "gen" + args.sata_gen,
+        sata_ports           = args.sata_ports,
         **parser.soc_argdict
 	)
     builder = Builder(soc, **parser.builder_argdict)
@@ -179,7 +219,11 @@ def main():
         builder.build(**parser.toolchain_argdict)
 
     if args.driver:
+        from litepcie.software import generate_litepcie_software
         generate_litepcie_software(soc, os.path.join(builder.output_dir, "driver"))
+        if args.with_pcie_dram_bench:
+            from litex_boards.pcie_dram_bench import generate_pcie_dram_bench_software
+            generate_pcie_dram_bench_software(soc, os.path.join(builder.output_dir, "driver"))
 
     if args.load:
         prog = soc.platform.create_programmer()
@@ -23,9 +23,6 @@ from litex.soc.integration.soc import SoCRegion
 from litex.soc.integration.builder import *
 from litex.soc.cores.led import LedChaser
 
-from litedram.modules import MT40A512M16
-from litedram.phy import usddrphy
-
 # CRG ----------------------------------------------------------------------------------------------
 
 class _CRG(LiteXModule):
@@ -96,6 +93,8 @@ class BaseSoC(SoCCore):
             # Link HBM2 channel 0 as main RAM
             self.bus.add_region("main_ram", SoCRegion(origin=0x4000_0000, size=0x1000_0000, linker=True)) # 256MB.
         elif not self.integrated_main_ram_size:
+            from litedram.modules import MT40A512M16
+            from litedram.phy import usddrphy
             # DDR4 SDRAM -------------------------------------------------------------------------------
             self.ddrphy = usddrphy.USPDDRPHY(
                 pads             = platform.request("ddram"),
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# UDP Streamer.
+#
+# Gateware: UDPStreamer sends the content of a ring buffer in main memory (DRAM, or integrated RAM on
+# boards without DRAM) as UDP packets, without the CPU in the data path:
+# - Ring buffer writer: capture data (sink, or a counter test pattern) is written to the ring buffer
+#   through a Wishbone DMA. The sink is stalled when the ring buffer is full.
+# - Ring buffer reader: once a packet is available in the ring buffer, it is read through a second
+#   Wishbone DMA into a packet buffer and only sent when complete, so the UDP/IP stack never waits
+#   on memory within a packet. The packet buffer holds two packets: the next packet is read while
+#   the current one is sent.
+# Destination IP/port, packet size and rate (minimum cycles between packets) are configured over
+# CSRs. The streamer has its own UDP/IP core on the Ethernet PHY (add_udp_streamer).
+#
+# The ring buffer is in main_ram (add_udp_streamer requires one, boards without DRAM have to be built
+# with --integrated-main-ram-size) and defaults to its top half (up to 16MB). Base/size can be changed
+# over CSRs while the streamer is disabled.
+#
+# Software: running the module receives the packets on the host and reports MB/s, and checks the
+# counter test pattern.
+#
+# Usage:
+#   ./digilent_nexys_video.py --with-udp-streamer --build --load
+#   (BIOS/firmware: set udp_streamer_dst_ip_address, then udp_streamer_pattern=1/udp_streamer_enable=1)
+#   python3 -m litex_boards.udp_streamer --port=2000
+
+import time
+import socket
+import argparse
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect import wishbone
+from litex.soc.interconnect.csr import *
+from litex.soc.cores.dma import WishboneDMAReader, WishboneDMAWriter
+
+# Constants ----------------------------------------------------------------------------------------
+
+UDP_STREAMER_PORT            = 2000
+UDP_STREAMER_MAX_PACKET_SIZE = 1472 # 1500 bytes MTU - IP/UDP headers.
+UDP_STREAMER_MAX_RING_SIZE   = 16*1024*1024
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _convert_ip(ip_address):
+    return int.from_bytes(socket.inet_aton(ip_address), "big")
+
+# UDP Streamer -------------------------------------------------------------------------------------
+
+class UDPStreamer(LiteXModule):
+    def __init__(self, udp_port, reader_bus, writer_bus,
+        src_port        = UDP_STREAMER_PORT,
+        dst_ip_address  = "192.168.1.100",
+        dst_port        = UDP_STREAMER_PORT,
+        max_packet_size = UDP_STREAMER_MAX_PACKET_SIZE,
+        ring_base       = 0,
+        ring_size       = 0):
+        data_width = reader_bus.data_width
+        assert writer_bus.data_width == data_width
+        assert udp_port.dw == data_width
+        self.sink = sink = stream.Endpoint([("data", data_width)])
+
+        self.enable         = CSRStorage(description="Enable (0: resets the ring buffer).")
+        self.pattern        = CSRStorage(description="Ring buffer data: 0: Sink (capture), 1: Counter (test pattern).")
+        self.base           = CSRStorage(32, reset=ring_base, description="Ring buffer base address (bytes).")
+        self.size           = CSRStorage(32, reset=ring_size, description="Ring buffer size (bytes, power of 2).")
+        self.dst_ip_address = CSRStorage(32, reset=_convert_ip(dst_ip_address), description="Destination IP address.")
+        self.dst_port       = CSRStorage(16, reset=dst_port, description="Destination UDP port.")
+        self.packet_size    = CSRStorage(16, reset=1024, description=f"UDP payload (bytes, multiple of {data_width//8}, up to {max_packet_size}).")
+        self.period         = CSRStorage(32, description="Minimum cycles between packets (0: wire speed).")
+        self.level          = CSRStatus(32,  description="Ring buffer level (bytes).")
+        self.packets        = CSRStatus(32,  description="Packets sent.")
+        self.overflows      = CSRStatus(32,  description="Cycles with sink data stalled on a full ring buffer.")
+
+        # # #
+
+        bytes_per_word = data_width//8
+        shift          = log2_int(bytes_per_word)
+        max_words      = max_packet_size//bytes_per_word
+        enable         = self.enable.storage
+
+        # Ring buffer (word addresses/pointers, pointers are free-running).
+        base   = Signal(32)
+        mask   = Signal(32)
+        words  = Signal(32)
+        wr_ptr = Signal(32)
+        rd_ptr = Signal(32)
+        level  = Signal(32)
+        self.comb += [
+            base.eq(self.base.storage[shift:]),
+            words.eq(self.size.storage[shift:]),
+            mask.eq(words - 1),
+            level.eq(wr_ptr - rd_ptr),
+            self.level.status.eq(level << shift),
+        ]
+
+        # Ring buffer writer.
+        self.writer = writer = WishboneDMAWriter(writer_bus, endianness="big")
+        full    = Signal()
+        counter = Signal(data_width)
+        self.comb += [
+            full.eq(level >= words),
+            writer.sink.valid.eq(enable & ~full & (self.pattern.storage | sink.valid)),
+            writer.sink.address.eq(base + (wr_ptr & mask)),
+            writer.sink.data.eq(Mux(self.pattern.storage, counter, sink.data)),
+            sink.ready.eq(~enable | (~self.pattern.storage & ~full & writer.sink.ready)),
+        ]
+        self.sync += [
+            If(~enable,
+                wr_ptr.eq(0),
+                counter.eq(0),
+            ).Elif(writer.sink.valid & writer.sink.ready,
+                wr_ptr.eq(wr_ptr + 1),
+                counter.eq(counter + 1),
+            ),
+            If(~enable,
+                self.overflows.status.eq(0),
+            ).Elif(~self.pattern.storage & sink.valid & full,
+                self.overflows.status.eq(self.overflows.status + 1),
+            ),
+        ]
+
+        # Ring buffer reader.
+        self.reader = reader = WishboneDMAReader(reader_bus, endianness="big")
+        self.buffer = buffer = stream.SyncFIFO([("data", data_width)], 2*max_words, buffered=True)
+        self.comb += reader.source.connect(buffer.sink)
+
+        packet_words = Signal(16)
+        offset       = Signal(16)
+        timer        = Signal(32)
+        self.comb += packet_words.eq(self.packet_size.storage[shift:])
+        self.sync += If(timer != 0, timer.eq(timer - 1))
+
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            NextValue(offset, 0),
+            If(enable & (timer == 0) & (packet_words != 0) & (level >= packet_words) &
+                ((buffer.level + reader.fifo.level + packet_words) <= 2*max_words),
+                NextValue(timer, self.period.storage),
+                NextState("READ")
+            ),
+            If(~enable,
+                NextValue(rd_ptr, 0)
+            )
+        )
+        fsm.act("READ",
+            reader.sink.valid.eq(1),
+            reader.sink.last.eq(offset == (packet_words - 1)),
+            reader.sink.address.eq(base + (rd_ptr & mask)),
+            If(reader.sink.ready,
+                NextValue(offset, offset + 1),
+                NextValue(rd_ptr, rd_ptr + 1),
+                If(reader.sink.last,
+                    NextState("IDLE")
+                )
+            )
+        )
+
+        # Packet buffer -> UDP (complete packets only).
+        buffered   = Signal(max=2*max_words + 1)
+        buffer_in  = buffer.sink.valid   & buffer.sink.ready   & buffer.sink.last
+        buffer_out = buffer.source.valid & buffer.source.ready & buffer.source.last
+        self.sync += [
+            If(buffer_in & ~buffer_out,
+                buffered.eq(buffered + 1)
+            ).Elif(~buffer_in & buffer_out,
+                buffered.eq(buffered - 1)
+            ),
+            If(~enable,
+                self.packets.status.eq(0),
+            ).Elif(buffer_out,
+                self.packets.status.eq(self.packets.status + 1),
+            )
+        ]
+
+        # Packet parameters, latched on the first word of each packet.
+        first    = Signal(reset=1)
+        dst_ip   = Signal(32)
+        dst_port = Signal(16)
+        length   = Signal(16)
+        self.sync += If(udp_port.sink.valid & udp_port.sink.ready,
+            first.eq(udp_port.sink.last)
+        )
+        self.sync += If(first,
+            dst_ip.eq(self.dst_ip_address.storage),
+            dst_port.eq(self.dst_port.storage),
+            length.eq(self.packet_size.storage),
+        )
+        self.comb += [
+            udp_port.sink.valid.eq(buffer.source.valid & (buffered != 0)),
+            buffer.source.ready.eq(udp_port.sink.ready & (buffered != 0)),
+            udp_port.sink.last.eq(buffer.source.last),
+            udp_port.sink.last_be.eq(Mux(buffer.source.last, 2**(bytes_per_word - 1), 0)),
+            udp_port.sink.data.eq(buffer.source.data),
+            udp_port.sink.src_port.eq(src_port),
+            udp_port.sink.dst_port.eq(Mux(first, self.dst_port.storage, dst_port)),
+            udp_port.sink.ip_address.eq(Mux(first, self.dst_ip_address.storage, dst_ip)),
+            udp_port.sink.length.eq(Mux(first, self.packet_size.storage, length)),
+            # RX: Unused.
+            udp_port.source.ready.eq(1),
+        ]
+
+def add_udp_streamer(soc, name="udp_streamer", phy=None, phy_cd="eth", data_width=8,
+    mac_address             = 0x10e2d5000000,
+    ip_address              = "192.168.1.50",
+    udp_port                = UDP_STREAMER_PORT,
+    dst_ip_address          = "192.168.1.100",
+    dst_port                = UDP_STREAMER_PORT,
+    max_packet_size         = UDP_STREAMER_MAX_PACKET_SIZE,
+    ring_size               = None,
+    with_timing_constraints = True):
+    from liteeth.core import LiteEthUDPIPCore
+
+    # Ring buffer (top of main_ram).
+    main_ram = soc.bus.regions.get("main_ram", None)
+    if main_ram is None:
+        raise ValueError("UDP Streamer requires a main_ram (DRAM or integrated main RAM) for its ring buffer.")
+    if ring_size is None:
+        ring_size = min(2**((main_ram.size//2).bit_length() - 1), UDP_STREAMER_MAX_RING_SIZE)
+    assert ring_size <= main_ram.size
+    ring_base = main_ram.origin + main_ram.size - ring_size
+
+    # Core (same configuration as SoC.add_etherbone).
+    assert data_width in [8, 32]
+    with_sys_datapath = (data_width == 32)
+    soc.check_if_exists(f"ethcore_{name}")
+    ethcore = LiteEthUDPIPCore(
+        phy               = phy,
+        mac_address       = mac_address,
+        ip_address        = ip_address,
+        clk_freq          = soc.clk_freq,
+        dw                = data_width,
+        with_sys_datapath = with_sys_datapath,
+    )
+    streamer_cd = "sys"
+    if not with_sys_datapath:
+        # Use PHY's eth_tx/eth_rx clock domains and run the streamer port from sys clock domain.
+        ethcore = ClockDomainsRenamer({
+            "eth_tx": phy_cd + "_tx",
+            "eth_rx": phy_cd + "_rx",
+            "sys"   : phy_cd + "_rx",
+        })(ethcore)
+        streamer_cd = name
+        setattr(soc, f"cd_{name}", ClockDomain(name))
+        soc.comb += getattr(soc, f"cd_{name}").clk.eq(ClockSignal("sys"))
+        soc.comb += getattr(soc, f"cd_{name}").rst.eq(ResetSignal("sys"))
+    soc.add_module(name=f"ethcore_{name}", module=ethcore)
+
+    # Ring buffer DMAs.
+    buses = []
+    for _ in range(2):
+        buses.append(wishbone.Interface(
+            data_width = soc.bus.data_width,
+            adr_width  = soc.bus.get_address_width(standard="wishbone"),
+            addressing = "word",
+        ))
+    reader_bus, writer_bus = buses
+
+    # Streamer.
+    soc.check_if_exists(name)
+    streamer = UDPStreamer(
+        udp_port        = ethcore.udp.crossbar.get_port(udp_port, dw=soc.bus.data_width, cd=streamer_cd),
+        reader_bus      = reader_bus,
+        writer_bus      = writer_bus,
+        src_port        = udp_port,
+        dst_ip_address  = dst_ip_address,
+        dst_port        = dst_port,
+        max_packet_size = max_packet_size,
+        ring_base       = ring_base,
+        ring_size       = ring_size,
+    )
+    soc.add_module(name=name, module=streamer)
+    dma_bus = getattr(soc, "dma_bus", soc.bus)
+    dma_bus.add_master(name=f"{name}_reader", master=reader_bus)
+    dma_bus.add_master(name=f"{name}_writer", master=writer_bus)
+
+    # Timing constraints (same as SoC.add_etherbone).
+    if with_timing_constraints:
+        eth_rx_clk = getattr(phy, "crg", phy).cd_eth_rx.clk
+        eth_tx_clk = getattr(phy, "crg", phy).cd_eth_tx.clk
+        soc.platform.add_period_constraint(eth_rx_clk, 1e9/phy.rx_clk_freq)
+        if not eth_rx_clk is eth_tx_clk:
+            soc.platform.add_period_constraint(eth_tx_clk, 1e9/phy.tx_clk_freq)
+            soc.platform.add_false_path_constraints(soc.crg.cd_sys.clk, eth_rx_clk, eth_tx_clk)
+        else:
+            soc.platform.add_false_path_constraints(soc.crg.cd_sys.clk, eth_rx_clk)
+    return streamer
+
+# Receiver -----------------------------------------------------------------------------------------
+
+def udp_streamer_receive(port=UDP_STREAMER_PORT, duration=10, check_pattern=False, word_bytes=4):
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 16*1024*1024)
+    sock.bind(("", port))
+    sock.settimeout(1)
+    results = {"packets": 0, "bytes": 0, "errors": 0}
+    expected = None
+    start    = None
+    end      = time.time() + duration
+    while time.time() < end:
+        try:
+            data = sock.recv(65536)
+        except socket.timeout:
+            continue
+        if start is None:
+            start = time.time()
+        results["packets"] += 1
+        results["bytes"]   += len(data)
+        if check_pattern:
+            for i in range(0, len(data) - word_bytes + 1, word_bytes):
+                value = int.from_bytes(data[i:i + word_bytes], "little")
+                if expected is not None and value != expected:
+                    results["errors"] += 1
+                expected = (value + 1) % 2**(8*word_bytes)
+    sock.close()
+    elapsed = 0 if start is None else time.time() - start
+    results["throughput"] = 0 if elapsed == 0 else results["bytes"]/elapsed
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description="UDP Streamer receiver/benchmark.")
+    parser.add_argument("--port",       default=UDP_STREAMER_PORT, type=int, help="UDP port.")
+    parser.add_argument("--duration",   default=10,                type=int, help="Duration (seconds).")
+    parser.add_argument("--pattern",    action="store_true",                 help="Check the counter test pattern.")
+    parser.add_argument("--word-bytes", default=4,                 type=int, help="Streamer data width (bytes), for the pattern check.")
+    args = parser.parse_args()
+
+    r = udp_streamer_receive(
+        port          = args.port,
+        duration      = args.duration,
+        check_pattern = args.pattern,
+        word_bytes    = args.word_bytes,
+    )
+    errors = f", {r['errors']} pattern errors" if args.pattern else ""
+    print(f"RX: {r['packets']} packets, {r['bytes']} bytes, {r['throughput']/1e6:.2f} MB/s{errors}.")
+
+if __name__ == "__main__":
+    main()
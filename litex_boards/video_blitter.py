@@ -0,0 +1,442 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Video Blitter.
+#
+# Gateware: VideoBlitter is a 2D DMA engine working on rectangles of the main RAM (typically the
+# Video FrameBuffer) with CSR-programmed source/destination addresses, strides and sizes:
+# - Fill: writes a constant color to the destination rectangle.
+# - Copy: copies the source rectangle to the destination rectangle, optionally skipping source
+#   pixels equal to a color key (transparent blit). Lines are walked top-to-bottom or bottom-to-top
+#   (reverse) and can be fully read before being written (line), so that overlapping copies
+#   (scrolling) are supported.
+# The engine uses dedicated native LiteDRAM crossbar ports and reads/writes a native DRAM word per
+# cycle (source words are realigned on the destination and rectangle edges/keyed pixels are byte
+# masked), so updates run at DRAM bandwidth instead of CPU store speed.
+# busy is released once the writes are done in DRAM: the last written word is read back after the
+# write data has been taken by the controller.
+#
+# DRAM ports bypass the CPU caches: dirty cache lines over the rectangles have to be flushed before
+# starting an operation (and cached lines invalidated before reading back with the CPU).
+#
+# Software: generate_video_blitter_header writes a video_blitter.h header (fill/copy functions in
+# pixel coordinates) for the firmware, next to the generated csr.h/soc.h.
+#
+# Usage:
+#   ./digilent_nexys_video.py --with-video-framebuffer --with-video-blitter --build --load
+#   (firmware: #include <generated/video_blitter.h> then video_blitter_fill(VIDEO_FRAMEBUFFER_BASE,
+#   VIDEO_BLITTER_STRIDE, x, y, w, h, color); video_blitter_wait())
+
+import os
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+
+from litedram.frontend.dma import LiteDRAMDMAReader
+
+# Line Walker --------------------------------------------------------------------------------------
+
+class _LineWalker(Module):
+    # Source/destination addresses of the current line and their alignment. Lines are copied in
+    # native DRAM words: source words are realigned on destination words (so that rectangles don't
+    # have to be aligned) and partial destination words are masked.
+    def __init__(self, depth, data_width, width, height, reverse, src_stride, dst_stride):
+        bpp = depth//8
+        bpw = data_width//8
+        ppw = data_width//depth
+        self.src    = Signal(32)
+        self.dst    = Signal(32)
+        self.y      = Signal(16)
+        self.x      = Signal(17)
+        self.so     = Signal(max=max(ppw, 2)) # Pixel offset in source word.
+        self.do     = Signal(max=max(ppw, 2)) # Pixel offset in destination word.
+        self.extra  = Signal()                # Source word before the first destination word.
+        self.n_dst  = Signal(17)              # Destination words of the line.
+        self.n_src  = Signal(17)              # Source words of the line.
+        self.last_y = Signal()
+
+        # # #
+
+        if ppw > 1:
+            self.comb += [
+                self.so.eq(self.src[log2_int(bpp):log2_int(bpw)]),
+                self.do.eq(self.dst[log2_int(bpp):log2_int(bpw)]),
+            ]
+        self.comb += [
+            self.extra.eq(self.so > self.do),
+            self.n_dst.eq((self.do + width + ppw - 1) >> log2_int(ppw)),
+            self.n_src.eq(self.n_dst + self.extra),
+            self.last_y.eq(self.y == (height - 1)),
+        ]
+        self.next_line = [
+            NextValue(self.src, Mux(reverse, self.src - src_stride, self.src + src_stride)),
+            NextValue(self.dst, Mux(reverse, self.dst - dst_stride, self.dst + dst_stride)),
+            NextValue(self.y,   self.y + 1),
+            NextValue(self.x,   0),
+        ]
+
+# Video Blitter ------------------------------------------------------------------------------------
+
+class VideoBlitter(LiteXModule):
+    def __init__(self, rd_port, wr_port, depth=32, fifo_depth=512):
+        assert rd_port.data_width == wr_port.data_width
+        assert depth in [8, 16, 32] and depth <= wr_port.data_width
+        self.depth = depth
+        dw   = wr_port.data_width
+        bpp  = depth//8     # Bytes per pixel.
+        ppw  = dw//depth    # Pixels per native word.
+        bpw  = dw//8        # Bytes per native word.
+
+        self.control = CSRStorage(fields=[
+            CSRField("op", size=1, offset=0, values=[
+                ("``0b0``", "Fill (destination rectangle with color)."),
+                ("``0b1``", "Copy (source rectangle to destination rectangle)."),
+            ]),
+            CSRField("key",     size=1, offset=1, description="Copy: skip source pixels equal to key."),
+            CSRField("reverse", size=1, offset=2, description="Walk lines bottom-to-top (src/dst are the first pixel of the last line)."),
+            CSRField("line",    size=1, offset=3, description="Copy: read each line before writing it (width <= line_max)."),
+        ])
+        self.src        = CSRStorage(32, description="Source address (bytes).")
+        self.src_stride = CSRStorage(32, description="Source stride (bytes).")
+        self.dst        = CSRStorage(32, description="Destination address (bytes).")
+        self.dst_stride = CSRStorage(32, description="Destination stride (bytes).")
+        self.width      = CSRStorage(16, description="Rectangle width (pixels).")
+        self.height     = CSRStorage(16, description="Rectangle height (lines).")
+        self.color      = CSRStorage(depth, description="Fill color.")
+        self.key        = CSRStorage(depth, description="Copy color key.")
+        self.start      = CSR()
+        self.busy       = CSRStatus(description="Operation in progress (0: writes done in DRAM).")
+        self.words      = CSRStatus(32, description="Native DRAM words written (total).")
+
+        # Maximum width in line mode (the line has to fit in the read FIFO).
+        self.line_max = (fifo_depth - 2)*ppw
+
+        # # #
+
+        # Parameters (latched on start).
+        copy       = Signal()
+        keyed      = Signal()
+        reverse    = Signal()
+        line       = Signal()
+        width      = Signal(16)
+        height     = Signal(16)
+        src_stride = Signal(32)
+        dst_stride = Signal(32)
+        color      = Signal(depth)
+        key        = Signal(depth)
+
+        # Line walkers (source/destination lines of the reads/writes).
+        self.rd = rd = _LineWalker(depth, dw, width, height, reverse, src_stride, dst_stride)
+        self.wr = wr = _LineWalker(depth, dw, width, height, reverse, src_stride, dst_stride)
+        start = [
+            NextValue(rd.src, self.src.storage), NextValue(rd.dst, self.dst.storage),
+            NextValue(wr.src, self.src.storage), NextValue(wr.dst, self.dst.storage),
+            NextValue(rd.y, 0), NextValue(rd.x, 0),
+            NextValue(wr.y, 0), NextValue(wr.x, 0),
+        ]
+
+        # DRAM Reader (Copy).
+        self.reader = reader = LiteDRAMDMAReader(rd_port, fifo_depth=fifo_depth, fifo_buffered=True)
+        rd_done = Signal()
+        rd_last = Signal()
+        self.comb += rd_last.eq(rd.x == (rd.n_src - 1))
+
+        # DRAM Writer (native words with byte enables).
+        wr_fifo  = stream.SyncFIFO([("data", dw), ("we", dw//8)], 16)
+        wr_valid = Signal()
+        wr_ready = Signal()
+        wr_data  = Signal(dw)
+        wr_we    = Signal(dw//8)
+        wr_last  = Signal()
+        wr_addr  = Signal(32) # Last written address.
+        self.submodules += wr_fifo
+        self.comb += [
+            wr_port.cmd.we.eq(1),
+            wr_port.cmd.addr.eq(wr.dst[log2_int(bpw):] + wr.x),
+            wr_port.cmd.valid.eq(wr_valid & wr_fifo.sink.ready),
+            wr_ready.eq(wr_port.cmd.ready & wr_fifo.sink.ready),
+            wr_fifo.sink.valid.eq(wr_valid & wr_port.cmd.ready),
+            wr_fifo.sink.data.eq(wr_data),
+            wr_fifo.sink.we.eq(wr_we),
+            wr_port.wdata.valid.eq(wr_fifo.source.valid),
+            wr_port.wdata.data.eq(wr_fifo.source.data),
+            wr_port.wdata.we.eq(wr_fifo.source.we),
+            wr_fifo.source.ready.eq(wr_port.wdata.ready),
+            wr_last.eq(wr.x == (wr.n_dst - 1)),
+        ]
+
+        # Realignment: destination word = window of the previous/current source words.
+        prev   = Signal(dw)
+        window = Signal(dw)
+        offset = Signal(max=ppw + 1)
+        joined = Cat(prev, reader.source.data)
+        self.comb += [
+            offset.eq(Mux(wr.extra, wr.so - wr.do, ppw + wr.so - wr.do)),
+            window.eq(Array([joined[i*depth:i*depth + dw] for i in range(ppw + 1)])[offset]),
+        ]
+
+        # Destination pixels mask (rectangle edges, color key).
+        first_px = Signal(max=max(ppw, 2))
+        last_px  = Signal(max=max(ppw, 2))
+        self.comb += [
+            first_px.eq(Mux(wr.x == 0, wr.do, 0)),
+            last_px.eq(Mux(wr_last, wr.do + width - 1, ppw - 1)),
+        ]
+        for i in range(ppw):
+            pix  = window[i*depth:(i + 1)*depth]
+            mask = (i >= first_px) & (i <= last_px) & ~(copy & keyed & (pix == key))
+            self.comb += [
+                wr_data[i*depth:(i + 1)*depth].eq(Mux(copy, pix, color)),
+                wr_we[i*bpp:(i + 1)*bpp].eq(Replicate(mask, bpp)),
+            ]
+
+        # Line mode: the writes of a line start once all the reads of the line have been issued.
+        wr_allowed = Signal()
+        wr_loaded  = Signal()
+        self.comb += wr_allowed.eq(~line | rd_done | (rd.y != wr.y))
+
+        # FSM.
+        self.fsm = fsm = FSM(reset_state="IDLE")
+        fsm.act("IDLE",
+            If(self.start.re,
+                NextValue(copy,       self.control.fields.op),
+                NextValue(keyed,      self.control.fields.key),
+                NextValue(reverse,    self.control.fields.reverse),
+                NextValue(line,       self.control.fields.line),
+                NextValue(width,      self.width.storage),
+                NextValue(height,     self.height.storage),
+                NextValue(src_stride, self.src_stride.storage),
+                NextValue(dst_stride, self.dst_stride.storage),
+                NextValue(color,      self.color.storage),
+                NextValue(key,        self.key.storage),
+                NextValue(rd_done,    ~self.control.fields.op),
+                NextValue(wr_loaded,  0),
+                *start,
+                If((self.width.storage != 0) & (self.height.storage != 0),
+                    NextState("RUN")
+                )
+            )
+        )
+        fsm.act("RUN",
+            # Source reads (Copy).
+            reader.sink.valid.eq(~rd_done),
+            reader.sink.last.eq(rd_last),
+            reader.sink.address.eq(rd.src[log2_int(bpw):] + rd.x),
+            If(reader.sink.valid & reader.sink.ready,
+                If(rd_last,
+                    *rd.next_line,
+                    If(rd.last_y,
+                        NextValue(rd_done, 1)
+                    )
+                ).Else(
+                    NextValue(rd.x, rd.x + 1)
+                )
+            ),
+            # Destination writes.
+            If(copy,
+                If(wr_allowed & reader.source.valid,
+                    # Load the source word before the first destination word.
+                    If(wr.extra & ~wr_loaded,
+                        reader.source.ready.eq(1),
+                        NextValue(prev, reader.source.data),
+                        NextValue(wr_loaded, 1)
+                    ).Else(
+                        wr_valid.eq(1),
+                        reader.source.ready.eq(wr_ready),
+                        If(wr_ready,
+                            NextValue(prev, reader.source.data)
+                        )
+                    )
+                )
+            ).Else(
+                wr_valid.eq(1)
+            ),
+            If(wr_valid & wr_ready,
+                NextValue(self.words.status, self.words.status + 1),
+                NextValue(wr_addr, wr_port.cmd.addr),
+                If(wr_last,
+                    *wr.next_line,
+                    NextValue(wr_loaded, 0),
+                    If(wr.last_y,
+                        NextState("DRAIN")
+                    )
+                ).Else(
+                    NextValue(wr.x, wr.x + 1)
+                )
+            )
+        )
+        fsm.act("DRAIN",
+            # Wait for the write data to be taken by the DRAM controller (when the writes are issued)...
+            If(~wr_fifo.source.valid,
+                NextState("FLUSH")
+            )
+        )
+        fsm.act("FLUSH",
+            # ... then read back the last written word: the read is issued after the writes, so its
+            # data returns once all the writes are done in DRAM and visible to the other ports.
+            reader.sink.valid.eq(1),
+            reader.sink.last.eq(1),
+            reader.sink.address.eq(wr_addr),
+            If(reader.sink.ready,
+                NextState("FLUSH-WAIT")
+            )
+        )
+        fsm.act("FLUSH-WAIT",
+            reader.source.ready.eq(1),
+            If(reader.source.valid,
+                NextState("IDLE")
+            )
+        )
+        self.comb += self.busy.status.eq(~fsm.ongoing("IDLE"))
+
+def add_video_blitter(soc, name="video_blitter", depth=None, fifo_depth=512):
+    # Pixel depth of the Video FrameBuffer (when not specified).
+    if depth is None:
+        depth = soc.constants["VIDEO_FRAMEBUFFER_DEPTH"]
+    blitter = VideoBlitter(
+        rd_port    = soc.sdram.crossbar.get_port(mode="read"),
+        wr_port    = soc.sdram.crossbar.get_port(mode="write"),
+        depth      = depth,
+        fifo_depth = fifo_depth,
+    )
+    soc.add_module(name=name, module=blitter)
+
+# Software -----------------------------------------------------------------------------------------
+
+_video_blitter_h = """/* SPDX-License-Identifier: BSD-2-Clause
+ *
+ * Video Blitter (generated by LiteX-Boards).
+ *
+ */
+
+#ifndef __GENERATED_VIDEO_BLITTER_H
+#define __GENERATED_VIDEO_BLITTER_H
+
+#include <generated/csr.h>
+#include <generated/soc.h>
+
+#define VIDEO_BLITTER(reg)     {blitter}_##reg
+#define VIDEO_BLITTER_BPP      {bpp}
+#ifdef VIDEO_FRAMEBUFFER_HRES
+#define VIDEO_BLITTER_STRIDE   (VIDEO_FRAMEBUFFER_HRES*VIDEO_BLITTER_BPP)
+#endif
+
+#define VIDEO_BLITTER_FILL     (0 << CSR_{BLITTER}_CONTROL_OP_OFFSET)
+#define VIDEO_BLITTER_COPY     (1 << CSR_{BLITTER}_CONTROL_OP_OFFSET)
+#define VIDEO_BLITTER_KEY      (1 << CSR_{BLITTER}_CONTROL_KEY_OFFSET)
+#define VIDEO_BLITTER_REVERSE  (1 << CSR_{BLITTER}_CONTROL_REVERSE_OFFSET)
+#define VIDEO_BLITTER_LINE     (1 << CSR_{BLITTER}_CONTROL_LINE_OFFSET)
+#define VIDEO_BLITTER_LINE_MAX {line_max}
+
+/* Note: the Blitter accesses the DRAM directly, flush the CPU caches over the rectangles before
+ * starting an operation (ex flush_l2_cache()) when they have been written by the CPU. */
+
+static inline int video_blitter_busy(void)
+{{
+    return VIDEO_BLITTER(busy_read)();
+}}
+
+static inline void video_blitter_wait(void)
+{{
+    while (VIDEO_BLITTER(busy_read)());
+}}
+
+static inline void video_blitter_start(unsigned int control,
+    unsigned int src, unsigned int src_stride,
+    unsigned int dst, unsigned int dst_stride,
+    unsigned int w, unsigned int h)
+{{
+    video_blitter_wait();
+    VIDEO_BLITTER(control_write)(control);
+    VIDEO_BLITTER(src_write)(src);
+    VIDEO_BLITTER(src_stride_write)(src_stride);
+    VIDEO_BLITTER(dst_write)(dst);
+    VIDEO_BLITTER(dst_stride_write)(dst_stride);
+    VIDEO_BLITTER(width_write)(w);
+    VIDEO_BLITTER(height_write)(h);
+    VIDEO_BLITTER(start_write)(1);
+}}
+
+/* Fill rectangle (x, y, w, h) of the buffer at base with color. */
+static inline void video_blitter_fill(unsigned int base, unsigned int stride,
+    unsigned int x, unsigned int y, unsigned int w, unsigned int h, unsigned int color)
+{{
+    unsigned int dst = base + y*stride + x*VIDEO_BLITTER_BPP;
+
+    video_blitter_wait();
+    VIDEO_BLITTER(color_write)(color);
+    video_blitter_start(VIDEO_BLITTER_FILL, 0, 0, dst, stride, w, h);
+}}
+
+static inline void video_blitter_copy_ex(unsigned int control,
+    unsigned int src_base, unsigned int src_stride, unsigned int sx, unsigned int sy,
+    unsigned int dst_base, unsigned int dst_stride, unsigned int dx, unsigned int dy,
+    unsigned int w, unsigned int h)
+{{
+    unsigned int src, dst, x, n;
+    int overlap = (src_base == dst_base) && (src_stride == dst_stride);
+
+    if ((w == 0) || (h == 0))
+        return;
+    /* Overlapping copy to lower lines: walk lines bottom-to-top. */
+    if (overlap && (dy > sy)) {{
+        control |= VIDEO_BLITTER_REVERSE;
+        sy += h - 1;
+        dy += h - 1;
+    }}
+    src = src_base + sy*src_stride;
+    dst = dst_base + dy*dst_stride;
+    /* Overlapping copy to the right on the same lines: read each line before writing it, in
+     * strips of up to VIDEO_BLITTER_LINE_MAX pixels starting from the right. */
+    if (overlap && (dy == sy) && (dx > sx)) {{
+        control |= VIDEO_BLITTER_LINE;
+        for (x = w; x > 0; x -= n) {{
+            n = (x > VIDEO_BLITTER_LINE_MAX) ? VIDEO_BLITTER_LINE_MAX : x;
+            video_blitter_start(VIDEO_BLITTER_COPY | control,
+                src + (sx + x - n)*VIDEO_BLITTER_BPP, src_stride,
+                dst + (dx + x - n)*VIDEO_BLITTER_BPP, dst_stride, n, h);
+        }}
+        return;
+    }}
+    video_blitter_start(VIDEO_BLITTER_COPY | control,
+        src + sx*VIDEO_BLITTER_BPP, src_stride,
+        dst + dx*VIDEO_BLITTER_BPP, dst_stride, w, h);
+}}
+
+/* Copy rectangle (sx, sy, w, h) to (dx, dy) (overlapping rectangles are supported). */
+static inline void video_blitter_copy(unsigned int base, unsigned int stride,
+    unsigned int sx, unsigned int sy, unsigned int dx, unsigned int dy, unsigned int w, unsigned int h)
+{{
+    video_blitter_copy_ex(0, base, stride, sx, sy, base, stride, dx, dy, w, h);
+}}
+
+/* Copy rectangle (sx, sy, w, h) of src_base to (dx, dy) of dst_base, skipping pixels equal to key. */
+static inline void video_blitter_copy_key(
+    unsigned int src_base, unsigned int src_stride, unsigned int sx, unsigned int sy,
+    unsigned int dst_base, unsigned int dst_stride, unsigned int dx, unsigned int dy,
+    unsigned int w, unsigned int h, unsigned int key)
+{{
+    video_blitter_wait();
+    VIDEO_BLITTER(key_write)(key);
+    video_blitter_copy_ex(VIDEO_BLITTER_KEY, src_base, src_stride, sx, sy, dst_base, dst_stride, dx, dy, w, h);
+}}
+
+#endif
+"""
+
+def generate_video_blitter_header(soc, filename, blitter="video_blitter"):
+    os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+    with open(filename, "w") as f:
+        f.write(_video_blitter_h.format(
+            blitter  = blitter,
+            BLITTER  = blitter.upper(),
+            bpp      = getattr(soc, blitter).depth//8,
+            line_max = getattr(soc, blitter).line_max,
+        ))
@@ -0,0 +1,1011 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Video Capture.
+#
+# Gateware: VideoCapture records a video stream (video_data_layout, from a video input PHY or a test
+# pattern) into a DRAM ring buffer of frame slots and streams the recorded frames on its source
+# (to a LitePCIe DMA, UDP Streamer, ...), without the CPU in the data path:
+# - Capture: pixels are packed (rgb888 with r in the LSBs, same format as the Video FrameBuffer) into
+#   native DRAM words in the video clock domain and written to the free slot through a native
+#   LiteDRAM port. Frames start on the first pixel after a vsync edge (any vsync polarity).
+# - Frames are only committed to the ring buffer when complete: a frame is dropped when the ring
+#   buffer is full at its start (dropped), when capture words are lost because the DRAM is too slow
+#   (overflows) or when its size differs from frame_size (errors: source resolution change).
+# - Readout: committed frames are read through a second native port and streamed (last on the last
+#   word of each frame), the slot is released once its last word has been accepted (sent).
+# The measured source resolution (hres/vres) is available over CSRs to configure frame_size.
+#
+# VideoS7HDMIInPHY is a 7-Series HDMI/DVI receiver (TMDS over IBUFDS/IDELAYE2/ISERDESE2) for boards
+# with HDMI inputs on regular IOs (ex Nexys Video): MMCM on the TMDS clock, per-channel word
+# alignment (bitslip until control tokens are received) and delay taps over CSRs, TMDS decoding,
+# data island/guard band removal (HDMI sources) and an EDID ROM on the DDC (I2C) pins.
+#
+# Software: generate_video_capture_software adds a litepcie_video_capture program (records frames
+# to a file and reports frame counters) to the driver generated by
+# litepcie.software.generate_litepcie_software.
+#
+# Usage (on the target):
+#   ./decklink_mini_4k.py --with-pcie --with-colorbars-capture --driver --build --load
+#   cd build/decklink_mini_4k/driver/user && make && ./litepcie_video_capture -n 60 -o frames.rgbx
+#   ./digilent_nexys_video.py --with-udp-streamer --with-video-capture --build --load
+#   (BIOS/firmware: configure udp_streamer with udp_streamer_pattern=0, then video_capture_enable=1)
+#
+# The UDP Streamer path (Nexys Video) is lossy and unframed, for monitoring/debug rather than
+# recording:
+# - Frames are copied a second time, into the UDP Streamer ring buffer in main RAM (over Wishbone).
+# - 1GbE can't sustain the capture (1280x720@60Hz: ~221MB/s): the UDP Streamer stalls the readout
+#   and frames are dropped whole at capture (dropped counter), ~1 frame in 2 are sent.
+# - The UDP payload is the raw pixel stream, without frame boundaries (last is not forwarded). With
+#   the UDP Streamer enabled before the capture and a packet_size dividing frame_size, frames start
+#   on a packet boundary every frame_size/packet_size packets; a packet lost on the host side shifts
+#   the following frames.
+
+from functools import reduce
+from operator import or_
+
+from migen import *
+from migen.genlib.cdc import MultiReg, PulseSynchronizer
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+from litex.soc.integration.soc import SoCRegion
+from litex.soc.cores.clock import S7MMCM
+from litex.soc.cores.code_tmds import control_tokens
+from litex.soc.cores.video import video_timings, video_data_layout, hbits, vbits
+from litex.soc.cores.video import VideoTimingGenerator, ColorBarsPattern
+
+from litedram.frontend.dma import LiteDRAMDMAReader, LiteDRAMDMAWriter
+
+from litex_boards.litepcie_software import add_litepcie_program
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def _edid(timings, name="LiteX"):
+    # EDID 1.3 base block with timings as preferred (first detailed) timing.
+    vt   = video_timings[timings] if isinstance(timings, str) else timings
+    edid = [0x00, 0xff, 0xff, 0xff, 0xff, 0xff, 0xff, 0x00]
+    # Vendor/Product: Manufacturer "LXB", Product 0x0001, Serial 0, Week 1, Year 2024.
+    manufacturer = ((ord("L") - 64) << 10) | ((ord("X") - 64) << 5) | (ord("B") - 64)
+    edid += [manufacturer >> 8, manufacturer & 0xff, 0x01, 0x00, 0x00, 0x00, 0x00, 0x00, 1, 2024 - 1990]
+    # Version 1.3.
+    edid += [0x01, 0x03]
+    # Display: Digital, size undefined, gamma 2.2, RGB color/preferred timing in first descriptor.
+    edid += [0x80, 0x00, 0x00, 120, 0x0a]
+    # Chromaticity (sRGB).
+    edid += [0xee, 0x91, 0xa3, 0x54, 0x4c, 0x99, 0x26, 0x0f, 0x50, 0x54]
+    # Established timings (640x480@60Hz) and no standard timings.
+    edid += [0x20, 0x00, 0x00]
+    edid += [0x01, 0x01]*8
+    # Detailed timing.
+    pix_clk = int(vt["pix_clk"]//10e3)
+    ha, hb, hso, hsw = vt["h_active"], vt["h_blanking"], vt["h_sync_offset"], vt["h_sync_width"]
+    va, vb, vso, vsw = vt["v_active"], vt["v_blanking"], vt["v_sync_offset"], vt["v_sync_width"]
+    edid += [
+        pix_clk & 0xff, pix_clk >> 8,
+        ha & 0xff, hb & 0xff, ((ha >> 8) << 4) | (hb >> 8),
+        va & 0xff, vb & 0xff, ((va >> 8) << 4) | (vb >> 8),
+        hso & 0xff, hsw & 0xff, ((vso & 0xf) << 4) | (vsw & 0xf),
+        ((hso >> 8) << 6) | ((hsw >> 8) << 4) | ((vso >> 4) << 2) | (vsw >> 4),
+        0x00, 0x00, 0x00, # Image size undefined.
+        0x00, 0x00,       # No borders.
+        0x1e,             # Digital separate sync, positive polarities.
+    ]
+    # Display name.
+    name = name.encode()[:13]
+    name = name + (b"\n" + b" "*12)[:13 - len(name)]
+    edid += [0x00, 0x00, 0x00, 0xfc, 0x00] + list(name)
+    # Range limits: 24-76Hz, 15-80kHz, 150MHz.
+    edid += [0x00, 0x00, 0x00, 0xfd, 0x00, 24, 76, 15, 80, 15, 0x00, 0x0a] + [0x20]*6
+    # Dummy descriptor.
+    edid += [0x00, 0x00, 0x00, 0x10, 0x00] + [0x00]*13
+    # No extension, checksum.
+    edid += [0x00]
+    edid += [(-sum(edid)) & 0xff]
+    assert len(edid) == 128
+    return edid
+
+# EDID ---------------------------------------------------------------------------------------------
+
+class _EDID(LiteXModule):
+    # I2C slave (address 0x50) reading the EDID ROM on the DDC pins (scl driven by the source).
+    def __init__(self, pads, timings):
+        self.mem = Memory(8, 128, init=_edid(timings))
+
+        # # #
+
+        port = self.mem.get_port(async_read=True)
+        self.specials += port
+
+        # IOs.
+        scl    = Signal()
+        sda    = Signal()
+        sda_oe = Signal()
+        self.sda_t = sda_t = TSTriple()
+        self.specials += sda_t.get_tristate(pads.sda)
+        self.specials += [
+            MultiReg(pads.scl, scl),
+            MultiReg(sda_t.i,  sda),
+        ]
+        self.comb += [
+            sda_t.o.eq(0),
+            sda_t.oe.eq(sda_oe),
+        ]
+
+        # Bus events.
+        scl_d = Signal()
+        sda_d = Signal()
+        self.sync += scl_d.eq(scl), sda_d.eq(sda)
+        start    = Signal()
+        stop     = Signal()
+        scl_rise = Signal()
+        scl_fall = Signal()
+        self.comb += [
+            start.eq(   scl & scl_d &  sda_d & ~sda),
+            stop.eq(    scl & scl_d & ~sda_d &  sda),
+            scl_rise.eq( scl & ~scl_d),
+            scl_fall.eq(~scl &  scl_d),
+        ]
+
+        # Protocol (bits are sampled on scl rising edges and driven on scl falling edges).
+        IDLE, ADDR, ADDR_END, ACK, WRITE, WRITE_END, READ, READ_ACK, READ_NEXT = range(9)
+        state   = Signal(max=9)
+        shift   = Signal(8)
+        bits    = Signal(3)
+        is_read = Signal()
+        offset  = Signal(7)
+        self.comb += port.adr.eq(offset)
+        load = [
+            sda_oe.eq(~port.dat_r[7]),
+            shift.eq(Cat(0, port.dat_r[:7])),
+            bits.eq(0),
+            state.eq(READ),
+        ]
+        self.sync += [
+            If(start,
+                sda_oe.eq(0),
+                bits.eq(0),
+                state.eq(ADDR),
+            ).Elif(stop,
+                sda_oe.eq(0),
+                state.eq(IDLE),
+            ).Else(
+                Case(state, {
+                    # Receive address (and direction) / offset.
+                    ADDR: If(scl_rise,
+                        shift.eq(Cat(sda, shift[:7])),
+                        bits.eq(bits + 1),
+                        If(bits == 7, state.eq(ADDR_END)),
+                    ),
+                    ADDR_END: If(scl_fall,
+                        If(shift[1:] == 0x50,
+                            sda_oe.eq(1),
+                            is_read.eq(shift[0]),
+                            state.eq(ACK),
+                        ).Else(
+                            state.eq(IDLE),
+                        )
+                    ),
+                    ACK: If(scl_fall,
+                        sda_oe.eq(0),
+                        bits.eq(0),
+                        If(is_read,
+                            *load
+                        ).Else(
+                            state.eq(WRITE),
+                        )
+                    ),
+                    WRITE: If(scl_rise,
+                        shift.eq(Cat(sda, shift[:7])),
+                        bits.eq(bits + 1),
+                        If(bits == 7, state.eq(WRITE_END)),
+                    ),
+                    WRITE_END: If(scl_fall,
+                        offset.eq(shift),
+                        sda_oe.eq(1),
+                        is_read.eq(0),
+                        state.eq(ACK),
+                    ),
+                    # Send data (until not acknowledged).
+                    READ: If(scl_fall,
+                        If(bits == 7,
+                            sda_oe.eq(0),
+                            state.eq(READ_ACK),
+                        ).Else(
+                            sda_oe.eq(~shift[7]),
+                            shift.eq(Cat(0, shift[:7])),
+                            bits.eq(bits + 1),
+                        )
+                    ),
+                    READ_ACK: If(scl_rise,
+                        If(sda,
+                            state.eq(IDLE),
+                        ).Else(
+                            offset.eq(offset + 1),
+                            state.eq(READ_NEXT),
+                        )
+                    ),
+                    READ_NEXT: If(scl_fall,
+                        *load
+                    ),
+                })
+            )
+        ]
+
+# TMDS Decoder -------------------------------------------------------------------------------------
+
+class _TMDSDecoder(LiteXModule):
+    def __init__(self):
+        self.q       = Signal(10) # Deserialized word (first bit in LSB).
+        self.bitslip = Signal()
+        self.aligned = Signal()
+        self.d       = Signal(8)
+        self.c       = Signal(2)
+        self.control = Signal()
+
+        # # #
+
+        q = self.q
+
+        # Word alignment: bitslip until runs of control tokens (blanking) are received.
+        token = Signal()
+        run   = Signal(3)
+        seen  = Signal()
+        timer = Signal(16)
+        self.comb += token.eq(reduce(or_, [q == t for t in control_tokens]))
+        self.sync += [
+            self.bitslip.eq(0),
+            If(token,
+                If(run == 7,
+                    seen.eq(1)
+                ).Else(
+                    run.eq(run + 1)
+                )
+            ).Else(
+                run.eq(0)
+            ),
+            timer.eq(timer + 1),
+            If(timer == 0,
+                self.aligned.eq(seen),
+                self.bitslip.eq(~seen),
+                seen.eq(0),
+            )
+        ]
+
+        # Decoding.
+        x = Signal(8)
+        self.comb += x.eq(Mux(q[9], ~q[:8], q[:8]))
+        self.sync += [
+            self.control.eq(token),
+            Case(q, {t: self.c.eq(i) for i, t in enumerate(control_tokens)}),
+            self.d[0].eq(x[0]),
+            [self.d[i].eq(x[i] ^ x[i-1] ^ ~q[8]) for i in range(1, 8)],
+        ]
+
+# TMDS Sync ----------------------------------------------------------------------------------------
+
+class _TMDSSync(LiteXModule):
+    # Synchronization/DE recovery: Syncs from channel 0 control tokens, Data Islands and Video Guard
+    # Bands of HDMI sources identified from the preceding preamble (CTL0-3 on channels 1/2).
+    def __init__(self, ch0, ch1, ch2):
+        self.source = source = stream.Endpoint(video_data_layout)
+
+        # # #
+
+        island    = Signal()
+        guard     = Signal(2)
+        video_pre = Signal()
+        data_pre  = Signal()
+        self.comb += [
+            video_pre.eq((ch1.c == 0b01) & (ch2.c == 0b00)),
+            data_pre.eq( (ch1.c == 0b01) & (ch2.c == 0b01)),
+            source.valid.eq(1),
+        ]
+        self.sync += [
+            source.de.eq(0),
+            If(ch0.control,
+                source.hsync.eq(ch0.c[0]),
+                source.vsync.eq(ch0.c[1]),
+                island.eq(data_pre),
+                guard.eq(Mux(video_pre, 2, 0)),
+            ).Elif(guard != 0,
+                guard.eq(guard - 1),
+            ).Else(
+                source.de.eq(~island),
+            ),
+            source.r.eq(ch2.d),
+            source.g.eq(ch1.d),
+            source.b.eq(ch0.d),
+        ]
+
+# TMDS Channel -------------------------------------------------------------------------------------
+
+class _TMDSChannel(LiteXModule):
+    def __init__(self, pad_p, pad_n, clock_domain, refclk_freq=200e6):
+        self.delay   = CSRStorage(5, description="IDELAYE2 taps.")
+        self.aligned = CSRStatus(description="Word aligned (control tokens received).")
+        self.d       = Signal(8) # Decoded data (clock_domain).
+        self.c       = Signal(2) # Decoded control (clock_domain).
+        self.control = Signal()  # Control token (clock_domain).
+
+        # # #
+
+        # Delay.
+        pad    = Signal()
+        pad_dl = Signal()
+        self.specials += Instance("IBUFDS", i_I=pad_p, i_IB=pad_n, o_O=pad)
+        self.specials += Instance("IDELAYE2",
+            p_DELAY_SRC             = "IDATAIN",
+            p_SIGNAL_PATTERN        = "DATA",
+            p_CINVCTRL_SEL          = "FALSE",
+            p_HIGH_PERFORMANCE_MODE = "TRUE",
+            p_REFCLK_FREQUENCY      = refclk_freq/1e6,
+            p_PIPE_SEL              = "FALSE",
+            p_IDELAY_TYPE           = "VAR_LOAD",
+            p_IDELAY_VALUE          = 0,
+            i_C           = ClockSignal("sys"),
+            i_LD          = self.delay.re,
+            i_CE          = 0,
+            i_LDPIPEEN    = 0,
+            i_INC         = 0,
+            i_CNTVALUEIN  = self.delay.storage,
+            i_IDATAIN     = pad,
+            o_DATAOUT     = pad_dl
+        )
+
+        # 1:10 Deserialization (2 ISERDESE2 coupled, 8:1 Max with one).
+        q       = Signal(10)
+        bitslip = Signal()
+        shift1  = Signal()
+        shift2  = Signal()
+        for serdes in ["master", "slave"]:
+            self.specials += Instance("ISERDESE2",
+                p_DATA_WIDTH     = 10,
+                p_DATA_RATE      = "DDR",
+                p_SERDES_MODE    = serdes.upper(),
+                p_INTERFACE_TYPE = "NETWORKING",
+                p_NUM_CE         = 1,
+                p_IOBDELAY       = "IFD",
+                i_DDLY      = pad_dl if serdes == "master" else 0,
+                i_CE1       = 1,
+                i_RST       = ResetSignal(clock_domain),
+                i_CLK       = ClockSignal(clock_domain + "5x"),
+                i_CLKB      = ~ClockSignal(clock_domain + "5x"),
+                i_CLKDIV    = ClockSignal(clock_domain),
+                i_BITSLIP   = bitslip,
+                i_SHIFTIN1  = shift1 if serdes == "slave" else 0,
+                i_SHIFTIN2  = shift2 if serdes == "slave" else 0,
+                **({
+                    "o_Q8": q[0], "o_Q7": q[1], "o_Q6": q[2], "o_Q5": q[3],
+                    "o_Q4": q[4], "o_Q3": q[5], "o_Q2": q[6], "o_Q1": q[7],
+                    "o_SHIFTOUT1": shift1, "o_SHIFTOUT2": shift2,
+                } if serdes == "master" else {
+                    "o_Q4": q[8], "o_Q3": q[9],
+                })
+            )
+
+        # Word alignment / TMDS decoding.
+        self.decoder = decoder = ClockDomainsRenamer(clock_domain)(_TMDSDecoder())
+        self.comb += [
+            decoder.q.eq(q),
+            bitslip.eq(decoder.bitslip),
+            self.d.eq(decoder.d),
+            self.c.eq(decoder.c),
+            self.control.eq(decoder.control),
+        ]
+        self.specials += MultiReg(decoder.aligned, self.aligned.status)
+
+# Video S7 HDMI In PHY -----------------------------------------------------------------------------
+
+class VideoS7HDMIInPHY(LiteXModule):
+    def __init__(self, pads, pix_clk_freq=74.25e6, clock_domain="hdmi_in", edid_timings="1280x720@60Hz", speedgrade=-1):
+        self.source = source = stream.Endpoint(video_data_layout) # clock_domain.
+        self.reset  = CSRStorage(description="MMCM reset (after a source change).")
+        self.locked = CSRStatus(description="MMCM locked (TMDS clock received).")
+
+        # # #
+
+        # Hot plug detect / EDID.
+        if hasattr(pads, "hpd_en"):
+            self.comb += pads.hpd_en.eq(1)
+        if edid_timings is not None:
+            self.edid = _EDID(pads, edid_timings)
+
+        # Clocking: Pixel clock and 5x (DDR bit) clock from TMDS clock.
+        clk = Signal()
+        self.specials += Instance("IBUFDS", i_I=pads.clk_p, i_IB=pads.clk_n, o_O=clk)
+        cd   = ClockDomain(clock_domain)
+        cd5x = ClockDomain(clock_domain + "5x")
+        setattr(self, f"cd_{clock_domain}",   cd)
+        setattr(self, f"cd_{clock_domain}5x", cd5x)
+        self.mmcm = mmcm = S7MMCM(speedgrade=speedgrade)
+        self.comb += mmcm.reset.eq(self.reset.storage)
+        mmcm.register_clkin(clk, pix_clk_freq)
+        mmcm.create_clkout(cd,   pix_clk_freq)
+        mmcm.create_clkout(cd5x, 5*pix_clk_freq, with_reset=False)
+        self.specials += MultiReg(mmcm.locked, self.locked.status)
+        self.clk = clk
+
+        # TMDS Channels (0: Blue, 1: Green, 2: Red).
+        channels = []
+        for i in range(3):
+            channel = _TMDSChannel(getattr(pads, f"data{i}_p"), getattr(pads, f"data{i}_n"), clock_domain)
+            setattr(self, f"data{i}", channel)
+            channels.append(channel)
+
+        # Synchronization/DE recovery.
+        self.sync_recovery = ClockDomainsRenamer(clock_domain)(_TMDSSync(*channels))
+        self.comb += self.sync_recovery.source.connect(source)
+
+# Video Capture ------------------------------------------------------------------------------------
+
+class VideoCapture(LiteXModule):
+    def __init__(self, wr_port, rd_port, base, slot_size, frame_size, slots=4, clock_domain="sys", data_width=None, fifo_depth=64):
+        assert rd_port.data_width == wr_port.data_width
+        dw  = wr_port.data_width
+        bpw = dw//8 # Bytes per native word.
+        ppw = dw//32 # Pixels per native word.
+        assert ppw >= 1
+        if data_width is None:
+            data_width = dw
+        self.sink   = sink   = stream.Endpoint(video_data_layout) # clock_domain.
+        self.source = source = stream.Endpoint([("data", data_width)])
+
+        self.enable     = CSRStorage(description="Enable (0: resets the ring buffer and counters).")
+        self.base       = CSRStorage(32, reset=base,       description="Ring buffer base address (bytes, DRAM address).")
+        self.slot_size  = CSRStorage(32, reset=slot_size,  description=f"Ring buffer slot size (bytes, multiple of {bpw}).")
+        self.slots      = CSRStorage(bits_for(slots), reset=slots, description=f"Ring buffer slots (1 to {slots}).")
+        self.frame_size = CSRStorage(32, reset=frame_size, description=f"Frame size (bytes, hres*vres*4, multiple of {bpw}, up to slot_size).")
+        self.hres       = CSRStatus(hbits, description="Measured horizontal resolution (pixels).")
+        self.vres       = CSRStatus(vbits, description="Measured vertical resolution (lines).")
+        self.level      = CSRStatus(bits_for(slots), description="Frames in the ring buffer.")
+        self.captured   = CSRStatus(32, description="Frames written to the ring buffer.")
+        self.dropped    = CSRStatus(32, description="Frames dropped (ring buffer full).")
+        self.overflows  = CSRStatus(32, description="Frames dropped (capture FIFO overflow).")
+        self.errors     = CSRStatus(32, description="Frames dropped (size different from frame_size).")
+        self.sent       = CSRStatus(32, description="Frames sent (read from the ring buffer).")
+
+        # # #
+
+        shift  = log2_int(bpw)
+        enable = self.enable.storage
+
+        # Capture (clock_domain) -------------------------------------------------------------------
+
+        self.cdc = cdc = stream.ClockDomainCrossing([("data", dw)],
+            cd_from = clock_domain,
+            cd_to   = "sys",
+            depth   = fifo_depth,
+        )
+        sync_cd   = getattr(self.sync, clock_domain)
+        enable_cd = Signal()
+        self.specials += MultiReg(enable, enable_cd, clock_domain)
+
+        # Frame start: first pixel after a vsync edge.
+        vsync = Signal()
+        sof   = Signal()
+        pixel = Signal()
+        self.comb += [
+            sink.ready.eq(1),
+            pixel.eq(sink.valid & sink.de),
+        ]
+        sync_cd += If(sink.valid,
+            vsync.eq(sink.vsync),
+            If(sink.vsync != vsync, sof.eq(1)),
+        )
+
+        # Pixel packing (first pixel in the LSBs, as in memory).
+        word     = Signal(dw)
+        index    = Signal(max=max(ppw, 2))
+        n        = Signal(max=max(ppw, 2))
+        first    = Signal()
+        drop     = Signal()
+        push     = Signal()
+        overflow = Signal()
+        self.comb += [
+            n.eq(Mux(sof, 0, index)),
+            push.eq(pixel & (n == (ppw - 1))),
+            cdc.sink.valid.eq(push & (sof | ~drop)),
+            cdc.sink.first.eq(sof | first),
+            cdc.sink.data.eq(Cat(word[32:], sink.r, sink.g, sink.b)),
+        ]
+        sync_cd += [
+            overflow.eq(0),
+            If(pixel,
+                word.eq(Cat(word[32:], sink.r, sink.g, sink.b, Constant(0, 8))),
+                index.eq(Mux(push, 0, n + 1)),
+                If(sof,
+                    sof.eq(0),
+                    drop.eq(0),
+                    first.eq(1),
+                ),
+                If(push,
+                    first.eq(0),
+                    If(cdc.sink.valid & ~cdc.sink.ready,
+                        # Capture words lost: drop the rest of the frame.
+                        drop.eq(1),
+                        overflow.eq(1),
+                    )
+                )
+            ),
+            # Start on a frame boundary.
+            If(~enable_cd,
+                sof.eq(0),
+                drop.eq(1),
+            )
+        ]
+
+        # Resolution measurement (also when disabled).
+        de     = Signal()
+        vedge  = Signal()
+        hcount = Signal(hbits)
+        vcount = Signal(vbits)
+        hres   = Signal(hbits)
+        vres   = Signal(vbits)
+        sync_cd += If(sink.valid,
+            de.eq(sink.de),
+            If(sink.vsync != vsync, vedge.eq(1)),
+            If(sink.de,
+                hcount.eq(hcount + 1),
+                If(vedge,
+                    vedge.eq(0),
+                    vres.eq(vcount),
+                    vcount.eq(0),
+                )
+            ).Elif(de,
+                hres.eq(hcount),
+                hcount.eq(0),
+                vcount.eq(vcount + 1),
+            )
+        )
+        self.specials += [
+            MultiReg(hres, self.hres.status),
+            MultiReg(vres, self.vres.status),
+        ]
+        self.overflow_ps = overflow_ps = PulseSynchronizer(clock_domain, "sys")
+        self.comb += overflow_ps.i.eq(overflow)
+
+        # Ring Buffer ------------------------------------------------------------------------------
+
+        frame_words = Signal(32 - shift)
+        slot_words  = Signal(32 - shift)
+        base_words  = Signal(32 - shift)
+        self.comb += [
+            frame_words.eq(self.frame_size.storage[shift:]),
+            slot_words.eq(self.slot_size.storage[shift:]),
+            base_words.eq(self.base.storage[shift:]),
+        ]
+        level   = Signal(bits_for(slots))
+        wr_slot = Signal(bits_for(slots))
+        wr_addr = Signal(32 - shift)
+        rd_slot = Signal(bits_for(slots))
+        rd_addr = Signal(32 - shift)
+        commit  = Signal()
+        release = Signal()
+        self.sync += [
+            level.eq(level + commit - release),
+            If(commit,
+                wr_slot.eq(wr_slot + 1),
+                wr_addr.eq(wr_addr + slot_words),
+                If(wr_slot == (self.slots.storage - 1),
+                    wr_slot.eq(0),
+                    wr_addr.eq(base_words),
+                )
+            ),
+            If(release,
+                rd_slot.eq(rd_slot + 1),
+                rd_addr.eq(rd_addr + slot_words),
+                If(rd_slot == (self.slots.storage - 1),
+                    rd_slot.eq(0),
+                    rd_addr.eq(base_words),
+                )
+            ),
+            If(~enable,
+                level.eq(0),
+                wr_slot.eq(0),
+                wr_addr.eq(base_words),
+                rd_slot.eq(0),
+                rd_addr.eq(base_words),
+            )
+        ]
+        self.comb += self.level.status.eq(level)
+
+        # Writer -----------------------------------------------------------------------------------
+
+        self.writer = writer = LiteDRAMDMAWriter(wr_port, fifo_depth=16)
+        count   = Signal(32 - shift)
+        ovf     = Signal()
+        start   = Signal()
+        drop_ev = Signal()
+        ovf_ev  = Signal()
+        err_ev  = Signal()
+        self.wr_fsm = wr_fsm = ResetInserter()(FSM(reset_state="IDLE"))
+        self.comb += wr_fsm.reset.eq(~enable)
+        wr_fsm.act("IDLE",
+            # Wait frame start (discard words until then).
+            cdc.source.ready.eq(1),
+            If(cdc.source.valid & cdc.source.first,
+                cdc.source.ready.eq(0),
+                NextValue(count, 0),
+                If(level == self.slots.storage,
+                    drop_ev.eq(1),
+                    NextState("DROP")
+                ).Else(
+                    start.eq(1),
+                    NextState("WRITE")
+                )
+            )
+        )
+        wr_fsm.act("DROP",
+            cdc.source.ready.eq(1),
+            If(cdc.source.valid & cdc.source.first & (count != 0),
+                cdc.source.ready.eq(0),
+                NextState("IDLE")
+            ),
+            If(cdc.source.valid,
+                NextValue(count, 1)
+            )
+        )
+        wr_fsm.act("WRITE",
+            If(cdc.source.valid & cdc.source.first & (count != 0),
+                # Next frame start: end of the current frame.
+                NextState("END")
+            ).Elif(count < frame_words,
+                writer.sink.valid.eq(cdc.source.valid),
+                writer.sink.address.eq(wr_addr + count),
+                writer.sink.data.eq(cdc.source.data),
+                cdc.source.ready.eq(writer.sink.ready),
+                If(cdc.source.valid & writer.sink.ready,
+                    NextValue(count, count + 1)
+                )
+            ).Else(
+                # Frame larger than frame_size.
+                cdc.source.ready.eq(1),
+                If(cdc.source.valid,
+                    NextValue(count, frame_words + 1)
+                )
+            )
+        )
+        wr_fsm.act("END",
+            If(ovf,
+                ovf_ev.eq(1)
+            ).Elif(count != frame_words,
+                err_ev.eq(1)
+            ).Else(
+                commit.eq(1)
+            ),
+            NextState("IDLE")
+        )
+        self.sync += [
+            If(overflow_ps.o, ovf.eq(1)),
+            If(start,         ovf.eq(0)),
+        ]
+
+        # Reader -----------------------------------------------------------------------------------
+
+        self.reader = reader = LiteDRAMDMAReader(rd_port, fifo_depth=fifo_depth)
+        rd_count = Signal(32 - shift)
+        self.comb += reader.enable.eq(enable) # Flushes pending reads when disabled.
+        self.rd_fsm = rd_fsm = ResetInserter()(FSM(reset_state="IDLE"))
+        self.comb += rd_fsm.reset.eq(~enable)
+        rd_fsm.act("IDLE",
+            NextValue(rd_count, 0),
+            If(level != 0,
+                NextState("READ")
+            )
+        )
+        rd_fsm.act("READ",
+            reader.sink.valid.eq(1),
+            reader.sink.address.eq(rd_addr + rd_count),
+            reader.sink.last.eq(rd_count == (frame_words - 1)),
+            If(reader.sink.ready,
+                NextValue(rd_count, rd_count + 1),
+                If(reader.sink.last,
+                    NextState("WAIT")
+                )
+            )
+        )
+        rd_fsm.act("WAIT",
+            If(release,
+                NextState("IDLE")
+            )
+        )
+
+        # Output (last on the last word of each frame).
+        self.converter = converter = ResetInserter()(stream.Converter(dw, data_width))
+        self.comb += [
+            converter.reset.eq(~enable),
+            reader.source.connect(converter.sink, omit={"valid", "ready"}),
+            converter.sink.valid.eq(reader.source.valid & enable),
+            reader.source.ready.eq(converter.sink.ready & enable),
+            release.eq(converter.sink.valid & converter.sink.ready & converter.sink.last),
+            converter.source.connect(source),
+        ]
+
+        # Counters ---------------------------------------------------------------------------------
+
+        for event, counter in [
+            (commit,  self.captured.status),
+            (drop_ev, self.dropped.status),
+            (ovf_ev,  self.overflows.status),
+            (err_ev,  self.errors.status),
+            (release, self.sent.status),
+            ]:
+            self.sync += [
+                If(event, counter.eq(counter + 1)),
+                If(~enable, counter.eq(0)),
+            ]
+
+# Video Capture Integration ------------------------------------------------------------------------
+
+def add_video_capture(soc, name="video_capture", phy=None, timings="1920x1080@60Hz", clock_domain="sys",
+    slots      = 4,
+    origin     = 0x48000000,
+    data_width = None,
+    fifo_depth = 64):
+    # Frame slots (sized for timings, aligned on 4KB) in main RAM.
+    vt         = video_timings[timings] if isinstance(timings, str) else timings
+    frame_size = vt["h_active"]*vt["v_active"]*4
+    slot_size  = (frame_size + 0xfff) & ~0xfff
+    base = soc.mem_map.get(name, None)
+    if base is None:
+        soc.bus.add_region(name, SoCRegion(
+            origin = origin,
+            size   = slots*slot_size,
+            linker = True)
+        )
+        base = soc.bus.regions[name].origin
+
+    # Frame slots are accessed through native DRAM ports: convert to a DRAM address (main_ram origin
+    # is DRAM address 0).
+    main_ram = soc.bus.regions["main_ram"]
+    assert main_ram.origin <= base
+    assert (base + slots*slot_size) <= (main_ram.origin + main_ram.size), f"{name} frame slots do not fit in main_ram."
+
+    # Video Capture.
+    capture = VideoCapture(
+        wr_port      = soc.sdram.crossbar.get_port(mode="write"),
+        rd_port      = soc.sdram.crossbar.get_port(mode="read"),
+        base         = base - main_ram.origin,
+        slot_size    = slot_size,
+        frame_size   = frame_size,
+        slots        = slots,
+        clock_domain = clock_domain,
+        data_width   = data_width,
+        fifo_depth   = fifo_depth,
+    )
+    soc.add_module(name=name, module=capture)
+
+    # Source: Video PHY or Test Pattern (Color Bars).
+    if phy is None:
+        vtg = VideoTimingGenerator(default_video_timings=timings)
+        vtg = ClockDomainsRenamer(clock_domain)(vtg)
+        soc.add_module(name=f"{name}_vtg", module=vtg)
+        colorbars = ClockDomainsRenamer(clock_domain)(ColorBarsPattern())
+        soc.add_module(name=f"{name}_colorbars", module=colorbars)
+        soc.comb += [
+            vtg.source.connect(colorbars.vtg_sink),
+            colorbars.source.connect(capture.sink),
+        ]
+    else:
+        soc.comb += (phy if isinstance(phy, stream.Endpoint) else phy.source).connect(capture.sink)
+
+    # Constants.
+    soc.add_constant(f"{name.upper()}_BASE",      base)
+    soc.add_constant(f"{name.upper()}_SLOT_SIZE", slot_size)
+    soc.add_constant(f"{name.upper()}_SLOTS",     slots)
+    return capture
+
+# Software -----------------------------------------------------------------------------------------
+
+_capture_c = """/* SPDX-License-Identifier: BSD-2-Clause
+ *
+ * LitePCIe Video Capture (generated by LiteX-Boards).
+ *
+ */
+
+#include <stdlib.h>
+#include <stdio.h>
+#include <string.h>
+#include <inttypes.h>
+#include <unistd.h>
+#include <signal.h>
+#include "liblitepcie.h"
+#include "litepcie_csr.h"
+#include "soc.h"
+
+#define CAPTURE(reg)      CSR_{capture}_##reg
+#define TIMEOUT_MS        5000
+
+static char litepcie_device[1024];
+static volatile int keep_running = 1;
+
+static void intHandler(int dummy) {{
+    keep_running = 0;
+}}
+
+/* CSR helpers */
+/*-------------*/
+
+#define CAPTURE_WRITE(reg, value) csr_write(fd, CAPTURE(reg##_ADDR), CAPTURE(reg##_SIZE), value)
+#define CAPTURE_READ(reg)         csr_read(fd,  CAPTURE(reg##_ADDR), CAPTURE(reg##_SIZE))
+
+static void print_counters(int fd)
+{{
+    printf("captured: %8" PRIu64 " dropped: %8" PRIu64 " overflows: %8" PRIu64 " errors: %8" PRIu64 " sent: %8" PRIu64 "\\n",
+        CAPTURE_READ(CAPTURED),
+        CAPTURE_READ(DROPPED),
+        CAPTURE_READ(OVERFLOWS),
+        CAPTURE_READ(ERRORS),
+        CAPTURE_READ(SENT));
+}}
+
+/* Capture */
+/*---------*/
+
+static int capture(const char *filename, uint64_t nframes, uint64_t frame_size)
+{{
+    static struct litepcie_dma_ctrl dma = {{.use_reader = 0, .use_writer = 1, .loopback = 0}};
+    FILE *fo = NULL;
+    char *frame, *buf;
+    uint64_t frame_offset = 0;
+    uint64_t frames = 0, last_frames = 0;
+    int64_t last_time, end_time;
+    int fd;
+    int ret = 0;
+
+    if (litepcie_dma_init(&dma, litepcie_device, 0))
+        exit(1);
+    fd = dma.fds.fd;
+
+    /* Frame size (from the measured resolution when not specified). */
+    CAPTURE_WRITE(ENABLE, 0);
+    if (frame_size == 0) {{
+        uint64_t hres = CAPTURE_READ(HRES);
+        uint64_t vres = CAPTURE_READ(VRES);
+        if ((hres == 0) || (vres == 0)) {{
+            fprintf(stderr, "No video source.\\n");
+            exit(1);
+        }}
+        printf("Source: %" PRIu64 "x%" PRIu64 "\\n", hres, vres);
+        frame_size = hres*vres*4;
+    }}
+    if (frame_size > CAPTURE_READ(SLOT_SIZE)) {{
+        fprintf(stderr, "Frame size larger than slot size.\\n");
+        exit(1);
+    }}
+    CAPTURE_WRITE(FRAME_SIZE, frame_size);
+    frame = malloc(frame_size);
+    if (!frame)
+        exit(1);
+    if (filename) {{
+        fo = fopen(filename, "wb");
+        if (!fo) {{
+            perror(filename);
+            exit(1);
+        }}
+    }}
+
+    /* Start receiving buffers, then the capture (frames start on buffer boundaries). */
+    dma.writer_enable = 1;
+    litepcie_dma_process(&dma);
+    CAPTURE_WRITE(ENABLE, 1);
+
+    /* Receive frames. */
+    last_time = get_time_ms();
+    end_time  = last_time + TIMEOUT_MS;
+    while (keep_running && ((nframes == 0) || (frames < nframes))) {{
+        litepcie_dma_process(&dma);
+        if ((dma.writer_hw_count - dma.writer_sw_count) > DMA_BUFFER_COUNT) {{
+            fprintf(stderr, "DMA buffers overrun (frame alignment lost).\\n");
+            ret = -1;
+            break;
+        }}
+        while ((buf = litepcie_dma_next_read_buffer(&dma)) != NULL) {{
+            uint64_t offset = 0;
+            while (offset < DMA_BUFFER_SIZE) {{
+                uint64_t n = frame_size - frame_offset;
+                if (n > DMA_BUFFER_SIZE - offset)
+                    n = DMA_BUFFER_SIZE - offset;
+                memcpy(frame + frame_offset, buf + offset, n);
+                frame_offset += n;
+                offset       += n;
+                if (frame_offset == frame_size) {{
+                    if (fo && ((nframes == 0) || (frames < nframes)))
+                        fwrite(frame, 1, frame_size, fo);
+                    frame_offset = 0;
+                    frames++;
+                    end_time = get_time_ms() + TIMEOUT_MS;
+                }}
+            }}
+        }}
+        if (get_time_ms() > end_time) {{
+            fprintf(stderr, "Timeout.\\n");
+            ret = -1;
+            break;
+        }}
+        if (get_time_ms() - last_time > 1000) {{
+            printf("%6.2f fps, ", (double)(frames - last_frames) * 1000 / (get_time_ms() - last_time));
+            print_counters(fd);
+            last_frames = frames;
+            last_time   = get_time_ms();
+        }}
+    }}
+
+    /* Stop. */
+    CAPTURE_WRITE(ENABLE, 0);
+    dma.writer_enable = 0;
+    litepcie_dma_process(&dma);
+    printf("%" PRIu64 " frames received, ", frames);
+    print_counters(fd);
+
+    if (fo)
+        fclose(fo);
+    free(frame);
+    litepcie_dma_cleanup(&dma);
+    return ret;
+}}
+
+/* Main */
+/*------*/
+
+static void help(void)
+{{
+    printf("LitePCIe Video Capture (frames are recorded in RGBX format).\\n"
+           "usage: litepcie_video_capture [options]\\n"
+           "\\n"
+           "options:\\n"
+           "-h                                Help.\\n"
+           "-c device_num                     Select the device (default = 0).\\n"
+           "-n frames                         Number of frames (default = 0: until interrupted).\\n"
+           "-o filename                       Record frames to file.\\n"
+           "-f frame_size                     Frame size (in bytes, default = measured resolution).\\n"
+           );
+    exit(1);
+}}
+
+int main(int argc, char **argv)
+{{
+    int c;
+    int device_num = 0;
+    uint64_t nframes = 0;
+    uint64_t frame_size = 0;
+    const char *filename = NULL;
+
+    signal(SIGINT, intHandler);
+
+    for (;;) {{
+        c = getopt(argc, argv, "hc:n:o:f:");
+        if (c == -1)
+            break;
+        switch (c) {{
+        case 'c':
+            device_num = atoi(optarg);
+            break;
+        case 'n':
+            nframes = strtoull(optarg, NULL, 0);
+            break;
+        case 'o':
+            filename = optarg;
+            break;
+        case 'f':
+            frame_size = strtoull(optarg, NULL, 0);
+            break;
+        default:
+            help();
+        }}
+    }}
+    snprintf(litepcie_device, sizeof(litepcie_device), "/dev/litepcie%d", device_num);
+
+    return capture(filename, nframes, frame_size) ? 1 : 0;
+}}
+"""
+
+def generate_video_capture_software(soc, dst, name="video_capture"):
+    # Add litepcie_video_capture to the user-space tools of a generated LitePCIe driver (dst).
+    add_litepcie_program(dst, "litepcie_video_capture", _capture_c.format(capture=name.upper()))
@@ -0,0 +1,253 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Double-Buffered Video FrameBuffer.
+#
+# Gateware: VideoFrameBufferDoubleBuffered is LiteX's VideoFrameBuffer (pixel formats, clock domain
+# crossing and timing generator synchronization are reused) with its Video DMA replaced by
+# VideoFrameBufferDMA (compatible dma_base/dma_length/dma_enable CSRs), adding:
+# - Page flipping: two pages (dma_base/dma_base1), the page to display (dma_page) is applied at the
+#   start of the next frame and the displayed page/number of frames are reported, so firmware can
+#   draw to the back page and flip without tearing.
+# - Burst reads: DRAM reads are issued in bursts of burst_length consecutive native words, only
+#   when the FIFO has room for a full burst, on a dedicated native-width crossbar port. Long bursts
+#   of row hits leave the DRAM to the other ports between bursts instead of interleaving single
+#   reads (the LiteDRAM crossbar has no priorities: deep FIFO + bursts are used instead).
+# - Underflow monitoring: frames with at least one underflow (missing pixel while DE) are counted.
+#
+# add_video_framebuffer mirrors SoC.add_video_framebuffer and reserves the two pages.
+#
+# Usage:
+#   ./digilent_nexys_video.py --with-video-framebuffer --video-double-buffered --build
+#   (firmware: draw to VIDEO_FRAMEBUFFER_BASE1, video_framebuffer_dma_page_write(1) then wait for
+#   video_framebuffer_dma_page_current_read() == 1)
+
+from contextlib import contextmanager
+
+from migen import *
+from migen.genlib.cdc import PulseSynchronizer
+
+from litex.gen import *
+
+from litex.soc.interconnect import stream
+from litex.soc.interconnect.csr import *
+from litex.soc.integration.soc import SoCRegion
+from litex.soc.cores.video import VideoTimingGenerator, VideoFrameBuffer
+
+from litedram.frontend.dma import LiteDRAMDMAReader
+
+# Helpers ------------------------------------------------------------------------------------------
+
+KILOBYTE = 1024
+
+# Same depths as VideoFrameBuffer (needed before creating it, to size the pages).
+_formats_depth = {
+    "rgb888" : 32,
+    "rgb565" : 16,
+    "rgb332" : 8,
+    "mono8"  : 8,
+    "mono1"  : 1,
+}
+
+@contextmanager
+def _video_dma_reader(dma_reader):
+    # VideoFrameBuffer creates its Video DMA with litedram.frontend.dma.LiteDRAMDMAReader (imported
+    # on creation): replace it while the VideoFrameBuffer is created.
+    import litedram.frontend.dma
+    reader = litedram.frontend.dma.LiteDRAMDMAReader
+    litedram.frontend.dma.LiteDRAMDMAReader = dma_reader
+    try:
+        yield
+    finally:
+        litedram.frontend.dma.LiteDRAMDMAReader = reader
+
+def _timings_res(timings):
+    timings = timings if isinstance(timings, str) else timings[0]
+    hres = int(timings.split("@")[0].split("x")[0])
+    vres = int(timings.split("@")[0].split("x")[1])
+    return hres, vres
+
+# Video FrameBuffer DMA ----------------------------------------------------------------------------
+
+class VideoFrameBufferDMA(LiteXModule):
+    def __init__(self, port, base, base1, length, fifo_depth=128*KILOBYTE, burst_length=64):
+        fifo_words = fifo_depth//(port.data_width//8)
+        assert burst_length <= fifo_words//2
+        self.source = stream.Endpoint([("data", port.data_width)])
+
+        self.base         = CSRStorage(32, reset=base,   description="Page 0 base address (bytes).")
+        self.base1        = CSRStorage(32, reset=base1,  description="Page 1 base address (bytes).")
+        self.length       = CSRStorage(32, reset=length, description="Frame length (bytes).")
+        self.enable       = CSRStorage(description="Enable (0: stops and resets DMA).")
+        self.page         = CSRStorage(description="Page to display (applied at the start of the next frame).")
+        self.page_current = CSRStatus(description="Displayed page.")
+        self.frames       = CSRStatus(32, description="Frames read.")
+
+        # # #
+
+        # DRAM Reader.
+        self.reader = reader = LiteDRAMDMAReader(port, fifo_depth=fifo_words, fifo_buffered=True)
+        self.comb += reader.enable.eq(self.enable.storage)
+        self.comb += reader.source.connect(self.source)
+
+        # FIFO level (issued reads not yet consumed).
+        level    = Signal(max=fifo_words + 1)
+        issued   = Signal()
+        consumed = Signal()
+        self.comb += issued.eq(reader.sink.valid & reader.sink.ready)
+        self.comb += consumed.eq(self.source.valid & self.source.ready & (level != 0))
+        self.sync += [
+            If(~self.enable.storage,
+                level.eq(0)
+            ).Else(
+                level.eq(level + issued - consumed)
+            )
+        ]
+
+        # Address generation (bursts, page flip at frame start).
+        shift  = log2_int(port.data_width//8)
+        base   = Signal(port.address_width)
+        offset = Signal(port.address_width)
+        length = Signal(port.address_width)
+        burst  = Signal(max=burst_length + 1)
+        self.comb += length.eq(self.length.storage[shift:])
+
+        self.fsm = fsm = ResetInserter()(FSM(reset_state="IDLE"))
+        self.comb += fsm.reset.eq(~self.enable.storage)
+        fsm.act("IDLE",
+            NextValue(offset, 0),
+            NextValue(burst,  0),
+            NextValue(base, Mux(self.page.storage, self.base1.storage[shift:], self.base.storage[shift:])),
+            NextValue(self.page_current.status, self.page.storage),
+            NextState("RUN")
+        )
+        fsm.act("RUN",
+            reader.sink.valid.eq(burst != 0),
+            reader.sink.last.eq(offset == (length - 1)),
+            reader.sink.address.eq(base + offset),
+            If(burst == 0,
+                If(level <= (fifo_words - burst_length),
+                    NextValue(burst, burst_length)
+                )
+            ).Elif(reader.sink.ready,
+                NextValue(offset, offset + 1),
+                NextValue(burst,  burst - 1),
+                If(reader.sink.last,
+                    NextValue(self.frames.status, self.frames.status + 1),
+                    NextState("IDLE")
+                )
+            )
+        )
+
+    def add_csr(self, default_base, default_length, default_enable=0, default_loop=1):
+        # Called by VideoFrameBuffer: CSRs are created with the DMA (always looping on the pages).
+        assert default_base   == self.base.storage.reset.value
+        assert default_length == self.length.storage.reset.value
+
+# Video FrameBuffer Double-Buffered ----------------------------------------------------------------
+
+class VideoFrameBufferDoubleBuffered(VideoFrameBuffer):
+    def __init__(self, dram_port, hres=800, vres=600, base=0x00000000, base1=None,
+        fifo_depth            = 128*KILOBYTE,
+        burst_length          = 64,
+        clock_domain          = "sys",
+        clock_faster_than_sys = False,
+        format                = "rgb888"):
+        self.underflows = CSRStatus(32, description="Frames with underflow(s).")
+
+        # # #
+
+        # Video FrameBuffer (LiteX's pipeline, with VideoFrameBufferDMA as Video DMA).
+        length = hres*vres*_formats_depth[format]//8
+        def dma_reader(port, fifo_depth, fifo_buffered):
+            return VideoFrameBufferDMA(port,
+                base         = base,
+                base1        = base + length if base1 is None else base1,
+                length       = length,
+                fifo_depth   = fifo_depth*(port.data_width//8),
+                burst_length = burst_length,
+            )
+        with _video_dma_reader(dma_reader):
+            VideoFrameBuffer.__init__(self, dram_port,
+                hres                  = hres,
+                vres                  = vres,
+                base                  = base,
+                fifo_depth            = fifo_depth,
+                clock_domain          = clock_domain,
+                clock_faster_than_sys = clock_faster_than_sys,
+                format                = format,
+            )
+
+        # Underflow monitoring (per frame, in Video clock domain, counted in sys clock domain).
+        # Video data is only forwarded (and source.de set) while the VideoFrameBuffer is in sync.
+        vtg_sink = self.vtg_sink
+        source   = self.source
+        frame_underflow = Signal()
+        self.underflow_ps = underflow_ps = PulseSynchronizer(clock_domain, "sys")
+        sync_video = getattr(self.sync, clock_domain)
+        sync_video += [
+            underflow_ps.i.eq(0),
+            If(vtg_sink.valid & source.de & ~source.valid,
+                frame_underflow.eq(1)
+            ),
+            If(vtg_sink.valid & vtg_sink.ready & vtg_sink.last,
+                underflow_ps.i.eq(frame_underflow),
+                frame_underflow.eq(0)
+            )
+        ]
+        self.sync += If(underflow_ps.o, self.underflows.status.eq(self.underflows.status + 1))
+
+# Add Video FrameBuffer ----------------------------------------------------------------------------
+
+def add_video_framebuffer(soc, name="video_framebuffer", phy=None, timings="800x600@60Hz", clock_domain="sys",
+    format       = "rgb888",
+    fifo_depth   = 128*KILOBYTE,
+    burst_length = 64,
+    max_timings  = None):
+    # Video Timing Generator.
+    vtg = VideoTimingGenerator(default_video_timings=timings if isinstance(timings, str) else timings[1])
+    vtg = ClockDomainsRenamer(clock_domain)(vtg)
+    soc.add_module(name=f"{name}_vtg", module=vtg)
+
+    # Pages (sized for the largest timings when switched at run-time, aligned on 4KB).
+    hres, vres = _timings_res(timings)
+    max_hres, max_vres = _timings_res(timings if max_timings is None else max_timings)
+    page_size = (max_hres*max_vres*_formats_depth[format]//8 + 0xfff) & ~0xfff
+
+    # Video FrameBuffer.
+    base = soc.mem_map.get(name, None)
+    if base is None:
+        soc.bus.add_region(name, SoCRegion(
+            origin = 0x40c00000,
+            size   = 2*page_size,
+            linker = True)
+        )
+        base = soc.bus.regions[name].origin
+    vfb = VideoFrameBufferDoubleBuffered(soc.sdram.crossbar.get_port(),
+        hres                  = hres,
+        vres                  = vres,
+        base                  = base,
+        base1                 = base + page_size,
+        fifo_depth            = fifo_depth,
+        burst_length          = burst_length,
+        format                = format,
+        clock_domain          = clock_domain,
+        clock_faster_than_sys = vtg.video_timings["pix_clk"] >= soc.sys_clk_freq,
+    )
+    soc.add_module(name=name, module=vfb)
+
+    # Connect Video Timing Generator to Video FrameBuffer.
+    soc.comb += vtg.source.connect(vfb.vtg_sink)
+
+    # Connect Video FrameBuffer to Video PHY.
+    soc.comb += vfb.source.connect(phy if isinstance(phy, stream.Endpoint) else phy.sink)
+
+    # Constants.
+    soc.add_constant("VIDEO_FRAMEBUFFER_BASE",  base)
+    soc.add_constant("VIDEO_FRAMEBUFFER_BASE1", base + page_size)
+    soc.add_constant("VIDEO_FRAMEBUFFER_HRES",  hres)
+    soc.add_constant("VIDEO_FRAMEBUFFER_VRES",  vres)
+    soc.add_constant("VIDEO_FRAMEBUFFER_DEPTH", vfb.depth)
@@ -0,0 +1,354 @@
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2024 LiteX-Boards Developers
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Run-time Video Modes.
+#
+# Gateware: VideoS7MMCM is a 7-Series video MMCM (pixel clock on CLKOUT0, 5x pixel clock for the
+# HDMI serializers on CLKOUT1) with its DRP interface exposed over CSRs. The MMCM configurations
+# (CLKFBOUT_MULT/DIVCLK_DIVIDE/CLKOUT dividers) of a table of video modes are computed at build time
+# and encoded as DRP register writes (XAPP888, integer dividers, BANDWIDTH=LOW lock/filter settings
+# from Xilinx's video PHY driver). The Video Timing Generator and Video FrameBuffer DMA already have
+# run-time timings/length CSRs, so switching mode does not require a new bitstream.
+#
+# Software: generate_video_modes_header writes a video_modes.h header (modes table and a
+# video_mode_set function) for the firmware, next to the generated csr.h/soc.h.
+#
+# Only Xilinx 7-Series MMCMs are supported (LiteX does not expose reconfiguration of the other
+# families PLLs). Modes are limited by the BUFG frequency of the 5x pixel clock (up to 1080p30 on
+# -1 devices).
+#
+# Usage:
+#   ./digilent_nexys_video.py --with-video-framebuffer --with-video-modes --build --load
+#   (firmware: #include <generated/video_modes.h> then video_mode_set(VIDEO_MODE_1280X720_60HZ))
+
+import os
+
+from migen import *
+
+from litex.gen import *
+
+from litex.soc.interconnect.csr import *
+from litex.soc.cores.clock.xilinx_common import XilinxClocking
+from litex.soc.cores.clock.xilinx_s7 import S7MMCM
+from litex.soc.cores.clock.common import compute_config_log
+from litex.soc.cores.video import video_timings
+
+# Constants ----------------------------------------------------------------------------------------
+
+VIDEO_MODES = [
+    "640x480@60Hz",
+    "640x480@75Hz",
+    "800x600@60Hz",
+    "800x600@75Hz",
+    "1024x768@60Hz",
+    "1024x768@75Hz",
+    "1280x720@60Hz",
+    "1920x1080@30Hz",
+]
+
+# Helpers ------------------------------------------------------------------------------------------
+
+# MMCME2 DRP registers.
+_MMCM_POWER_REG     = 0x28
+_MMCM_CLKOUT0_REGS  = (0x08, 0x09)
+_MMCM_CLKOUT1_REGS  = (0x0a, 0x0b)
+_MMCM_CLKFBOUT_REGS = (0x14, 0x15)
+_MMCM_DIVCLK_REG    = 0x16
+_MMCM_LOCK_REGS     = (0x18, 0x19, 0x1a)
+_MMCM_FILTER_REGS   = (0x4e, 0x4f)
+
+def _mmcm_divider(divide):
+    # High/Low times, Edge and No-Count of a 50% duty cycle integer divider.
+    if divide == 1:
+        return 1, 1, 0, 1
+    high = divide//2
+    low  = divide - high
+    return high, low, divide%2, 0
+
+def _mmcm_clk_regs(divide):
+    high, low, edge, no_count = _mmcm_divider(divide)
+    reg1 = (1 << 12) | (high << 6) | low # Phase Mux = 0.
+    reg2 = (edge << 7) | (no_count << 6) # Delay = 0, no fractional divide.
+    return reg1, reg2
+
+def _mmcm_divclk_reg(divide):
+    high, low, edge, no_count = _mmcm_divider(divide)
+    return (edge << 13) | (no_count << 12) | (high << 6) | low
+
+def _mmcm_lock_regs(mult):
+    lock1 = {
+         1: 0x01e8,  2: 0x01e8,  3: 0x01e8,  4: 0x01e8,  5: 0x01e8,
+         6: 0x01e8,  7: 0x01e8,  8: 0x01e8,  9: 0x01e8, 10: 0x01e8,
+        11: 0x0184, 12: 0x0139, 13: 0x01ee, 14: 0x01bc, 15: 0x018a,
+        16: 0x0171, 17: 0x013f, 18: 0x0126, 19: 0x010d, 20: 0x00f4,
+        21: 0x00db, 22: 0x00c2, 23: 0x00a9, 24: 0x0090, 25: 0x0090,
+        26: 0x0077, 27: 0x005e, 28: 0x005e, 29: 0x0045, 30: 0x0045,
+        31: 0x002c, 32: 0x002c, 33: 0x002c, 34: 0x0013, 35: 0x0013,
+        36: 0x0013,
+    }.get(mult, 0x00fa)
+    lock2 = {
+        1: 0x1801, 2: 0x1801, 3: 0x2001, 4: 0x2c01, 5: 0x3801,
+        6: 0x4401, 7: 0x4c01, 8: 0x5801, 9: 0x6401, 10: 0x7001,
+    }.get(mult, 0x7c01)
+    lock3 = {
+        1: 0x19e9, 2: 0x19e9, 3: 0x21e9, 4: 0x2de9, 5: 0x39e9,
+        6: 0x45e9, 7: 0x4de9, 8: 0x59e9, 9: 0x65e9, 10: 0x71e9,
+    }.get(mult, 0x7de9)
+    return lock1, lock2, lock3
+
+def _mmcm_filter_regs(mult):
+    # BANDWIDTH=LOW.
+    for mults, filter2 in [
+        (range( 1,  5), 0x9900),
+        (range( 5,  6), 0x1900),
+        (range( 6,  7), 0x8900),
+        (range( 7,  8), 0x9100),
+        (range( 8,  9), 0x0900),
+        (range( 9, 11), 0x1100),
+        (range(11, 12), 0x8100),
+        (range(12, 16), 0x9800),
+        (range(16, 19), 0x0100),
+        (range(19, 26), 0x1800),
+        (range(26, 31), 0x8800),
+        (range(31, 48), 0x9000),
+        ]:
+        if mult in mults:
+            return 0x0800, filter2
+    return 0x0800, 0x0800
+
+# Video S7MMCM -------------------------------------------------------------------------------------
+
+class VideoS7MMCM(S7MMCM):
+    # 5x pixel clock is distributed on a BUFG.
+    bufg_freq_max = {-1: 464e6, -2: 628e6, -3: 628e6}
+
+    def __init__(self, modes=VIDEO_MODES, speedgrade=-1, margin=1e-2):
+        S7MMCM.__init__(self, speedgrade=speedgrade)
+        self.modes      = modes
+        self.speedgrade = speedgrade
+        self.margin     = margin
+        self.expose_drp()
+        # Held during reconfiguration (drp_reset from expose_drp is a pulse and is not connected).
+        self.drp_reset = CSRStorage(description="MMCM reset (set during DRP writes).")
+
+    def compute_mode_config(self, mode):
+        pix_clk = video_timings[mode]["pix_clk"]
+        if 5*pix_clk > self.bufg_freq_max[self.speedgrade]:
+            raise ValueError(f"Video Mode {mode} not supported: 5x pixel clock ({5*pix_clk/1e6:3.2f}MHz) over BUFG max.")
+        (vco_freq_min, vco_freq_max) = self.vco_freq_range
+        best = None
+        for divclk_divide in range(*self.divclk_divide_range):
+            if self.clkin_freq/divclk_divide < 10e6:
+                break
+            for clkfbout_mult in reversed(range(2, 64+1)):
+                vco_freq = self.clkin_freq*clkfbout_mult/divclk_divide
+                if vco_freq < vco_freq_min or vco_freq > vco_freq_max:
+                    continue
+                # CLKOUT1 (5x pixel clock) divider, CLKOUT0 (pixel clock) = 5x CLKOUT1 divider.
+                for clkout_divide in range(1, 128//5 + 1):
+                    error = abs(vco_freq/(5*clkout_divide) - pix_clk)/pix_clk
+                    if best is None or error < best[0]:
+                        best = (error, divclk_divide, clkfbout_mult, clkout_divide, vco_freq)
+        if best is None or best[0] > self.margin:
+            raise ValueError(f"No MMCM config found for Video Mode {mode}.")
+        error, divclk_divide, clkfbout_mult, clkout_divide, vco_freq = best
+        return {
+            "divclk_divide"  : divclk_divide,
+            "clkout0_freq"   : vco_freq/(5*clkout_divide),
+            "clkout0_divide" : 5*clkout_divide,
+            "clkout0_phase"  : 0,
+            "clkout1_freq"   : vco_freq/clkout_divide,
+            "clkout1_divide" : clkout_divide,
+            "clkout1_phase"  : 0,
+            "vco"            : vco_freq,
+            "clkfbout_mult"  : clkfbout_mult,
+        }
+
+    def compute_mode_drp(self, mode):
+        # DRP (address, value) writes of the mode's MMCM configuration.
+        config = self.compute_mode_config(mode)
+        writes = [(_MMCM_POWER_REG, 0xffff)]
+        writes += zip(_MMCM_CLKFBOUT_REGS, _mmcm_clk_regs(config["clkfbout_mult"]))
+        writes += [(_MMCM_DIVCLK_REG, _mmcm_divclk_reg(config["divclk_divide"]))]
+        writes += zip(_MMCM_CLKOUT0_REGS, _mmcm_clk_regs(config["clkout0_divide"]))
+        writes += zip(_MMCM_CLKOUT1_REGS, _mmcm_clk_regs(config["clkout1_divide"]))
+        writes += zip(_MMCM_LOCK_REGS,    _mmcm_lock_regs(config["clkfbout_mult"]))
+        writes += zip(_MMCM_FILTER_REGS,  _mmcm_filter_regs(config["clkfbout_mult"]))
+        return writes
+
+    def default_mode(self):
+        # Mode of the pixel clock requested with create_clkout (initial configuration).
+        pix_clk = self.clkouts[0][1]
+        for mode in self.modes:
+            if abs(video_timings[mode]["pix_clk"] - pix_clk) <= pix_clk*self.margin:
+                return mode
+        raise ValueError(f"Pixel clock {pix_clk/1e6:3.2f}MHz not in Video Modes.")
+
+    def compute_config(self):
+        assert len(self.clkouts) == 2
+        assert self.clkouts[1][1] == 5*self.clkouts[0][1]
+        config = self.compute_mode_config(self.default_mode())
+        compute_config_log(self.logger, config)
+        return config
+
+    def do_finalize(self):
+        # Check all modes are reachable.
+        for mode in self.modes:
+            self.compute_mode_config(mode)
+        reset = Signal()
+        self.comb += reset.eq(self.reset | self.drp_reset.storage)
+        self.reset = reset
+        XilinxClocking.do_finalize(self)
+        config = self.compute_config()
+        mmcm_fb = Signal()
+        self.params.update(
+            # Global.
+            p_BANDWIDTH = "LOW", # Lock/Filter DRP settings.
+            i_RST       = self.reset,
+            i_PWRDWN    = self.power_down,
+            o_LOCKED    = self.locked,
+
+            # VCO.
+            p_REF_JITTER1     = 0.01,
+            p_CLKIN1_PERIOD   = 1e9/self.clkin_freq,
+            p_CLKFBOUT_MULT_F = config["clkfbout_mult"],
+            p_DIVCLK_DIVIDE   = config["divclk_divide"],
+            i_CLKIN1          = self.clkin,
+            i_CLKFBIN         = mmcm_fb,
+            o_CLKFBOUT        = mmcm_fb,
+
+            # Pixel / 5x Pixel clocks.
+            p_CLKOUT0_DIVIDE_F = config["clkout0_divide"],
+            p_CLKOUT0_PHASE    = 0,
+            o_CLKOUT0          = self.clkouts[0][0],
+            p_CLKOUT1_DIVIDE   = config["clkout1_divide"],
+            p_CLKOUT1_PHASE    = 0,
+            o_CLKOUT1          = self.clkouts[1][0],
+        )
+        self.specials += Instance("MMCME2_ADV", **self.params)
+
+# Software -----------------------------------------------------------------------------------------
+
+_video_modes_h = """/* SPDX-License-Identifier: BSD-2-Clause
+ *
+ * Run-time Video Modes (generated by LiteX-Boards).
+ *
+ */
+
+#ifndef __GENERATED_VIDEO_MODES_H
+#define __GENERATED_VIDEO_MODES_H
+
+#include <generated/csr.h>
+
+#define VIDEO_PLL(reg)         {pll}_##reg
+#define VIDEO_VTG(reg)         {framebuffer}_vtg_##reg
+#define VIDEO_DMA(reg)         {framebuffer}_dma_##reg
+#define VIDEO_MODE_DRP_WRITES  {drp_writes}
+#define VIDEO_MODES_COUNT      {count}
+#define VIDEO_MODE_DEFAULT     {default}
+
+{mode_defines}
+
+struct video_mode {{
+    const char *name;
+    unsigned int pix_clk;
+    unsigned short hres, hsync_start, hsync_end, hscan;
+    unsigned short vres, vsync_start, vsync_end, vscan;
+    unsigned int length; /* FrameBuffer DMA length (bytes). */
+    unsigned short drp[VIDEO_MODE_DRP_WRITES][2]; /* MMCM DRP (address, value) writes. */
+}};
+
+static const struct video_mode video_modes[VIDEO_MODES_COUNT] = {{
+{modes}
+}};
+
+static inline void video_pll_drp_write(unsigned short adr, unsigned short value)
+{{
+    VIDEO_PLL(drp_adr_write)(adr);
+    VIDEO_PLL(drp_dat_w_write)(value);
+    VIDEO_PLL(drp_write_write)(1);
+    while (!VIDEO_PLL(drp_drdy_read)());
+}}
+
+static inline int video_mode_set(int n)
+{{
+    const struct video_mode *m;
+    int i;
+
+    if (n < 0 || n >= VIDEO_MODES_COUNT)
+        return -1;
+    m = &video_modes[n];
+
+    /* Stop FrameBuffer DMA / Video Timing Generator. */
+    VIDEO_DMA(enable_write)(0);
+    VIDEO_VTG(enable_write)(0);
+
+    /* Reconfigure Video PLL (held in reset during DRP writes) and wait for lock. */
+    VIDEO_PLL(drp_reset_write)(1);
+    for (i = 0; i < VIDEO_MODE_DRP_WRITES; i++)
+        video_pll_drp_write(m->drp[i][0], m->drp[i][1]);
+    VIDEO_PLL(drp_reset_write)(0);
+    while (!VIDEO_PLL(drp_locked_read)());
+
+    /* Video Timings / FrameBuffer length. */
+    VIDEO_VTG(hres_write)(m->hres);
+    VIDEO_VTG(hsync_start_write)(m->hsync_start);
+    VIDEO_VTG(hsync_end_write)(m->hsync_end);
+    VIDEO_VTG(hscan_write)(m->hscan);
+    VIDEO_VTG(vres_write)(m->vres);
+    VIDEO_VTG(vsync_start_write)(m->vsync_start);
+    VIDEO_VTG(vsync_end_write)(m->vsync_end);
+    VIDEO_VTG(vscan_write)(m->vscan);
+    VIDEO_DMA(length_write)(m->length);
+
+    /* Restart. */
+    VIDEO_VTG(enable_write)(1);
+    VIDEO_DMA(enable_write)(1);
+
+    return 0;
+}}
+
+#endif
+"""
+
+def _video_mode_define(mode):
+    return "VIDEO_MODE_" + mode.upper().replace("@", "_")
+
+def generate_video_modes_header(soc, filename, pll="crg_video_pll", framebuffer="video_framebuffer"):
+    video_pll = soc.crg.video_pll
+    depth     = getattr(soc, framebuffer).depth
+    defines   = []
+    modes     = []
+    for n, mode in enumerate(video_pll.modes):
+        vt     = video_timings[mode]
+        drp    = video_pll.compute_mode_drp(mode)
+        config = video_pll.compute_mode_config(mode)
+        defines.append(f"#define {_video_mode_define(mode):<30} {n}")
+        modes.append("    {{\"{name}\", {pix_clk}, {hres}, {hsync_start}, {hsync_end}, {hscan}, {vres}, {vsync_start}, {vsync_end}, {vscan}, {length},\n        {{{drp}}}}},".format(
+            name        = mode,
+            pix_clk     = int(config["clkout0_freq"]),
+            hres        = vt["h_active"],
+            hsync_start = vt["h_active"] + vt["h_sync_offset"],
+            hsync_end   = vt["h_active"] + vt["h_sync_offset"] + vt["h_sync_width"],
+            hscan       = vt["h_active"] + vt["h_blanking"] - 1,
+            vres        = vt["v_active"],
+            vsync_start = vt["v_active"] + vt["v_sync_offset"],
+            vsync_end   = vt["v_active"] + vt["v_sync_offset"] + vt["v_sync_width"],
+            vscan       = vt["v_active"] + vt["v_blanking"] - 1,
+            length      = vt["h_active"]*vt["v_active"]*depth//8,
+            drp         = ", ".join(f"{{0x{adr:02x}, 0x{value:04x}}}" for adr, value in drp),
+        ))
+    os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
+    with open(filename, "w") as f:
+        f.write(_video_modes_h.format(
+            pll          = pll,
+            framebuffer  = framebuffer,
+            drp_writes   = len(drp),
+            count        = len(modes),
+            default      = _video_mode_define(video_pll.default_mode()),
+            mode_defines = "\n".join(defines),
+            modes        = "\n".join(modes),
+        ))
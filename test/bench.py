@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Targets benchmarks.
+#
+# imports: Import time of each target module (in a fresh interpreter, on top of the Migen/LiteX
+#          stack shared by all targets) and optional cores (litedram, liteeth, litepcie, ...) pulled
+#          in at import.
+#
+# elaborate: Import time, elaboration time (--build --no-compile), generated Verilog size and peak
+#            RSS of each target in several configurations (minimal, +DRAM, +Ethernet, +PCIe, when
+#            supported by the target). Results can be compared against a stored baseline with
+#            configurable regression thresholds (exit code is 1 on regression).
+#
+# Usage:
+#   python3 -m test.bench imports --json=imports.json
+#   python3 -m test.bench imports --compare=imports.json digilent_arty sqrl_xcu1525
+#   python3 -m test.bench elaborate --json=baseline.json
+#   python3 -m test.bench elaborate --compare=baseline.json --time-threshold=20 xilinx_vc707
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import subprocess
+import concurrent.futures
+
+from test import sweep
+
+# Helpers ------------------------------------------------------------------------------------------
+
+optional_cores = ["litedram", "liteeth", "litepcie", "litesata", "litesdcard", "litescope", "litespi", "liteiclink"]
+
+# Stack imported by all targets, loaded before measuring the target itself.
+common_modules = [
+    "migen",
+    "litex.gen",
+    "litex.soc.cores.clock",
+    "litex.soc.integration.soc_core",
+    "litex.soc.integration.builder",
+]
+
+def run_python(code, cwd=sweep.repo_dir):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([sweep.repo_dir] + [p for p in [env.get("PYTHONPATH")] if p])
+    proc = subprocess.run([sys.executable, "-c", code],
+        cwd    = cwd,
+        env    = env,
+        stdout = subprocess.PIPE,
+        stderr = subprocess.PIPE,
+        universal_newlines = True)
+    if proc.returncode != 0:
+        return None
+    return json.loads(proc.stdout.splitlines()[-1])
+
+# Imports ------------------------------------------------------------------------------------------
+
+import_code = """
+import sys
+import json
+import time
+{common}
+cores = set(m.split(".")[0] for m in sys.modules)
+start = time.perf_counter()
+import {module}
+duration = time.perf_counter() - start
+print(json.dumps({{
+    "import_time" : duration,
+    "cores"       : sorted(set(m.split(".")[0] for m in sys.modules if m.split(".")[0] in {cores!r}) - cores),
+}}))
+"""
+
+def bench_import(name, repeat=3):
+    code = import_code.format(
+        common = "\n".join(f"import {m}" for m in common_modules),
+        module = f"litex_boards.targets.{name}",
+        cores  = optional_cores)
+    results = [run_python(code) for _ in range(repeat)]
+    if None in results:
+        return {"name": name, "import_time": None, "cores": None}
+    return {
+        "name"        : name,
+        "import_time" : min(r["import_time"] for r in results),
+        "cores"       : results[0]["cores"],
+    }
+
+# Elaborate ----------------------------------------------------------------------------------------
+
+base_args = ["--cpu-type=vexriscv", "--cpu-variant=minimal", "--build", "--no-compile"]
+no_dram   = ["--integrated-main-ram-size=0x1000"]
+
+# Configurations: name -> (args, applicable(target source)).
+configs = {
+    "minimal"  : (no_dram,                       lambda src: True),
+    "dram"     : ([],                            lambda src: "add_sdram" in src),
+    "ethernet" : (no_dram + ["--with-ethernet"], lambda src: '"--with-ethernet"' in src),
+    "pcie"     : (no_dram + ["--with-pcie"],     lambda src: '"--with-pcie"' in src),
+}
+
+elaborate_code = """
+import sys
+import json
+import time
+import resource
+import importlib
+start  = time.perf_counter()
+module = importlib.import_module({module!r})
+import_time = time.perf_counter() - start
+sys.argv = [{module!r}] + {argv!r}
+start = time.perf_counter()
+module.main()
+elaborate_time = time.perf_counter() - start
+peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss*(1 if sys.platform == "darwin" else 1024)
+print(json.dumps({{
+    "import_time"    : import_time,
+    "elaborate_time" : elaborate_time,
+    "peak_rss"       : peak_rss,
+}}))
+"""
+
+def target_configs(name, selected=list(configs.keys())):
+    with open(os.path.join(sweep.targets_dir, name + ".py"), "r") as f:
+        src = f.read()
+    return [config for config in selected if configs[config][1](src)]
+
+def verilog_size(output_dir):
+    size = 0
+    for root, dirs, files in os.walk(os.path.join(output_dir, "gateware")):
+        size += sum(os.path.getsize(os.path.join(root, f)) for f in files if f.endswith((".v", ".sv")))
+    return size
+
+def bench_elaborate(name, config, output_dir="build/bench"):
+    board_dir = os.path.join(os.path.abspath(output_dir), config, name)
+    shutil.rmtree(board_dir, ignore_errors=True)
+    os.makedirs(board_dir)
+    code = elaborate_code.format(
+        module = f"litex_boards.targets.{name}",
+        argv   = base_args + configs[config][0] + ["--output-dir", board_dir])
+    r = run_python(code, cwd=board_dir)
+    result = {
+        "name"           : name,
+        "config"         : config,
+        "passed"         : r is not None,
+        "import_time"    : None,
+        "elaborate_time" : None,
+        "peak_rss"       : None,
+        "verilog_size"   : None,
+    }
+    if r is not None:
+        result.update(r)
+        result["verilog_size"] = verilog_size(board_dir)
+    return result
+
+# Regressions --------------------------------------------------------------------------------------
+
+def find_regressions(results, baseline, thresholds, min_time=0.1):
+    # Return (result, metric, value, baseline value) for metrics exceeding their threshold (in %).
+    # Time metrics also have to exceed min_time (in s) in absolute, to filter out noise.
+    baseline    = {(b["name"], b["config"]): b for b in baseline}
+    regressions = []
+    for r in results:
+        b = baseline.get((r["name"], r["config"]), None)
+        if b is None:
+            continue
+        if b["passed"] and not r["passed"]:
+            regressions.append((r, "passed", False, True))
+            continue
+        for metric, threshold in thresholds.items():
+            value, ref = r[metric], b[metric]
+            if value is None or ref is None or ref == 0:
+                continue
+            if metric.endswith("_time") and (value - ref) < min_time:
+                continue
+            if (value - ref)/ref*100 > threshold:
+                regressions.append((r, metric, value, ref))
+    return regressions
+
+# Reports ------------------------------------------------------------------------------------------
+
+def print_elaborate(results):
+    for r in results:
+        if not r["passed"]:
+            print(f"{r['name']:40s} {r['config']:10s} elaboration failed")
+            continue
+        print(f"{r['name']:40s} {r['config']:10s} "
+            f"import: {r['import_time']:6.2f}s "
+            f"elaborate: {r['elaborate_time']:6.2f}s "
+            f"verilog: {r['verilog_size']/1e3:8.1f}KB "
+            f"peak_rss: {r['peak_rss']/1e6:7.1f}MB")
+
+def print_regressions(regressions):
+    for r, metric, value, ref in regressions:
+        if metric == "passed":
+            print(f"REGRESSION {r['name']} {r['config']}: elaboration now fails.")
+        else:
+            print(f"REGRESSION {r['name']} {r['config']}: {metric} {ref:g} -> {value:g} ({(value - ref)/ref*100:+.1f}%).")
+
+def print_imports(results, baseline=None):
+    baseline = {r["name"]: r for r in (baseline or [])}
+    for r in results:
+        if r["import_time"] is None:
+            print(f"{r['name']:40s} import failed")
+            continue
+        line = f"{r['name']:40s} {r['import_time']*1e3:8.1f}ms {','.join(r['cores']) or '-':30s}"
+        b = baseline.get(r["name"], None)
+        if b is not None and b["import_time"] is not None:
+            delta = r["import_time"] - b["import_time"]
+            line += f" ({delta*1e3:+.1f}ms vs baseline, was {','.join(b['cores']) or '-'})"
+        print(line)
+    valid = [r for r in results if r["import_time"] is not None]
+    if valid:
+        total = sum(r["import_time"] for r in valid)
+        print(f"Total: {total:.3f}s for {len(valid)} targets.")
+        common = [r for r in valid if r["name"] in baseline and baseline[r["name"]]["import_time"] is not None]
+        if common:
+            before = sum(baseline[r["name"]]["import_time"] for r in common)
+            after  = sum(r["import_time"] for r in common)
+            print(f"Baseline: {before:.3f}s -> {after:.3f}s ({(after - before)/before*100:+.1f}%).")
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="LiteX-Boards targets benchmarks.")
+    parser.add_argument("bench",            choices=["imports", "elaborate"], help="Benchmark to run.")
+    parser.add_argument("names",            nargs="*",                        help="Restrict benchmark to these targets.")
+    parser.add_argument("--repeat",         default=3, type=int,              help="Number of runs per target (best is kept, imports only).")
+    parser.add_argument("--configs",        default=",".join(configs.keys()), help="Configurations to elaborate (comma separated).")
+    parser.add_argument("--jobs",           default=1, type=int,              help="Number of parallel jobs (elaborate only, >1 affects timings).")
+    parser.add_argument("--output-dir",     default="build/bench",            help="Base output directory (elaborate only).")
+    parser.add_argument("--json",           default=None,                     help="Write results to JSON file.")
+    parser.add_argument("--compare",        default=None,                     help="Compare results against a JSON baseline.")
+    parser.add_argument("--time-threshold", default=25, type=float,           help="Import/elaboration time regression threshold (in %%).")
+    parser.add_argument("--rss-threshold",  default=10, type=float,           help="Peak RSS regression threshold (in %%).")
+    parser.add_argument("--size-threshold", default=5,  type=float,           help="Verilog size regression threshold (in %%).")
+    parser.add_argument("--min-time",       default=0.1, type=float,          help="Minimal absolute time regression (in s).")
+    args = parser.parse_intermixed_args()
+
+    names    = args.names or sweep.collect_names(sweep.targets_dir, sweep.excluded_targets)
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r") as f:
+            baseline = json.load(f)
+
+    if args.bench == "imports":
+        results = [bench_import(name, repeat=args.repeat) for name in names]
+        print_imports(results, baseline)
+
+    if args.bench == "elaborate":
+        selected = args.configs.split(",")
+        for config in selected:
+            assert config in configs, f"Unknown configuration {config}."
+        runs = [(name, config) for name in names for config in target_configs(name, selected)]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            results = list(executor.map(lambda run: bench_elaborate(*run, output_dir=args.output_dir), runs))
+        print_elaborate(results)
+        if baseline is not None:
+            regressions = find_regressions(results, baseline,
+                thresholds = {
+                    "import_time"    : args.time_threshold,
+                    "elaborate_time" : args.time_threshold,
+                    "peak_rss"       : args.rss_threshold,
+                    "verilog_size"   : args.size_threshold,
+                },
+                min_time = args.min_time)
+            print_regressions(regressions)
+            if regressions:
+                if args.json:
+                    with open(args.json, "w") as f:
+                        json.dump(results, f, indent=4)
+                sys.exit(1)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=4)
+
+if __name__ == "__main__":
+    main()
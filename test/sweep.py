@@ -0,0 +1,624 @@
+#!/usr/bin/env python3
+
+#
+# This file is part of LiteX-Boards.
+#
+# Copyright (c) 2017-2021 Florent Kermarrec <florent@enjoy-digital.fr>
+# SPDX-License-Identifier: BSD-2-Clause
+
+# Parallel board sweep: elaborates platforms/targets concurrently, each one in its own process and
+# its own output directory, and reports per-board results as JUnit XML and/or JSON.
+#
+# A content-hash cache can be enabled (--cache-dir or LITEX_BOARDS_CACHE_DIR): results/outputs of
+# passing boards are stored under a key computed from the target/platform sources, the shared
+# litex_boards/*.py modules, the arguments and the installed LiteX stack versions, and are reused as
+# long as none of these change.
+#
+# A PLL/MMCM configuration cache can be enabled (--pll-cache-dir or LITEX_BOARDS_PLL_CACHE_DIR, see
+# litex_boards/pll_cache.py): the per-board cache hits are reported.
+#
+# The sweep can be split over several machines with --shard i/N (i in [1, N], or LITEX_BOARDS_SHARD):
+# when per-board durations from previous sweeps are available (--timings with JSON reports, or
+# LITEX_BOARDS_TIMINGS), shards are balanced by cost, otherwise boards are split by a deterministic
+# hash of their name.
+#
+# Two modes are available:
+# - fork (default on POSIX): the parent imports the Migen/LiteX/cores stack once and forks a
+#   worker per board that runs the target in-process, avoiding a cold interpreter start/import of
+#   the full stack for each board.
+# - subprocess: each board is run with "python3 -m litex_boards.targets.<name>".
+#
+# Usage:
+#   python3 -m test.sweep targets   --jobs=8 --junit=targets.xml
+#   python3 -m test.sweep platforms --json=platforms.json digilent_arty xilinx_kc705
+
+import os
+import sys
+import ast
+import time
+import json
+import runpy
+import shutil
+import hashlib
+import argparse
+import importlib
+import importlib.metadata
+import traceback
+import subprocess
+import concurrent.futures
+import xml.etree.ElementTree as ET
+
+# Paths --------------------------------------------------------------------------------------------
+
+repo_dir      = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+platforms_dir = os.path.join(repo_dir, "litex_boards", "platforms")
+targets_dir   = os.path.join(repo_dir, "litex_boards", "targets")
+
+# Exclusions ---------------------------------------------------------------------------------------
+
+excluded_platforms = [
+    "qmtech_daughterboard",              # Reason: Not a real platform.
+    "qmtech_rp2040_daughterboard",       # Reason: Not a real platform.
+    "enclustra_st1",                     # Readon: Not a real platform.
+    "quicklogic_quickfeather",           # Reason: No default clock.
+    "colognechip_gatemate_evb",          # Reason: Toolchain not yet mainlined.
+    "efinix_ti375_c529_dev_kit",         # Reason: Require Efinity toolchain.
+    "efinix_titanium_ti60_f225_dev_kit", # Reason: Require Efinity toolchain.
+    "efinix_trion_t120_bga576_dev_kit",  # Reason: Require Efinity toolchain.
+    "efinix_trion_t20_bga256_dev_kit",   # Reason: Require Efinity toolchain.
+    "efinix_trion_t20_mipi_dev_kit",     # Reason: Require Efinity toolchain.
+    "efinix_xyloni_dev_kit",             # Reason: Require Efinity toolchain.
+    "sipeed_tang_primer",                # Reason: Require Anlogic toolchain.
+    "jungle_electronics_fireant",        # Reason: Require Efinity toolchain.
+    "efinix_t8f81_dev_kit",              # Reason: Require Efinity toolchain.
+    "adi_plutosdr",                      # Reason: No default clock.
+    "newae_cw305",                       # Reason: No default clock.
+]
+
+excluded_targets = [
+    "simple",                            # Reason: Generic target.
+    "quicklogic_quickfeather",           # Reason: No default clock.
+    "colognechip_gatemate_evb",          # Reason: Toolchain not yet mainlined.
+    "efinix_ti375_c529_dev_kit",         # Reason: Require Efinity toolchain.
+    "efinix_titanium_ti60_f225_dev_kit", # Reason: Require Efinity toolchain.
+    "efinix_trion_t120_bga576_dev_kit",  # Reason: Require Efinity toolchain.
+    "efinix_trion_t20_bga256_dev_kit",   # Reason: Require Efinity toolchain.
+    "efinix_trion_t20_mipi_dev_kit",     # Reason: Require Efinity toolchain.
+    "efinix_xyloni_dev_kit",             # Reason: Require Efinity toolchain.
+    "sipeed_tang_primer",                # Reason: Require Anlogic toolchain.
+    "jungle_electronics_fireant",        # Reason: Require Efinity toolchain.
+    "efinix_t8f81_dev_kit",              # Reason: Require Efinity toolchain.
+]
+
+# Jobs ---------------------------------------------------------------------------------------------
+
+class BoardJob:
+    def __init__(self, kind, name, args):
+        assert kind in ["platform", "target"]
+        self.kind = kind
+        self.name = name
+        self.args = args
+
+    @property
+    def module(self):
+        if self.kind == "platform":
+            return "litex_boards.targets.simple"
+        return f"litex_boards.targets.{self.name}"
+
+    def argv(self, output_dir):
+        argv = []
+        if self.kind == "platform":
+            argv += [f"litex_boards.platforms.{self.name}"]
+        argv += self.args
+        argv += ["--output-dir", output_dir]
+        return argv
+
+    def command(self, output_dir):
+        return [sys.executable, "-m", self.module] + self.argv(output_dir)
+
+class BoardResult:
+    def __init__(self, kind, name, passed, duration, stderr="", output_dir=None, cached=False, pll_cache=None):
+        self.kind       = kind
+        self.name       = name
+        self.passed     = passed
+        self.duration   = duration
+        self.stderr     = stderr
+        self.output_dir = output_dir
+        self.cached     = cached
+        self.pll_cache  = pll_cache
+
+    def to_dict(self):
+        return {
+            "kind"       : self.kind,
+            "name"       : self.name,
+            "passed"     : self.passed,
+            "duration"   : self.duration,
+            "stderr"     : self.stderr,
+            "output_dir" : self.output_dir,
+            "cached"     : self.cached,
+            "pll_cache"  : self.pll_cache,
+        }
+
+def collect_names(directory, excluded=[]):
+    names = []
+    for file in sorted(os.listdir(directory)):
+        if file.endswith(".py"):
+            name = file.replace(".py", "")
+            if name not in ["__init__"] + excluded:
+                names.append(name)
+    return names
+
+# Build simple design for a platform.
+def platform_jobs(names=None):
+    names = collect_names(platforms_dir, excluded_platforms) if names is None else names
+    args  = ["--build", "--no-compile", "--uart-name=stub"]
+    return [BoardJob("platform", name, args) for name in names]
+
+# Build default configuration for a target.
+def target_jobs(names=None):
+    names = collect_names(targets_dir, excluded_targets) if names is None else names
+    args  = ["--cpu-type=vexriscv", "--cpu-variant=minimal", "--build", "--no-compile"]
+    return [BoardJob("target", name, args) for name in names]
+
+# Runner -------------------------------------------------------------------------------------------
+
+def job_output_dir(job, output_dir):
+    return os.path.join(os.path.abspath(output_dir), job.kind + "s", job.name)
+
+def prepare_output_dir(job, output_dir):
+    # Each board gets a private directory used as cwd/output-dir, so boards can run concurrently
+    # (and targets writing files to their cwd don't collide).
+    board_dir = job_output_dir(job, output_dir)
+    shutil.rmtree(board_dir, ignore_errors=True)
+    os.makedirs(board_dir)
+    return board_dir
+
+def read_stderr(board_dir, stderr_lines=50):
+    with open(os.path.join(board_dir, "sweep.err"), "r", errors="replace") as f:
+        return "\n".join(f.read().splitlines()[-stderr_lines:])
+
+def read_pll_cache(board_dir):
+    # PLL cache lookups of the board (without details), when the PLL cache is enabled.
+    filename = os.path.join(board_dir, "pll_cache.json")
+    if not os.path.exists(filename):
+        return None
+    with open(filename, "r") as f:
+        stats = json.load(f)
+    stats.pop("details", None)
+    return stats
+
+def run_job(job, output_dir, pll_cache_dir=None):
+    board_dir = prepare_output_dir(job, output_dir)
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([repo_dir] + [p for p in [env.get("PYTHONPATH")] if p])
+    command = job.command(board_dir)
+    if pll_cache_dir is not None:
+        # Run the target through the PLL cache runner.
+        command = [sys.executable, "-m", "litex_boards.pll_cache",
+            "--cache-dir", os.path.abspath(pll_cache_dir),
+            "--report",    os.path.join(board_dir, "pll_cache.json"),
+            job.module] + job.argv(board_dir)
+    start = time.time()
+    with open(os.path.join(board_dir, "sweep.log"), "w") as stdout:
+        with open(os.path.join(board_dir, "sweep.err"), "w") as stderr:
+            proc = subprocess.run(command,
+                cwd    = board_dir,
+                env    = env,
+                stdout = stdout,
+                stderr = stderr)
+    return BoardResult(
+        kind       = job.kind,
+        name       = job.name,
+        passed     = (proc.returncode == 0),
+        duration   = time.time() - start,
+        stderr     = read_stderr(board_dir),
+        output_dir = board_dir,
+        pll_cache  = read_pll_cache(board_dir),
+    )
+
+def default_jobs():
+    return int(os.environ.get("LITEX_BOARDS_JOBS", os.cpu_count() or 1))
+
+def default_mode():
+    return os.environ.get("LITEX_BOARDS_SWEEP_MODE", "fork" if hasattr(os, "fork") else "subprocess")
+
+def default_pll_cache_dir():
+    return os.environ.get("LITEX_BOARDS_PLL_CACHE_DIR", None)
+
+def run_jobs_subprocess(jobs, output_dir, njobs, pll_cache_dir=None):
+    with concurrent.futures.ThreadPoolExecutor(max_workers=njobs) as executor:
+        futures = [executor.submit(run_job, job, output_dir, pll_cache_dir) for job in jobs]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+# Fork Server --------------------------------------------------------------------------------------
+
+def job_filename(job):
+    return os.path.join(targets_dir, job.module.split(".")[-1] + ".py")
+
+# Cores imported lazily by the targets (in BaseSoC/main, for optional features) that are preloaded
+# for all jobs.
+preloaded_modules = [
+    "litex.build.parser",
+    "litedram.modules",
+    "litedram.phy",
+    "litedram.frontend.dma",
+    "liteeth.phy",
+    "liteeth.mac",
+    "liteeth.core",
+    "liteeth.frontend.etherbone",
+    "litepcie.core",
+    "litepcie.frontend.dma",
+    "litepcie.software",
+    "litesata.core",
+    "litespi",
+    "litesdcard",
+]
+
+def job_modules(job):
+    # Modules imported by the target (or simple target + platform), at top-level or lazily in
+    # functions/branches, found by AST scan.
+    modules  = ["litex.soc.cores.cpu"]
+    filename = job_filename(job)
+    with open(filename, "r") as f:
+        tree = ast.parse(f.read(), filename)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules += [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and (node.level == 0) and node.module:
+            modules += [node.module]
+            modules += [f"{node.module}.{alias.name}" for alias in node.names if alias.name != "*"]
+    if job.kind == "platform":
+        modules += [f"litex_boards.platforms.{job.name}"]
+    return modules
+
+def preload(jobs):
+    # Import the stack once in the parent; forked workers inherit it through sys.modules.
+    if repo_dir not in sys.path:
+        sys.path.insert(0, repo_dir)
+    modules = set(preloaded_modules)
+    for job in jobs:
+        modules.update(job_modules(job))
+    for module in sorted(modules):
+        if module in sys.modules or module.startswith("litex_boards.targets."):
+            continue
+        try:
+            importlib.import_module(module)
+        except Exception:
+            pass # Not a module or not importable: left to the worker (and reported there).
+
+def fork_job(job, board_dir, pll_cache=None):
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid != 0:
+        return pid
+    # Worker: run target's main() in-process, as "python3 -m" would.
+    status = 1
+    try:
+        stdout = os.open(os.path.join(board_dir, "sweep.log"), os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        stderr = os.open(os.path.join(board_dir, "sweep.err"), os.O_WRONLY | os.O_CREAT | os.O_TRUNC)
+        os.dup2(stdout, 1)
+        os.dup2(stderr, 2)
+        # Also rebind sys.stdout/stderr, in case the parent replaced them (ex pytest capture).
+        sys.stdout = open(1, "w", closefd=False)
+        sys.stderr = open(2, "w", closefd=False)
+        os.chdir(board_dir)
+        sys.argv = [job.module] + job.argv(board_dir)
+        if pll_cache is not None:
+            pll_cache.reset()
+        try:
+            runpy.run_module(job.module, run_name="__main__", alter_sys=True)
+            status = 0
+        except SystemExit as e:
+            # As the interpreter: non-integer exit codes (ex sys.exit("message")) are printed.
+            if not isinstance(e.code, (int, type(None))):
+                print(e.code, file=sys.stderr)
+            status = 0 if e.code in [None, 0] else 1
+        if pll_cache is not None:
+            pll_cache.write_report(os.path.join(board_dir, "pll_cache.json"))
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(status)
+
+def run_jobs_fork(jobs, output_dir, njobs, pll_cache_dir=None):
+    preload(jobs)
+    pll_cache = None
+    if pll_cache_dir is not None:
+        from litex_boards import pll_cache as _pll_cache
+        pll_cache = _pll_cache.enable(os.path.abspath(pll_cache_dir))
+    pending = list(jobs)
+    running = {}
+    while pending or running:
+        while pending and len(running) < njobs:
+            job       = pending.pop(0)
+            board_dir = prepare_output_dir(job, output_dir)
+            pid       = fork_job(job, board_dir, pll_cache)
+            running[pid] = (job, board_dir, time.time())
+        pid, status = os.waitpid(-1, 0)
+        if pid not in running:
+            continue
+        job, board_dir, start = running.pop(pid)
+        yield BoardResult(
+            kind       = job.kind,
+            name       = job.name,
+            passed     = os.WIFEXITED(status) and (os.WEXITSTATUS(status) == 0),
+            duration   = time.time() - start,
+            stderr     = read_stderr(board_dir),
+            output_dir = board_dir,
+            pll_cache  = read_pll_cache(board_dir),
+        )
+
+# Cache --------------------------------------------------------------------------------------------
+
+def stack_versions():
+    # Installed Migen/LiteX/cores/pythondata versions (any of them can change the elaborated design).
+    versions = {}
+    for dist in importlib.metadata.distributions():
+        name = (dist.metadata["Name"] or "").lower()
+        if name == "migen" or name.startswith(("lite", "pythondata-")):
+            versions[name] = dist.version
+    return sorted(versions.items())
+
+def shared_sources():
+    # Shared LiteX-Boards modules (litex_boards/*.py: ethernet, sata_*, video_*, udp_streamer, ...)
+    # that targets can import: any of them can change the elaborated design.
+    package_dir = os.path.join(repo_dir, "litex_boards")
+    return [os.path.join(package_dir, f) for f in sorted(os.listdir(package_dir)) if f.endswith(".py")]
+
+def job_sources(job):
+    # Target file + platform file(s) used by the job + shared modules.
+    sources = [job_filename(job)] + shared_sources()
+    for module in job_modules(job):
+        if module.startswith("litex_boards.platforms."):
+            filename = os.path.join(platforms_dir, module.split(".")[-1] + ".py")
+            if os.path.exists(filename):
+                sources.append(filename)
+    return sorted(set(sources))
+
+def cache_key(job, versions):
+    h = hashlib.sha256()
+    h.update(json.dumps([job.kind, job.name, job.args, versions, sys.version_info[:2]]).encode())
+    for filename in job_sources(job):
+        with open(filename, "rb") as f:
+            h.update(os.path.relpath(filename, repo_dir).encode())
+            h.update(hashlib.sha256(f.read()).digest())
+    return h.hexdigest()
+
+def default_cache_dir():
+    return os.environ.get("LITEX_BOARDS_CACHE_DIR", None)
+
+def cache_load(job, key, cache_dir, output_dir):
+    entry = os.path.join(cache_dir, key)
+    if not os.path.exists(os.path.join(entry, "result.json")):
+        return None
+    with open(os.path.join(entry, "result.json"), "r") as f:
+        result = json.load(f)
+    board_dir = job_output_dir(job, output_dir)
+    shutil.rmtree(board_dir, ignore_errors=True)
+    shutil.copytree(os.path.join(entry, "outputs"), board_dir)
+    return BoardResult(
+        kind       = job.kind,
+        name       = job.name,
+        passed     = True,
+        duration   = result["duration"],
+        stderr     = result["stderr"],
+        output_dir = board_dir,
+        cached     = True,
+        pll_cache  = result.get("pll_cache", None),
+    )
+
+def cache_store(result, key, cache_dir):
+    # Only passing boards are stored: failures are often environment-related and must be retried.
+    if not result.passed:
+        return
+    entry = os.path.join(cache_dir, key)
+    tmp   = f"{entry}.tmp{os.getpid()}"
+    shutil.rmtree(tmp, ignore_errors=True)
+    shutil.copytree(result.output_dir, os.path.join(tmp, "outputs"))
+    with open(os.path.join(tmp, "result.json"), "w") as f:
+        json.dump(result.to_dict(), f, indent=4)
+    try:
+        os.rename(tmp, entry)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True) # Already stored (concurrent sweep).
+
+# Sharding -----------------------------------------------------------------------------------------
+
+def parse_shard(shard):
+    # "i/N" -> (i, N), with i in [1, N].
+    try:
+        index, count = (int(v) for v in shard.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard {shard}, expected i/N.")
+    if not (1 <= index <= count):
+        raise ValueError(f"Invalid shard {shard}, i must be in [1, N].")
+    return index, count
+
+def load_timings(filenames):
+    # Per-board durations from sweep JSON reports (later reports override earlier ones).
+    timings = {}
+    for filename in filenames:
+        if not os.path.exists(filename):
+            continue
+        with open(filename, "r") as f:
+            for r in json.load(f):
+                timings[(r["kind"], r["name"])] = r["duration"]
+    return timings
+
+def default_shard():
+    shard = os.environ.get("LITEX_BOARDS_SHARD", None)
+    return None if shard is None else parse_shard(shard)
+
+def default_timings():
+    filenames = os.environ.get("LITEX_BOARDS_TIMINGS", "")
+    return load_timings([f for f in filenames.split(os.pathsep) if f])
+
+def job_hash(job):
+    return int(hashlib.sha256(f"{job.kind}:{job.name}".encode()).hexdigest()[:8], 16)
+
+def shard_jobs(jobs, shard=None, timings=None):
+    shard   = default_shard()   if shard   is None else shard
+    timings = default_timings() if timings is None else timings
+    if shard is None:
+        return jobs
+    index, count = shard
+
+    # No history: deterministic hash split.
+    known = [timings[(job.kind, job.name)] for job in jobs if (job.kind, job.name) in timings]
+    if not known:
+        return [job for job in jobs if job_hash(job) % count == (index - 1)]
+
+    # History: greedy cost balancing (longest boards first, each one to the least loaded shard).
+    # Boards without history are given the median known cost.
+    default = sorted(known)[len(known)//2]
+    costs   = {(job.kind, job.name): timings.get((job.kind, job.name), default) for job in jobs}
+    loads   = [0.0]*count
+    shards  = [[] for _ in range(count)]
+    for job in sorted(jobs, key=lambda job: (-costs[(job.kind, job.name)], job.kind, job.name)):
+        n = loads.index(min(loads))
+        loads[n] += costs[(job.kind, job.name)]
+        shards[n].append((job.kind, job.name))
+    selected = set(shards[index - 1])
+    return [job for job in jobs if (job.kind, job.name) in selected]
+
+# Sweep --------------------------------------------------------------------------------------------
+
+def run_jobs(jobs, output_dir="build/sweep", njobs=None, mode=None, cache_dir=None, pll_cache_dir=None, keep_builds=True, callback=None):
+    njobs         = default_jobs()          if njobs         is None else njobs
+    mode          = default_mode()          if mode          is None else mode
+    cache_dir     = default_cache_dir()     if cache_dir     is None else cache_dir
+    pll_cache_dir = default_pll_cache_dir() if pll_cache_dir is None else pll_cache_dir
+    runner = {
+        "fork"       : run_jobs_fork,
+        "subprocess" : run_jobs_subprocess,
+    }[mode]
+    results = []
+
+    # Reuse cached results, only elaborate boards whose inputs changed.
+    keys = {}
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        versions  = stack_versions()
+        remaining = []
+        for job in jobs:
+            keys[(job.kind, job.name)] = key = cache_key(job, versions)
+            result = cache_load(job, key, cache_dir, output_dir)
+            if result is None:
+                remaining.append(job)
+            else:
+                if callback is not None:
+                    callback(result)
+                results.append(result)
+    else:
+        remaining = jobs
+
+    for result in runner(remaining, output_dir, njobs, pll_cache_dir):
+        if cache_dir is not None:
+            cache_store(result, keys[(result.kind, result.name)], cache_dir)
+        if callback is not None:
+            callback(result)
+        if result.passed and not keep_builds:
+            shutil.rmtree(result.output_dir, ignore_errors=True)
+        results.append(result)
+    # Report in submission order, independently of completion order.
+    order = {(job.kind, job.name): n for n, job in enumerate(jobs)}
+    return sorted(results, key=lambda r: order[(r.kind, r.name)])
+
+# Reports ------------------------------------------------------------------------------------------
+
+def write_json(results, filename):
+    with open(filename, "w") as f:
+        json.dump([r.to_dict() for r in results], f, indent=4)
+
+def write_junit(results, filename):
+    testsuites = ET.Element("testsuites")
+    for kind in sorted(set(r.kind for r in results)):
+        kind_results = [r for r in results if r.kind == kind]
+        testsuite    = ET.SubElement(testsuites, "testsuite",
+            name     = f"litex_boards.{kind}s",
+            tests    = str(len(kind_results)),
+            failures = str(len([r for r in kind_results if not r.passed])),
+            time     = f"{sum(r.duration for r in kind_results):.3f}")
+        for r in kind_results:
+            testcase = ET.SubElement(testsuite, "testcase",
+                classname = f"litex_boards.{kind}s",
+                name      = r.name,
+                time      = f"{r.duration:.3f}")
+            if r.cached:
+                properties = ET.SubElement(testcase, "properties")
+                ET.SubElement(properties, "property", name="cached", value="true")
+            if not r.passed:
+                failure = ET.SubElement(testcase, "failure", message=f"{r.name} elaboration failed.")
+                failure.text = r.stderr
+    ET.ElementTree(testsuites).write(filename, encoding="utf-8", xml_declaration=True)
+
+def print_summary(results):
+    failed = [r for r in results if not r.passed]
+    cached = [r for r in results if r.cached]
+    print(f"{len(results) - len(failed)}/{len(results)} boards passed ({len(cached)} from cache).")
+    pll_caches = [r.pll_cache for r in results if r.pll_cache is not None and not r.cached]
+    if pll_caches:
+        hits    = sum(s["hits"]    for s in pll_caches)
+        lookups = sum(s["lookups"] for s in pll_caches)
+        print(f"PLL cache: {hits}/{lookups} hits.")
+    for r in failed:
+        print(f"FAILED {r.kind} {r.name} (log: {os.path.join(r.output_dir, 'sweep.err')})")
+
+# Main ---------------------------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel LiteX-Boards elaboration sweep.")
+    parser.add_argument("kind",          choices=["targets", "platforms", "all"], help="Boards to sweep.")
+    parser.add_argument("names",         nargs="*",                               help="Restrict sweep to these boards.")
+    parser.add_argument("--jobs",        default=None, type=int,                  help="Number of parallel jobs (default: CPU count).")
+    parser.add_argument("--mode",        default=None, choices=["fork", "subprocess"], help="Elaboration mode (default: fork when available).")
+    parser.add_argument("--output-dir",  default="build/sweep",                   help="Base output directory.")
+    parser.add_argument("--junit",       default=None,                            help="Write JUnit XML report to file.")
+    parser.add_argument("--json",        default=None,                            help="Write JSON report to file.")
+    parser.add_argument("--shard",       default=None,                            help="Only run shard i/N of the boards (i in [1, N]).")
+    parser.add_argument("--timings",     default=[], action="append",             help="JSON report(s) of previous sweeps used to balance shards.")
+    parser.add_argument("--cache-dir",   default=None,                            help="Elaboration cache directory (default: LITEX_BOARDS_CACHE_DIR, disabled if unset).")
+    parser.add_argument("--pll-cache-dir", default=None,                          help="PLL configuration cache directory (default: LITEX_BOARDS_PLL_CACHE_DIR, disabled if unset).")
+    parser.add_argument("--clean",       action="store_true",                     help="Remove build directories of passing boards.")
+    args = parser.parse_intermixed_args()
+
+    names = args.names or None
+    jobs  = []
+    if args.kind in ["platforms", "all"]:
+        jobs += platform_jobs(names)
+    if args.kind in ["targets", "all"]:
+        jobs += target_jobs(names)
+    jobs = shard_jobs(jobs,
+        shard   = parse_shard(args.shard) if args.shard is not None else None,
+        timings = load_timings(args.timings) if args.timings else None)
+
+    def callback(result):
+        status = "PASS" if result.passed else "FAIL"
+        cached = ", cached" if result.cached else ""
+        pll    = ""
+        if result.pll_cache is not None and not result.cached:
+            pll = f", pll cache {result.pll_cache['hits']}/{result.pll_cache['lookups']} hits"
+        print(f"[{status}] {result.kind} {result.name} ({result.duration:.1f}s{cached}{pll})", flush=True)
+
+    results = run_jobs(jobs,
+        output_dir    = args.output_dir,
+        njobs         = args.jobs,
+        mode          = args.mode,
+        cache_dir     = args.cache_dir,
+        pll_cache_dir = args.pll_cache_dir,
+        keep_builds   = not args.clean,
+        callback      = callback)
+
+    if args.json:
+        write_json(results, args.json)
+    if args.junit:
+        write_junit(results, args.junit)
+    print_summary(results)
+    sys.exit(0 if all(r.passed for r in results) else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import random
+import unittest
+
+from migen import *
+
+from litex_boards.baser import BaseRScrambler, BaseRPCSTX, BaseRPCSRX
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def scramble(words, state=0):
+    # Software model of the x^58 + x^39 + 1 scrambler (LSB first, state = last 58 line bits).
+    out = []
+    for word in words:
+        line = 0
+        for n in range(64):
+            history = (state | (line << 58)) >> n
+            bit     = ((word >> n) ^ (history >> (58 - 39)) ^ history) & 1
+            line   |= bit << n
+        state = (state | (line << 58)) >> 64
+        out.append(line)
+    return out
+
+def xgmii(*lanes):
+    # (data, ctl) from 8 lanes, control characters given as ("K", value).
+    data, ctl = 0, 0
+    for i, lane in enumerate(lanes):
+        if isinstance(lane, tuple):
+            ctl  |= 1 << i
+            lane  = lane[1]
+        data |= lane << (8*i)
+    return data, ctl
+
+I, S, T, E = ("K", 0x07), ("K", 0xfb), ("K", 0xfd), ("K", 0xfe)
+
+# Scrambler ----------------------------------------------------------------------------------------
+
+class TestBaseRScrambler(unittest.TestCase):
+    def test_scrambler(self):
+        prng  = random.Random(42)
+        words = [prng.randrange(2**64) for _ in range(32)]
+        dut   = BaseRScrambler()
+        line  = []
+        def generator():
+            for word in words:
+                yield dut.i.eq(word)
+                yield
+                line.append((yield dut.o))
+        run_simulation(dut, generator())
+        self.assertEqual(line, scramble(words))
+
+    def test_loopback(self):
+        # Scrambler -> Descrambler (the first word only fills the scrambler/descrambler states).
+        class DUT(Module):
+            def __init__(self):
+                self.submodules.scrambler   = BaseRScrambler()
+                self.submodules.descrambler = BaseRScrambler(descramble=True)
+                self.comb += self.descrambler.i.eq(self.scrambler.o)
+        prng  = random.Random(0)
+        words = [prng.randrange(2**64) for _ in range(32)]
+        dut   = DUT()
+        out   = []
+        def generator():
+            yield dut.scrambler.i.eq(0x0123456789abcdef)
+            yield
+            for word in words:
+                yield dut.scrambler.i.eq(word)
+                yield
+                out.append((yield dut.descrambler.o))
+        run_simulation(dut, generator())
+        self.assertEqual(out, words)
+
+# PCS ----------------------------------------------------------------------------------------------
+
+class PCSLoopback(Module):
+    def __init__(self):
+        self.submodules.tx = tx = BaseRPCSTX()
+        self.submodules.rx = rx = BaseRPCSRX()
+        self.comb += [
+            rx.data.eq(tx.data),
+            rx.header.eq(tx.header),
+        ]
+
+class TestBaseRPCS(unittest.TestCase):
+    def check_loopback(self, frames):
+        dut      = PCSLoopback()
+        idle     = xgmii(*[I]*8)
+        received = []
+        def generator():
+            # Idles until block lock (64 valid sync headers).
+            yield dut.tx.xgmii_data.eq(idle[0])
+            yield dut.tx.xgmii_ctl.eq(idle[1])
+            for _ in range(256):
+                if (yield dut.rx.block_lock):
+                    break
+                yield
+            self.assertEqual((yield dut.rx.block_lock), 1)
+            for data, ctl in frames + [idle]*4:
+                yield dut.tx.xgmii_data.eq(data)
+                yield dut.tx.xgmii_ctl.eq(ctl)
+                yield
+        @passive
+        def monitor():
+            while True:
+                if (yield dut.rx.block_lock):
+                    received.append(((yield dut.rx.xgmii_data), (yield dut.rx.xgmii_ctl)))
+                yield
+        run_simulation(dut, [generator(), monitor()])
+
+        # Skip idles, then frames come out unchanged (with the encoder/decoder latency).
+        while received and received[0] == idle:
+            received.pop(0)
+        self.assertEqual(received[:len(frames)], frames)
+
+    def test_start_lane0(self):
+        prng   = random.Random(1)
+        frames = [xgmii(S, 0x55, 0x55, 0x55, 0x55, 0x55, 0x55, 0xd5)]
+        frames += [(prng.randrange(2**64), 0x00) for _ in range(8)]
+        for k in range(8):
+            frames.append(xgmii(*[prng.randrange(256) for _ in range(k)], T, *[I]*(7 - k)))
+            frames.append(xgmii(S, *[prng.randrange(256) for _ in range(7)]))
+            frames.append((prng.randrange(2**64), 0x00))
+        frames.append(xgmii(T, *[I]*7))
+        self.check_loopback(frames)
+
+    def test_start_lane4(self):
+        frames = [
+            xgmii(*[I]*4, S, 0x55, 0x55, 0xd5),
+            (0x0011223344556677, 0x00),
+            xgmii(0xaa, 0xbb, T, *[I]*5),
+        ]
+        self.check_loopback(frames)
+
+    def test_error(self):
+        # Error characters are transmitted/decoded as /E/.
+        self.check_loopback([xgmii(*[I]*7, E), xgmii(*[I]*4, S, 1, 2, 3), xgmii(T, *[I]*7)])
+
+    def test_block_lock(self):
+        # Invalid sync headers: no lock, slips requested.
+        dut   = BaseRPCSRX()
+        slips = []
+        def generator():
+            yield dut.header.eq(0b11)
+            for _ in range(200):
+                slips.append((yield dut.slip))
+                yield
+            self.assertEqual((yield dut.block_lock), 0)
+        run_simulation(dut, generator())
+        self.assertGreater(sum(slips), 1)
@@ -0,0 +1,60 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import unittest
+
+from test import bench
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def result(name="board", config="minimal", passed=True, elaborate_time=10.0, peak_rss=100e6):
+    return {
+        "name"           : name,
+        "config"         : config,
+        "passed"         : passed,
+        "elaborate_time" : elaborate_time,
+        "peak_rss"       : peak_rss,
+    }
+
+def regressions(results, baseline, thresholds={"elaborate_time": 20, "peak_rss": 10}, min_time=0.1):
+    return [(r["name"], r["config"], metric) for r, metric, value, ref in
+        bench.find_regressions(results, baseline, thresholds, min_time=min_time)]
+
+# Regressions --------------------------------------------------------------------------------------
+
+class TestFindRegressions(unittest.TestCase):
+    def test_threshold(self):
+        # Relative threshold (in %), per metric: only increases above it are regressions.
+        baseline = [result()]
+        self.assertEqual(regressions([result(elaborate_time=11.9)], baseline), [])
+        self.assertEqual(regressions([result(elaborate_time=12.1)], baseline), [("board", "minimal", "elaborate_time")])
+        self.assertEqual(regressions([result(elaborate_time=5.0)],  baseline), [])
+        self.assertEqual(regressions([result(peak_rss=109e6)],      baseline), [])
+        self.assertEqual(regressions([result(peak_rss=111e6)],      baseline), [("board", "minimal", "peak_rss")])
+        # Metrics without threshold are not checked.
+        self.assertEqual(regressions([result(peak_rss=200e6)], baseline, thresholds={"elaborate_time": 20}), [])
+
+    def test_min_time(self):
+        # Time metrics also have to increase by min_time (in s): +100% on 0.05s is noise...
+        baseline = [result(elaborate_time=0.05)]
+        self.assertEqual(regressions([result(elaborate_time=0.1)], baseline), [])
+        self.assertEqual(regressions([result(elaborate_time=0.2)], baseline), [("board", "minimal", "elaborate_time")])
+        # ... but not for other metrics.
+        baseline = [result(peak_rss=0.05)]
+        self.assertEqual(regressions([result(peak_rss=0.1)], baseline), [("board", "minimal", "peak_rss")])
+
+    def test_passed(self):
+        # Elaboration failures are regressions (other metrics not compared), fixes are not.
+        self.assertEqual(regressions([result(passed=False, elaborate_time=None)], [result()]), [("board", "minimal", "passed")])
+        self.assertEqual(regressions([result()], [result(passed=False, elaborate_time=None)]), [])
+
+    def test_new_missing(self):
+        # New benchmarks (no baseline) and missing benchmarks (baseline only) are not regressions;
+        # results are matched on (name, config).
+        baseline = [result(name="old"), result(name="board", config="ethernet", elaborate_time=1.0)]
+        results  = [result(name="new", elaborate_time=100.0), result(name="board", elaborate_time=100.0)]
+        self.assertEqual(regressions(results, baseline), [])
+        results.append(result(name="board", config="ethernet", elaborate_time=2.0))
+        self.assertEqual(regressions(results, baseline), [("board", "ethernet", "elaborate_time")])
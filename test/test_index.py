@@ -0,0 +1,36 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import json
+import unittest
+
+from litex_boards import index
+
+class TestIndex(unittest.TestCase):
+    # Stored index must be up to date with platforms (regenerate with python3 -m litex_boards.index --update).
+    def test_index_up_to_date(self):
+        with open(index.index_filename, "r") as f:
+            stored = json.load(f)
+        self.assertEqual(stored, json.loads(json.dumps(index.generate_index())))
+
+    def test_index_query(self):
+        arty = index.get_platform("digilent_arty")
+        self.assertEqual(arty["vendor"],           "xilinx")
+        self.assertEqual(arty["default_clk_name"], "clk100")
+        self.assertIn("xc7a35ticsg324-1L", arty["devices"])
+        self.assertIn("ddram",             arty["resources"])
+        names = [info["name"] for info in index.find_platforms(vendor="xilinx", resources=["pcie_x4"])]
+        self.assertIn("sqrl_xcu1525", names)
+        self.assertNotIn("digilent_arty", names)
+
+    def test_index_scan(self):
+        # Resources built in functions (_get_io()), devices from split/negative parameters.
+        names = [info["name"] for info in index.find_platforms(resources=["pcie_x4"])]
+        for name in ["sitlinv_stlv7325_v1", "sitlinv_stlv7325_v2"]:
+            self.assertIn(name, names)
+        self.assertIn("ddram", index.get_platform("sitlinv_xc7k420t")["resources"])
+        self.assertEqual(index.get_platform("alientek_davincipro")["devices"], ["xc7a100tfgg484-2", "xc7a35tfgg484-2"])
+        self.assertEqual(index.get_platform("qmtech_wukong")["devices"],       ["xc7a100t-2fgg676"])
+        self.assertEqual(index.get_platform("adi_adrv2crr_fmc")["default_clk_freq"], 122.88e6)
@@ -0,0 +1,36 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import tempfile
+import unittest
+
+from litex_boards.litepcie_software import add_litepcie_program
+
+# LitePCIe Software --------------------------------------------------------------------------------
+
+class TestLitePCIeSoftware(unittest.TestCase):
+    def test_add_program(self):
+        # Programs are added once to PROGS (before all) with a rule linking liblitepcie, even when
+        # the driver is generated again.
+        with tempfile.TemporaryDirectory() as dst:
+            user_dir = os.path.join(dst, "user")
+            os.makedirs(user_dir)
+            with open(os.path.join(user_dir, "Makefile"), "w") as f:
+                f.write("PROGS=litepcie_util\n\nall: $(PROGS)\n")
+            for _ in range(2):
+                add_litepcie_program(dst, "litepcie_a", "int main(void) { return 0; }\n")
+                add_litepcie_program(dst, "litepcie_b", "int main(void) { return 1; }\n")
+            with open(os.path.join(user_dir, "Makefile")) as f:
+                makefile = f.read()
+            with open(os.path.join(user_dir, "litepcie_b.c")) as f:
+                source = f.read()
+            self.assertTrue(os.path.exists(os.path.join(user_dir, "litepcie_csr.h")))
+
+        self.assertEqual(source, "int main(void) { return 1; }\n")
+        self.assertTrue(makefile.startswith("PROGS=litepcie_util\nPROGS+=litepcie_a\nPROGS+=litepcie_b\n\nall: $(PROGS)\n"))
+        for name in ["litepcie_a", "litepcie_b"]:
+            self.assertEqual(makefile.count(f"PROGS+={name}\n"), 1)
+            self.assertEqual(makefile.count(f"\n{name}: liblitepcie/liblitepcie.a {name}.o\n"), 1)
@@ -0,0 +1,110 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import re
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+from migen import *
+
+from litex.soc.interconnect import stream
+
+from litedram.common import LiteDRAMNativePort
+from litedram.frontend.dma import LiteDRAMDMAWriter, LiteDRAMDMAReader
+
+from litex_boards.pcie_dram_bench import PCIeDRAMBench, generate_pcie_dram_bench_software
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def generated_csr_values(soc, base, size):
+    # Values written by the generated program to the memory DMAs base/length CSRs (C expressions
+    # evaluated with the program's base/size and macros).
+    with tempfile.TemporaryDirectory() as dst:
+        os.makedirs(os.path.join(dst, "user"))
+        with open(os.path.join(dst, "user", "Makefile"), "w") as f:
+            f.write("PROGS=litepcie_util\n\nall: $(PROGS)\n")
+        generate_pcie_dram_bench_software(soc, dst)
+        with open(os.path.join(dst, "user", "litepcie_dram_bench.c")) as f:
+            source = f.read()
+    macros = dict(re.findall(r"#define (\w+)\s+(\d+)", source))
+    values = {}
+    for dma, reg, expr in re.findall(r"csr_write\(fd, MEM_(\w+)\((\w+)_ADDR\),\s*MEM_\w+\(\w+\),\s*([^;]+)\);", source):
+        if reg in ["BASE", "LENGTH"]:
+            expr = re.sub(r"\w+", lambda m: macros.get(m.group(0), m.group(0)), expr).replace("/", "//")
+            values[(dma, reg)] = eval(expr, {"base": base, "size": size})
+    return values
+
+class BenchDUT(Module):
+    def __init__(self, dma_data_width=64, mem_data_width=128):
+        self.dma        = SimpleNamespace(
+            source = stream.Endpoint([("data", dma_data_width)]),
+            sink   = stream.Endpoint([("data", dma_data_width)]),
+        )
+        self.wr_port    = LiteDRAMNativePort("write", 24, mem_data_width)
+        self.rd_port    = LiteDRAMNativePort("read",  24, mem_data_width)
+        self.submodules.dram_dma_writer = LiteDRAMDMAWriter(self.wr_port, with_csr=True)
+        self.submodules.dram_dma_reader = LiteDRAMDMAReader(self.rd_port, with_csr=True)
+        self.submodules.bench = PCIeDRAMBench(self.dma, self.dram_dma_writer, self.dram_dma_reader)
+
+# PCIe DRAM Bench ----------------------------------------------------------------------------------
+
+class TestPCIeDRAMBench(unittest.TestCase):
+    base = 0x0001_0000
+    size = 0x400
+
+    def test_host_to_mem(self):
+        # The memory writer covers [base, base + size) and is done after size bytes.
+        dut    = BenchDUT()
+        values = generated_csr_values(dut, self.base, self.size)
+        bpw    = dut.wr_port.data_width//8
+        addrs  = []
+        def generator():
+            writer = dut.dram_dma_writer
+            yield writer._base.storage.eq(values[("WRITER", "BASE")])
+            yield writer._length.storage.eq(values[("WRITER", "LENGTH")])
+            yield writer._enable.storage.eq(1)
+            yield dut.dma.source.valid.eq(1)
+            yield dut.wr_port.cmd.ready.eq(1)
+            yield dut.wr_port.wdata.ready.eq(1)
+            for _ in range(4*self.size):
+                if (yield dut.wr_port.cmd.valid):
+                    addrs.append((yield dut.wr_port.cmd.addr))
+                if (yield writer._done.status):
+                    break
+                yield
+            self.assertEqual((yield writer._done.status), 1)
+            self.assertEqual((yield dut.bench.writer_bytes.status), self.size)
+        run_simulation(dut, generator())
+        self.assertEqual(addrs, list(range(self.base//bpw, (self.base + self.size)//bpw)))
+
+    def test_mem_to_host(self):
+        # The program waits for reader_bytes >= size: the memory reader has to stream size bytes.
+        dut    = BenchDUT()
+        values = generated_csr_values(dut, self.base, self.size)
+        bpw    = dut.rd_port.data_width//8
+        addrs  = []
+        def generator():
+            reader = dut.dram_dma_reader
+            yield reader._base.storage.eq(values[("READER", "BASE")])
+            yield reader._length.storage.eq(values[("READER", "LENGTH")])
+            yield reader._enable.storage.eq(1)
+            yield dut.dma.sink.ready.eq(1)
+            yield dut.rd_port.cmd.ready.eq(1)
+            pending = 0
+            for _ in range(4*self.size):
+                if (yield dut.rd_port.cmd.valid):
+                    addrs.append((yield dut.rd_port.cmd.addr))
+                    pending += 1
+                yield dut.rd_port.rdata.valid.eq(pending > 0)
+                if (pending > 0) and (yield dut.rd_port.rdata.ready):
+                    pending -= 1
+                if (yield dut.bench.reader_bytes.status) >= self.size:
+                    break
+                yield
+            self.assertEqual((yield dut.bench.reader_bytes.status), self.size)
+        run_simulation(dut, generator())
+        self.assertEqual(addrs, list(range(self.base//bpw, (self.base + self.size)//bpw)))
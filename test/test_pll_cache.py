@@ -0,0 +1,75 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import tempfile
+import unittest
+
+from migen import *
+from migen.fhdl import verilog
+
+from litex.soc.cores.clock import S7MMCM, ECP5PLL
+
+from litex_boards import pll_cache
+
+# Designs ------------------------------------------------------------------------------------------
+
+class PLLDesign(Module):
+    def __init__(self, pll_cls, **kwargs):
+        self.clk = Signal()
+        self.clock_domains.cd_sys    = ClockDomain()
+        self.clock_domains.cd_sys2x  = ClockDomain()
+        self.clock_domains.cd_sys90  = ClockDomain()
+        self.submodules.pll = pll = pll_cls(**kwargs)
+        pll.register_clkin(self.clk, 100e6)
+        pll.create_clkout(self.cd_sys,   75e6,  with_reset=False)
+        pll.create_clkout(self.cd_sys2x, 150e6, with_reset=False)
+        pll.create_clkout(self.cd_sys90, 75e6,  with_reset=False, phase=90)
+
+def elaborate(pll_cls, **kwargs):
+    design = PLLDesign(pll_cls, **kwargs)
+    output = str(verilog.convert(design, ios={design.clk}))
+    return design.pll.config, output
+
+# PLL Cache ----------------------------------------------------------------------------------------
+
+class TestPLLCache(unittest.TestCase):
+    def tearDown(self):
+        pll_cache.disable()
+
+    def check_pll(self, pll_cls, **kwargs):
+        reference = elaborate(pll_cls, **kwargs)
+        with tempfile.TemporaryDirectory() as directory:
+            cache = pll_cache.enable(directory)
+            miss  = elaborate(pll_cls, **kwargs)
+            self.assertEqual(cache.stats()["misses"], 1)
+            self.assertEqual(len(os.listdir(directory)), 1)
+            cache.reset()
+            hit   = elaborate(pll_cls, **kwargs)
+            self.assertEqual(cache.stats()["hits"], 1)
+
+        # Same configuration and Verilog with/without the cache.
+        self.assertEqual(miss, reference)
+        self.assertEqual(hit,  reference)
+
+    def test_s7mmcm(self):
+        self.check_pll(S7MMCM, speedgrade=-1)
+
+    def test_ecp5pll(self):
+        # The search adds an output (feedback), that must be replayed on a hit.
+        self.check_pll(ECP5PLL)
+
+    def test_disable(self):
+        with tempfile.TemporaryDirectory() as directory:
+            pll_cache.enable(directory)
+            pll_cache.disable()
+            elaborate(S7MMCM, speedgrade=-1)
+            self.assertEqual(os.listdir(directory), [])
+            self.assertIsNone(pll_cache.get())
+
+    def test_no_implicit_enable(self):
+        # Importing litex_boards must not enable the cache, even with LITEX_BOARDS_PLL_CACHE_DIR set.
+        self.assertIsNone(pll_cache.get())
+        self.assertNotIn(S7MMCM, pll_cache._patched)
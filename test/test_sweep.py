@@ -0,0 +1,182 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from test import sweep
+
+# Helpers ------------------------------------------------------------------------------------------
+
+def write_file(filename, content):
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename, "w") as f:
+        f.write(content)
+
+class FakeTree:
+    # Minimal litex_boards tree (target, platform, shared module) the sweep paths are redirected to.
+    def __init__(self, directory):
+        self.repo_dir      = directory
+        self.platforms_dir = os.path.join(directory, "litex_boards", "platforms")
+        self.targets_dir   = os.path.join(directory, "litex_boards", "targets")
+        write_file(os.path.join(self.targets_dir,   "board.py"), "from litex_boards.platforms import board\n")
+        write_file(os.path.join(self.platforms_dir, "board.py"), "# Platform.\n")
+        write_file(os.path.join(directory, "litex_boards", "ethernet.py"), "# Shared module.\n")
+
+    def patch(self):
+        return mock.patch.multiple(sweep,
+            repo_dir      = self.repo_dir,
+            platforms_dir = self.platforms_dir,
+            targets_dir   = self.targets_dir)
+
+# Cache --------------------------------------------------------------------------------------------
+
+class TestCache(unittest.TestCase):
+    def test_cache_key(self):
+        with tempfile.TemporaryDirectory() as directory:
+            tree = FakeTree(directory)
+            with tree.patch():
+                job      = sweep.BoardJob("target", "board", ["--build"])
+                versions = [("litex", "1.0")]
+                key      = sweep.cache_key(job, versions)
+                self.assertEqual(key, sweep.cache_key(job, versions))
+                self.assertIn(os.path.join(tree.platforms_dir, "board.py"), sweep.job_sources(job))
+
+                # Arguments/stack versions are part of the key.
+                self.assertNotEqual(key, sweep.cache_key(sweep.BoardJob("target", "board", []), versions))
+                self.assertNotEqual(key, sweep.cache_key(job, [("litex", "2.0")]))
+
+                # Target, platform and shared modules are part of the key.
+                keys = [key]
+                for filename in [
+                    os.path.join(tree.targets_dir,   "board.py"),
+                    os.path.join(tree.platforms_dir, "board.py"),
+                    os.path.join(directory, "litex_boards", "ethernet.py")]:
+                    with open(filename, "a") as f:
+                        f.write("# Change.\n")
+                    keys.append(sweep.cache_key(job, versions))
+                self.assertEqual(len(set(keys)), len(keys))
+
+    def test_run_jobs_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            tree = FakeTree(directory)
+            job  = sweep.BoardJob("target", "board", [])
+            def runner(jobs, output_dir, njobs, pll_cache_dir=None):
+                for job in jobs:
+                    board_dir = sweep.prepare_output_dir(job, output_dir)
+                    write_file(os.path.join(board_dir, "board.v"), "// Verilog.\n")
+                    runs.append(job.name)
+                    yield sweep.BoardResult(job.kind, job.name, True, 1.0, output_dir=board_dir)
+            runs = []
+            with tree.patch(), mock.patch.dict(sweep.__dict__, run_jobs_fork=runner):
+                kwargs = dict(
+                    output_dir = os.path.join(directory, "build"),
+                    cache_dir  = os.path.join(directory, "cache"),
+                    mode       = "fork",
+                    njobs      = 1)
+                first  = sweep.run_jobs([job], **kwargs)
+                second = sweep.run_jobs([job], **kwargs)
+            self.assertEqual(runs, ["board"])
+            self.assertEqual([r.cached for r in first + second], [False, True])
+            self.assertTrue(os.path.exists(os.path.join(second[0].output_dir, "board.v")))
+
+# Runners ------------------------------------------------------------------------------------------
+
+class FakeJob(sweep.BoardJob):
+    # Job running a top-level module of the fake targets directory instead of a LiteX-Boards target.
+    @property
+    def module(self):
+        return self.name
+
+fake_targets = {
+    "sweep_pass"  : "import sys\nopen('argv.txt', 'w').write(' '.join(sys.argv[1:]))\nprint('building')\n",
+    "sweep_exit"  : "import sys\nsys.exit(0)\n",
+    "sweep_fail"  : "import sys\nsys.exit('failed')\n",
+    "sweep_crash" : "raise RuntimeError('crashed')\n",
+}
+
+class TestRunners(unittest.TestCase):
+    def run_fake_jobs(self, mode):
+        with tempfile.TemporaryDirectory() as directory:
+            targets_dir = os.path.join(directory, "targets")
+            for name, content in fake_targets.items():
+                write_file(os.path.join(targets_dir, f"{name}.py"), content)
+            jobs       = [FakeJob("target", name, ["--build"]) for name in fake_targets.keys()]
+            output_dir = os.path.join(directory, "build")
+            pythonpath = os.pathsep.join([targets_dir] + [p for p in [os.environ.get("PYTHONPATH")] if p])
+            with mock.patch.object(sweep, "targets_dir", targets_dir), \
+                 mock.patch.object(sweep.sys, "path", [targets_dir] + sweep.sys.path), \
+                 mock.patch.dict(os.environ, {"PYTHONPATH": pythonpath}):
+                results = sweep.run_jobs(jobs, output_dir=output_dir, njobs=2, mode=mode, cache_dir=None, pll_cache_dir=None)
+
+            # Results are reported in submission order.
+            self.assertEqual([r.name for r in results], list(fake_targets.keys()))
+            self.assertEqual([r.passed for r in results], [True, True, False, False])
+            self.assertIn("failed",  results[2].stderr)
+            self.assertIn("crashed", results[3].stderr)
+
+            # Each board runs in its own directory, with --output-dir pointing to it.
+            board_dir = sweep.job_output_dir(jobs[0], output_dir)
+            self.assertEqual(results[0].output_dir, board_dir)
+            with open(os.path.join(board_dir, "argv.txt"), "r") as f:
+                self.assertEqual(f.read(), f"--build --output-dir {board_dir}")
+            with open(os.path.join(board_dir, "sweep.log"), "r") as f:
+                self.assertIn("building", f.read())
+
+    def test_run_jobs_subprocess(self):
+        self.run_fake_jobs("subprocess")
+
+    @unittest.skipUnless(hasattr(os, "fork"), "fork not available.")
+    def test_run_jobs_fork(self):
+        self.run_fake_jobs("fork")
+
+# Sharding -----------------------------------------------------------------------------------------
+
+class TestSharding(unittest.TestCase):
+    jobs = [sweep.BoardJob("target", f"board{n}", []) for n in range(20)]
+
+    def check_partition(self, shards):
+        names = [job.name for shard in shards for job in shard]
+        self.assertEqual(sorted(names), sorted(job.name for job in self.jobs))
+        # Jobs keep their order in each shard.
+        for shard in shards:
+            self.assertEqual(shard, [job for job in self.jobs if job in shard])
+
+    def test_parse_shard(self):
+        self.assertEqual(sweep.parse_shard("1/1"), (1, 1))
+        self.assertEqual(sweep.parse_shard("3/4"), (3, 4))
+        for shard in ["0/4", "5/4", "1", "1/2/3", "a/b", ""]:
+            with self.assertRaises(ValueError):
+                sweep.parse_shard(shard)
+
+    def test_shard_jobs_hash(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop("LITEX_BOARDS_SHARD", None)
+            self.assertEqual(sweep.shard_jobs(self.jobs, shard=None, timings={}), self.jobs)
+        shards = [sweep.shard_jobs(self.jobs, shard=(i, 3), timings={}) for i in range(1, 4)]
+        self.check_partition(shards)
+        # Deterministic, and independent of the other jobs.
+        self.assertEqual(shards[0], sweep.shard_jobs(self.jobs, shard=(1, 3), timings={}))
+        self.assertEqual(sweep.shard_jobs(self.jobs[:5], shard=(1, 3), timings={}), [job for job in shards[0] if job in self.jobs[:5]])
+
+    def test_shard_jobs_timings(self):
+        # One long board, others short/unknown (median cost): the long board gets its own shard.
+        timings = {("target", job.name): 1.0 for job in self.jobs[:10]}
+        timings[("target", "board0")] = 30.0
+        shards  = [sweep.shard_jobs(self.jobs, shard=(i, 2), timings=timings) for i in range(1, 3)]
+        self.check_partition(shards)
+        self.assertIn(self.jobs[0], shards[0])
+        self.assertEqual(len(shards[0]), 1)
+        self.assertEqual(shards, [sweep.shard_jobs(self.jobs, shard=(i, 2), timings=timings) for i in range(1, 3)])
+
+    def test_load_timings(self):
+        with tempfile.TemporaryDirectory() as directory:
+            reports = [os.path.join(directory, f"report{n}.json") for n in range(2)]
+            for n, filename in enumerate(reports):
+                sweep.write_json([sweep.BoardResult("target", "board0", True, 10.0*(n + 1))], filename)
+            timings = sweep.load_timings(reports + [os.path.join(directory, "missing.json")])
+            self.assertEqual(timings, {("target", "board0"): 20.0})
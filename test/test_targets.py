@@ -5,89 +5,26 @@
 # This file is Copyright (c) 2019 Tim 'mithro' Ansell <me@mith.ro>
 # SPDX-License-Identifier: BSD-2-Clause
 
-import subprocess
 import unittest
-import os
 
-from migen import *
-
-from litex.soc.integration.builder import *
+from test import sweep
 
 class TestTargets(unittest.TestCase):
-    excluded_platforms = [
-        "qmtech_daughterboard",              # Reason: Not a real platform.
-        "qmtech_rp2040_daughterboard",       # Reason: Not a real platform.
-        "enclustra_st1",                     # Readon: Not a real platform.
-        "quicklogic_quickfeather",           # Reason: No default clock.
-        "colognechip_gatemate_evb",          # Reason: Toolchain not yet mainlined.
-        "efinix_ti375_c529_dev_kit",         # Reason: Require Efinity toolchain.
-        "efinix_titanium_ti60_f225_dev_kit", # Reason: Require Efinity toolchain.
-        "efinix_trion_t120_bga576_dev_kit",  # Reason: Require Efinity toolchain.
-        "efinix_trion_t20_bga256_dev_kit",   # Reason: Require Efinity toolchain.
-        "efinix_trion_t20_mipi_dev_kit",     # Reason: Require Efinity toolchain.
-        "efinix_xyloni_dev_kit",             # Reason: Require Efinity toolchain.
-        "sipeed_tang_primer",                # Reason: Require Anlogic toolchain.
-        "jungle_electronics_fireant",        # Reason: Require Efinity toolchain.
-        "efinix_t8f81_dev_kit",              # Reason: Require Efinity toolchain.
-        "adi_plutosdr",                      # Reason: No default clock.
-        "newae_cw305",                       # Reason: No default clock.
-    ]
-    excluded_targets   = [
-        "simple",                            # Reason: Generic target.
-        "quicklogic_quickfeather",           # Reason: No default clock.
-        "colognechip_gatemate_evb",          # Reason: Toolchain not yet mainlined.
-        "efinix_ti375_c529_dev_kit",         # Reason: Require Efinity toolchain.
-        "efinix_titanium_ti60_f225_dev_kit", # Reason: Require Efinity toolchain.
-        "efinix_trion_t120_bga576_dev_kit",  # Reason: Require Efinity toolchain.
-        "efinix_trion_t20_bga256_dev_kit",   # Reason: Require Efinity toolchain.
-        "efinix_trion_t20_mipi_dev_kit",     # Reason: Require Efinity toolchain.
-        "efinix_xyloni_dev_kit",             # Reason: Require Efinity toolchain.
-        "sipeed_tang_primer",                # Reason: Require Anlogic toolchain.
-        "jungle_electronics_fireant",        # Reason: Require Efinity toolchain.
-        "efinix_t8f81_dev_kit",              # Reason: Require Efinity toolchain.
-    ]
+    excluded_platforms = sweep.excluded_platforms
+    excluded_targets   = sweep.excluded_targets
+
+    # Boards are elaborated in parallel (see test/sweep.py, LITEX_BOARDS_JOBS to set the number of
+    # jobs), each one in its own build/sweep/<kind>s/<name> directory. LITEX_BOARDS_SHARD=i/N (and
+    # LITEX_BOARDS_TIMINGS) only runs a shard of the boards.
+    def check_results(self, results):
+        for result in results:
+            with self.subTest(**{result.kind: result.name}):
+                self.assertTrue(result.passed, msg=f"\n{result.stderr}")
 
     # Build simple design for all platforms.
     def test_platforms(self):
-        # Collect platforms.
-        platforms = []
-        for file in os.listdir("./litex_boards/platforms/"):
-            if file.endswith(".py"):
-                file = file.replace(".py", "")
-                if file not in ["__init__"] + self.excluded_platforms:
-                    platforms.append(file)
-
-        # Test platforms with simple design.
-        for name in platforms:
-            with self.subTest(platform=name):
-                os.system("rm -rf build")
-                cmd = """\
-python3 -m litex_boards.targets.simple litex_boards.platforms.{} \
-    --build            \
-    --no-compile       \
-    --uart-name="stub" \
-""".format(name)
-                subprocess.check_call(cmd, shell=True)
+        self.check_results(sweep.run_jobs(sweep.shard_jobs(sweep.platform_jobs())))
 
     # Build default configuration for all targets.
     def test_targets(self):
-        # Collect targets.
-        targets = []
-        for file in os.listdir("./litex_boards/targets/"):
-            if file.endswith(".py"):
-                file = file.replace(".py", "")
-                if file not in ["__init__"] + self.excluded_targets:
-                    targets.append(file)
-
-        # Test targets.
-        for name in targets:
-            with self.subTest(target=name):
-                os.system("rm -rf build")
-                cmd = """\
-python3 -m litex_boards.targets.{} \
-    --cpu-type=vexriscv     \
-    --cpu-variant=minimal   \
-    --build                 \
-    --no-compile            \
-""".format(name)
-                subprocess.check_call(cmd, shell=True)
+        self.check_results(sweep.run_jobs(sweep.shard_jobs(sweep.target_jobs())))
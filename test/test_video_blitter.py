@@ -0,0 +1,238 @@
+#
+# This file is part of LiteX-Boards.
+#
+# SPDX-License-Identifier: BSD-2-Clause
+
+import random
+import unittest
+
+from migen import *
+
+from litedram.common import LiteDRAMNativePort
+
+from litex_boards.video_blitter import VideoBlitter
+
+# DRAM Model ---------------------------------------------------------------------------------------
+
+class DRAMModel:
+    # Native read/write ports on a word memory, with random ready/valid. Write data is applied
+    # write_latency cycles after being taken and reads only return once the writes issued before
+    # them are applied (as the LiteDRAM controller keeps the accesses order).
+    def __init__(self, rd_port, wr_port, mem, write_latency=16, seed=0):
+        self.rd_port       = rd_port
+        self.wr_port       = wr_port
+        self.mem           = mem
+        self.write_latency = write_latency
+        self.prng          = random.Random(seed)
+
+    def write(self, addr, data, we):
+        word = self.mem.get(addr, 0)
+        for i in range(len(self.wr_port.wdata.we)):
+            if (we >> i) & 0x1:
+                word &= ~(0xff << 8*i)
+                word |= data & (0xff << 8*i)
+        self.mem[addr] = word
+
+    @passive
+    def generator(self):
+        rd, wr  = self.rd_port, self.wr_port
+        cycle   = 0
+        wr_cmds = [] # Write commands waiting for their data.
+        writes  = [] # Write data waiting to be applied (cycle, addr, data, we).
+        reads   = [] # Read commands (addr, writes issued before).
+        issued  = 0
+        applied = 0
+        while True:
+            # Handshakes of the current cycle.
+            if (yield wr.cmd.valid) and (yield wr.cmd.ready):
+                wr_cmds.append((yield wr.cmd.addr))
+                issued += 1
+            if (yield wr.wdata.valid) and (yield wr.wdata.ready):
+                writes.append((cycle + self.write_latency, wr_cmds.pop(0), (yield wr.wdata.data), (yield wr.wdata.we)))
+            if (yield rd.cmd.valid) and (yield rd.cmd.ready):
+                reads.append(((yield rd.cmd.addr), issued))
+            if (yield rd.rdata.valid) and (yield rd.rdata.ready):
+                reads.pop(0)
+
+            # Write data applied to the memory.
+            while writes and writes[0][0] <= cycle:
+                self.write(*writes.pop(0)[1:])
+                applied += 1
+
+            # Next cycle.
+            rdata_valid = bool(reads) and (reads[0][1] <= applied) and (self.prng.random() < 0.8)
+            yield wr.cmd.ready.eq(self.prng.random() < 0.8)
+            yield wr.wdata.ready.eq(bool(wr_cmds) and (self.prng.random() < 0.8))
+            yield rd.cmd.ready.eq(self.prng.random() < 0.8)
+            yield rd.rdata.valid.eq(rdata_valid)
+            yield rd.rdata.data.eq(self.mem.get(reads[0][0], 0) if rdata_valid else 0)
+            yield
+            cycle += 1
+
+# Framebuffer --------------------------------------------------------------------------------------
+
+class FrameBuffer:
+    # Pixels of a hres x vres framebuffer at base, stored in native words.
+    def __init__(self, base, hres, vres, depth, data_width, seed=0):
+        self.base       = base
+        self.hres       = hres
+        self.vres       = vres
+        self.depth      = depth
+        self.bpp        = depth//8
+        self.stride     = hres*self.bpp
+        self.data_width = data_width
+        prng = random.Random(seed)
+        # Few colors, so that color keys match.
+        self.pixels = [[prng.choice([1, 2, 3, 2**depth - 1]) for x in range(hres)] for y in range(vres)]
+
+    def address(self, x, y):
+        return self.base + y*self.stride + x*self.bpp
+
+    def to_mem(self):
+        mem = {}
+        bpw = self.data_width//8
+        for y in range(self.vres):
+            for x in range(self.hres):
+                offset = self.address(x, y)
+                shift  = 8*(offset % bpw)
+                mem[offset//bpw] = mem.get(offset//bpw, 0) | (self.pixels[y][x] << shift)
+        return mem
+
+    def from_mem(self, mem):
+        bpw = self.data_width//8
+        pixels = []
+        for y in range(self.vres):
+            pixels.append([])
+            for x in range(self.hres):
+                offset = self.address(x, y)
+                pixels[-1].append((mem.get(offset//bpw, 0) >> 8*(offset % bpw)) & (2**self.depth - 1))
+        return pixels
+
+# Video Blitter ------------------------------------------------------------------------------------
+
+OP_FILL    = 0b0000
+OP_COPY    = 0b0001
+OP_KEY     = 0b0010
+OP_REVERSE = 0b0100
+OP_LINE    = 0b1000
+
+class TestVideoBlitter(unittest.TestCase):
+    def blit(self, depth, data_width, ops, hres=40, vres=12, fifo_depth=32):
+        # ops: list of (control, sx, sy, dx, dy, w, h, color/key), coordinates as passed to the
+        # Blitter (for reverse, sy/dy are the last line).
+        rd_port = LiteDRAMNativePort("read",  24, data_width)
+        wr_port = LiteDRAMNativePort("write", 24, data_width)
+        dut     = VideoBlitter(rd_port, wr_port, depth=depth, fifo_depth=fifo_depth)
+        fb      = FrameBuffer(0x1000, hres, vres, depth, data_width)
+        model   = DRAMModel(rd_port, wr_port, fb.to_mem())
+        results = []
+        def generator():
+            for control, sx, sy, dx, dy, w, h, value in ops:
+                yield dut.control.fields.op.eq(     (control >> 0) & 0b1)
+                yield dut.control.fields.key.eq(    (control >> 1) & 0b1)
+                yield dut.control.fields.reverse.eq((control >> 2) & 0b1)
+                yield dut.control.fields.line.eq(   (control >> 3) & 0b1)
+                yield dut.src.storage.eq(fb.address(sx, sy))
+                yield dut.src_stride.storage.eq(fb.stride)
+                yield dut.dst.storage.eq(fb.address(dx, dy))
+                yield dut.dst_stride.storage.eq(fb.stride)
+                yield dut.width.storage.eq(w)
+                yield dut.height.storage.eq(h)
+                yield dut.color.storage.eq(value)
+                yield dut.key.storage.eq(value)
+                yield dut.start.re.eq(1)
+                yield
+                yield dut.start.re.eq(0)
+                yield
+                for _ in range(20000):
+                    if not (yield dut.busy.status):
+                        break
+                    yield
+                self.assertEqual((yield dut.busy.status), 0)
+                # Memory content once busy is released.
+                results.append(fb.from_mem(model.mem))
+        run_simulation(dut, [generator(), model.generator()])
+        return fb, results
+
+    def reference(self, fb, pixels, op):
+        # Copies are done from the original source (no overlap artifacts).
+        control, sx, sy, dx, dy, w, h, value = op
+        pixels = [line[:] for line in pixels]
+        source = [line[:] for line in pixels]
+        step   = -1 if control & OP_REVERSE else 1
+        for j in range(h):
+            for i in range(w):
+                if control & OP_COPY:
+                    pixel = source[sy + step*j][sx + i]
+                    if (control & OP_KEY) and (pixel == value):
+                        continue
+                else:
+                    pixel = value
+                pixels[dy + step*j][dx + i] = pixel
+        return pixels
+
+    def check(self, depth, data_width, ops, **kwargs):
+        fb, results = self.blit(depth, data_width, ops, **kwargs)
+        pixels = fb.pixels
+        for op, result in zip(ops, results):
+            pixels = self.reference(fb, pixels, op)
+            self.assertEqual(result, pixels, op)
+
+    def test_fill(self):
+        self.check(32, 128, [
+            (OP_FILL, 0, 0,  0, 0, 40, 1, 0xdeadbeef), # Full line.
+            (OP_FILL, 0, 0,  1, 2,  6, 3, 0x12345678), # Unaligned.
+            (OP_FILL, 0, 0,  5, 5,  2, 4, 0x00c0ffee), # Inside a word.
+            (OP_FILL, 0, 0, 39, 9,  1, 3, 0x55aa55aa), # Last pixel.
+        ])
+
+    def test_fill_16bpp(self):
+        self.check(16, 64, [
+            (OP_FILL, 0, 0,  3, 1, 13, 5, 0xbeef),
+            (OP_FILL, 0, 0, 10, 8,  1, 1, 0x1234),
+        ])
+
+    def test_copy_unaligned(self):
+        self.check(32, 128, [
+            (OP_COPY, 0, 0, 20, 0, 8, 3, 0), # Aligned.
+            (OP_COPY, 1, 4, 22, 4, 7, 3, 0), # Source after destination in word.
+            (OP_COPY, 3, 7, 21, 7, 9, 4, 0), # Source before destination in word.
+            (OP_COPY, 2, 1,  5, 9, 1, 2, 0), # Single pixel.
+        ])
+
+    def test_copy_8bpp(self):
+        self.check(8, 64, [
+            (OP_COPY, 3, 0, 21, 2, 13, 5, 0),
+            (OP_COPY, 9, 6,  2, 1,  6, 4, 0),
+        ])
+
+    def test_copy_reverse(self):
+        # Overlapping copy to lower lines (scroll down): bottom-to-top from the last line.
+        self.check(32, 128, [
+            (OP_COPY | OP_REVERSE, 2, 8, 5, 10, 30, 8, 0),
+            (OP_COPY | OP_REVERSE, 0, 9, 0, 11, 40, 10, 0),
+        ])
+
+    def test_copy_overlap_up(self):
+        # Overlapping copy to upper lines (scroll up): top-to-bottom.
+        self.check(32, 128, [(OP_COPY, 3, 2, 1, 0, 33, 10, 0)])
+
+    def test_copy_line(self):
+        # Overlapping copy to the right on the same lines: each line is read before being written.
+        self.check(32, 128, [
+            (OP_COPY | OP_LINE, 1, 2, 4, 2, 24, 6, 0),
+            (OP_COPY | OP_LINE, 0, 0, 1, 0, 39, 2, 0),
+        ])
+
+    def test_copy_key(self):
+        self.check(32, 128, [
+            (OP_COPY | OP_KEY, 0, 0, 17, 6, 20, 6, 0x00000002),
+            (OP_COPY | OP_KEY, 5, 6,  2, 1, 11, 3, 0xffffffff),
+        ])
+
+    def test_empty(self):
+        # Zero width/height: no operation.
+        self.check(32, 128, [
+            (OP_FILL, 0, 0, 0, 0, 0, 4, 0x1),
+            (OP_COPY, 0, 0, 4, 0, 4, 0, 0),
+        ])